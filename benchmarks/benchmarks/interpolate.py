@@ -73,6 +73,36 @@ class BenchPPoly(Benchmark):
         self.pp(self.xp)
 
 
+class SplineEvaluation(Benchmark):
+    param_names = ['spline', 'n_breakpoints', 'breakpoints', 'points']
+    params = [
+        ['CubicSpline', 'BSpline'],
+        [100, 100000],
+        ['uniform', 'random'],
+        ['sorted', 'random']
+    ]
+
+    def setup(self, spline, n_breakpoints, breakpoints, points):
+        np.random.seed(1234)
+        if breakpoints == 'uniform':
+            x = np.linspace(0, 1, n_breakpoints)
+        else:
+            x = np.sort(np.random.random(n_breakpoints))
+            x[0], x[-1] = 0, 1
+        y = np.random.random(n_breakpoints)
+        if spline == 'CubicSpline':
+            self.spl = interpolate.CubicSpline(x, y)
+        else:
+            self.spl = interpolate.make_interp_spline(x, y)
+
+        self.xp = np.random.random(10**6)
+        if points == 'sorted':
+            self.xp.sort()
+
+    def time_evaluation(self, spline, n_breakpoints, breakpoints, points):
+        self.spl(self.xp)
+
+
 class GridData(Benchmark):
     param_names = ['n_grids', 'method']
     params = [
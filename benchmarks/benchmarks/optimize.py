@@ -13,7 +13,8 @@ try:
     import scipy.optimize
     from scipy.optimize.optimize import rosen, rosen_der, rosen_hess
     from scipy.optimize import (leastsq, basinhopping, differential_evolution,
-                                OptimizeResult)
+                                OptimizeResult, linear_sum_assignment)
+    from scipy.sparse import csr_matrix
 except ImportError:
     pass
 
@@ -380,6 +381,38 @@ class BenchLeastSquares(Benchmark):
             raise NotImplementedError
 
 
+class BenchLinearSumAssignment(Benchmark):
+    """Class for benchmarking the linear sum assignment solver."""
+    params = [
+        [10, 100, 1000, 5000],
+        ['square', 'wide', 'sparse']
+    ]
+    param_names = [
+        "n", "shape"
+    ]
+
+    def setup(self, n, shape):
+        rng = np.random.RandomState(1234)
+        if shape == 'square':
+            self.cost = rng.rand(n, n)
+        elif shape == 'wide':
+            self.cost = rng.rand(n, 2 * n)
+        else:
+            # ten candidate columns per row, as in tracking association
+            # problems, and a 100 times larger problem
+            n = 100 * n
+            cols = rng.randint(0, n, (n, 10))
+            cols[:, 0] = rng.permutation(n)
+            self.cost = csr_matrix((rng.rand(10 * n), cols.ravel(),
+                                    np.arange(0, 10 * n + 1, 10)),
+                                   shape=(n, n))
+            if n > 100000:
+                raise NotImplementedError
+
+    def time_linear_sum_assignment(self, n, shape):
+        linear_sum_assignment(self.cost)
+
+
 try:
     # the value of SCIPY_XSLOW is used to control how many repeats of each
     # function
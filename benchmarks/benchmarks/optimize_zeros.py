@@ -2,9 +2,12 @@ from __future__ import division, print_function, absolute_import
 
 from math import sqrt
 
+import numpy as np
+
 # Import testing parameters
 try:
     from scipy.optimize._tstutils import methods, mstrings, functions, fstrings
+    from scipy.optimize import brentq, newton, chandrupatla
 except ImportError:
     pass
 
@@ -27,3 +30,31 @@ class Zeros(Benchmark):
 
     def time_zeros(self, func, meth):
         self.meth(self.func, self.a, self.b)
+
+
+class ZerosArray(Benchmark):
+    # Many independent problems, x**3 == c, solved by a loop over brentq or
+    # at once by the array solvers.
+    params = [
+        [10, 1000, 100000],
+        ['brentq', 'chandrupatla', 'newton', 'secant']
+    ]
+    param_names = ['size', 'solver']
+
+    def setup(self, size, meth):
+        if meth == 'brentq' and size > 1000:
+            raise NotImplementedError()
+        self.c = np.linspace(0.5, 100, size)
+
+    def time_zeros_array(self, size, meth):
+        f = lambda x, c: x**3 - c
+        if meth == 'brentq':
+            for c in self.c:
+                brentq(f, 0, 5, args=(c,))
+        elif meth == 'chandrupatla':
+            chandrupatla(f, 0, 5, args=(self.c,))
+        elif meth == 'newton':
+            newton(f, np.full(self.c.shape, 3.), args=(self.c,),
+                   fprime=lambda x, c: 3 * x**2)
+        else:
+            newton(f, np.full(self.c.shape, 3.), args=(self.c,))
@@ -139,6 +139,38 @@ class Matvecs(Benchmark):
         self.A * self.x
 
 
+class MatvecWorkers(Benchmark):
+    params = [
+        ['csr', 'bsr'],
+        [1, 10],
+        [1, 2, 4]
+    ]
+    param_names = ['format', 'n_vecs', 'workers']
+
+    def setup(self, format, n_vecs, workers):
+        b = (2, 2)
+        self.A = sparse.kron(poisson2d(500),
+                             ones(b)).tobsr(blocksize=b).asformat(format)
+        if n_vecs == 1:
+            self.x = ones(self.A.shape[1], dtype=float)
+        else:
+            self.x = ones((self.A.shape[1], n_vecs), dtype=float)
+
+    def time_matvec(self, format, n_vecs, workers):
+        self.A.dot(self.x, workers=workers)
+
+
+class MatmulWorkers(Benchmark):
+    params = [1, 2, 4]
+    param_names = ['workers']
+
+    def setup(self, workers):
+        self.A = poisson2d(500, format='csr')
+
+    def time_matmul(self, workers):
+        self.A.dot(self.A, workers=workers)
+
+
 class Matmul(Benchmark):
     def setup(self):
         H1, W1 = 1, 100000
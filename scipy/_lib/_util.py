@@ -3,8 +3,10 @@ from __future__ import division, print_function, absolute_import
 import functools
 import operator
 import sys
+import threading
 import warnings
 import numbers
+import multiprocessing
 from collections import namedtuple
 import inspect
 
@@ -135,6 +137,136 @@ def _prune_array(array):
     return array
 
 
+def _normalize_workers(workers):
+    """Return the number of threads requested by a ``workers`` argument.
+
+    ``workers=-1`` means one thread per processor; otherwise `workers` must
+    be a positive integer.
+    """
+    if workers is None:
+        return 1
+    workers = operator.index(workers)
+    if workers == -1:
+        return multiprocessing.cpu_count()
+    if workers < 1:
+        raise ValueError("workers must be a positive integer or -1, "
+                         "got %r" % (workers,))
+    return workers
+
+
+def _threaded_ranges(func, n, workers=1):
+    """Call ``func(start, stop)`` over a static partition of ``range(n)``.
+
+    The chunks are processed by `workers` threads, so `func` should spend
+    its time in code that releases the GIL. The first exception raised in
+    a worker thread is re-raised in the calling thread.
+    """
+    workers = min(_normalize_workers(workers), n)
+    if workers <= 1:
+        if n > 0:
+            func(0, n)
+        return
+
+    errors = []
+
+    def _thread_func(start, stop):
+        try:
+            func(start, stop)
+        except BaseException as e:
+            errors.append(e)
+
+    # static scheduling without load balancing, as in cKDTree.query
+    ranges = [(j * n // workers, (j + 1) * n // workers)
+              for j in range(workers)]
+    threads = [threading.Thread(target=_thread_func, args=r) for r in ranges]
+    for t in threads:
+        t.daemon = True
+        t.start()
+    for t in threads:
+        t.join()
+    if errors:
+        raise errors[0]
+
+
+class MapWrapper(object):
+    """
+    Parallelisation wrapper for working with map-like callables, such as
+    `multiprocessing.Pool.map`.
+
+    Parameters
+    ----------
+    pool : int or map-like callable
+        If `pool` is an integer, then it specifies the number of processes
+        to use for parallelization. If ``int(pool) == 1``, then no
+        parallelization is used and the builtin `map` is used. If
+        ``int(pool) == -1``, then the pool uses all available CPUs.
+        If `pool` is a map-like callable that follows the same calling
+        sequence as the built-in map function, then this callable is used
+        for parallelization.
+
+    Notes
+    -----
+    A process pool created by the wrapper is owned by it, and is closed by
+    `close`, on leaving a ``with`` block, or when the wrapper is garbage
+    collected. A map-like callable supplied by the user is left alone.
+    """
+    def __init__(self, pool=1):
+        self.pool = None
+        self._mapfunc = map
+        self._own_pool = False
+
+        if callable(pool):
+            self.pool = pool
+            self._mapfunc = self.pool
+        else:
+            nprocs = _normalize_workers(pool)
+            if nprocs > 1:
+                self.pool = multiprocessing.Pool(nprocs)
+                self._mapfunc = self.pool.map
+                self._own_pool = True
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if self._own_pool:
+            self.pool.close()
+            self.pool.terminate()
+
+    def __del__(self):
+        self.close()
+        self.terminate()
+
+    def terminate(self):
+        if self._own_pool:
+            self.pool.terminate()
+
+    def join(self):
+        if self._own_pool:
+            self.pool.join()
+
+    def close(self):
+        if self._own_pool:
+            self.pool.close()
+
+    def __call__(self, func, iterable):
+        # only accept one iterable because that's all Pool.map accepts
+        return self._mapfunc(func, iterable)
+
+
+class _FunctionWrapper(object):
+    """
+    Object to wrap user cost function, allowing picklability
+    """
+    def __init__(self, f, args, kwargs=None):
+        self.f = f
+        self.args = [] if args is None else args
+        self.kwargs = {} if kwargs is None else kwargs
+
+    def __call__(self, x):
+        return self.f(x, *self.args, **self.kwargs)
+
+
 class DeprecatedImport(object):
     """
     Deprecated import, with redirection + warning.
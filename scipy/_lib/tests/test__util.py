@@ -1,9 +1,12 @@
 from __future__ import division, print_function, absolute_import
 
+from multiprocessing import Pool
+
 import numpy as np
 from numpy.testing import assert_equal, assert_, assert_raises
 
-from scipy._lib._util import _aligned_zeros, check_random_state
+from scipy._lib._util import (_aligned_zeros, check_random_state,
+                              _threaded_ranges, MapWrapper)
 
 
 def test__aligned_zeros():
@@ -53,3 +56,58 @@ def test_check_random_state():
     rsi = check_random_state(None)
     assert_equal(type(rsi), np.random.RandomState)
     assert_raises(ValueError, check_random_state, 'a')
+
+
+def test__threaded_ranges():
+    for n in [0, 1, 7, 100]:
+        for workers in [1, 3, 16, -1]:
+            out = np.zeros(n, dtype=int)
+
+            def func(start, stop):
+                out[start:stop] += 1
+
+            _threaded_ranges(func, n, workers)
+            assert_equal(out, np.ones(n, dtype=int))
+
+    def fail(start, stop):
+        raise ZeroDivisionError()
+
+    assert_raises(ZeroDivisionError, _threaded_ranges, fail, 10, 4)
+    assert_raises(ValueError, _threaded_ranges, fail, 10, 0)
+
+
+def test_mapwrapper_serial():
+    in_arg = np.arange(10.)
+    out_arg = np.sin(in_arg)
+
+    p = MapWrapper(1)
+    assert_(p._mapfunc is map)
+    assert_(p.pool is None)
+    assert_(p._own_pool is False)
+    out = list(p(np.sin, in_arg))
+    assert_equal(out, out_arg)
+
+    assert_raises(ValueError, MapWrapper, 0)
+
+
+def test_mapwrapper_parallel():
+    in_arg = np.arange(10.)
+    out_arg = np.sin(in_arg)
+
+    with MapWrapper(2) as p:
+        out = p(np.sin, in_arg)
+        assert_equal(list(out), out_arg)
+        assert_(p._own_pool is True)
+
+    # a map-like callable is used as is, and not closed by the wrapper
+    q = Pool(2)
+    try:
+        with MapWrapper(q.map) as p:
+            out = p(np.sin, in_arg)
+            assert_equal(list(out), out_arg)
+            assert_(p._own_pool is False)
+        out = q.map(np.sin, in_arg)
+        assert_equal(list(out), out_arg)
+    finally:
+        q.close()
+        q.join()
@@ -41,9 +41,11 @@ Unstructured data:
 
    griddata
    LinearNDInterpolator
+   linear_interpolation_matrix
    NearestNDInterpolator
    CloughTocher2DInterpolator
    Rbf
+   LocalRbf
    interp2d
 
 For data on a grid:
@@ -54,6 +56,8 @@ For data on a grid:
    interpn
    RegularGridInterpolator
    RectBivariateSpline
+   NdBSpline
+   make_ndbspl
 
 .. seealso::
 
@@ -76,6 +80,10 @@ Tensor product polynomials:
    BSpline
    make_interp_spline
    make_lsq_spline
+   BSplineBatch
+   make_interp_spline_batch
+   make_pspline
+   PSplineAccumulator
 
 Functional interface to FITPACK routines:
 
@@ -179,7 +187,7 @@ from .fitpack import *
 # New interface to fitpack library:
 from .fitpack2 import *
 
-from .rbf import Rbf
+from .rbf import Rbf, LocalRbf
 
 from .polyint import *
 
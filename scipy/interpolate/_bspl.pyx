@@ -8,6 +8,11 @@ cimport numpy as cnp
 
 cimport cython
 
+from libc.stdlib cimport malloc, free
+from libc.string cimport memset
+
+from scipy.linalg.cython_lapack cimport dgbsv
+
 cdef extern from "src/__fitpack.h":
     void _deBoor_D(double *t, double x, int k, int ell, int m, double *result) nogil
 
@@ -20,6 +25,8 @@ ctypedef fused double_or_complex:
     double
     double complex
 
+include "_interval_search.pxi"
+
 
 #------------------------------------------------------------------------------
 # B-splines
@@ -35,7 +42,7 @@ cdef inline int find_interval(double[::1] t,
     """
     Find an interval such that t[interval] <= xval < t[interval+1].
 
-    Uses a linear search with locality, see fitpack's splev.
+    Uses a search with locality, see `_search_interval`.
 
     Parameters
     ----------
@@ -57,10 +64,21 @@ cdef inline int find_interval(double[::1] t,
     interval : int
         Suitable interval or -1 if xval was nan.
 
+    """
+    return _find_interval(&t[0], t.shape[0], k, xval, prev_l, extrapolate)
+
+
+cdef inline int _find_interval(const double *t,
+                               int len_t,
+                               int k,
+                               double xval,
+                               int prev_l,
+                               bint extrapolate) nogil:
+    """
+    Pointer version of `find_interval`, for knots ``t[:len_t]``.
     """
     cdef:
-        int l
-        int n = t.shape[0] - k - 1
+        int n = len_t - k - 1
         double tb = t[k]
         double te = t[n]
 
@@ -71,17 +89,13 @@ cdef inline int find_interval(double[::1] t,
     if ((xval < tb) or (xval > te)) and not extrapolate:
         return -1
 
-    l = prev_l if k < prev_l < n else k
-
-    # xval is in support, search for interval s.t. t[interval] <= xval < t[l+1]
-    while(xval < t[l] and l != k):
-        l -= 1
+    if xval < tb:
+        return k
+    if xval >= te:
+        return n - 1
 
-    l += 1
-    while(xval >= t[l] and l != n):
-        l += 1
-
-    return l-1
+    # xval is in support, search for interval s.t. t[l] <= xval < t[l+1]
+    return _search_interval(t, k, n, xval, prev_l)
 
 
 @cython.wraparound(False)
@@ -158,6 +172,167 @@ def evaluate_spline(double[::1] t,
                     out[ip, jp] = out[ip, jp] + c[interval + a - k, jp] * work[a]
 
 
+@cython.wraparound(False)
+@cython.boundscheck(False)
+@cython.cdivision(True)
+def evaluate_ndbspline(double[:, ::1] xi,
+                       double[::1] t,
+                       cnp.npy_intp[::1] t_start,
+                       cnp.npy_intp[::1] len_t,
+                       cnp.npy_intp[::1] k,
+                       cnp.npy_intp[::1] nu,
+                       bint extrapolate,
+                       double_or_complex[:, ::1] c1,
+                       cnp.npy_intp[::1] strides_c1,
+                       double_or_complex[:, ::1] out,
+                       cnp.npy_intp start,
+                       cnp.npy_intp stop):
+    """
+    Evaluate a tensor product spline at the points ``xi[start:stop]``.
+
+    Parameters
+    ----------
+    xi : ndarray, shape (s, ndim)
+        Points to evaluate the spline at.
+    t : ndarray
+        Concatenated knots; the knots of dimension ``d`` are
+        ``t[t_start[d]:t_start[d] + len_t[d]]``.
+    t_start, len_t : ndarray, shape (ndim,)
+        Offsets and lengths of the knot vectors in `t`.
+    k : ndarray, shape (ndim,)
+        Spline degrees.
+    nu : ndarray, shape (ndim,)
+        Orders of the partial derivatives to evaluate.
+    extrapolate : int
+        Whether to extrapolate to out-of-bounds points, or to return NaNs.
+    c1 : ndarray, shape (n1*...*nd, m)
+        B-spline coefficients, with the spline dimensions flattened in C
+        order into rows with the given `strides_c1`.
+    out : ndarray, shape (s, m)
+        Computed values of the spline at each of the input points.
+        This argument is modified in-place.
+
+    Notes
+    -----
+    Consecutive points in the same knot interval of a dimension reuse the
+    coefficient offsets, and points with the same coordinate reuse the
+    nonzero B-spline values, so that evaluation on a grid or along
+    sorted points only computes the basis where it changes.
+
+    """
+    cdef:
+        cnp.npy_intp ndim = xi.shape[1], m = c1.shape[1]
+        cnp.npy_intp p, d, a, j, pos, last, kmax = 0
+        int i
+        double_or_complex acc
+        bint valid
+        double x
+        double *work
+        double *basis
+        double *xprev
+        double *pw
+        cnp.npy_intp *b_start
+        cnp.npy_intp *offsets
+        cnp.npy_intp *po
+        cnp.npy_intp *count
+        int *interval
+
+    if xi.shape[0] != out.shape[0] or out.shape[1] != m:
+        raise ValueError("out, xi and c1 have incompatible shapes")
+    for d in range(ndim):
+        if nu[d] < 0:
+            raise NotImplementedError("Cannot do derivative order %s." % nu[d])
+        kmax = max(kmax, k[d])
+
+    # per-dimension bookkeeping, packed into a single allocation
+    work = <double *>malloc(((2*kmax + 2) + ndim*(kmax + 1) + 2*ndim + 1) *
+                            sizeof(double) +
+                            (ndim + 1 + ndim*(kmax + 1) + 2*ndim + 1) *
+                            sizeof(cnp.npy_intp) +
+                            ndim * sizeof(int))
+    if not work:
+        raise MemoryError()
+    basis = work + 2*kmax + 2
+    xprev = basis + ndim*(kmax + 1)
+    pw = xprev + ndim
+    b_start = <cnp.npy_intp *>(pw + ndim + 1)
+    offsets = b_start + ndim + 1
+    po = offsets + ndim*(kmax + 1)
+    count = po + ndim + 1
+    interval = <int *>(count + ndim)
+
+    with nogil:
+        b_start[0] = 0
+        for d in range(ndim):
+            b_start[d+1] = b_start[d] + k[d] + 1
+            interval[d] = -1
+            xprev[d] = nan
+
+        for p in range(start, stop):
+            valid = True
+            for d in range(ndim):
+                x = xi[p, d]
+                i = _find_interval(&t[t_start[d]], len_t[d], k[d], x,
+                                   interval[d], extrapolate)
+                if i < 0:
+                    valid = False
+                    break
+                if i != interval[d] or x != xprev[d]:
+                    # on return, the first k+1 elements of work are
+                    # B_{i-k}, ..., B_i at x
+                    _deBoor_D(&t[t_start[d]], x, k[d], i, nu[d], work)
+                    for a in range(k[d] + 1):
+                        basis[b_start[d] + a] = work[a]
+                    xprev[d] = x
+                if i != interval[d]:
+                    for a in range(k[d] + 1):
+                        offsets[b_start[d] + a] = (i - k[d] + a) * strides_c1[d]
+                    interval[d] = i
+
+            if not valid:
+                for j in range(m):
+                    out[p, j] = nan
+                continue
+
+            # sum over the (k+1)**ndim nonzero tensor products, keeping the
+            # partial weights and offsets of the leading dimensions; the
+            # last dimension is summed directly
+            for j in range(m):
+                out[p, j] = 0
+            pw[0] = 1
+            po[0] = 0
+            for d in range(ndim):
+                count[d] = 0
+            last = ndim - 1
+            d = 0
+            while True:
+                while d < last:
+                    pos = b_start[d] + count[d]
+                    pw[d+1] = pw[d] * basis[pos]
+                    po[d+1] = po[d] + offsets[pos]
+                    d += 1
+                for j in range(m):
+                    acc = 0
+                    for a in range(k[last] + 1):
+                        acc = acc + (basis[b_start[last] + a] *
+                                     c1[po[last] + offsets[b_start[last] + a], j])
+                    out[p, j] = out[p, j] + pw[last] * acc
+
+                d = last - 1
+                if d < 0:
+                    break
+                count[d] += 1
+                while d >= 0 and count[d] > k[d]:
+                    count[d] = 0
+                    d -= 1
+                    if d >= 0:
+                        count[d] += 1
+                if d < 0:
+                    break
+
+    free(work)
+
+
 def evaluate_all_bspl(double[::1] t, int k, double xval, int m, int nu=0):
     """Evaluate the ``k+1`` B-splines which are non-zero on interval ``m``.
 
@@ -411,3 +586,201 @@ def _norm_eq_lsq(double[::1] x,
                 # ... and A.T @ y
                 for ci in range(rhs.shape[1]):
                     rhs[row, ci] = rhs[row, ci] + wrk[r] * y[j, ci] * wval
+
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+@cython.cdivision(True)
+def _banded_inverse(double[:, :] cb, double[:, :] zb):
+    """Compute the band of the inverse of a symmetric banded matrix.
+
+    Given the lower Cholesky factor ``L`` of a matrix ``A = L @ L.T`` with
+    `b` subdiagonals, compute the entries of ``Z = inv(A)`` within the band
+    of ``A`` in O(n b**2) operations, with the recursion of Hutchinson and
+    de Hoog (1985).
+
+    Both arrays are in the LAPACK lower banded storage, i.e.
+    ``L[i+d, i] == cb[d, i]`` and ``Z[i+d, i] == zb[d, i]``.
+    This routine is not supposed to be called directly, and
+    does no error checking.
+
+    Parameters
+    ----------
+    cb : ndarray, shape (b+1, n)
+        The banded Cholesky factor, as returned by
+        ``cholesky_banded(..., lower=True)``.
+    zb : ndarray, shape (b+1, n)
+        On exit: the band of the inverse.
+
+    """
+    cdef:
+        int n = cb.shape[1], b = cb.shape[0] - 1
+        int i, j, m, hi
+        double s, lii
+
+    with nogil:
+        for i in range(n - 1, -1, -1):
+            lii = cb[0, i]
+            hi = min(i + b, n - 1)
+            # off-diagonal entries Z[j, i], j > i, from the rows below
+            for j in range(hi, i, -1):
+                s = 0.
+                for m in range(i + 1, hi + 1):
+                    if m >= j:
+                        s += cb[m - i, i] * zb[m - j, j]
+                    else:
+                        s += cb[m - i, i] * zb[j - m, m]
+                zb[j - i, i] = -s / lii
+            s = 0.
+            for m in range(i + 1, hi + 1):
+                s += cb[m - i, i] * zb[m - i, i]
+            zb[0, i] = 1. / (lii * lii) - s / lii
+
+#------------------------------------------------------------------------------
+# Batches of univariate splines
+#------------------------------------------------------------------------------
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def _make_interp_batch(double[::1] x,
+                       double[:, ::1] y,
+                       cnp.npy_intp[::1] offsets,
+                       int k,
+                       double[::1] t,
+                       double[:, ::1] c,
+                       int[::1] info,
+                       cnp.npy_intp start,
+                       cnp.npy_intp stop):
+    """Compute the not-a-knot interpolating splines of curves `start` to
+    `stop` of a batch.
+
+    Curve ``i`` has the abscissas ``x[offsets[i]:offsets[i+1]]`` and the
+    ordinates in the same rows of `y`. Its knots are written to
+    ``t[offsets[i] + i*(k+1):offsets[i+1] + (i+1)*(k+1)]`` and its
+    coefficients to the rows ``offsets[i]:offsets[i+1]`` of `c`. ``info[i]``
+    is set to the LAPACK ``gbsv`` status of the collocation solve.
+
+    This routine is not supposed to be called directly, and does no error
+    checking: `k` must be odd and each curve needs at least ``k+1`` sorted
+    abscissas.
+
+    """
+    cdef:
+        cnp.npy_intp i, j, a, col, n, nmax = 0, off, toff
+        cnp.npy_intp m = y.shape[1], half = (k - 1) // 2
+        int kl = k, ku = k, ldab = 3*k + 1, left, clmn, nn, nrhs = m, ldb
+        double *ab
+        double *rhs
+        double *wrk
+        int *ipiv
+        double *tc
+
+    for i in range(start, stop):
+        nmax = max(nmax, offsets[i+1] - offsets[i])
+
+    ab = <double *>malloc((ldab*nmax + nmax*m + 2*k + 2) * sizeof(double))
+    ipiv = <int *>malloc(nmax * sizeof(int))
+    if not ab or not ipiv:
+        free(ab)
+        free(ipiv)
+        raise MemoryError()
+    rhs = ab + ldab*nmax
+    wrk = rhs + nmax*m
+
+    with nogil:
+        for i in range(start, stop):
+            off = offsets[i]
+            n = offsets[i+1] - off
+            toff = off + i*(k + 1)
+            tc = &t[toff]
+
+            # not-a-knot knots, as in _not_a_knot
+            for j in range(k + 1):
+                tc[j] = x[off]
+                tc[n + j] = x[off + n - 1]
+            for j in range(n - k - 1):
+                tc[k + 1 + j] = x[off + half + 1 + j]
+
+            # collocation matrix in the LAPACK banded storage, cf _colloc
+            memset(ab, 0, ldab*n*sizeof(double))
+            left = k
+            for j in range(n):
+                left = _find_interval(tc, n + k + 1, k, x[off + j], left,
+                                      False)
+                _deBoor_D(tc, x[off + j], k, left, 0, wrk)
+                for a in range(k + 1):
+                    clmn = left - k + a
+                    ab[kl + ku + j - clmn + clmn*ldab] = wrk[a]
+
+            # right-hand sides in Fortran order
+            for j in range(n):
+                for col in range(m):
+                    rhs[j + col*n] = y[off + j, col]
+
+            nn = n
+            ldb = n
+            dgbsv(&nn, &kl, &ku, &nrhs, ab, &ldab, ipiv, rhs, &ldb, &info[i])
+
+            for j in range(n):
+                for col in range(m):
+                    c[off + j, col] = rhs[j + col*n]
+
+    free(ab)
+    free(ipiv)
+
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def _evaluate_batch(double[::1] t,
+                    cnp.npy_intp[::1] t_offsets,
+                    double_or_complex[:, ::1] c,
+                    cnp.npy_intp[::1] c_offsets,
+                    int k,
+                    double[::1] xp,
+                    cnp.npy_intp[::1] xp_offsets,
+                    int nu,
+                    bint extrapolate,
+                    double_or_complex[:, ::1] out,
+                    cnp.npy_intp start,
+                    cnp.npy_intp stop):
+    """Evaluate splines `start` to `stop` of a batch.
+
+    Spline ``i`` has the knots ``t[t_offsets[i]:t_offsets[i+1]]`` and the
+    coefficients in the rows ``c_offsets[i]:c_offsets[i+1]`` of `c`; it is
+    evaluated at ``xp[xp_offsets[i]:xp_offsets[i+1]]`` into the same rows of
+    `out`. No error checking.
+
+    """
+    cdef:
+        cnp.npy_intp i, ip, jp, a
+        int interval, len_t
+        double *work
+        const double *tc
+
+    work = <double *>malloc((2*k + 2) * sizeof(double))
+    if not work:
+        raise MemoryError()
+
+    with nogil:
+        for i in range(start, stop):
+            tc = &t[t_offsets[i]]
+            len_t = t_offsets[i+1] - t_offsets[i]
+            interval = k
+            for ip in range(xp_offsets[i], xp_offsets[i+1]):
+                interval = _find_interval(tc, len_t, k, xp[ip], interval,
+                                          extrapolate)
+                if interval < 0:
+                    for jp in range(c.shape[1]):
+                        out[ip, jp] = nan
+                    interval = k
+                    continue
+
+                _deBoor_D(<double *>tc, xp[ip], k, interval, nu, work)
+
+                for jp in range(c.shape[1]):
+                    out[ip, jp] = 0.
+                    for a in range(k + 1):
+                        out[ip, jp] = out[ip, jp] + (
+                            c[c_offsets[i] + interval + a - k, jp] * work[a])
+
+    free(work)
@@ -6,11 +6,15 @@ import operator
 import numpy as np
 from scipy.linalg import (get_lapack_funcs, LinAlgError,
                           cholesky_banded, cho_solve_banded)
+from scipy._lib._util import _threaded_ranges
+from scipy.special import comb
 from . import _bspl
 from . import _fitpack_impl
 from . import _fitpack as _dierckx
 
-__all__ = ["BSpline", "make_interp_spline", "make_lsq_spline"]
+__all__ = ["BSpline", "make_interp_spline", "make_lsq_spline", "NdBSpline",
+           "make_ndbspl", "BSplineBatch", "make_interp_spline_batch",
+           "PSplineAccumulator", "make_pspline"]
 
 
 # copy-paste from interpolate.py
@@ -475,6 +479,416 @@ class BSpline(object):
         return out.reshape(c.shape[1:])
 
 
+class NdBSpline(object):
+    r"""Tensor product spline object.
+
+    The value at point ``xp = (x1, x2, ..., xN)`` is evaluated as a linear
+    combination
+
+    .. math::
+
+        \sum_{j_1=0}^{n_1-1} \cdots \sum_{j_N=0}^{n_N-1}
+        c_{j_1, \dots, j_N} B_{j_1, k_1; t_1}(x_1) \cdots
+        B_{j_N, k_N; t_N}(x_N)
+
+    where :math:`B_{j, k; t}` are the univariate B-spline basis functions of
+    degree `k` and knots `t`, as in `BSpline`.
+
+    Parameters
+    ----------
+    t : tuple of 1D ndarrays
+        knots in directions 1, 2, ... N, ``len(t[i]) == n[i] + k[i] + 1``
+    c : ndarray, shape (n1, n2, ..., nN, ...)
+        spline coefficients
+    k : int or length-N tuple of integers
+        spline degrees. A single integer is used for all dimensions.
+    extrapolate : bool, optional
+        whether to extrapolate beyond the base interval of each dimension,
+        ``t[i][k[i]] .. t[i][-k[i]-1]``, or to return nans.
+        Default is True.
+
+    Attributes
+    ----------
+    t : tuple of ndarrays
+        knots
+    c : ndarray
+        coefficients of the tensor product spline
+    k : tuple of integers
+        degrees in each dimension
+    extrapolate : bool
+        whether to extrapolate beyond the base interval
+
+    Methods
+    -------
+    __call__
+    derivative
+
+    See Also
+    --------
+    BSpline : a univariate B-spline object
+    make_ndbspl : construct an interpolating tensor product spline
+    RegularGridInterpolator : interpolation on a regular grid
+
+    Notes
+    -----
+    Evaluation is compiled and only visits the ``(k1+1)*...*(kN+1)``
+    nonzero terms of the sum at each point. Consecutive points in the same
+    knot interval share the coefficient offsets, and consecutive points with
+    an equal coordinate share its B-spline values, so that evaluating on
+    sorted or gridded points is cheaper than on scattered ones.
+
+    .. versionadded:: 1.0.0
+
+    Examples
+    --------
+    Interpolate a function of three variables on a grid, and evaluate the
+    result and its partial derivative with respect to the first variable:
+
+    >>> from scipy.interpolate import make_ndbspl
+    >>> x = np.linspace(0, 1, 11)
+    >>> y = np.linspace(0, 2, 21)
+    >>> z = np.linspace(-1, 1, 9)
+    >>> X, Y, Z = np.meshgrid(x, y, z, indexing='ij')
+    >>> spl = make_ndbspl((x, y, z), np.sin(X) * Y**2 + Z)
+    >>> xi = np.array([[0.25, 1.5, 0.1], [0.8, 0.3, -0.5]])
+    >>> np.allclose(spl(xi), np.sin(xi[:, 0]) * xi[:, 1]**2 + xi[:, 2])
+    True
+    >>> np.allclose(spl(xi, nu=(1, 0, 0)), np.cos(xi[:, 0]) * xi[:, 1]**2,
+    ...             atol=1e-5)
+    True
+
+    """
+    def __init__(self, t, c, k, extrapolate=True):
+        super(NdBSpline, self).__init__()
+
+        ndim = len(t)
+        if ndim < 1:
+            raise ValueError("Need at least one knot vector.")
+        try:
+            len(k)
+        except TypeError:
+            k = (k,) * ndim
+        if len(k) != ndim:
+            raise ValueError("len(t) = %d != %d = len(k)." % (ndim, len(k)))
+
+        self.k = tuple(operator.index(kd) for kd in k)
+        self.t = tuple(np.ascontiguousarray(td, dtype=np.float64) for td in t)
+        self.c = np.asarray(c)
+        self.extrapolate = bool(extrapolate)
+
+        if self.c.ndim < ndim:
+            raise ValueError("Coefficients must be at least "
+                             "%d-dimensional." % ndim)
+        for d in range(ndim):
+            td, kd = self.t[d], self.k[d]
+            n = td.shape[0] - kd - 1
+            if kd < 0:
+                raise ValueError("Spline degree in dimension %d cannot be "
+                                 "negative." % d)
+            if td.ndim != 1:
+                raise ValueError("Knot vector in dimension %d must be "
+                                 "one-dimensional." % d)
+            if n < kd + 1:
+                raise ValueError("Need at least %d knots for degree %d in "
+                                 "dimension %d." % (2*kd + 2, kd, d))
+            if (np.diff(td) < 0).any():
+                raise ValueError("Knots in dimension %d must be in a "
+                                 "non-decreasing order." % d)
+            if len(np.unique(td[kd:n+1])) < 2:
+                raise ValueError("Need at least two internal knots in "
+                                 "dimension %d." % d)
+            if not np.isfinite(td).all():
+                raise ValueError("Knots in dimension %d should not have nans "
+                                 "or infs." % d)
+            if self.c.shape[d] != n:
+                raise ValueError("Knots, coefficients and degree in "
+                                 "dimension %d are inconsistent: got %d "
+                                 "coefficients for %d knots and degree %d."
+                                 % (d, self.c.shape[d], td.shape[0], kd))
+
+        dt = _get_dtype(self.c.dtype)
+        self.c = np.ascontiguousarray(self.c, dtype=dt)
+
+    def __call__(self, xi, nu=None, extrapolate=None, workers=1):
+        """Evaluate the tensor product spline at `xi`.
+
+        Parameters
+        ----------
+        xi : array_like, shape (..., ndim)
+            The coordinates to evaluate the spline at.
+        nu : array_like, optional, shape (ndim,)
+            Orders of the partial derivatives to evaluate. Default is zero
+            in each dimension.
+        extrapolate : bool, optional
+            whether to extrapolate based on the first and last intervals in
+            each dimension or return nans. Default is `self.extrapolate`.
+        workers : int, optional
+            Number of threads to evaluate the points with. If -1 is given all
+            CPU threads are used. Default: 1.
+
+        Returns
+        -------
+        values : ndarray, shape ``xi.shape[:-1] + self.c.shape[ndim:]``
+            The value of the spline, or of its partial derivative, at `xi`.
+
+        """
+        ndim = len(self.t)
+        if extrapolate is None:
+            extrapolate = self.extrapolate
+        extrapolate = bool(extrapolate)
+
+        if nu is None:
+            nu = np.zeros((ndim,), dtype=np.intp)
+        else:
+            nu = np.asarray(nu, dtype=np.intp)
+            if nu.ndim != 1 or nu.shape[0] != ndim:
+                raise ValueError("invalid number of derivative orders nu = "
+                                 "%s for ndim = %d." % (nu, ndim))
+            if (nu < 0).any():
+                raise ValueError("derivative orders must be non-negative, "
+                                 "got nu = %s." % nu)
+            for d in range(ndim):
+                if nu[d] > self.k[d]:
+                    raise ValueError("Order of derivative nu[%d] = %d must "
+                                     "be <= k[%d] = %d."
+                                     % (d, nu[d], d, self.k[d]))
+
+        xi = np.asarray(xi, dtype=float)
+        xi_shape = xi.shape
+        xi = xi.reshape(-1, xi_shape[-1])
+        if xi_shape[-1] != ndim:
+            raise ValueError("Shapes: xi.shape=%s and ndim=%s" %
+                             (xi_shape, ndim))
+        xi = np.ascontiguousarray(xi)
+
+        # prepare the knots and coefficients for the compiled evaluator
+        t = np.concatenate(self.t)
+        len_t = np.array([td.shape[0] for td in self.t], dtype=np.intp)
+        t_start = np.r_[0, np.cumsum(len_t)[:-1]].astype(np.intp)
+        k = np.asarray(self.k, dtype=np.intp)
+
+        c = np.ascontiguousarray(self.c)
+        c1 = c.reshape(prod(c.shape[:ndim]), -1)
+        strides_c1 = np.array([prod(c.shape[d+1:ndim]) for d in range(ndim)],
+                              dtype=np.intp)
+
+        out = np.empty((xi.shape[0], c1.shape[1]), dtype=c.dtype)
+
+        def _evaluate(start, stop):
+            _bspl.evaluate_ndbspline(xi, t, t_start, len_t, k, nu,
+                                     extrapolate, c1, strides_c1, out,
+                                     start, stop)
+
+        _threaded_ranges(_evaluate, xi.shape[0], workers)
+        return out.reshape(xi_shape[:-1] + self.c.shape[ndim:])
+
+    def derivative(self, nu):
+        """Return a tensor product spline representing a partial derivative.
+
+        Parameters
+        ----------
+        nu : array_like, shape (ndim,)
+            Orders of the derivative in each dimension.
+
+        Returns
+        -------
+        spl : NdBSpline
+            A new instance of degree ``k[i] - nu[i]`` in dimension ``i``.
+
+        """
+        ndim = len(self.t)
+        nu = np.asarray(nu, dtype=int)
+        if nu.shape != (ndim,) or (nu < 0).any():
+            raise ValueError("invalid derivative orders nu = %s." % nu)
+
+        t, c, k = list(self.t), self.c, list(self.k)
+        for d in range(ndim):
+            if nu[d] == 0:
+                continue
+            if nu[d] > k[d]:
+                raise ValueError("Order of derivative nu[%d] = %d must be "
+                                 "<= k[%d] = %d." % (d, nu[d], d, k[d]))
+            spl = BSpline.construct_fast(t[d], np.rollaxis(c, d), k[d])
+            spl = spl.derivative(nu[d])
+            t[d], k[d] = spl.t, spl.k
+            # drop the padding added by splder
+            n = t[d].shape[0] - k[d] - 1
+            c = np.rollaxis(spl.c[:n], 0, d + 1)
+        return NdBSpline(t, c, k, extrapolate=self.extrapolate)
+
+
+def _check_offsets(offsets, size, name="offsets"):
+    """Validate the CSR-style row offsets of a ragged batch."""
+    offsets = np.asarray(offsets)
+    if offsets.ndim != 1 or offsets.shape[0] < 1:
+        raise ValueError("%s must be a non-empty 1-D array." % name)
+    if not np.issubdtype(offsets.dtype, np.integer):
+        raise ValueError("%s must be an integer array." % name)
+    offsets = np.ascontiguousarray(offsets, dtype=np.intp)
+    if offsets[0] != 0 or offsets[-1] != size:
+        raise ValueError("%s must start at 0 and end at %d." % (name, size))
+    if (np.diff(offsets) < 0).any():
+        raise ValueError("%s must be non-decreasing." % name)
+    return offsets
+
+
+class BSplineBatch(object):
+    r"""A batch of univariate splines in the B-spline basis.
+
+    The splines share the degree `k`, but each has its own knots and
+    coefficients. These are stored in the compressed ("CSR") layout: the
+    knots of spline ``i`` are ``t[t_offsets[i]:t_offsets[i+1]]`` and its
+    coefficients are ``c[c_offsets[i]:c_offsets[i+1]]``.
+
+    Parameters
+    ----------
+    t : ndarray, shape (nt,)
+        concatenated knots
+    t_offsets : ndarray of int, shape (nsplines + 1,)
+        offsets of the knots of each spline in `t`
+    c : ndarray, shape (nc, ...)
+        concatenated spline coefficients
+    c_offsets : ndarray of int, shape (nsplines + 1,)
+        offsets of the coefficients of each spline in `c`
+    k : int
+        B-spline degree
+    extrapolate : bool, optional
+        whether to extrapolate beyond the base interval of each spline, or to
+        return nans. Default is True.
+
+    Methods
+    -------
+    __call__
+    __getitem__
+
+    See Also
+    --------
+    BSpline : a single univariate B-spline
+    make_interp_spline_batch : construct a batch of interpolating splines
+
+    Notes
+    -----
+    Evaluation is compiled and releases the GIL, so that a batch can be
+    evaluated by several threads.
+
+    .. versionadded:: 1.0.0
+
+    """
+    def __init__(self, t, t_offsets, c, c_offsets, k, extrapolate=True):
+        super(BSplineBatch, self).__init__()
+
+        self.k = operator.index(k)
+        self.t = np.ascontiguousarray(t, dtype=np.float64)
+        self.c = np.asarray(c)
+        self.extrapolate = bool(extrapolate)
+
+        if self.k < 0:
+            raise ValueError("Spline order cannot be negative.")
+        if self.t.ndim != 1:
+            raise ValueError("Knot vector must be one-dimensional.")
+        if self.c.ndim < 1:
+            raise ValueError("Coefficients must be at least 1-dimensional.")
+        self.t_offsets = _check_offsets(t_offsets, self.t.shape[0],
+                                        "t_offsets")
+        self.c_offsets = _check_offsets(c_offsets, self.c.shape[0],
+                                        "c_offsets")
+        if self.t_offsets.shape != self.c_offsets.shape:
+            raise ValueError("t_offsets and c_offsets have different "
+                             "lengths.")
+        n = np.diff(self.t_offsets) - self.k - 1
+        if (n < self.k + 1).any():
+            raise ValueError("Need at least %d knots for degree %d." %
+                             (2*self.k + 2, self.k))
+        if (np.diff(self.c_offsets) < n).any():
+            raise ValueError("Knots, coefficients and degree are "
+                             "inconsistent.")
+        if not np.isfinite(self.t).all():
+            raise ValueError("Knots should not have nans or infs.")
+
+        dt = _get_dtype(self.c.dtype)
+        self.c = np.ascontiguousarray(self.c, dtype=dt)
+
+    @classmethod
+    def construct_fast(cls, t, t_offsets, c, c_offsets, k, extrapolate=True):
+        """Construct a batch without making checks.
+
+        Accepts same parameters as the regular constructor. Input arrays
+        must be C contiguous and of correct shape and dtype.
+        """
+        self = object.__new__(cls)
+        self.t, self.t_offsets, self.k = t, t_offsets, k
+        self.c, self.c_offsets = c, c_offsets
+        self.extrapolate = extrapolate
+        return self
+
+    def __len__(self):
+        return self.t_offsets.shape[0] - 1
+
+    def __getitem__(self, i):
+        """Return spline `i` of the batch as a `BSpline`."""
+        i = operator.index(i)
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError("spline index out of range")
+        t = self.t[self.t_offsets[i]:self.t_offsets[i+1]]
+        c = self.c[self.c_offsets[i]:self.c_offsets[i+1]]
+        return BSpline.construct_fast(t, c, self.k,
+                                      extrapolate=self.extrapolate)
+
+    def __call__(self, x, offsets, nu=0, extrapolate=None, workers=1):
+        """Evaluate the splines of the batch.
+
+        Parameters
+        ----------
+        x : array_like, shape (nx,)
+            Concatenated points; spline ``i`` is evaluated at
+            ``x[offsets[i]:offsets[i+1]]``.
+        offsets : array_like of int, shape (nsplines + 1,)
+            Offsets of the points of each spline in `x`.
+        nu : int, optional
+            derivative to evaluate (default is 0).
+        extrapolate : bool, optional
+            whether to extrapolate based on the first and last intervals
+            or return nans. Default is `self.extrapolate`.
+        workers : int, optional
+            Number of threads to evaluate the splines with. If -1 is given
+            all CPU threads are used. Default: 1.
+
+        Returns
+        -------
+        y : ndarray, shape ``(nx,) + c.shape[1:]``
+            The values of the splines, in the layout of `x`.
+
+        """
+        if extrapolate is None:
+            extrapolate = self.extrapolate
+        nu = operator.index(nu)
+        if nu < 0:
+            raise ValueError("Cannot do derivative order %s." % nu)
+        if nu > self.k:
+            raise ValueError("Order of derivative nu = %d must be <= k = %d."
+                             % (nu, self.k))
+        x = np.ascontiguousarray(x, dtype=np.float_)
+        if x.ndim != 1:
+            raise ValueError("x must be one-dimensional.")
+        offsets = _check_offsets(offsets, x.shape[0])
+        if offsets.shape != self.t_offsets.shape:
+            raise ValueError("Expected %d offsets for %d splines, got %d." %
+                             (len(self) + 1, len(self), offsets.shape[0]))
+
+        c = self.c.reshape(self.c.shape[0], -1)
+        out = np.empty((x.shape[0], c.shape[1]), dtype=c.dtype)
+
+        def _evaluate(start, stop):
+            _bspl._evaluate_batch(self.t, self.t_offsets, c, self.c_offsets,
+                                  self.k, x, offsets, nu, bool(extrapolate),
+                                  out, start, stop)
+
+        _threaded_ranges(_evaluate, len(self), workers)
+        return out.reshape(x.shape + self.c.shape[1:])
+
+
 #################################
 #  Interpolating spline helpers #
 #################################
@@ -887,3 +1301,554 @@ def make_lsq_spline(x, y, t, k=3, w=None, axis=0, check_finite=True):
     c = np.ascontiguousarray(c)
     return BSpline.construct_fast(t, c, k, axis=axis)
 
+
+def make_ndbspl(points, values, k=3, check_finite=True):
+    """Construct an interpolating tensor product B-spline.
+
+    Parameters
+    ----------
+    points : tuple of ndarrays of float, with shapes (m1,), ..., (mN,)
+        The points defining the rectilinear grid in N dimensions. The points
+        in each dimension must be strictly increasing.
+    values : array_like, shape (m1, ..., mN, ...)
+        The data on the grid.
+    k : int or length-N tuple of integers, optional
+        The spline degrees. Default is cubic, k=3.
+    check_finite : bool, optional
+        Whether to check that the input arrays contain only finite numbers.
+        Default is True.
+
+    Returns
+    -------
+    spl : NdBSpline
+        The tensor product spline which interpolates `values` on the grid.
+
+    Notes
+    -----
+    The coefficients are found by separable collocation: the banded system
+    of `make_interp_spline` is solved along each dimension in turn, with the
+    data in the remaining dimensions as right-hand sides. The knots in each
+    dimension are the ones chosen by `make_interp_spline` without boundary
+    conditions, i.e. the not-a-knot knots for odd degrees.
+
+    .. versionadded:: 1.0.0
+
+    See Also
+    --------
+    NdBSpline : the tensor product B-spline object
+    make_interp_spline : the univariate interpolating B-spline
+    RegularGridInterpolator : interpolation on a regular grid
+
+    """
+    ndim = len(points)
+    values = np.asarray(values)
+    if values.ndim < ndim:
+        raise ValueError("There are %d point arrays, but values has %d "
+                         "dimensions" % (ndim, values.ndim))
+    try:
+        len(k)
+    except TypeError:
+        k = (k,) * ndim
+    if len(k) != ndim:
+        raise ValueError("len(points) = %d != %d = len(k)." % (ndim, len(k)))
+
+    t = []
+    c = values
+    for d in range(ndim):
+        x = _as_float_array(points[d], check_finite)
+        if x.ndim != 1 or x.shape[0] != values.shape[d]:
+            raise ValueError("There are %d points and %d values in "
+                             "dimension %d" % (x.size, values.shape[d], d))
+        spl = make_interp_spline(x, c, k=k[d], axis=d,
+                                 check_finite=check_finite)
+        t.append(spl.t)
+        c = np.rollaxis(spl.c, 0, d + 1)
+
+    return NdBSpline(t, c, k)
+
+
+def make_interp_spline_batch(x, y, offsets, k=3, check_finite=True,
+                             workers=1):
+    """Compute a batch of interpolating B-splines of ragged data.
+
+    Each curve of the batch is interpolated independently with the
+    not-a-knot spline of degree `k`, as `make_interp_spline` does by
+    default, but the curves are fitted in a single compiled loop.
+
+    Parameters
+    ----------
+    x : array_like, shape (n,)
+        Concatenated abscissas; curve ``i`` has the abscissas
+        ``x[offsets[i]:offsets[i+1]]``, which must be strictly increasing.
+    y : array_like, shape (n, ...)
+        Ordinates, in the layout of `x`.
+    offsets : array_like of int, shape (ncurves + 1,)
+        Offsets of the curves in `x` and `y`. Each curve needs at least
+        ``k+1`` points.
+    k : int, optional
+        Odd B-spline degree. Default is cubic, k=3.
+    check_finite : bool, optional
+        Whether to check that the input arrays contain only finite numbers.
+        Default is True.
+    workers : int, optional
+        Number of threads to fit the curves with. If -1 is given all CPU
+        threads are used. Default: 1.
+
+    Returns
+    -------
+    b : BSplineBatch
+        The interpolating splines. Spline ``i`` has the coefficients
+        ``b.c[offsets[i]:offsets[i+1]]``.
+
+    See Also
+    --------
+    make_interp_spline : interpolate a single curve
+    BSplineBatch : a batch of B-splines
+
+    Notes
+    -----
+    .. versionadded:: 1.0.0
+
+    Examples
+    --------
+    Interpolate two curves with different abscissas:
+
+    >>> from scipy.interpolate import make_interp_spline_batch
+    >>> x = np.r_[np.linspace(0, 1, 5), np.linspace(0, 2, 8)]
+    >>> offsets = [0, 5, 13]
+    >>> b = make_interp_spline_batch(x, np.sin(x), offsets)
+    >>> xnew = np.r_[0.5, 1.5]
+    >>> b(xnew, [0, 1, 2])
+    array([ 0.47942554,  0.99745804])
+
+    """
+    k = operator.index(k)
+    if k < 1 or k % 2 != 1:
+        raise ValueError("Odd degree for now only. Got %s." % k)
+
+    x = _as_float_array(x, check_finite)
+    y = _as_float_array(y, check_finite)
+    if x.ndim != 1:
+        raise ValueError("Expect x to be a 1-D array_like.")
+    if y.ndim < 1 or y.shape[0] != x.shape[0]:
+        raise ValueError('x and y are incompatible.')
+    offsets = _check_offsets(offsets, x.shape[0])
+    ncurves = offsets.shape[0] - 1
+    if (np.diff(offsets) < k + 1).any():
+        raise ValueError("Each curve needs at least %d points for degree "
+                         "%d." % (k + 1, k))
+    # x must increase within each curve; the curves may overlap
+    dx = np.diff(x)
+    dx[offsets[1:-1] - 1] = 1.
+    if (dx <= 0).any():
+        raise ValueError("Expect x to be sorted within each curve.")
+
+    y2 = y.reshape(y.shape[0], -1)
+    if np.iscomplexobj(y2):
+        re = make_interp_spline_batch(x, y2.real, offsets, k, False, workers)
+        im = make_interp_spline_batch(x, y2.imag, offsets, k, False, workers)
+        c = re.c + 1j*im.c
+        return BSplineBatch.construct_fast(re.t, re.t_offsets,
+                                           c.reshape(y.shape), offsets, k)
+
+    y2 = np.ascontiguousarray(y2, dtype=np.float_)
+    t = np.empty(x.shape[0] + ncurves*(k + 1))
+    t_offsets = offsets + np.arange(ncurves + 1) * (k + 1)
+    c = np.empty_like(y2)
+    info = np.zeros(ncurves, dtype=np.intc)
+
+    def _fit(start, stop):
+        _bspl._make_interp_batch(x, y2, offsets, k, t, c, info, start, stop)
+
+    _threaded_ranges(_fit, ncurves, workers)
+
+    if (info > 0).any():
+        raise LinAlgError("Collocation matix is singular for curve %d." %
+                          np.nonzero(info > 0)[0][0])
+    elif (info < 0).any():
+        raise ValueError('illegal value in %d-th argument of internal gbsv' %
+                         -info[info < 0][0])
+
+    return BSplineBatch.construct_fast(t, t_offsets, c.reshape(y.shape),
+                                       offsets, k)
+
+
+#################################
+#  Penalized spline smoothing   #
+#################################
+
+def _difference_penalty(n, order, nb):
+    """The penalty ``D.T @ D``, with ``D`` the difference matrix of the given
+    order on `n` coefficients, in the lower banded storage with `nb`
+    subdiagonals (``nb >= order``)."""
+    d = np.array([comb(order, j) * (-1)**(order - j)
+                  for j in range(order + 1)], dtype=float)
+    pb = np.zeros((nb + 1, n), dtype=float)
+    m = n - order
+    for s1 in range(order + 1):
+        for s2 in range(s1 + 1):
+            pb[s1 - s2, s2:s2 + m] += d[s1] * d[s2]
+    return pb
+
+
+def _banded_sym_matvec(ab, c):
+    """Compute ``A @ c`` for the symmetric ``A`` in the lower banded
+    storage `ab` and the 2-D `c`."""
+    out = ab[0][:, None] * c
+    for d in range(1, ab.shape[0]):
+        out[d:] += ab[d, :-d, None] * c[:-d]
+        out[:-d] += ab[d, :-d, None] * c[d:]
+    return out
+
+
+class PSplineAccumulator(object):
+    r"""Accumulate data for a penalized least-squares B-spline (P-spline).
+
+    The data are added in chunks with `add`, which builds the banded normal
+    equations of the least-squares problem in a single pass over each
+    chunk, so that data sets which do not fit in memory can be smoothed.
+    `solve` then returns the spline minimizing
+
+    .. math::
+
+        \sum_j \left(w_j (y_j - S(x_j))\right)^2 +
+        \lambda \sum_i (\Delta^p c_i)^2
+
+    where :math:`\Delta^p` is the difference operator of order `p` on the
+    spline coefficients [1]_.
+
+    Parameters
+    ----------
+    t : array_like, shape (n + k + 1,)
+        Knots. All data must be within the base interval ``t[k] .. t[n]``.
+    k : int, optional
+        B-spline degree. Default is cubic, k=3.
+
+    Attributes
+    ----------
+    t : ndarray
+        knots
+    k : int
+        B-spline degree
+    nobs : int
+        number of data points added
+    lam : float or None
+        the penalty of the last `solve`, or None
+
+    Methods
+    -------
+    add
+    solve
+    gcv
+
+    See Also
+    --------
+    make_pspline : smooth data given at once
+    make_lsq_spline : least-squares spline without a penalty
+
+    Notes
+    -----
+    Only the ``(k+1, n)`` band of the normal equations and the ``(n, ...)``
+    right-hand side are stored, so that the memory use does not depend on
+    the number of data points.
+
+    .. versionadded:: 1.0.0
+
+    References
+    ----------
+    .. [1] P. H. C. Eilers and B. D. Marx, "Flexible smoothing with
+           B-splines and penalties", Statistical Science 11, 89 (1996).
+
+    Examples
+    --------
+    Smooth data arriving in chunks:
+
+    >>> from scipy.interpolate import PSplineAccumulator
+    >>> np.random.seed(1234)
+    >>> t = np.r_[(0,)*3, np.linspace(0, 1, 41), (1,)*3]
+    >>> acc = PSplineAccumulator(t)
+    >>> for i in range(10):
+    ...     x = np.random.rand(10000)
+    ...     y = np.sin(2*np.pi*x) + 0.1*np.random.randn(10000)
+    ...     acc.add(x, y)
+    >>> spl = acc.solve()
+    >>> abs(spl(0.25) - 1) < 0.01
+    True
+
+    """
+    def __init__(self, t, k=3):
+        self.t = _as_float_array(t, True)
+        self.k = operator.index(k)
+        if self.k < 0:
+            raise ValueError("Expect non-negative k.")
+        if self.t.ndim != 1 or np.any(self.t[1:] < self.t[:-1]):
+            raise ValueError("Expect t to be a 1-D sorted array_like.")
+        self._n = self.t.size - self.k - 1
+        if self._n < self.k + 1:
+            raise ValueError("Need at least %d knots for degree %d" %
+                             (2*self.k + 2, self.k))
+        self.nobs = 0
+        self.lam = None
+        self._ab = np.zeros((self.k + 1, self._n), dtype=np.float_,
+                            order='F')
+        self._rhs = None
+        self._yy = 0.
+        self._y_shape = None
+
+    def add(self, x, y, w=None, check_finite=True):
+        """Add a chunk of data.
+
+        Parameters
+        ----------
+        x : array_like, shape (m,)
+            Abscissas, in any order.
+        y : array_like, shape (m, ...)
+            Ordinates. The trailing shape must be the same for all chunks.
+        w : array_like, shape (m,), optional
+            Weights. Default is equal weights.
+        check_finite : bool, optional
+            Whether to check that the input arrays contain only finite
+            numbers. Default is True.
+
+        Returns
+        -------
+        self : PSplineAccumulator
+
+        """
+        x = _as_float_array(x, check_finite)
+        y = _as_float_array(y, check_finite)
+        if w is None:
+            w = np.ones_like(x)
+        else:
+            w = _as_float_array(w, check_finite)
+        if x.ndim != 1 or y.ndim < 1 or x.size != y.shape[0]:
+            raise ValueError('x & y are incompatible.')
+        if w.shape != x.shape:
+            raise ValueError('Incompatible weights.')
+        if self._y_shape is None:
+            self._y_shape = y.shape[1:]
+            self._rhs = np.zeros((self._n, prod(self._y_shape)),
+                                 dtype=y.dtype, order='F')
+        elif y.shape[1:] != self._y_shape:
+            raise ValueError("Expected y with trailing shape %s, got %s." %
+                             (self._y_shape, y.shape[1:]))
+        if x.size == 0:
+            return self
+        if x.min() < self.t[self.k] or x.max() > self.t[self._n]:
+            raise ValueError("Out of bounds: all x must be within "
+                             "[%s, %s]." % (self.t[self.k], self.t[self._n]))
+        if np.iscomplexobj(y) and not np.iscomplexobj(self._rhs):
+            self._rhs = self._rhs.astype(y.dtype, order='F')
+
+        y = y.reshape(x.size, -1)
+        rhs = self._rhs
+        if rhs.dtype != y.dtype:
+            y = y.astype(rhs.dtype)
+        _bspl._norm_eq_lsq(x, self.t, self.k, np.ascontiguousarray(y), w,
+                           self._ab, rhs)
+        self._yy += np.sum(abs(y)**2 * (w**2)[:, None])
+        self.nobs += x.size
+        return self
+
+    def _factor(self, lam, penalty_order):
+        # the banded normal equations with the penalty, and their
+        # Cholesky factor
+        n, k = self._n, self.k
+        nb = max(k, penalty_order)
+        ab = np.zeros((nb + 1, n), dtype=np.float_)
+        ab[:k + 1] = self._ab
+        if lam != 0:
+            ab += lam * _difference_penalty(n, penalty_order, nb)
+        cb = cholesky_banded(ab, lower=True)
+        return cb
+
+    def _fit(self, lam, penalty_order):
+        cb = self._factor(lam, penalty_order)
+        c = cho_solve_banded((cb, True), self._rhs)
+        return c, cb
+
+    def gcv(self, lam, penalty_order=2):
+        r"""Generalized cross-validation score of a penalty.
+
+        The score is
+
+        .. math::
+
+            V(\lambda) = \frac{m \, \mathrm{RSS}(\lambda)}
+                               {(m - \mathrm{tr} H(\lambda))^2}
+
+        where :math:`m` is the number of data points, RSS the weighted
+        residual sum of squares, and :math:`H` the hat matrix. The trace of
+        :math:`H` is computed exactly from the band of the inverse of the
+        normal equations, in time linear in the number of coefficients.
+
+        Parameters
+        ----------
+        lam : float
+            The penalty.
+        penalty_order : int, optional
+            The order of the differences of the penalty. Default is 2.
+
+        Returns
+        -------
+        score : float
+
+        """
+        if self.nobs == 0:
+            raise ValueError("No data have been added.")
+        c, cb = self._fit(lam, penalty_order)
+        return self._gcv(c, cb)
+
+    def _gcv(self, c, cb):
+        rhs = self._rhs
+        # residual sum of squares from the normal equations:
+        # |W y|^2 - 2 c.X'W y + c.X'WX c
+        rss = (self._yy - 2*np.real(np.sum(np.conj(c) * rhs)) +
+               np.real(np.sum(np.conj(c) * _banded_sym_matvec(self._ab, c))))
+        rss = max(rss, 0.)
+
+        # tr(H) = tr(inv(X'WX + lam P) X'WX), from the band of the inverse
+        zb = np.zeros_like(cb)
+        _bspl._banded_inverse(cb, zb)
+        ab = self._ab
+        trace = np.sum(zb[0] * ab[0])
+        for d in range(1, ab.shape[0]):
+            trace += 2*np.sum(zb[d, :-d] * ab[d, :-d])
+
+        m = self.nobs
+        return m * rss / max(m - trace, 1e-10*m)**2
+
+    def solve(self, lam=None, penalty_order=2):
+        """Compute the penalized spline.
+
+        Parameters
+        ----------
+        lam : float, optional
+            The penalty. If None (default), the penalty minimizing the
+            generalized cross-validation score (see `gcv`) is used.
+        penalty_order : int, optional
+            The order of the differences of the penalty. Default is 2, so
+            that the spline tends to a straight line for large `lam`.
+
+        Returns
+        -------
+        spl : BSpline
+            The smoothing spline. The penalty used is stored as `lam`.
+
+        """
+        if self.nobs == 0:
+            raise ValueError("No data have been added.")
+        penalty_order = operator.index(penalty_order)
+        if not 0 <= penalty_order < self._n:
+            raise ValueError("penalty_order must be between 0 and %d." %
+                             (self._n - 1))
+
+        if lam is None:
+            lam = self._minimize_gcv(penalty_order)
+        elif lam < 0:
+            raise ValueError("lam must be non-negative.")
+
+        c, cb = self._fit(lam, penalty_order)
+        self.lam = lam
+        c = np.ascontiguousarray(c.reshape((self._n,) + self._y_shape))
+        return BSpline.construct_fast(self.t, c, self.k)
+
+    def _minimize_gcv(self, penalty_order):
+        from scipy.optimize import minimize_scalar
+
+        # search the penalty relative to the scale of the data term
+        scale = (np.sum(self._ab[0]) /
+                 np.sum(_difference_penalty(self._n, penalty_order,
+                                            penalty_order)[0]))
+
+        def score(log_lam):
+            try:
+                return self.gcv(scale * 10**log_lam, penalty_order)
+            except LinAlgError:
+                return np.inf
+
+        grid = np.linspace(-10, 10, 41)
+        scores = [score(g) for g in grid]
+        i = int(np.argmin(scores))
+        if not np.isfinite(scores[i]):
+            raise LinAlgError("Normal equations are singular for all "
+                              "penalties.")
+        lo, hi = grid[max(i - 1, 0)], grid[min(i + 1, grid.size - 1)]
+        res = minimize_scalar(score, bounds=(lo, hi), method='bounded',
+                              options=dict(xatol=1e-3))
+        log_lam = res.x if res.fun < scores[i] else grid[i]
+        return scale * 10**log_lam
+
+
+def make_pspline(x, y, t=None, k=3, w=None, lam=None, penalty_order=2,
+                 nknots=None, check_finite=True):
+    """Compute a penalized least-squares B-spline (P-spline).
+
+    Parameters
+    ----------
+    x : array_like, shape (m,)
+        Abscissas.
+    y : array_like, shape (m, ...)
+        Ordinates.
+    t : array_like, shape (n + k + 1,), optional
+        Knots. Default is `nknots` uniformly spaced knots over the range
+        of `x`, with boundary knots of multiplicity ``k+1``.
+    k : int, optional
+        B-spline degree. Default is cubic, k=3.
+    w : array_like, shape (m,), optional
+        Weights. Default is equal weights.
+    lam : float, optional
+        The penalty. If None (default), it is chosen by generalized
+        cross-validation.
+    penalty_order : int, optional
+        The order of the coefficient differences penalized. Default is 2.
+    nknots : int, optional
+        Number of distinct knots if `t` is not given. Default is
+        ``min(m // 4, 100)``, and at least 2.
+    check_finite : bool, optional
+        Whether to check that the input arrays contain only finite numbers.
+        Default is True.
+
+    Returns
+    -------
+    spl : BSpline
+        The smoothing spline.
+
+    See Also
+    --------
+    PSplineAccumulator : smooth data given in chunks, with more details
+    make_lsq_spline : least-squares spline without a penalty
+    UnivariateSpline : FITPACK smoothing spline with adaptive knots
+
+    Notes
+    -----
+    The fit builds the banded normal equations in one pass over the data,
+    and its cost for each penalty does not depend on the number of data
+    points, which makes it suited to very large data sets.
+
+    .. versionadded:: 1.0.0
+
+    Examples
+    --------
+    >>> from scipy.interpolate import make_pspline
+    >>> np.random.seed(1234)
+    >>> x = np.sort(np.random.rand(10000))
+    >>> y = np.sin(2*np.pi*x) + 0.2*np.random.randn(x.size)
+    >>> spl = make_pspline(x, y)
+    >>> xs = np.linspace(0, 1, 201)
+    >>> np.abs(spl(xs) - np.sin(2*np.pi*xs)).max() < 0.1
+    True
+
+    """
+    x = _as_float_array(x, check_finite)
+    if t is None:
+        if x.ndim != 1 or x.size == 0:
+            raise ValueError("Expect x to be a non-empty 1-D array_like.")
+        if nknots is None:
+            nknots = max(min(x.size // 4, 100), 2)
+        xmin, xmax = x.min(), x.max()
+        t = np.r_[(xmin,)*k, np.linspace(xmin, xmax, nknots), (xmax,)*k]
+
+    acc = PSplineAccumulator(t, k)
+    acc.add(x, y, w, check_finite=check_finite)
+    return acc.solve(lam, penalty_order)
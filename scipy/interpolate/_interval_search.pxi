@@ -0,0 +1,67 @@
+# -*- cython -*-
+#
+# Interval search shared by the piecewise polynomial (_ppoly) and B-spline
+# (_bspl) evaluation routines.
+#
+
+cdef inline int _search_interval(const double *x, int lo, int hi,
+                                 double xval, int hint) nogil:
+    """
+    Find ``l`` in ``[lo, hi-1]`` such that ``x[l] <= xval < x[l+1]``, given
+    that ``x[lo] <= xval < x[hi]`` for the non-decreasing array `x`.
+
+    The interval `hint` of a previous point and the one following it are
+    tried first, and then the interval `xval` would be in if ``x[lo:hi+1]``
+    were uniformly spaced. Otherwise the search gallops away from the latter
+    guess before bisecting. Sorted points are so located in time linear in
+    the number of points and intervals, points on uniformly spaced
+    breakpoints in O(1), and other points in O(log(hi - lo)).
+    """
+    cdef int l, r, mid, step
+
+    if hint < lo:
+        hint = lo
+    elif hint > hi - 1:
+        hint = hi - 1
+    if x[hint] <= xval:
+        if xval < x[hint+1]:
+            return hint
+        if hint + 1 < hi and xval < x[hint+2]:
+            return hint + 1
+
+    hint = lo + <int>((xval - x[lo]) / (x[hi] - x[lo]) * (hi - lo))
+    if hint < lo:
+        hint = lo
+    elif hint > hi - 1:
+        hint = hi - 1
+    if x[hint] <= xval < x[hint+1]:
+        return hint
+
+    step = 1
+    if xval >= x[hint+1]:
+        l = hint + 1
+        r = l + 1
+        while r < hi and x[r] <= xval:
+            l = r
+            step *= 2
+            r = l + step
+        if r > hi:
+            r = hi
+    else:
+        r = hint
+        l = r - 1
+        while l > lo and x[l] > xval:
+            r = l
+            step *= 2
+            l = r - step
+        if l < lo:
+            l = lo
+
+    # bisect, keeping x[l] <= xval < x[r]
+    while r - l > 1:
+        mid = l + (r - l) // 2
+        if x[mid] <= xval:
+            l = mid
+        else:
+            r = mid
+    return l
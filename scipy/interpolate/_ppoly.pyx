@@ -29,6 +29,8 @@ cdef extern from "numpy/npy_math.h":
 
 DEF MAX_DIMS = 64
 
+include "_interval_search.pxi"
+
 #------------------------------------------------------------------------------
 # Piecewise power basis polynomials
 #------------------------------------------------------------------------------
@@ -593,7 +595,7 @@ cdef int find_interval_ascending(double *x,
         Suitable interval or -1 if nan.
 
     """
-    cdef int interval, high, low, mid
+    cdef int interval
     cdef double a, b
 
     a = x[0]
@@ -619,30 +621,8 @@ cdef int find_interval_ascending(double *x,
         interval = nx - 2
     else:
         # Find the interval the coordinate is in
-        # (binary search with locality)
-        if xval >= x[interval]:
-            low = interval
-            high = nx - 2
-        else:
-            low = 0
-            high = interval
-
-        if xval < x[low+1]:
-            high = low
-
-        while low < high:
-            mid = (high + low)//2
-            if xval < x[mid]:
-                # mid < high
-                high = mid
-            elif xval >= x[mid + 1]:
-                low = mid + 1
-            else:
-                # x[mid] <= xval < x[mid+1]
-                low = mid
-                break
-
-        interval = low
+        # (search with locality, see _search_interval)
+        interval = _search_interval(x, 0, nx - 1, xval, interval)
 
     return interval
 
@@ -0,0 +1,399 @@
+"""
+Compiled evaluation kernels for RegularGridInterpolator.
+
+The interpolation stencil of each point is located and evaluated in a
+single pass, without the per-corner index and weight temporaries of the
+NumPy implementation. The kernels release the GIL, so that disjoint ranges
+of points can be evaluated in parallel threads.
+
+"""
+
+cimport cython
+cimport numpy as np
+import numpy as np
+
+from libc.stdlib cimport malloc, free
+from libc.math cimport fabs
+
+cdef extern from "numpy/npy_math.h":
+    double nan "NPY_NAN"
+
+np.import_array()
+
+DEF MAX_DIMS = 32
+
+DEF LINEAR = 0
+DEF NEAREST = 1
+DEF CUBIC = 2
+DEF PCHIP = 3
+
+# codes of the ``method`` names of the interpolator
+METHODS = {'linear': LINEAR, 'nearest': NEAREST, 'cubic': CUBIC,
+           'pchip': PCHIP}
+
+
+#------------------------------------------------------------------------------
+# Interval search
+#------------------------------------------------------------------------------
+
+@cython.cdivision(True)
+cdef inline np.intp_t _find_interval(const double *g, np.intp_t n, double x,
+                                     double inv_dx, bint uniform,
+                                     np.intp_t hint) nogil:
+    """
+    Find ``i`` in ``[0, n-2]`` such that ``g[i] <= x < g[i+1]``, clamping
+    points outside the grid to the first and last interval.
+
+    For a uniform grid the index is computed directly; otherwise the
+    interval `hint` of the previous point is tried before a binary search.
+    """
+    cdef np.intp_t lo, hi, mid
+    cdef double f
+
+    if x <= g[0]:
+        return 0
+    if x >= g[n-1]:
+        return n - 2
+
+    if uniform:
+        f = (x - g[0]) * inv_dx
+        if f >= n - 2:
+            lo = n - 2
+        else:
+            lo = <np.intp_t>f
+        # correct for rounding in the computed spacing
+        if lo < n - 2 and x >= g[lo+1]:
+            lo += 1
+        elif lo > 0 and x < g[lo]:
+            lo -= 1
+        return lo
+
+    if 0 <= hint <= n - 2 and g[hint] <= x < g[hint+1]:
+        return hint
+
+    lo = 0
+    hi = n - 1
+    while hi - lo > 1:
+        mid = (lo + hi) >> 1
+        if g[mid] <= x:
+            lo = mid
+        else:
+            hi = mid
+    return lo
+
+
+#------------------------------------------------------------------------------
+# One-dimensional cubic weights
+#------------------------------------------------------------------------------
+
+@cython.cdivision(True)
+cdef inline void _add_derivative(const double *g, np.intp_t n, np.intp_t j,
+                                 np.intp_t base, double scale,
+                                 double *w) nogil:
+    """
+    Add ``scale`` times the coefficients of the finite difference estimate
+    of the derivative at node `j` to the stencil weights `w`, where node
+    ``k`` has stencil position ``k - base``.
+
+    The estimate is the derivative of the quadratic through three
+    neighbouring nodes (one-sided at the ends of the grid), or the secant
+    slope if the grid has only two nodes.
+    """
+    cdef double h0, h1
+
+    if n == 2:
+        h0 = g[1] - g[0]
+        w[0 - base] -= scale / h0
+        w[1 - base] += scale / h0
+    elif j == 0:
+        h0 = g[1] - g[0]
+        h1 = g[2] - g[1]
+        w[0 - base] -= scale * (2*h0 + h1) / (h0 * (h0 + h1))
+        w[1 - base] += scale * (h0 + h1) / (h0 * h1)
+        w[2 - base] -= scale * h0 / (h1 * (h0 + h1))
+    elif j == n - 1:
+        h0 = g[n-2] - g[n-3]
+        h1 = g[n-1] - g[n-2]
+        w[n-3 - base] += scale * h1 / (h0 * (h0 + h1))
+        w[n-2 - base] -= scale * (h0 + h1) / (h0 * h1)
+        w[n-1 - base] += scale * (2*h1 + h0) / (h1 * (h0 + h1))
+    else:
+        h0 = g[j] - g[j-1]
+        h1 = g[j+1] - g[j]
+        w[j-1 - base] -= scale * h1 / (h0 * (h0 + h1))
+        w[j - base] += scale * (h1 - h0) / (h0 * h1)
+        w[j+1 - base] += scale * h0 / (h1 * (h0 + h1))
+
+
+cdef inline void _cubic_weights(const double *g, np.intp_t n, np.intp_t i,
+                                double t, double *w) nogil:
+    """
+    Weights of the nodes ``i-1, ..., i+2`` for the cubic Hermite
+    interpolant on ``[g[i], g[i+1]]`` with finite difference derivatives.
+    """
+    cdef double h = g[i+1] - g[i]
+    cdef double t2 = t*t, t3 = t*t*t
+
+    w[0] = 0
+    w[1] = 2*t3 - 3*t2 + 1
+    w[2] = -2*t3 + 3*t2
+    w[3] = 0
+    _add_derivative(g, n, i, i - 1, h * (t3 - 2*t2 + t), w)
+    _add_derivative(g, n, i + 1, i - 1, h * (t3 - t2), w)
+
+
+@cython.cdivision(True)
+cdef inline double _pchip_interior(double h0, double h1, double d0,
+                                   double d1) nogil:
+    # weighted harmonic mean of the slopes, as in PchipInterpolator
+    cdef double w1, w2
+    if d0 == 0 or d1 == 0 or (d0 > 0) != (d1 > 0):
+        return 0
+    w1 = 2*h1 + h0
+    w2 = h1 + 2*h0
+    return (w1 + w2) / (w1/d0 + w2/d1)
+
+
+@cython.cdivision(True)
+cdef inline double _pchip_edge(double h0, double h1, double m0,
+                               double m1) nogil:
+    # shape-preserving three-point end derivative, as in PchipInterpolator
+    cdef double d = ((2*h0 + h1)*m0 - h0*m1) / (h0 + h1)
+    if (d > 0) != (m0 > 0) or d == 0 or m0 == 0:
+        return 0
+    if (m0 > 0) != (m1 > 0) and fabs(d) > 3*fabs(m0):
+        return 3*m0
+    return d
+
+
+@cython.cdivision(True)
+cdef inline double _pchip_1d(const double *g, np.intp_t n, np.intp_t i,
+                             double t, const double *y) nogil:
+    """
+    Evaluate the PCHIP interpolant on ``[g[i], g[i+1]]`` from the values
+    `y` at the nodes ``i-1, ..., i+2`` (those outside the grid are unused).
+    """
+    cdef double h = g[i+1] - g[i]
+    cdef double hl = 0, hr = 0, d0 = 0, d1, d2 = 0, m1, m2
+    cdef double t2 = t*t, t3 = t*t*t
+    cdef bint has_left = i > 0, has_right = i + 2 <= n - 1
+
+    d1 = (y[2] - y[1]) / h
+    if has_left:
+        hl = g[i] - g[i-1]
+        d0 = (y[1] - y[0]) / hl
+    if has_right:
+        hr = g[i+2] - g[i+1]
+        d2 = (y[3] - y[2]) / hr
+
+    if has_left:
+        m1 = _pchip_interior(hl, h, d0, d1)
+    elif has_right:
+        m1 = _pchip_edge(h, hr, d1, d2)
+    else:
+        m1 = d1
+    if has_right:
+        m2 = _pchip_interior(h, hr, d1, d2)
+    elif has_left:
+        m2 = _pchip_edge(h, hl, d1, d0)
+    else:
+        m2 = d1
+
+    return ((2*t3 - 3*t2 + 1)*y[1] + (t3 - 2*t2 + t)*h*m1 +
+            (-2*t3 + 3*t2)*y[2] + (t3 - t2)*h*m2)
+
+
+#------------------------------------------------------------------------------
+# Stencil traversal
+#------------------------------------------------------------------------------
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef inline void _stencil_sum(np.intp_t ndim, np.intp_t npts,
+                              const double *w, const np.intp_t *off,
+                              double[:,::1] values, double[:,::1] out,
+                              np.intp_t p, double *buf,
+                              np.intp_t col) nogil:
+    """
+    Visit the ``npts**ndim`` stencil nodes in C order, with node ``m`` in
+    dimension ``d`` at row offset ``off[npts*d + m]`` of `values` and with
+    weight ``w[npts*d + m]``.
+
+    If `buf` is NULL, the weighted sum of the rows of the nodes is added to
+    ``out[p]``; otherwise column `col` of the nodes is gathered into `buf`. The partial weights and offsets of the leading dimensions are
+    kept, so that each node costs O(1) operations on average.
+    """
+    cdef np.intp_t count[MAX_DIMS]
+    cdef double pw[MAX_DIMS + 1]
+    cdef np.intp_t po[MAX_DIMS + 1]
+    cdef np.intp_t d, k, node = 0, nvalues = values.shape[1]
+
+    pw[0] = 1
+    po[0] = 0
+    d = 0
+    for k in range(ndim):
+        count[k] = 0
+
+    while True:
+        # update the partial products from the changed dimension on
+        while d < ndim:
+            pw[d+1] = pw[d] * w[npts*d + count[d]]
+            po[d+1] = po[d] + off[npts*d + count[d]]
+            d += 1
+
+        if buf != NULL:
+            buf[node] = values[po[ndim], col]
+        elif pw[ndim] != 0:
+            for k in range(nvalues):
+                out[p, k] += pw[ndim] * values[po[ndim], k]
+        node += 1
+
+        d = ndim - 1
+        count[d] += 1
+        while count[d] == npts:
+            count[d] = 0
+            d -= 1
+            if d < 0:
+                return
+            count[d] += 1
+
+
+#------------------------------------------------------------------------------
+# N-D evaluation
+#------------------------------------------------------------------------------
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.cdivision(True)
+def evaluate(int method,
+             double[::1] grid,
+             np.intp_t[::1] grid_start,
+             np.intp_t[::1] grid_size,
+             double[::1] grid_inv_dx,
+             np.uint8_t[::1] grid_uniform,
+             np.intp_t[::1] strides,
+             double[:,::1] values,
+             double[:,::1] xi,
+             double[:,::1] out,
+             bint use_fill,
+             double fill_value,
+             np.intp_t start,
+             np.intp_t stop):
+    """
+    evaluate(method, grid, grid_start, grid_size, grid_inv_dx, grid_uniform,
+             strides, values, xi, out, use_fill, fill_value, start, stop)
+
+    Interpolate at the points ``xi[start:stop]`` into ``out[start:stop]``.
+
+    The grid points of dimension ``d`` are
+    ``grid[grid_start[d]:grid_start[d] + grid_size[d]]``, with the
+    reciprocal spacing ``grid_inv_dx[d]`` if ``grid_uniform[d]`` is set.
+    `values` holds the data with the grid dimensions flattened in C order
+    (with the given `strides`, in rows) and the trailing dimensions in
+    columns. Points outside the grid are set to `fill_value` if `use_fill`
+    is true, and extrapolated otherwise.
+    """
+    cdef np.intp_t ndim = xi.shape[1], nvalues = values.shape[1]
+    cdef np.intp_t p, d, k, m, offset, n, j, s, nstencil, line
+    cdef np.intp_t idx[MAX_DIMS]
+    cdef np.intp_t off[4*MAX_DIMS]
+    cdef np.intp_t hint[MAX_DIMS]
+    cdef double t[MAX_DIMS]
+    cdef double w[4*MAX_DIMS]
+    cdef double x
+    cdef const double *g
+    cdef double *buf = NULL
+    cdef bint outside, isnan
+
+    if ndim > MAX_DIMS:
+        raise ValueError("too many dimensions (maximum is %d)" % MAX_DIMS)
+    if method not in (LINEAR, NEAREST, CUBIC, PCHIP):
+        raise ValueError("unknown method %d" % method)
+    if method in (CUBIC, PCHIP) and ndim > 12:
+        raise ValueError("too many dimensions for method (maximum is 12)")
+
+    nstencil = 1
+    for d in range(ndim):
+        hint[d] = 0
+        if method in (CUBIC, PCHIP):
+            nstencil *= 4
+
+    if method == PCHIP:
+        buf = <double *>malloc(nstencil * sizeof(double))
+        if not buf:
+            raise MemoryError()
+
+    with nogil:
+        for p in range(start, stop):
+            outside = False
+            isnan = False
+            for d in range(ndim):
+                x = xi[p, d]
+                n = grid_size[d]
+                g = &grid[grid_start[d]]
+                if x != x:
+                    isnan = True
+                    break
+                if x < g[0] or x > g[n-1]:
+                    outside = True
+                idx[d] = _find_interval(g, n, x, grid_inv_dx[d],
+                                        grid_uniform[d], hint[d])
+                hint[d] = idx[d]
+                t[d] = (x - g[idx[d]]) / (g[idx[d]+1] - g[idx[d]])
+
+            if isnan or (outside and use_fill):
+                for k in range(nvalues):
+                    out[p, k] = nan if isnan else fill_value
+                continue
+
+            if method == NEAREST:
+                offset = 0
+                for d in range(ndim):
+                    offset += (idx[d] + (t[d] > 0.5)) * strides[d]
+                for k in range(nvalues):
+                    out[p, k] = values[offset, k]
+                continue
+
+            for k in range(nvalues):
+                out[p, k] = 0
+
+            if method == LINEAR:
+                for d in range(ndim):
+                    w[2*d] = 1 - t[d]
+                    w[2*d + 1] = t[d]
+                    off[2*d] = idx[d] * strides[d]
+                    off[2*d + 1] = (idx[d] + 1) * strides[d]
+                _stencil_sum(ndim, 2, w, off, values, out, p, NULL, 0)
+                continue
+
+            for d in range(ndim):
+                if method == CUBIC:
+                    _cubic_weights(&grid[grid_start[d]], grid_size[d],
+                                   idx[d], t[d], &w[4*d])
+                for m in range(4):
+                    # nodes outside the grid carry no weight, and are not
+                    # used by _pchip_1d
+                    j = idx[d] - 1 + m
+                    if j < 0:
+                        j = 0
+                    elif j > grid_size[d] - 1:
+                        j = grid_size[d] - 1
+                    off[4*d + m] = j * strides[d]
+
+            if method == CUBIC:
+                _stencil_sum(ndim, 4, w, off, values, out, p, NULL, 0)
+                continue
+
+            for k in range(nvalues):
+                _stencil_sum(ndim, 4, w, off, values, out, p, buf, k)
+
+                # reduce the stencil one dimension at a time, last first
+                line = nstencil
+                for d in range(ndim - 1, -1, -1):
+                    line //= 4
+                    for s in range(line):
+                        buf[s] = _pchip_1d(&grid[grid_start[d]], grid_size[d],
+                                           idx[d], t[d], &buf[4*s])
+                out[p, k] = buf[0]
+
+    free(buf)
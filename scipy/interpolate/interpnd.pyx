@@ -305,6 +305,44 @@ class LinearNDInterpolator(NDInterpolatorBase):
         return out
 
 
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def _find_simplices(tri, double[:,::1] xi, int[::1] isimplex,
+                    double[:,::1] barycentric, Py_ssize_t start_point,
+                    Py_ssize_t stop_point):
+    """
+    Locate the points ``xi[start_point:stop_point]`` in the triangulation
+    `tri`, storing the simplex indices (-1 outside the hull) and the
+    barycentric coordinates in `isimplex` and `barycentric`.
+
+    The GIL is released during the search, so disjoint ranges of points can
+    be processed in parallel threads.
+    """
+    cdef double c[NPY_MAXDIMS]
+    cdef int j, ndim, start
+    cdef Py_ssize_t i
+    cdef qhull.DelaunayInfo_t info
+    cdef double eps, eps_broad
+
+    ndim = xi.shape[1]
+    start = 0
+
+    qhull._get_delaunay_info(&info, tri, 1, 0, 0)
+
+    eps = 100 * DBL_EPSILON
+    eps_broad = sqrt(DBL_EPSILON)
+
+    with nogil:
+        for i in range(start_point, stop_point):
+            # the walk starts from the simplex of the previous point
+            isimplex[i] = qhull._find_simplex(&info, c, &xi[0,0] + i*ndim,
+                                              &start, eps, eps_broad)
+            if isimplex[i] == -1:
+                continue
+            for j in range(ndim+1):
+                barycentric[i,j] = c[j]
+
+
 #------------------------------------------------------------------------------
 # Gradient estimation in 2D
 #------------------------------------------------------------------------------
@@ -22,12 +22,14 @@ import scipy.special as spec
 from scipy.special import comb
 
 from scipy._lib.six import xrange, integer_types, string_types
+from scipy._lib._util import _threaded_ranges
 
 from . import fitpack
 from . import dfitpack
 from . import _fitpack
 from .polyint import _Interpolator1D
 from . import _ppoly
+from . import _rgi
 from .fitpack2 import RectBivariateSpline
 from .interpnd import _ndim_coords_from_arrays
 from ._bsplines import make_interp_spline, BSpline
@@ -2254,9 +2256,9 @@ class RegularGridInterpolator(object):
     Interpolation on a regular grid in arbitrary dimensions
 
     The data must be defined on a regular grid; the grid spacing however may be
-    uneven.  Linear and nearest-neighbour interpolation are supported. After
-    setting up the interpolator object, the interpolation method (*linear* or
-    *nearest*) may be chosen at each evaluation.
+    uneven.  Linear, nearest-neighbour, cubic and monotone cubic (PCHIP)
+    interpolation are supported. After setting up the interpolator object, the
+    interpolation method may be chosen at each evaluation.
 
     Parameters
     ----------
@@ -2267,9 +2269,9 @@ class RegularGridInterpolator(object):
         The data on the regular grid in n dimensions.
 
     method : str, optional
-        The method of interpolation to perform. Supported are "linear" and
-        "nearest". This parameter will become the default for the object's
-        ``__call__`` method. Default is "linear".
+        The method of interpolation to perform. Supported are "linear",
+        "nearest", "cubic" and "pchip". This parameter will become the default
+        for the object's ``__call__`` method. Default is "linear".
 
     bounds_error : bool, optional
         If True, when interpolated values are requested outside of the
@@ -2291,6 +2293,17 @@ class RegularGridInterpolator(object):
     avoids expensive triangulation of the input data by taking advantage of the
     regular grid structure.
 
+    The "cubic" method is the tensor product of one-dimensional cubic Hermite
+    interpolants, whose derivatives at the grid points are estimated with
+    three-point finite differences; it reproduces quadratic data exactly. The
+    "pchip" method is the tensor product of `PchipInterpolator` along each
+    dimension, and does not overshoot the data in one dimension. Both use the
+    4 grid points nearest to the evaluation point in each dimension.
+
+    Real-valued data are interpolated with compiled code that releases the
+    GIL. Evaluation points are processed in blocks, and grid intervals are
+    found directly on uniformly spaced dimensions and by bisection otherwise.
+
     .. versionadded:: 0.14
 
     Examples
@@ -2344,9 +2357,12 @@ class RegularGridInterpolator(object):
     # this class is based on code originally programmed by Johannes Buchner,
     # see https://github.com/JohannesBuchner/regulargrid
 
+    # number of evaluation points processed at a time by the compiled kernels
+    _block_size = 65536
+
     def __init__(self, points, values, method="linear", bounds_error=True,
                  fill_value=np.nan):
-        if method not in ["linear", "nearest"]:
+        if method not in _rgi.METHODS:
             raise ValueError("Method '%s' is not defined" % method)
         self.method = method
         self.bounds_error = bounds_error
@@ -2384,8 +2400,27 @@ class RegularGridInterpolator(object):
                                  "dimension %d" % (len(p), values.shape[i], i))
         self.grid = tuple([np.asarray(p) for p in points])
         self.values = values
+        self._setup_grid()
+
+    def _setup_grid(self):
+        # concatenated grid description for the compiled kernels
+        sizes = np.array([p.size for p in self.grid], dtype=np.intp)
+        self._grid_size = sizes
+        self._grid_start = np.concatenate(([0], np.cumsum(sizes)[:-1])
+                                          ).astype(np.intp)
+        self._grid_cat = np.ascontiguousarray(np.concatenate(self.grid),
+                                              dtype=float)
+        self._grid_uniform = np.zeros(len(self.grid), dtype=np.uint8)
+        self._grid_inv_dx = np.zeros(len(self.grid))
+        for i, p in enumerate(self.grid):
+            if p.size < 2:
+                continue
+            h = (p[-1] - p[0]) / (p.size - 1)
+            if np.allclose(np.diff(p), h, rtol=1e-8, atol=0):
+                self._grid_uniform[i] = 1
+                self._grid_inv_dx[i] = 1. / h
 
-    def __call__(self, xi, method=None):
+    def __call__(self, xi, method=None, workers=1):
         """
         Interpolation at coordinates
 
@@ -2395,12 +2430,18 @@ class RegularGridInterpolator(object):
             The coordinates to sample the gridded data at
 
         method : str
-            The method of interpolation to perform. Supported are "linear" and
-            "nearest".
+            The method of interpolation to perform. Supported are "linear",
+            "nearest", "cubic" and "pchip".
+
+        workers : int, optional
+            Number of threads to evaluate the points with. If -1 is given all
+            CPU threads are used. Default: 1.
+
+            .. versionadded:: 1.0.0
 
         """
         method = self.method if method is None else method
-        if method not in ["linear", "nearest"]:
+        if method not in _rgi.METHODS:
             raise ValueError("Method '%s' is not defined" % method)
 
         ndim = len(self.grid)
@@ -2413,13 +2454,35 @@ class RegularGridInterpolator(object):
         xi_shape = xi.shape
         xi = xi.reshape(-1, xi_shape[-1])
 
-        if self.bounds_error:
+        if self.bounds_error and xi.shape[0] > 0:
             for i, p in enumerate(xi.T):
-                if not np.logical_and(np.all(self.grid[i][0] <= p),
-                                      np.all(p <= self.grid[i][-1])):
+                # NaN coordinates fail the comparison and are out of bounds
+                if not (self.grid[i][0] <= np.min(p) and
+                        np.max(p) <= self.grid[i][-1]):
                     raise ValueError("One of the requested xi is out of bounds "
                                      "in dimension %d" % i)
 
+        values = self.values
+        compiled = (isinstance(values, np.ndarray) and
+                    values.dtype.kind in 'fc' and
+                    np.isrealobj(xi) and
+                    all(p.size >= 2 for p in self.grid))
+        if method in ("cubic", "pchip"):
+            if not compiled:
+                values = np.asarray(values)
+                if (values.dtype.kind not in 'fc' or
+                        any(p.size < 2 for p in self.grid)):
+                    raise ValueError("Method '%s' needs at least 2 points in "
+                                     "each dimension and floating point "
+                                     "values" % method)
+            if method == "pchip" and np.iscomplexobj(values):
+                raise ValueError("Method 'pchip' does not support complex "
+                                 "values")
+            compiled = True
+        if compiled:
+            result = self._evaluate_compiled(method, values, xi, workers)
+            return result.reshape(xi_shape[:-1] + values.shape[ndim:])
+
         indices, norm_distances, out_of_bounds = self._find_indices(xi.T)
         if method == "linear":
             result = self._evaluate_linear(indices,
@@ -2434,6 +2497,52 @@ class RegularGridInterpolator(object):
 
         return result.reshape(xi_shape[:-1] + self.values.shape[ndim:])
 
+    def _evaluate_compiled(self, method, values, xi, workers,
+                           fill_value=None):
+        use_fill = not self.bounds_error and self.fill_value is not None
+        if fill_value is None:
+            fill_value = self.fill_value if use_fill else 0.
+        if np.iscomplexobj(values):
+            # the methods are linear in the data, so that the real and
+            # imaginary parts can be interpolated separately
+            fill_value = complex(fill_value)
+            result = self._evaluate_compiled(method, values.real, xi, workers,
+                                             fill_value.real)
+            result = result + 1j*self._evaluate_compiled(
+                method, values.imag, xi, workers, fill_value.imag)
+            return result
+
+        ndim = len(self.grid)
+        shape = values.shape
+        dtype = values.dtype
+        values = values.reshape(int(np.prod(shape[:ndim])),
+                                int(np.prod(shape[ndim:])))
+        strides = np.ones(ndim, dtype=np.intp)
+        for i in range(ndim - 2, -1, -1):
+            strides[i] = strides[i + 1] * shape[i + 1]
+
+        values = np.ascontiguousarray(values, dtype=float)
+        out = np.empty((xi.shape[0], values.shape[1]), dtype=float)
+        code = _rgi.METHODS[method]
+        block = self._block_size
+
+        def _evaluate(start, stop):
+            for b in range(start, stop, block):
+                # convert the coordinates one block at a time
+                x = np.ascontiguousarray(xi[b:min(b + block, stop)],
+                                         dtype=float)
+                _rgi.evaluate(code, self._grid_cat, self._grid_start,
+                              self._grid_size, self._grid_inv_dx,
+                              self._grid_uniform, strides, values, x,
+                              out[b:b + x.shape[0]], use_fill, fill_value,
+                              0, x.shape[0])
+
+        _threaded_ranges(_evaluate, xi.shape[0], workers)
+
+        if method == "nearest" and dtype != out.dtype:
+            out = out.astype(dtype)
+        return out.reshape((xi.shape[0],) + shape[ndim:])
+
     def _evaluate_linear(self, indices, norm_distances, out_of_bounds):
         # slice for broadcasting over trailing dimensions in self.values
         vslice = (slice(None),) + (None,)*(self.values.ndim - len(indices))
@@ -2493,9 +2602,9 @@ def interpn(points, values, xi, method="linear", bounds_error=True,
         The coordinates to sample the gridded data at
 
     method : str, optional
-        The method of interpolation to perform. Supported are "linear" and
-        "nearest", and "splinef2d". "splinef2d" is only supported for
-        2-dimensional data.
+        The method of interpolation to perform. Supported are "linear",
+        "nearest", "cubic", "pchip" and "splinef2d". "splinef2d" is only
+        supported for 2-dimensional data.
 
     bounds_error : bool, optional
         If True, when interpolated values are requested outside of the
@@ -2526,17 +2635,17 @@ def interpn(points, values, xi, method="linear", bounds_error=True,
     LinearNDInterpolator : Piecewise linear interpolant on unstructured data
                            in N dimensions
 
-    RegularGridInterpolator : Linear and nearest-neighbor Interpolation on a
-                              regular grid in arbitrary dimensions
+    RegularGridInterpolator : Linear, nearest-neighbor and cubic interpolation
+                              on a regular grid in arbitrary dimensions
 
     RectBivariateSpline : Bivariate spline approximation over a rectangular mesh
 
     """
     # sanity check 'method' kwarg
-    if method not in ["linear", "nearest", "splinef2d"]:
+    if method not in ["linear", "nearest", "cubic", "pchip", "splinef2d"]:
         raise ValueError("interpn only understands the methods 'linear', "
-                         "'nearest', and 'splinef2d'. You provided %s." %
-                         method)
+                         "'nearest', 'cubic', 'pchip' and 'splinef2d'. You "
+                         "provided %s." % method)
 
     if not hasattr(values, 'ndim'):
         values = np.asarray(values)
@@ -2583,13 +2692,8 @@ def interpn(points, values, xi, method="linear", bounds_error=True,
                              "in dimension %d" % i)
 
     # perform interpolation
-    if method == "linear":
-        interp = RegularGridInterpolator(points, values, method="linear",
-                                         bounds_error=bounds_error,
-                                         fill_value=fill_value)
-        return interp(xi)
-    elif method == "nearest":
-        interp = RegularGridInterpolator(points, values, method="nearest",
+    if method in ("linear", "nearest", "cubic", "pchip"):
+        interp = RegularGridInterpolator(points, values, method=method,
                                          bounds_error=bounds_error,
                                          fill_value=fill_value)
         return interp(xi)
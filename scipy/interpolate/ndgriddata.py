@@ -8,11 +8,13 @@ from __future__ import division, print_function, absolute_import
 
 import numpy as np
 from .interpnd import LinearNDInterpolator, NDInterpolatorBase, \
-     CloughTocher2DInterpolator, _ndim_coords_from_arrays
-from scipy.spatial import cKDTree
+     CloughTocher2DInterpolator, _ndim_coords_from_arrays, _find_simplices
+from scipy.spatial import cKDTree, Delaunay
+from scipy.sparse import csr_matrix
+from scipy._lib._util import _threaded_ranges
 
 __all__ = ['griddata', 'NearestNDInterpolator', 'LinearNDInterpolator',
-           'CloughTocher2DInterpolator']
+           'CloughTocher2DInterpolator', 'linear_interpolation_matrix']
 
 #------------------------------------------------------------------------------
 # Nearest-neighbour interpolation
@@ -223,3 +225,117 @@ def griddata(points, values, xi, method='linear', fill_value=np.nan,
     else:
         raise ValueError("Unknown interpolation method %r for "
                          "%d dimensional data" % (method, ndim))
+
+
+#------------------------------------------------------------------------------
+# Precomputed linear interpolation
+#------------------------------------------------------------------------------
+
+def linear_interpolation_matrix(points, xi, rescale=False, workers=1):
+    """
+    Sparse matrix of piecewise linear interpolation weights.
+
+    Locates the points `xi` in the Delaunay triangulation of `points` once
+    and returns the barycentric interpolation weights as a sparse matrix
+    ``W``, such that ``W.dot(values)`` gives the same result as
+    ``LinearNDInterpolator(points, values)(xi)`` for points inside the
+    convex hull. This is useful when many sets of values, given on the
+    same data points, are interpolated onto the same points `xi`.
+
+    Parameters
+    ----------
+    points : ndarray of floats, shape (npoints, ndims); or Delaunay
+        Data point coordinates, or a precomputed Delaunay triangulation.
+    xi : ndarray of float, shape (..., ndims)
+        Points at which to interpolate data.
+    rescale : bool, optional
+        Rescale points to unit cube before performing interpolation.
+        This is useful if some of the input dimensions have
+        incommensurable units and differ by many orders of magnitude.
+    workers : int, optional
+        Number of threads used for locating the points `xi`; -1 means one
+        thread per processor. Default is 1.
+
+    Returns
+    -------
+    W : csr_matrix, shape (M, npoints)
+        The interpolation matrix, where ``M`` is the number of points in
+        `xi`. Each row holds the ``ndims + 1`` barycentric weights of the
+        enclosing simplex; the rows of points outside the convex hull are
+        empty.
+
+    See Also
+    --------
+    LinearNDInterpolator, griddata
+
+    Notes
+    -----
+    Whether a point lies outside the convex hull can be read off the
+    matrix as ``np.diff(W.indptr) == 0``; this can be used to apply a
+    fill value.
+
+    .. versionadded:: 1.0.0
+
+    Examples
+    --------
+    >>> from scipy.interpolate import linear_interpolation_matrix
+    >>> points = np.random.rand(100, 2)
+    >>> grid_x, grid_y = np.mgrid[0:1:50j, 0:1:50j]
+    >>> W = linear_interpolation_matrix(points, (grid_x, grid_y))
+
+    Interpolate 10 different value fields at once:
+
+    >>> values = np.random.rand(100, 10)
+    >>> out = W.dot(values).reshape(grid_x.shape + (10,))
+    >>> out[np.diff(W.indptr).reshape(grid_x.shape) == 0] = np.nan
+
+    """
+    if isinstance(points, Delaunay):
+        if rescale:
+            raise ValueError("Rescaling is not supported when passing "
+                             "a Delaunay triangulation as ``points``.")
+        tri = points
+        points = tri.points
+    else:
+        tri = None
+        points = np.ascontiguousarray(_ndim_coords_from_arrays(points),
+                                      dtype=np.double)
+    if points.ndim != 2:
+        raise ValueError("invalid shape for input data points")
+    if points.shape[1] < 2:
+        raise ValueError("input data must be at least 2-D")
+    ndim = points.shape[1]
+
+    xi = np.asanyarray(_ndim_coords_from_arrays(xi, ndim=ndim))
+    if xi.shape[-1] != ndim:
+        raise ValueError("number of dimensions in xi does not match x")
+    xi = np.ascontiguousarray(xi.reshape(-1, ndim), dtype=np.double)
+
+    if rescale:
+        # scale to unit cube centered at 0, as in NDInterpolatorBase
+        offset = np.mean(points, axis=0)
+        points = points - offset
+        scale = points.ptp(axis=0)
+        scale[~(scale > 0)] = 1.0
+        points /= scale
+        xi = (xi - offset) / scale
+    if tri is None:
+        tri = Delaunay(points)
+
+    m = xi.shape[0]
+    isimplex = np.empty(m, dtype=np.intc)
+    barycentric = np.empty((m, ndim + 1), dtype=np.double)
+    # compute the lazily evaluated transform before starting any threads
+    tri.transform
+
+    def _locate(start, stop):
+        _find_simplices(tri, xi, isimplex, barycentric, start, stop)
+
+    _threaded_ranges(_locate, m, workers)
+
+    inside = isimplex >= 0
+    indptr = np.zeros(m + 1, dtype=np.intc)
+    np.cumsum(np.where(inside, ndim + 1, 0), out=indptr[1:])
+    indices = tri.simplices[isimplex[inside]].ravel()
+    data = barycentric[inside].ravel()
+    return csr_matrix((data, indices, indptr), shape=(m, points.shape[0]))
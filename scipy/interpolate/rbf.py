@@ -49,9 +49,11 @@ import numpy as np
 
 from scipy import linalg
 from scipy._lib.six import callable, get_method_function, get_function_code
+from scipy._lib._util import _threaded_ranges
 from scipy.special import xlogy
+from scipy.spatial import cKDTree
 
-__all__ = ['Rbf']
+__all__ = ['Rbf', 'LocalRbf']
 
 
 class Rbf(object):
@@ -188,6 +190,11 @@ class Rbf(object):
         return a0
 
     def __init__(self, *args, **kwargs):
+        self._init_nodes(args, kwargs)
+        self.nodes = linalg.solve(self.A, self.di)
+
+    def _init_nodes(self, args, kwargs):
+        # Store the nodes and values, and the kernel parameters in kwargs.
         self.xi = np.asarray([np.asarray(a, dtype=np.float_).flatten()
                            for a in args[:-1]])
         self.N = self.xi.shape[-1]
@@ -217,8 +224,6 @@ class Rbf(object):
         for item, value in kwargs.items():
             setattr(self, item, value)
 
-        self.nodes = linalg.solve(self.A, self.di)
-
     @property
     def A(self):
         # this only exists for backwards compatibility: self.A was available
@@ -243,3 +248,140 @@ class Rbf(object):
         xa = np.asarray([a.flatten() for a in args], dtype=np.float_)
         r = self._call_norm(xa, self.xi)
         return np.dot(self._function(r), self.nodes).reshape(shp)
+
+
+def _unique_rows(a):
+    """Return the unique rows of a 2-D integer array and the inverse map."""
+    if a.shape[0] == 0:
+        return a, np.zeros(0, dtype=np.intp)
+    order = np.lexsort(a.T[::-1])
+    a_sorted = a[order]
+    is_new = np.ones(a.shape[0], dtype=bool)
+    is_new[1:] = np.any(a_sorted[1:] != a_sorted[:-1], axis=1)
+    inverse = np.empty(a.shape[0], dtype=np.intp)
+    inverse[order] = np.cumsum(is_new) - 1
+    return a_sorted[is_new], inverse
+
+
+class LocalRbf(Rbf):
+    """
+    LocalRbf(*args, neighbors=50, chunk_size=1000, workers=1)
+
+    Radial basis function interpolation of n-dimensional scattered data
+    over local neighbourhoods.
+
+    `Rbf` solves a dense system coupling all ``N`` nodes, which costs
+    ``O(N**3)`` time and ``O(N**2)`` memory, and evaluates a dense
+    ``M x N`` kernel matrix on every call. `LocalRbf` instead interpolates
+    each evaluation point with the radial basis function through its
+    `neighbors` nearest nodes, found with a `scipy.spatial.cKDTree`. The
+    local systems are shared between evaluation points with the same
+    neighbourhood, and the evaluation points are processed in chunks, so
+    memory use is bounded independently of ``N`` and ``M``.
+
+    Parameters
+    ----------
+    *args : arrays
+        x, y, z, ..., d, where x, y, z, ... are the coordinates of the nodes
+        and d is the array of values at the nodes
+    function : str or callable, optional
+        The radial basis function, as for `Rbf`. Default is
+        'multiquadric'.
+    epsilon : float, optional
+        Adjustable constant for gaussian or multiquadrics functions, as for
+        `Rbf`.
+    smooth : float, optional
+        Values greater than zero increase the smoothness of the
+        approximation. 0 is for interpolation (default).
+    neighbors : int, optional
+        Number of nearest nodes used for each evaluation point. If it is
+        not less than the number of nodes, all nodes are used and the
+        result agrees with `Rbf`. Default is 50.
+    chunk_size : int, optional
+        Number of evaluation points processed at once. The temporary
+        memory is roughly ``chunk_size * neighbors**2`` floats per worker.
+        Default is 1000.
+    workers : int, optional
+        Number of threads used for evaluation; -1 means one thread per
+        processor. Default is 1.
+
+    See Also
+    --------
+    Rbf
+
+    Notes
+    -----
+    Only the euclidean norm is supported. The interpolant is continuous
+    only where the neighbourhoods of nearby points coincide; larger values
+    of `neighbors` reduce the size of the jumps at the boundaries between
+    neighbourhoods.
+
+    .. versionadded:: 1.0.0
+
+    Examples
+    --------
+    >>> from scipy.interpolate import LocalRbf
+    >>> x, y, d = np.random.rand(3, 5000)
+    >>> rbfi = LocalRbf(x, y, d, neighbors=30, workers=2)
+    >>> xi = yi = np.linspace(0, 1, 20)
+    >>> di = rbfi(xi, yi)
+    >>> di.shape
+    (20,)
+
+    """
+
+    def __init__(self, *args, **kwargs):
+        if 'norm' in kwargs:
+            raise ValueError("LocalRbf only supports the euclidean norm")
+        self.neighbors = int(kwargs.pop('neighbors', 50))
+        self.chunk_size = int(kwargs.pop('chunk_size', 1000))
+        self.workers = kwargs.pop('workers', 1)
+        if self.neighbors < 1:
+            raise ValueError("neighbors must be a positive integer")
+        if self.chunk_size < 1:
+            raise ValueError("chunk_size must be a positive integer")
+        self._init_nodes(args, kwargs)
+        self.neighbors = min(self.neighbors, self.N)
+        self._tree = cKDTree(self.xi.T)
+        # smoke test of the radial basis function on a few nodes
+        self._init_function(self._call_norm(self.xi[:, :2], self.xi[:, :2]))
+
+    @property
+    def A(self):
+        raise AttributeError("LocalRbf does not form the global system")
+
+    def _evaluate(self, xa, out):
+        k = self.neighbors
+        _, idx = self._tree.query(xa, k=k)
+        if k == 1:
+            idx = idx[:, np.newaxis]
+        idx = np.sort(idx, axis=1)
+        # solve one local system per distinct neighbourhood
+        sets, inverse = _unique_rows(idx)
+        x = self.xi.T[sets]
+        r = np.sqrt(((x[:, :, np.newaxis, :] -
+                      x[:, np.newaxis, :, :])**2).sum(axis=-1))
+        a = self._function(r) - np.eye(k)*self.smooth
+        weights = np.linalg.solve(a, self.di[sets][..., np.newaxis])[..., 0]
+        r = np.sqrt(((xa[:, np.newaxis, :] - x[inverse])**2).sum(axis=-1))
+        out[...] = (self._function(r) * weights[inverse]).sum(axis=-1)
+
+    def __call__(self, *args):
+        args = [np.asarray(x) for x in args]
+        if not all([x.shape == y.shape for x in args for y in args]):
+            raise ValueError("Array lengths must be equal")
+        if len(args) != self.xi.shape[0]:
+            raise ValueError("Expected %d coordinate arrays, got %d"
+                             % (self.xi.shape[0], len(args)))
+        shp = args[0].shape
+        xa = np.asarray([a.flatten() for a in args], dtype=np.float_).T
+        out = np.empty(xa.shape[0],
+                       dtype=np.result_type(self.di.dtype, np.float_))
+
+        def _chunks(start, stop):
+            for i in range(start, stop, self.chunk_size):
+                j = min(i + self.chunk_size, stop)
+                self._evaluate(xa[i:j], out[i:j])
+
+        _threaded_ranges(_chunks, xa.shape[0], self.workers)
+        return out.reshape(shp)
@@ -20,12 +20,17 @@ def configuration(parent_package='',top_path=None):
 
     config.add_extension('_ppoly',
                          sources=['_ppoly.c'],
+                         depends=['_interval_search.pxi'],
                          **lapack_opt)
 
+    config.add_extension('_rgi',
+                         sources=['_rgi.c'])
+
     config.add_extension('_bspl',
                          sources=['_bspl.c'],
                          libraries=['fitpack'],
-                         depends=['src/__fitpack.h'] + fitpack_src)
+                         depends=(['src/__fitpack.h', '_interval_search.pxi']
+                                  + fitpack_src))
 
     config.add_extension('_fitpack',
                          sources=['src/_fitpackmodule.c'],
@@ -9,7 +9,9 @@ from numpy.testing.decorators import knownfailureif
 
 from scipy.interpolate import (BSpline, BPoly, PPoly, make_interp_spline,
         make_lsq_spline, _bspl, splev, splrep, splprep, splder, splantider,
-         sproot, splint, insert)
+         sproot, splint, insert, NdBSpline, make_ndbspl,
+         RectBivariateSpline, BSplineBatch, make_interp_spline_batch,
+         make_pspline, PSplineAccumulator)
 import scipy.linalg as sl
 
 from scipy.interpolate._bsplines import _not_a_knot, _augknt
@@ -116,6 +118,22 @@ class TestBSpline(TestCase):
         y_n2 = [_naive_eval_2(x, t, c, k) for x in xx]
         assert_allclose(y_b, y_n2, atol=1e-14)
 
+    def test_interval_search(self):
+        # a degree 0 spline whose value is the knot interval index, on
+        # uniform, non-uniform and repeated knots
+        np.random.seed(1234)
+        knots = [np.linspace(0, 1, 101),
+                 np.sort(np.random.rand(101))**3,
+                 np.r_[0, 0, 0.2, 0.2, 0.5, 0.5, 0.5, 0.9, 1, 1]]
+        for t in knots:
+            n = t.size - 1
+            b = BSpline(t, np.arange(n, dtype=float), 0)
+            xp = np.r_[np.random.uniform(t[0] - 0.1, t[-1] + 0.1, 500), t]
+            for xq in [xp, np.sort(xp), np.sort(xp)[::-1]]:
+                wanted = np.searchsorted(t, xq, side='right') - 1
+                wanted = np.clip(wanted, 0, n - 1)
+                assert_equal(b(xq), wanted)
+
     def test_rndm_splev(self):
         b = _make_random_spline()
         t, c, k = b.tck
@@ -1069,5 +1087,244 @@ class TestLSQ(TestCase):
             assert_raises(ValueError, make_lsq_spline, x, y, t)
 
 
+class TestNdBSpline(TestCase):
+    def _make_3d(self):
+        np.random.seed(1234)
+        x = np.linspace(0, 1, 11)
+        y = np.sort(np.random.rand(9)) * 2
+        z = np.linspace(-1, 1, 7)
+        return x, y, z
+
+    def _f(self, x, y, z):
+        # a cubic in each variable, reproduced exactly by cubic splines
+        return x**3 - 2*x*y**2 + y*z**3 + 1
+
+    def test_interpolate_cubic(self):
+        x, y, z = self._make_3d()
+        values = self._f(*np.meshgrid(x, y, z, indexing='ij'))
+        spl = make_ndbspl((x, y, z), values)
+        assert_equal(spl.k, (3, 3, 3))
+
+        xi = np.random.rand(50, 3) * [1, y[-1] - y[0], 2] + [0, y[0], -1]
+        assert_allclose(spl(xi), self._f(*xi.T), atol=1e-13)
+        grid = np.concatenate([g[..., None] for g in
+                               np.meshgrid(x, y, z, indexing='ij')], axis=-1)
+        assert_allclose(spl(grid), values, atol=1e-13)
+
+        # partial derivatives, evaluated directly and as splines
+        wanted = 3*xi[:, 0]**2 - 2*xi[:, 1]**2
+        assert_allclose(spl(xi, nu=(1, 0, 0)), wanted, atol=1e-12)
+        wanted = 6*xi[:, 2]
+        assert_allclose(spl(xi, nu=(0, 1, 2)), wanted, atol=1e-11)
+        dspl = spl.derivative((0, 1, 2))
+        assert_equal(dspl.k, (3, 2, 1))
+        assert_allclose(dspl(xi), wanted, atol=1e-11)
+
+    def test_compare_1d_2d(self):
+        np.random.seed(1234)
+        x = np.sort(np.random.rand(12))
+        y = np.linspace(0, 2, 8)
+        values = np.random.rand(12, 8)
+        xi = np.c_[np.random.rand(40) * (x[-1] - x[0]) + x[0],
+                   np.random.rand(40) * 2]
+
+        b = make_interp_spline(x, values[:, 0])
+        spl = make_ndbspl((x,), values[:, 0])
+        assert_allclose(spl(xi[:, :1]), b(xi[:, 0]), atol=1e-14)
+
+        spl = make_ndbspl((x, y), values)
+        rbs = RectBivariateSpline(x, y, values)
+        assert_allclose(spl(xi), rbs.ev(xi[:, 0], xi[:, 1]), atol=1e-13)
+
+    def test_direct_construction(self):
+        # tensor product of univariate splines
+        b1 = _make_random_spline(n=10, k=3)
+        b2 = _make_random_spline(n=8, k=2)
+        c = b1.c[:, None] * b2.c[None, :]
+        spl = NdBSpline((b1.t, b2.t), c, (3, 2))
+        xi = np.random.rand(30, 2)
+        assert_allclose(spl(xi), b1(xi[:, 0]) * b2(xi[:, 1]), atol=1e-14)
+        assert_allclose(spl(xi, nu=(1, 1)),
+                        b1(xi[:, 0], nu=1) * b2(xi[:, 1], nu=1), atol=1e-12)
+
+        assert_raises(ValueError, NdBSpline, (b1.t, b2.t), c, 3)
+        assert_raises(ValueError, NdBSpline, (b1.t,), c[:, 0], (3, 2))
+        assert_raises(ValueError, spl, xi[:, :1])
+        assert_raises(ValueError, spl, xi, nu=(-1, 0))
+        assert_allclose(spl(xi, nu=(3, 2)),
+                        b1(xi[:, 0], nu=3) * b2(xi[:, 1], nu=2), atol=1e-10)
+        for nu in [(4, 0), (0, 3), (10, 10)]:
+            assert_raises(ValueError, spl, xi, nu=nu)
+
+    def test_vector_valued_and_complex(self):
+        x, y, z = self._make_3d()
+        values = self._f(*np.meshgrid(x, y, z, indexing='ij'))
+        values = values[..., None] * [1, 1 + 2j]
+        spl = make_ndbspl((x, y, z), values)
+        xi = np.random.rand(20, 2, 3) * [1, y[-1] - y[0], 2] + [0, y[0], -1]
+        res = spl(xi)
+        assert_equal(res.shape, (20, 2, 2))
+        wanted = self._f(*np.rollaxis(xi, -1))
+        assert_allclose(res[..., 0], wanted, atol=1e-13)
+        assert_allclose(res[..., 1], (1 + 2j)*wanted, atol=1e-13)
+
+    def test_extrapolate_and_workers(self):
+        x, y, z = self._make_3d()
+        values = self._f(*np.meshgrid(x, y, z, indexing='ij'))
+        spl = make_ndbspl((x, y, z), values)
+        xi = np.random.rand(100, 3) * [1.4, 2, 2.4] - [0.2, 0, 1.2]
+
+        # the pieces are cubic, so that extrapolation is exact here
+        assert_allclose(spl(xi), self._f(*xi.T), atol=1e-11)
+        out = ((xi < [x[0], y[0], z[0]]) | (xi > [x[-1], y[-1], z[-1]])).any(1)
+        res = spl(xi, extrapolate=False)
+        assert_(np.isnan(res[out]).all())
+        assert_allclose(res[~out], self._f(*xi[~out].T), atol=1e-13)
+        assert_(np.isnan(spl([[np.nan, 0.5, 0.]])).all())
+
+        assert_equal(spl(xi, workers=3), spl(xi))
+
+
+class TestBatch(TestCase):
+    def _make_batch(self, ncurves=20, trailing=()):
+        np.random.seed(1234)
+        counts = np.random.randint(6, 15, size=ncurves)
+        offsets = np.r_[0, np.cumsum(counts)]
+        x = np.concatenate([np.sort(np.random.rand(n)) for n in counts])
+        y = np.random.rand(*((x.size,) + trailing))
+        return x, y, offsets
+
+    def test_compare_make_interp_spline(self):
+        x, y, offsets = self._make_batch(trailing=(2,))
+        for k in (1, 3, 5):
+            b = make_interp_spline_batch(x, y, offsets, k=k)
+            assert_equal(len(b), 20)
+            for i in (0, 7, 19):
+                sl_ = slice(offsets[i], offsets[i+1])
+                spl = make_interp_spline(x[sl_], y[sl_], k=k)
+                assert_allclose(b[i].t, spl.t, atol=1e-15)
+                assert_allclose(b[i].c, spl.c, atol=1e-12)
+            assert_allclose(b(x, offsets), y, atol=1e-12)
+
+    def test_evaluate(self):
+        x, y, offsets = self._make_batch()
+        b = make_interp_spline_batch(x, y, offsets)
+        xp = np.random.rand(200) * 1.2 - 0.1
+        xp_offsets = np.r_[0, np.sort(np.random.randint(0, 200, 19)), 200]
+        for nu in (0, 1, 2):
+            res = b(xp, xp_offsets, nu=nu)
+            for i in range(len(b)):
+                sl_ = slice(xp_offsets[i], xp_offsets[i+1])
+                assert_allclose(res[sl_], b[i](xp[sl_], nu=nu), atol=1e-12)
+        assert_equal(b(xp, xp_offsets, workers=3), b(xp, xp_offsets))
+        for nu in (4, 5, 10):
+            assert_raises(ValueError, b, xp, xp_offsets, nu=nu)
+
+        res = b(xp, xp_offsets, extrapolate=False)
+        for i in range(len(b)):
+            sl_ = slice(xp_offsets[i], xp_offsets[i+1])
+            out = (xp[sl_] < x[offsets[i]]) | (xp[sl_] > x[offsets[i+1]-1])
+            assert_(np.isnan(res[sl_][out]).all())
+            assert_(not np.isnan(res[sl_][~out]).any())
+
+    def test_complex_and_direct(self):
+        x, y, offsets = self._make_batch()
+        yc = y * (1. + 2.j)
+        b = make_interp_spline_batch(x, yc, offsets, workers=2)
+        assert_allclose(b(x, offsets), yc, atol=1e-12)
+
+        b2 = BSplineBatch(b.t, b.t_offsets, b.c, b.c_offsets, b.k)
+        assert_allclose(b2(x, offsets), b(x, offsets), atol=1e-15)
+
+    def test_invalid(self):
+        x, y, offsets = self._make_batch()
+        assert_raises(ValueError, make_interp_spline_batch, x, y, offsets,
+                      k=2)
+        assert_raises(ValueError, make_interp_spline_batch, x, y,
+                      offsets[:-1])
+        assert_raises(ValueError, make_interp_spline_batch, x[::-1], y,
+                      offsets)
+        assert_raises(ValueError, make_interp_spline_batch, x, y,
+                      [0, 3, x.size])
+        b = make_interp_spline_batch(x, y, offsets)
+        assert_raises(ValueError, b, x, offsets[:-1])
+        assert_raises(IndexError, b.__getitem__, len(b))
+
+
+class TestPSpline(TestCase):
+    def setUp(self):
+        np.random.seed(1234)
+        self.x = np.sort(np.random.random(300))
+        self.y = np.sin(2*np.pi*self.x) + 0.2*np.random.randn(300)
+        self.t = np.r_[(0,)*3, np.linspace(0, 1, 16), (1,)*3]
+
+    def _dense(self, lam, w=None):
+        # the penalized least-squares problem with dense matrices
+        x, y, t = self.x, self.y, self.t
+        n = t.size - 4
+        X = np.array([BSpline(t, np.eye(n)[i], 3)(x) for i in range(n)]).T
+        if w is not None:
+            X, y = w[:, None] * X, w * y
+        D = np.diff(np.eye(n), 2, axis=0)
+        A = np.dot(X.T, X) + lam * np.dot(D.T, D)
+        c = np.linalg.solve(A, np.dot(X.T, y))
+        H = np.dot(X, np.linalg.solve(A, X.T))
+        rss = np.sum((y - np.dot(X, c))**2)
+        m = x.size
+        return c, m * rss / (m - np.trace(H))**2
+
+    def test_compare_lsq(self):
+        x, y, t = self.x, self.y, self.t
+        w = np.random.random(x.size)
+        spl = make_pspline(x, y, t=t, w=w, lam=0)
+        assert_allclose(spl.c, make_lsq_spline(x, y, t, w=w).c, atol=1e-12)
+
+    def test_compare_dense(self):
+        x, y, t = self.x, self.y, self.t
+        w = np.random.random(x.size) + 0.5
+        acc = PSplineAccumulator(t).add(x, y, w)
+        for lam in (1e-3, 0.5, 100.):
+            c, score = self._dense(lam, w)
+            assert_allclose(acc.solve(lam).c, c, rtol=1e-10)
+            assert_allclose(acc.gcv(lam), score, rtol=1e-10)
+            assert_equal(acc.lam, lam)
+
+    def test_gcv_minimum(self):
+        acc = PSplineAccumulator(self.t).add(self.x, self.y)
+        spl = acc.solve()
+        lam = acc.lam
+        score = acc.gcv(lam)
+        assert_(score <= acc.gcv(2*lam) and score <= acc.gcv(lam/2))
+        xs = np.linspace(0, 1, 101)
+        assert_(np.sqrt(np.mean((spl(xs) - np.sin(2*np.pi*xs))**2)) < 0.05)
+
+    def test_chunks(self):
+        x, y, t = self.x, self.y, self.t
+        y = np.c_[y, 1j*y]
+        acc = PSplineAccumulator(t)
+        for i in range(3):
+            acc.add(x[i::3], y[i::3])
+        assert_equal(acc.nobs, x.size)
+        spl = acc.solve(lam=0.5)
+        assert_equal(spl.c.shape, (t.size - 4, 2))
+        spl_all = make_pspline(x, y, t=t, lam=0.5)
+        assert_allclose(spl.c, spl_all.c, atol=1e-12)
+        assert_allclose(spl.c[:, 1], 1j*spl.c[:, 0], atol=1e-12)
+
+    def test_default_knots(self):
+        spl = make_pspline(self.x, self.y, nknots=10)
+        assert_equal(spl.t.size, 10 + 2*3)
+        assert_allclose(spl.t[[0, -1]], self.x[[0, -1]])
+
+    def test_invalid(self):
+        acc = PSplineAccumulator(self.t)
+        assert_raises(ValueError, acc.solve)
+        assert_raises(ValueError, acc.add, self.x + 1, self.y)
+        acc.add(self.x, self.y)
+        assert_raises(ValueError, acc.add, self.x, np.c_[self.y, self.y])
+        assert_raises(ValueError, acc.solve, lam=-1)
+        assert_raises(ValueError, acc.solve, penalty_order=self.t.size)
+
+
 if __name__ == "__main__":
     run_module_suite()
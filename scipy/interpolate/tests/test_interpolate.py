@@ -14,7 +14,7 @@ from scipy._lib.six import xrange
 from scipy.interpolate import (interp1d, interp2d, lagrange, PPoly, BPoly,
          ppform, splrep, splev, splantider, splint, sproot, Akima1DInterpolator,
          RegularGridInterpolator, LinearNDInterpolator, NearestNDInterpolator,
-         RectBivariateSpline, interpn, NdPPoly, BSpline)
+         RectBivariateSpline, interpn, NdPPoly, BSpline, PchipInterpolator)
 
 from scipy.special import poch, gamma
 
@@ -985,6 +985,26 @@ class TestPPoly(TestCase):
             roots_a = pa.roots()
             assert_allclose(roots_a, np.sort(roots_d), rtol=1e-12)
 
+    def test_interval_search(self):
+        # a piecewise constant polynomial whose value is the interval index,
+        # on uniform, non-uniform and repeated breakpoints, and at sorted,
+        # reverse sorted and random points
+        np.random.seed(1234)
+        breakpoints = [np.linspace(0, 1, 101),
+                       np.sort(np.random.rand(101))**3,
+                       np.r_[0, 0.2, 0.2, 0.5, 0.5, 0.5, 0.9, 1]]
+        for x in breakpoints:
+            m = x.size - 1
+            p = PPoly(np.arange(m, dtype=float)[None, :], x)
+            xp = np.r_[np.random.uniform(x[0] - 0.1, x[-1] + 0.1, 500), x]
+            for xq in [xp, np.sort(xp), np.sort(xp)[::-1]]:
+                wanted = np.clip(np.searchsorted(x, xq, side='right') - 1,
+                                 0, m - 1)
+                # the last interval is closed, and intervals of zero
+                # length are never found
+                wanted[xq == x[-1]] = m - 1
+                assert_equal(p(xq), wanted)
+
     def test_multi_shape(self):
         c = np.random.rand(6, 2, 1, 2, 3)
         x = np.array([0, 0.5, 1])
@@ -2486,6 +2506,83 @@ class TestRegularGridInterpolator(TestCase):
         interpolator = RegularGridInterpolator(points, values)
         interpolator = RegularGridInterpolator(points, values, fill_value=0.)
 
+    def test_compiled_matches_numpy(self):
+        # compare the compiled kernels with the NumPy implementation, on
+        # uniform and non-uniform grids and with extrapolation
+        np.random.seed(1234)
+        points = (np.sort(np.random.rand(6)), np.linspace(0, 1, 5),
+                  np.linspace(-1, 2, 4))
+        values = np.random.rand(6, 5, 4, 2)
+        sample = np.random.rand(200, 3) * [1.2, 1.2, 3.6] - [0.1, 0.1, 1.2]
+
+        for method in ['linear', 'nearest']:
+            interp = RegularGridInterpolator(points, values, method=method,
+                                             bounds_error=False,
+                                             fill_value=None)
+            indices, norm_distances, out_of_bounds = \
+                interp._find_indices(sample.T)
+            if method == 'linear':
+                wanted = interp._evaluate_linear(indices, norm_distances,
+                                                 out_of_bounds)
+            else:
+                wanted = interp._evaluate_nearest(indices, norm_distances,
+                                                  out_of_bounds)
+            assert_allclose(interp(sample), wanted, rtol=1e-13)
+
+            # several blocks, evaluated in parallel
+            interp._block_size = 7
+            assert_allclose(interp(sample, workers=3), wanted, rtol=1e-13)
+
+    def test_nan_and_fill(self):
+        points, values = self._get_sample_4d()
+        sample = np.asarray([[0.1, 0.1, 1., np.nan], [0.1, 0.1, 1., 1.1],
+                             [0.5, 0.5, .5, .5]])
+        for method in ['linear', 'nearest', 'cubic', 'pchip']:
+            interp = RegularGridInterpolator(points, values, method=method,
+                                             bounds_error=False,
+                                             fill_value=-1.)
+            v = interp(sample)
+            assert_(np.isnan(v[0]))
+            assert_equal(v[1], -1.)
+            assert_allclose(v[2], 555.5)
+
+    def test_cubic_quadratic(self):
+        # the cubic method reproduces quadratic functions
+        np.random.seed(1234)
+        x = np.sort(np.random.rand(7)) * 3
+        y = np.linspace(-1, 1, 6)
+        z = np.array([0., 1.])
+
+        def f(x, y, z):
+            return x**2 - 2*x*y + 3*y**2 + x - z + 1
+
+        values = f(*np.meshgrid(x, y, z, indexing='ij'))
+        interp = RegularGridInterpolator((x, y, z), values, method='cubic')
+        sample = np.random.rand(50, 3) * [x[-1] - x[0], 2, 1] + [x[0], -1, 0]
+        assert_allclose(interp(sample), f(*sample.T), atol=1e-12)
+
+        values = values - 2j*values
+        interp = RegularGridInterpolator((x, y, z), values, method='cubic')
+        assert_allclose(interp(sample), (1 - 2j)*f(*sample.T), atol=1e-12)
+
+    def test_pchip(self):
+        # the pchip method is the tensor product of PchipInterpolator
+        np.random.seed(1234)
+        x = np.sort(np.random.rand(8))
+        y = np.linspace(0, 2, 3)
+        u = np.random.rand(8)
+        v = np.random.rand(3)
+        values = u[:, None] * v[None, :]
+        interp = RegularGridInterpolator((x, y), values, method='pchip')
+        sample = np.random.rand(50, 2) * [x[-1] - x[0], 2] + [x[0], 0]
+        wanted = (PchipInterpolator(x, u)(sample[:, 0]) *
+                  PchipInterpolator(y, v)(sample[:, 1]))
+        assert_allclose(interp(sample), wanted, rtol=1e-13)
+
+        assert_raises(ValueError, interp, sample, method='unknown')
+        interp = RegularGridInterpolator((x, y), values + 1j, method='pchip')
+        assert_raises(ValueError, interp, sample)
+
 
 class MyValue(object):
     """
@@ -2583,6 +2680,16 @@ class TestInterpN(TestCase):
                          bounds_error=False, fill_value=999.99)
         assert_array_almost_equal(actual, wanted)
 
+    def test_cubic_4d(self):
+        points, values = self._sample_4d_data()
+        interp_rg = RegularGridInterpolator(points, values, method="cubic")
+        sample = np.asarray([[0.1, 0.1, 10., 9.], [0.3, 0.7, 2., 4.]])
+        wanted = interpn(points, values, sample, method="cubic")
+        assert_array_almost_equal(interp_rg(sample), wanted)
+        # the data are linear along each dimension
+        wanted = interpn(points, values, sample, method="linear")
+        assert_array_almost_equal(interp_rg(sample), wanted)
+
     def test_nearest_4d(self):
         # create a 4d grid of 3 points in each dimension
         points, values = self._sample_4d_data()
@@ -4,7 +4,10 @@ import numpy as np
 from numpy.testing import (assert_equal, assert_array_equal, assert_allclose,
         run_module_suite, assert_raises)
 
-from scipy.interpolate import griddata, NearestNDInterpolator
+from scipy.interpolate import (griddata, NearestNDInterpolator,
+                               LinearNDInterpolator,
+                               linear_interpolation_matrix)
+from scipy.spatial import Delaunay
 
 
 class TestGriddata(object):
@@ -176,5 +179,46 @@ def test_nearest_options():
     assert_allclose(nndi(x), nndi_o(x), atol=1e-14)
 
 
+class TestLinearInterpolationMatrix(object):
+    def test_matches_interpolator(self):
+        np.random.seed(1234)
+        for ndim in [2, 3]:
+            x = np.random.rand(60, ndim)
+            y = np.random.rand(60, 4)
+            xi = np.random.rand(5, 8, ndim) * 1.2 - 0.1
+            expected = LinearNDInterpolator(x, y)(xi).reshape(40, 4)
+            for workers in [1, 3]:
+                w = linear_interpolation_matrix(x, xi, workers=workers)
+                assert_equal(w.shape, (40, 60))
+                outside = np.diff(w.indptr) == 0
+                assert_array_equal(outside, np.isnan(expected[:, 0]))
+                assert_allclose(w.dot(y)[~outside], expected[~outside],
+                                rtol=1e-12)
+
+    def test_delaunay_and_rescale(self):
+        np.random.seed(1234)
+        x = np.random.rand(30, 2) * [1, 1000]
+        y = np.random.rand(30)
+        xi = np.random.rand(20, 2) * [1, 1000]
+        for w, ip in [(linear_interpolation_matrix(Delaunay(x), xi),
+                       LinearNDInterpolator(x, y)),
+                      (linear_interpolation_matrix(x, xi, rescale=True),
+                       LinearNDInterpolator(x, y, rescale=True))]:
+            expected = ip(xi)
+            inside = np.diff(w.indptr) > 0
+            assert_array_equal(inside, ~np.isnan(expected))
+            assert_allclose(w.dot(y)[inside], expected[inside])
+        assert_raises(ValueError, linear_interpolation_matrix,
+                      Delaunay(x), xi, rescale=True)
+
+    def test_tuple_xi(self):
+        x = [(0, 0), (0, 1), (1, 0), (1, 1)]
+        y = np.array([1., 2., 3., 4.])
+        grid_x, grid_y = np.mgrid[0:1:5j, 0:1:4j]
+        w = linear_interpolation_matrix(x, (grid_x, grid_y))
+        assert_allclose(w.dot(y).reshape(grid_x.shape),
+                        griddata(x, y, (grid_x, grid_y)))
+
+
 if __name__ == "__main__":
     run_module_suite()
@@ -5,9 +5,10 @@ from __future__ import division, print_function, absolute_import
 
 import numpy as np
 from numpy.testing import (assert_, assert_array_almost_equal,
-                           assert_almost_equal, run_module_suite)
+                           assert_almost_equal, assert_equal, assert_raises,
+                           run_module_suite)
 from numpy import linspace, sin, random, exp, allclose
-from scipy.interpolate.rbf import Rbf
+from scipy.interpolate.rbf import Rbf, LocalRbf
 
 FUNCTIONS = ('multiquadric', 'inverse multiquadric', 'gaussian',
              'cubic', 'quintic', 'thin-plate', 'linear')
@@ -154,5 +155,53 @@ def test_rbf_epsilon_none_collinear():
     rbf = Rbf(x, y, z, epsilon=None)
     assert_(rbf.epsilon > 0)
 
+
+def check_local_rbf_matches_global(function):
+    # With all nodes in every neighbourhood LocalRbf reduces to Rbf.
+    np.random.seed(1234)
+    x, y = np.random.rand(2, 40)
+    d = x*exp(-x**2 - y**2)
+    xi, yi = np.random.rand(2, 7, 3)
+    rbf = Rbf(x, y, d, epsilon=0.5, function=function)
+    local = LocalRbf(x, y, d, epsilon=0.5, function=function, neighbors=100)
+    assert_equal(local.neighbors, 40)
+    assert_array_almost_equal(local(xi, yi), rbf(xi, yi))
+    assert_equal(local(xi, yi).shape, (7, 3))
+
+
+def test_local_rbf_matches_global():
+    for function in FUNCTIONS:
+        yield check_local_rbf_matches_global, function
+
+
+def test_local_rbf_interpolation():
+    # LocalRbf goes through the nodes, and chunking and threads do not
+    # change the result.
+    np.random.seed(1234)
+    x, y, z = np.random.rand(3, 500)
+    d = sin(3*x) * y + z
+    rbf = LocalRbf(x, y, z, d, neighbors=20)
+    assert_array_almost_equal(rbf(x, y, z), d)
+
+    xi, yi, zi = 0.2 + 0.6*np.random.rand(3, 300)
+    expected = rbf(xi, yi, zi)
+    for chunk_size, workers in [(1, 1), (7, 3), (1000, -1)]:
+        rbf = LocalRbf(x, y, z, d, neighbors=20, chunk_size=chunk_size,
+                       workers=workers)
+        assert_array_almost_equal(rbf(xi, yi, zi), expected, decimal=12)
+
+    # away from the boundary the local fit approximates the smooth function
+    rbf = LocalRbf(x, y, z, d, neighbors=50)
+    assert_(np.abs(rbf(xi, yi, zi) - (sin(3*xi) * yi + zi)).max() < 0.05)
+
+
+def test_local_rbf_errors():
+    x, y = np.random.rand(2, 10)
+    assert_raises(ValueError, LocalRbf, x, y, neighbors=0)
+    assert_raises(ValueError, LocalRbf, x, y, norm=lambda a, b: a - b)
+    rbf = LocalRbf(x, y, neighbors=3)
+    assert_raises(ValueError, rbf, x, x)
+
+
 if __name__ == "__main__":
     run_module_suite()
@@ -64,6 +64,7 @@ Interpolation
    shift - Shift an array
    spline_filter
    spline_filter1d
+   SplineInterpolator - Spline interpolation with cached coefficients
    zoom - Zoom an array
 
 Measurements
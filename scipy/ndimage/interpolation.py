@@ -35,11 +35,14 @@ import numpy
 from . import _ni_support
 from . import _nd_image
 from functools import wraps
+from scipy._lib._util import _threaded_ranges, _normalize_workers
+from scipy._lib._numpy_compat import broadcast_to
 
 import warnings
 
 __all__ = ['spline_filter1d', 'spline_filter', 'geometric_transform',
-           'map_coordinates', 'affine_transform', 'shift', 'zoom', 'rotate']
+           'map_coordinates', 'affine_transform', 'shift', 'zoom', 'rotate',
+           'SplineInterpolator']
 
 
 def _extend_mode_to_code(mode):
@@ -364,6 +367,43 @@ def map_coordinates(input, coordinates, output=None, order=3,
     return return_value
 
 
+def _normalize_affine(matrix, offset, input_shape, output_rank):
+    """
+    Validate an affine `matrix` and `offset` as accepted by
+    `affine_transform`, returning contiguous float64 arrays. Homogeneous
+    matrices are split into their linear part and the offset.
+    """
+    ndim = len(input_shape)
+    matrix = numpy.asarray(matrix, dtype=numpy.float64)
+    if matrix.ndim not in [1, 2] or matrix.shape[0] < 1:
+        raise RuntimeError('no proper affine matrix provided')
+    if (matrix.ndim == 2 and matrix.shape[1] == ndim + 1 and
+            (matrix.shape[0] in [ndim, ndim + 1])):
+        if matrix.shape[0] == ndim + 1:
+            exptd = [0] * ndim + [1]
+            if not numpy.all(matrix[ndim] == exptd):
+                msg = ('Expected homogeneous transformation matrix with '
+                       'shape %s for image shape %s, but bottom row was '
+                       'not equal to %s' % (matrix.shape, input_shape, exptd))
+                raise ValueError(msg)
+        # assume input is homogeneous coordinate transformation matrix
+        offset = matrix[:ndim, ndim]
+        matrix = matrix[:ndim, :ndim]
+    if matrix.shape[0] != ndim:
+        raise RuntimeError('affine matrix has wrong number of rows')
+    if matrix.ndim == 2 and matrix.shape[1] != output_rank:
+        raise RuntimeError('affine matrix has wrong number of columns')
+    if not matrix.flags.contiguous:
+        matrix = matrix.copy()
+    offset = _ni_support._normalize_sequence(offset, ndim)
+    offset = numpy.asarray(offset, dtype=numpy.float64)
+    if offset.ndim != 1 or offset.shape[0] < 1:
+        raise RuntimeError('no proper offset provided')
+    if not offset.flags.contiguous:
+        offset = offset.copy()
+    return matrix, offset
+
+
 @_fix_endianness
 def affine_transform(input, matrix, offset=0.0, output_shape=None,
                      output=None, order=3,
@@ -467,33 +507,8 @@ def affine_transform(input, matrix, offset=0.0, output_shape=None,
         filtered = input
     output, return_value = _ni_support._get_output(output, input,
                                                    shape=output_shape)
-    matrix = numpy.asarray(matrix, dtype=numpy.float64)
-    if matrix.ndim not in [1, 2] or matrix.shape[0] < 1:
-        raise RuntimeError('no proper affine matrix provided')
-    if (matrix.ndim == 2 and matrix.shape[1] == input.ndim + 1 and
-            (matrix.shape[0] in [input.ndim, input.ndim + 1])):
-        if matrix.shape[0] == input.ndim + 1:
-            exptd = [0] * input.ndim + [1]
-            if not numpy.all(matrix[input.ndim] == exptd):
-                msg = ('Expected homogeneous transformation matrix with '
-                       'shape %s for image shape %s, but bottom row was '
-                       'not equal to %s' % (matrix.shape, input.shape, exptd))
-                raise ValueError(msg)
-        # assume input is homogeneous coordinate transformation matrix
-        offset = matrix[:input.ndim, input.ndim]
-        matrix = matrix[:input.ndim, :input.ndim]
-    if matrix.shape[0] != input.ndim:
-        raise RuntimeError('affine matrix has wrong number of rows')
-    if matrix.ndim == 2 and matrix.shape[1] != output.ndim:
-        raise RuntimeError('affine matrix has wrong number of columns')
-    if not matrix.flags.contiguous:
-        matrix = matrix.copy()
-    offset = _ni_support._normalize_sequence(offset, input.ndim)
-    offset = numpy.asarray(offset, dtype=numpy.float64)
-    if offset.ndim != 1 or offset.shape[0] < 1:
-        raise RuntimeError('no proper offset provided')
-    if not offset.flags.contiguous:
-        offset = offset.copy()
+    matrix, offset = _normalize_affine(matrix, offset, input.shape,
+                                       output.ndim)
     if matrix.ndim == 1:
         warnings.warn(
             "The behaviour of affine_transform with a one-dimensional "
@@ -789,3 +804,392 @@ def rotate(input, angle, axes=(1, 0), reshape=True,
                 else:
                     coordinates[jj] = 0
     return return_value
+
+
+class SplineInterpolator(object):
+    """
+    Spline interpolation of an array with precomputed spline coefficients.
+
+    `map_coordinates`, `affine_transform`, `shift` and `zoom` prefilter
+    their input with `spline_filter` on every call. This class performs
+    the prefiltering once, so that the same array can be resampled many
+    times (e.g. in an image registration loop) at the cost of the
+    interpolation alone. Evaluation can be split over several threads.
+
+    Parameters
+    ----------
+    input : array_like
+        The input array.
+    order : int, optional
+        The order of the spline interpolation, default is 3.
+        The order has to be in the range 0-5.
+    mode : str, optional
+        Points outside the boundaries of the input are filled according
+        to the given mode ('constant', 'nearest', 'reflect', 'mirror' or
+        'wrap'). Default is 'constant'.
+    cval : scalar, optional
+        Value used for points outside the boundaries of the input if
+        ``mode='constant'``. Default is 0.0
+    prefilter : bool, optional
+        If False, `input` is assumed to hold spline coefficients already,
+        i.e. to have been filtered with `spline_filter`. Default is True.
+    dtype : {numpy.float64, numpy.float32}, optional
+        The data type in which the spline coefficients are stored. Using
+        `numpy.float32` halves the memory footprint of the cache at the
+        cost of precision. Default is `numpy.float64`.
+
+    Attributes
+    ----------
+    coefficients : ndarray
+        The spline coefficients of `input`.
+    order, mode, cval : int, str, float
+        The interpolation parameters given on construction.
+
+    See Also
+    --------
+    map_coordinates, affine_transform, shift, zoom, spline_filter
+
+    Notes
+    -----
+    All evaluation methods accept a ``workers`` argument giving the number
+    of threads to use; ``-1`` means one thread per processor. The output
+    is split into independent blocks, so the result does not depend on the
+    number of workers.
+
+    The default data type of the output is that of `input`, as in the
+    function interface.
+
+    .. versionadded:: 1.0.0
+
+    Examples
+    --------
+    >>> from scipy import ndimage
+    >>> a = np.arange(12.).reshape((4, 3))
+    >>> interp = ndimage.SplineInterpolator(a, order=1)
+    >>> interp.map_coordinates([[0.5, 2], [0.5, 1]])
+    array([ 2.,  7.])
+
+    Evaluate a batch of two affine transforms in one call:
+
+    >>> interp.affine_transform_batch([np.eye(2), 0.5 * np.eye(2)])
+    array([[[  0. ,   1. ,   2. ],
+            [  3. ,   4. ,   5. ],
+            [  6. ,   7. ,   8. ],
+            [  9. ,  10. ,  11. ]],
+    <BLANKLINE>
+           [[  0. ,   0.5,   1. ],
+            [  1.5,   2. ,   2.5],
+            [  3. ,   3.5,   4. ],
+            [  4.5,   5. ,   5.5]]])
+
+    """
+
+    def __init__(self, input, order=3, mode='constant', cval=0.0,
+                 prefilter=True, dtype=numpy.float64):
+        if order < 0 or order > 5:
+            raise RuntimeError('spline order not supported')
+        input = numpy.asarray(input)
+        if numpy.iscomplexobj(input):
+            raise TypeError('Complex type not supported')
+        if input.ndim < 1:
+            raise RuntimeError('input and output rank must be > 0')
+        dtype = numpy.dtype(dtype)
+        if dtype not in (numpy.float32, numpy.float64):
+            raise ValueError('dtype must be float32 or float64')
+        if prefilter and order > 1:
+            coefficients = spline_filter(input, order, output=dtype)
+        else:
+            coefficients = numpy.array(input, dtype=dtype)
+        self.coefficients = coefficients
+        self.order = order
+        self.mode = mode
+        self.cval = float(cval)
+        self._mode = _extend_mode_to_code(mode)
+        self._output_dtype = input.dtype
+
+    @property
+    def shape(self):
+        return self.coefficients.shape
+
+    @property
+    def ndim(self):
+        return self.coefficients.ndim
+
+    def _get_output(self, output, shape):
+        if output is None:
+            output = numpy.zeros(shape, dtype=self._output_dtype)
+            return output, output
+        return _ni_support._get_output(output, self.coefficients,
+                                       shape=shape)
+
+    def _zoom_shift(self, zoom, shift, output, workers):
+        # Output coordinates ``o`` map to ``(o + shift) * zoom``, so a block
+        # of rows starting at ``start`` is evaluated with its first shift
+        # component increased by ``start``.
+        if zoom is not None:
+            zoom = numpy.ascontiguousarray(zoom, dtype=numpy.float64)
+        if shift is None:
+            shift = numpy.zeros(self.ndim, dtype=numpy.float64)
+
+        def _block(start, stop):
+            block_shift = numpy.array(shift, dtype=numpy.float64)
+            block_shift[0] += start
+            _nd_image.zoom_shift(self.coefficients, zoom, block_shift,
+                                 output[start:stop], self.order, self._mode,
+                                 self.cval)
+
+        _threaded_ranges(_block, output.shape[0], workers)
+
+    def _affine(self, matrix, offset, output, workers):
+        if matrix.ndim == 1:
+            if numpy.all(matrix != 0):
+                self._zoom_shift(matrix, offset / matrix, output, workers)
+                return
+            matrix = numpy.diag(matrix)
+
+        def _block(start, stop):
+            block_offset = offset + matrix[:, 0] * start
+            _nd_image.geometric_transform(self.coefficients, None, None,
+                                          matrix, block_offset,
+                                          output[start:stop], self.order,
+                                          self._mode, self.cval, None, None)
+
+        _threaded_ranges(_block, output.shape[0], workers)
+
+    @_fix_endianness
+    def map_coordinates(self, coordinates, output=None, workers=1):
+        """
+        Interpolate the array at the given coordinates.
+
+        Parameters
+        ----------
+        coordinates : array_like
+            The coordinates at which the array is evaluated, with shape
+            ``(ndim,) + output_shape``.
+        output : ndarray or dtype, optional
+            The array in which to place the output, or the dtype of the
+            returned array.
+        workers : int, optional
+            Number of threads to use. Default is 1.
+
+        Returns
+        -------
+        map_coordinates : ndarray or None
+            The interpolated values. If `output` is given as a parameter,
+            None is returned.
+
+        See Also
+        --------
+        scipy.ndimage.map_coordinates
+
+        """
+        coordinates = numpy.asarray(coordinates)
+        if numpy.iscomplexobj(coordinates):
+            raise TypeError('Complex type not supported')
+        output_shape = coordinates.shape[1:]
+        if len(output_shape) < 1:
+            raise RuntimeError('input and output rank must be > 0')
+        if coordinates.shape[0] != self.ndim:
+            raise RuntimeError('invalid shape for coordinate array')
+        output, return_value = self._get_output(output, output_shape)
+        coordinates = coordinates.reshape(self.ndim, -1)
+        if output.flags.c_contiguous:
+            flat = output.reshape(-1)
+        else:
+            flat = numpy.zeros(output.size, dtype=output.dtype)
+
+        def _block(start, stop):
+            _nd_image.geometric_transform(self.coefficients, None,
+                                          coordinates[:, start:stop],
+                                          None, None, flat[start:stop],
+                                          self.order, self._mode, self.cval,
+                                          None, None)
+
+        _threaded_ranges(_block, flat.shape[0], workers)
+        if not output.flags.c_contiguous:
+            output[...] = flat.reshape(output_shape)
+        return return_value
+
+    __call__ = map_coordinates
+
+    @_fix_endianness
+    def affine_transform(self, matrix, offset=0.0, output_shape=None,
+                         output=None, workers=1):
+        """
+        Apply an affine transformation to the array.
+
+        Parameters
+        ----------
+        matrix : ndarray
+            The inverse coordinate transformation matrix, in any of the
+            forms accepted by `scipy.ndimage.affine_transform`. A
+            one-dimensional `matrix` is the diagonal of the linear
+            transformation.
+        offset : float or sequence, optional
+            The offset into the array where the transform is applied.
+        output_shape : tuple of ints, optional
+            Shape tuple. Default is the shape of the array.
+        output : ndarray or dtype, optional
+            The array in which to place the output, or the dtype of the
+            returned array.
+        workers : int, optional
+            Number of threads to use. Default is 1.
+
+        Returns
+        -------
+        affine_transform : ndarray or None
+            The transformed array. If `output` is given as a parameter,
+            None is returned.
+
+        See Also
+        --------
+        scipy.ndimage.affine_transform
+
+        """
+        if output_shape is None:
+            output_shape = self.shape
+        output_shape = tuple(output_shape)
+        if len(output_shape) < 1:
+            raise RuntimeError('input and output rank must be > 0')
+        output, return_value = self._get_output(output, output_shape)
+        matrix, offset = _normalize_affine(matrix, offset, self.shape,
+                                           output.ndim)
+        self._affine(matrix, offset, output, workers)
+        return return_value
+
+    def affine_transform_batch(self, matrices, offsets=0.0,
+                               output_shape=None, output=None, workers=1):
+        """
+        Apply a batch of affine transformations to the array.
+
+        Parameters
+        ----------
+        matrices : array_like
+            A stack of ``K`` inverse coordinate transformation matrices,
+            each in one of the forms accepted by `affine_transform`.
+        offsets : float or array_like, optional
+            A scalar, a sequence of ``ndim`` values shared by all
+            transforms, or an array of shape ``(K, ndim)``. Ignored for
+            homogeneous matrices.
+        output_shape : tuple of ints, optional
+            Shape tuple of a single transformed array. Default is the
+            shape of the array.
+        output : ndarray or dtype, optional
+            The array of shape ``(K,) + output_shape`` in which to place
+            the output, or the dtype of the returned array.
+        workers : int, optional
+            Number of threads to use. Default is 1.
+
+        Returns
+        -------
+        affine_transform_batch : ndarray or None
+            The transformed arrays, stacked along the first axis. If
+            `output` is given as a parameter, None is returned.
+
+        """
+        matrices = numpy.asarray(matrices, dtype=numpy.float64)
+        if matrices.ndim not in [2, 3]:
+            raise RuntimeError('no proper stack of affine matrices provided')
+        nbatch = matrices.shape[0]
+        offsets = numpy.asarray(offsets, dtype=numpy.float64)
+        if offsets.ndim < 2:
+            offsets = broadcast_to(offsets, (nbatch, self.ndim))
+        if offsets.shape != (nbatch, self.ndim):
+            raise RuntimeError('no proper offsets provided')
+        if output_shape is None:
+            output_shape = self.shape
+        output_shape = tuple(output_shape)
+        if len(output_shape) < 1:
+            raise RuntimeError('input and output rank must be > 0')
+        output, return_value = self._get_output(output,
+                                                (nbatch,) + output_shape)
+        normalized = [_normalize_affine(matrices[k], offsets[k], self.shape,
+                                        len(output_shape))
+                      for k in range(nbatch)]
+        nworkers = _normalize_workers(workers)
+        if nbatch >= nworkers:
+            # one thread per group of transforms
+            def _block(start, stop):
+                for k in range(start, stop):
+                    self._affine(normalized[k][0], normalized[k][1],
+                                 output[k], 1)
+
+            _threaded_ranges(_block, nbatch, nworkers)
+        else:
+            for k in range(nbatch):
+                self._affine(normalized[k][0], normalized[k][1], output[k],
+                             nworkers)
+        return return_value
+
+    @_fix_endianness
+    def shift(self, shift, output=None, workers=1):
+        """
+        Shift the array.
+
+        Parameters
+        ----------
+        shift : float or sequence
+            The shift along the axes. If a float, `shift` is the same for
+            each axis.
+        output : ndarray or dtype, optional
+            The array in which to place the output, or the dtype of the
+            returned array.
+        workers : int, optional
+            Number of threads to use. Default is 1.
+
+        Returns
+        -------
+        shift : ndarray or None
+            The shifted array. If `output` is given as a parameter, None is
+            returned.
+
+        See Also
+        --------
+        scipy.ndimage.shift
+
+        """
+        output, return_value = self._get_output(output, self.shape)
+        shift = _ni_support._normalize_sequence(shift, self.ndim)
+        shift = numpy.asarray([-ii for ii in shift], dtype=numpy.float64)
+        self._zoom_shift(None, shift, output, workers)
+        return return_value
+
+    @_fix_endianness
+    def zoom(self, zoom, output=None, workers=1):
+        """
+        Zoom the array.
+
+        Parameters
+        ----------
+        zoom : float or sequence
+            The zoom factor along the axes. If a float, `zoom` is the same
+            for each axis.
+        output : ndarray or dtype, optional
+            The array in which to place the output, or the dtype of the
+            returned array.
+        workers : int, optional
+            Number of threads to use. Default is 1.
+
+        Returns
+        -------
+        zoom : ndarray or None
+            The zoomed array. If `output` is given as a parameter, None is
+            returned.
+
+        See Also
+        --------
+        scipy.ndimage.zoom
+
+        """
+        zoom = _ni_support._normalize_sequence(zoom, self.ndim)
+        output_shape = tuple(
+                [int(round(ii * jj)) for ii, jj in zip(self.shape, zoom)])
+        zoom_div = numpy.array(output_shape, float) - 1
+        # Zooming to infinite values is unpredictable, so just choose
+        # zoom factor 1 instead
+        zoom = numpy.divide(numpy.array(self.shape) - 1, zoom_div,
+                            out=numpy.ones(self.ndim, dtype=numpy.float64),
+                            where=zoom_div != 0)
+        output, return_value = self._get_output(output, output_shape)
+        self._zoom_shift(zoom, None, output, workers)
+        return return_value
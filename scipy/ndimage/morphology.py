@@ -33,7 +33,9 @@ from __future__ import division, print_function, absolute_import
 import numpy
 from . import _ni_support
 from . import _nd_image
+from . import _ni_edt
 from . import filters
+from scipy._lib._util import _threaded_ranges
 
 __all__ = ['iterate_structure', 'generate_binary_structure', 'binary_erosion',
            'binary_dilation', 'binary_opening', 'binary_closing',
@@ -2005,9 +2007,30 @@ def distance_transform_cdt(input, metric='chessboard',
         return None
 
 
+def _squared_edt(input, sampling, dtype, workers):
+    """
+    Squared euclidean distance transform of the binary `input`, computed
+    one axis at a time in an array of the given floating point `dtype`.
+    """
+    dt = numpy.zeros(input.shape, dtype=dtype)
+    dt[input != 0] = numpy.inf
+    for axis in range(input.ndim):
+        n = input.shape[axis]
+        pre = int(numpy.prod(input.shape[:axis]))
+        post = int(numpy.prod(input.shape[axis + 1:]))
+        view = dt.reshape(pre, n, post)
+        weight = 1.0 if sampling is None else float(sampling[axis])**2
+
+        def _lines(start, stop, view=view, weight=weight):
+            _ni_edt.squared_edt_axis(view, weight, start, stop)
+
+        _threaded_ranges(_lines, pre * post, workers)
+    return dt
+
+
 def distance_transform_edt(input, sampling=None,
                         return_distances=True, return_indices=False,
-                        distances=None, indices=None):
+                        distances=None, indices=None, workers=1):
     """
     Exact euclidean distance transform.
 
@@ -2029,10 +2052,18 @@ def distance_transform_edt(input, sampling=None,
         return_distances/return_indices must be True. Default is True.
     return_indices : bool, optional
         Whether to return indices matrix. Default is False.
-    distances : ndarray, optional
-        Used for output of distance array, must be of type float64.
+    distances : ndarray or dtype, optional
+        Used for output of distance array, or the dtype of the returned
+        distance array. Must be of type float32 or float64; the default is
+        float64.
     indices : ndarray, optional
         Used for output of indices, must be of type int32.
+    workers : int, optional
+        Number of threads used to compute the distances when
+        `return_indices` is False; -1 means one thread per processor.
+        Default is 1.
+
+        .. versionadded:: 1.0.0
 
     Returns
     -------
@@ -2054,6 +2085,19 @@ def distance_transform_edt(input, sampling=None,
     Euclidean distance to input points x[i], and n is the
     number of dimensions.
 
+    If only the distances are requested, they are computed in linear time
+    by a separable algorithm [1]_ that processes the lines along each axis
+    independently and does not store the feature transform. The lines can
+    then be distributed over several threads with `workers`, and a float32
+    result halves the memory needed. An input without background elements
+    is still handled by the feature transform, so that its distances are the
+    same as when the indices are requested.
+
+    References
+    ----------
+    .. [1] P. F. Felzenszwalb and D. P. Huttenlocher, "Distance Transforms
+           of Sampled Functions", Theory of Computing, 8, pp. 415-428, 2012.
+
     Examples
     --------
     >>> from scipy import ndimage
@@ -2121,6 +2165,14 @@ def distance_transform_edt(input, sampling=None,
 
     ft_inplace = isinstance(indices, numpy.ndarray)
     dt_inplace = isinstance(distances, numpy.ndarray)
+    if dt_inplace:
+        dt_type = distances.dtype.type
+    elif distances is not None:
+        dt_type = numpy.dtype(distances).type
+    else:
+        dt_type = numpy.float64
+    if dt_type not in (numpy.float32, numpy.float64):
+        raise RuntimeError('distances must be of float32 or float64 type')
     # calculate the feature transform
     input = numpy.atleast_1d(numpy.where(input, 1, 0).astype(numpy.int8))
     if sampling is not None:
@@ -2129,6 +2181,17 @@ def distance_transform_edt(input, sampling=None,
         if not sampling.flags.contiguous:
             sampling = sampling.copy()
 
+    # without background the feature transform defines the distances, so
+    # that case is left to it
+    if return_distances and not return_indices and not input.all():
+        if dt_inplace and distances.shape != input.shape:
+            raise RuntimeError('distances has wrong shape')
+        dt = _squared_edt(input, sampling, dt_type, workers)
+        if dt_inplace:
+            numpy.sqrt(dt, distances)
+            return None
+        return numpy.sqrt(dt, dt)
+
     if ft_inplace:
         ft = indices
         if ft.shape != (input.ndim,) + input.shape:
@@ -2151,13 +2214,11 @@ def distance_transform_edt(input, sampling=None,
         if dt_inplace:
             dt = numpy.add.reduce(dt, axis=0)
             if distances.shape != dt.shape:
-                raise RuntimeError('indices has wrong shape')
-            if distances.dtype.type != numpy.float64:
-                raise RuntimeError('indices must be of float64 type')
+                raise RuntimeError('distances has wrong shape')
             numpy.sqrt(dt, distances)
         else:
             dt = numpy.add.reduce(dt, axis=0)
-            dt = numpy.sqrt(dt)
+            dt = numpy.sqrt(dt).astype(dt_type, copy=False)
 
     # construct and return the result
     result = []
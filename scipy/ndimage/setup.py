@@ -27,6 +27,10 @@ def configuration(parent_package='', top_path=None):
                          sources=["src/_ni_label.c",],
                          include_dirs=['src']+[get_include()])
 
+    config.add_extension("_ni_edt",
+                         sources=["src/_ni_edt.c",],
+                         include_dirs=[get_include()])
+
     config.add_extension("_ctest",
                          sources=["src/_ctest.c"],
                          include_dirs=[get_include()])
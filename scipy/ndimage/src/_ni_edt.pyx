@@ -0,0 +1,118 @@
+######################################################################
+# Separable exact euclidean distance transform.
+#
+# The squared distance transform is computed one axis at a time with the
+# lower envelope of parabolas algorithm of Felzenszwalb & Huttenlocher
+# (Theory of Computing 8, 2012). Each pass works in place on the output
+# array, so no feature-index array is materialised.
+######################################################################
+
+cimport cython
+import numpy as np
+cimport numpy as np
+from libc.stdlib cimport malloc, free
+from libc.math cimport INFINITY
+
+np.import_array()
+
+ctypedef fused floating:
+    np.float32_t
+    np.float64_t
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.cdivision(True)
+cdef void _envelope_line(double *f, double *d, double *z, np.intp_t *v,
+                         np.intp_t n, double w) nogil:
+    """
+    Set ``d[q] = min_p(w * (q - p)**2 + f[p])`` for ``q`` in ``range(n)``.
+
+    Samples with ``f[p] == inf`` do not contribute to the envelope.
+    """
+    cdef np.intp_t k = -1, p, q
+    cdef double s
+
+    for q in range(n):
+        if f[q] == INFINITY:
+            continue
+        if k < 0:
+            k = 0
+            v[0] = q
+            z[0] = -INFINITY
+            z[1] = INFINITY
+            continue
+        while True:
+            p = v[k]
+            s = (((f[q] + w * q * q) - (f[p] + w * p * p)) /
+                 (2.0 * w * (q - p)))
+            # z[0] is -inf, so the envelope is never emptied
+            if s <= z[k]:
+                k -= 1
+            else:
+                break
+        k += 1
+        v[k] = q
+        z[k] = s
+        z[k + 1] = INFINITY
+
+    if k < 0:
+        for q in range(n):
+            d[q] = INFINITY
+        return
+
+    k = 0
+    for q in range(n):
+        while z[k + 1] < q:
+            k += 1
+        p = v[k]
+        d[q] = w * (q - p) * (q - p) + f[p]
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def squared_edt_axis(floating[:, :, :] dist, double weight,
+                     np.intp_t start, np.intp_t stop):
+    """
+    squared_edt_axis(dist, weight, start, stop)
+
+    Transform lines ``start`` to ``stop`` along the middle axis of the
+    ``(pre, n, post)`` array `dist` in place. Lines are numbered in C order
+    over the ``(pre, post)`` outer axes; `weight` is the squared sampling
+    along the transformed axis.
+    """
+    cdef np.intp_t n = dist.shape[1], post = dist.shape[2]
+    cdef np.intp_t line, i, j, q
+    cdef double *f
+    cdef double *d
+    cdef double *z
+    cdef np.intp_t *v
+
+    if n == 0 or stop <= start:
+        return
+
+    f = <double *>malloc(n * sizeof(double))
+    d = <double *>malloc(n * sizeof(double))
+    z = <double *>malloc((n + 1) * sizeof(double))
+    v = <np.intp_t *>malloc(n * sizeof(np.intp_t))
+    if not f or not d or not z or not v:
+        free(f)
+        free(d)
+        free(z)
+        free(v)
+        raise MemoryError()
+
+    with nogil:
+        for line in range(start, stop):
+            i = line // post
+            j = line % post
+            for q in range(n):
+                f[q] = dist[i, q, j]
+            _envelope_line(f, d, z, v, n, weight)
+            for q in range(n):
+                dist[i, q, j] = <floating>d[q]
+
+    free(f)
+    free(d)
+    free(z)
+    free(v)
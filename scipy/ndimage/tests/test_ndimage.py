@@ -38,7 +38,8 @@ from unittest import expectedFailure
 import numpy
 from numpy import fft
 from numpy.testing import (assert_, assert_equal, assert_array_equal,
-        run_module_suite, assert_array_almost_equal, assert_almost_equal, dec)
+        run_module_suite, assert_array_almost_equal, assert_almost_equal, dec,
+        assert_raises)
 import scipy.ndimage as ndimage
 from nose import SkipTest
 
@@ -3029,6 +3030,39 @@ class TestNdimage:
         out = ndimage.distance_transform_edt(False)
         assert_array_almost_equal(out, [0.])
 
+    def test_distance_transform_edt_separable(self):
+        numpy.random.seed(1234)
+        data = numpy.random.rand(9, 12, 7) > 0.1
+        for sampling in [None, [1, 1, 1], [2, 0.5, 1.5]]:
+            ref = ndimage.distance_transform_bf(data, 'euclidean',
+                                                sampling=sampling)
+            for workers in [1, 4]:
+                out = ndimage.distance_transform_edt(data, sampling=sampling,
+                                                     workers=workers)
+                assert_equal(out.dtype, numpy.float64)
+                assert_array_almost_equal(out, ref)
+                out = ndimage.distance_transform_edt(data, sampling=sampling,
+                                                     distances=numpy.float32,
+                                                     workers=workers)
+                assert_equal(out.dtype, numpy.float32)
+                assert_array_almost_equal(out, ref, decimal=5)
+            dt = numpy.zeros(data.shape, dtype=numpy.float32)
+            assert_equal(ndimage.distance_transform_edt(
+                data, sampling=sampling, distances=dt), None)
+            assert_array_almost_equal(dt, ref, decimal=5)
+
+    def test_distance_transform_edt_no_background(self):
+        # the distances agree with those computed along with the indices
+        data = numpy.ones((3, 4))
+        ref, ft = ndimage.distance_transform_edt(data, return_indices=True)
+        out = ndimage.distance_transform_edt(data)
+        assert_array_almost_equal(out, ref)
+        out = ndimage.distance_transform_edt(data, distances=numpy.float32)
+        assert_equal(out.dtype, numpy.float32)
+        assert_array_almost_equal(out, ref)
+        assert_raises(RuntimeError, ndimage.distance_transform_edt,
+                      numpy.ones((3, 4)), distances=numpy.int32)
+
     def test_generate_structure01(self):
         struct = ndimage.generate_binary_structure(0, 1)
         assert_array_almost_equal(struct, 1)
@@ -4594,6 +4628,116 @@ class TestNdimage:
             assert_array_almost_equal(expected, out)
 
 
+class TestSplineInterpolator:
+
+    def setUp(self):
+        numpy.random.seed(1234)
+        self.data = numpy.random.rand(12, 9)
+
+    def test_map_coordinates(self):
+        coords = numpy.random.rand(2, 5, 7) * 13 - 1
+        for order in range(6):
+            for mode in ['constant', 'nearest', 'reflect', 'mirror', 'wrap']:
+                expected = ndimage.map_coordinates(self.data, coords,
+                                                   order=order, mode=mode,
+                                                   cval=-1.0)
+                interp = ndimage.SplineInterpolator(self.data, order=order,
+                                                    mode=mode, cval=-1.0)
+                for workers in [1, 3]:
+                    out = interp.map_coordinates(coords, workers=workers)
+                    assert_array_almost_equal(out, expected, decimal=12)
+                assert_array_almost_equal(interp(coords), expected,
+                                          decimal=12)
+
+    def test_map_coordinates_output(self):
+        coords = numpy.random.rand(2, 6, 4) * 8
+        interp = ndimage.SplineInterpolator(self.data)
+        expected = ndimage.map_coordinates(self.data, coords)
+        out = numpy.zeros((4, 6)).T
+        assert_equal(interp.map_coordinates(coords, output=out, workers=2),
+                     None)
+        assert_array_almost_equal(out, expected)
+
+    def test_float32_coefficients(self):
+        coords = numpy.random.rand(2, 50) * 8
+        interp = ndimage.SplineInterpolator(self.data, dtype=numpy.float32)
+        assert_equal(interp.coefficients.dtype, numpy.float32)
+        expected = ndimage.map_coordinates(self.data, coords)
+        assert_array_almost_equal(interp(coords), expected, decimal=5)
+
+    def test_no_prefilter(self):
+        coeffs = ndimage.spline_filter(self.data, order=3)
+        interp = ndimage.SplineInterpolator(coeffs, prefilter=False)
+        assert_array_almost_equal(interp.shift(0.3),
+                                  ndimage.shift(self.data, 0.3))
+
+    def test_affine_transform(self):
+        matrices = [numpy.array([[0.8, 0.3], [-0.2, 1.1]]),
+                    numpy.array([[0.8, 0.3, 1.5], [-0.2, 1.1, -0.5]]),
+                    numpy.array([0.7, 1.2]),
+                    numpy.array([0.0, 1.2])]
+        interp = ndimage.SplineInterpolator(self.data, order=3,
+                                            mode='nearest')
+        for matrix in matrices:
+            for shape in [None, (7, 15)]:
+                # a one-dimensional matrix is the diagonal of the transform
+                full = numpy.diag(matrix) if matrix.ndim == 1 else matrix
+                expected = ndimage.affine_transform(
+                    self.data, full, offset=[0.5, -0.3],
+                    output_shape=shape, mode='nearest')
+                for workers in [1, 4]:
+                    out = interp.affine_transform(
+                        matrix, offset=[0.5, -0.3], output_shape=shape,
+                        workers=workers)
+                    assert_array_almost_equal(out, expected)
+
+    def test_affine_transform_batch(self):
+        interp = ndimage.SplineInterpolator(self.data, order=2)
+        angles = numpy.linspace(0, numpy.pi, 5)
+        matrices = numpy.array([[[numpy.cos(a), -numpy.sin(a)],
+                                 [numpy.sin(a), numpy.cos(a)]]
+                                for a in angles])
+        offsets = numpy.random.rand(5, 2)
+        for workers in [1, 2, 8]:
+            out = interp.affine_transform_batch(matrices, offsets,
+                                                output_shape=(10, 10),
+                                                workers=workers)
+            assert_equal(out.shape, (5, 10, 10))
+            for k in range(5):
+                expected = ndimage.affine_transform(self.data, matrices[k],
+                                                    offsets[k], order=2,
+                                                    output_shape=(10, 10))
+                assert_array_almost_equal(out[k], expected)
+
+    def test_shift_zoom(self):
+        interp = ndimage.SplineInterpolator(self.data, order=3)
+        for workers in [1, 3]:
+            assert_array_almost_equal(
+                interp.shift([1.5, -0.25], workers=workers),
+                ndimage.shift(self.data, [1.5, -0.25]))
+            assert_array_almost_equal(
+                interp.zoom([1.5, 0.5], workers=workers),
+                ndimage.zoom(self.data, [1.5, 0.5]))
+
+    def test_integer_input(self):
+        data = numpy.arange(12, dtype=numpy.int16).reshape(4, 3)
+        interp = ndimage.SplineInterpolator(data, order=1)
+        out = interp.map_coordinates([[0.5, 2], [0.5, 1]])
+        assert_equal(out.dtype, numpy.int16)
+        assert_array_equal(out, [2, 7])
+
+    def test_errors(self):
+        assert_raises(RuntimeError, ndimage.SplineInterpolator,
+                      self.data, order=6)
+        assert_raises(ValueError, ndimage.SplineInterpolator,
+                      self.data, dtype=numpy.int32)
+        interp = ndimage.SplineInterpolator(self.data)
+        assert_raises(RuntimeError, interp.map_coordinates,
+                      numpy.zeros((3, 4)))
+        assert_raises(ValueError, interp.map_coordinates,
+                      numpy.zeros((2, 4)), workers=0)
+
+
 class TestDilateFix:
 
     def setUp(self):
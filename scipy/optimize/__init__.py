@@ -118,6 +118,7 @@ Fitting
    :toctree: generated/
 
    curve_fit -- Fit curve to a set of points
+   curve_fit_batch -- Fit a curve to many independent sets of points
 
 Root finding
 ============
@@ -132,6 +133,7 @@ Scalar functions
    ridder - Ridder's method
    bisect - Bisection method
    newton - Secant method or Newton's method
+   chandrupatla - Chandrupatla's method, for arrays of problems
 
 Fixed point finding:
 
@@ -195,7 +197,7 @@ Simplex Algorithm:
 .. autosummary::
    :toctree: generated/
 
-   linprog -- Linear programming using the simplex algorithm
+   linprog -- Unified interface for linear programming solvers
    linprog_verbose_callback -- Sample callback function for linprog
 
 The `linprog` function supports the following methods:
@@ -203,6 +205,8 @@ The `linprog` function supports the following methods:
 .. toctree::
 
    optimize.linprog-simplex
+   optimize.linprog-revised_simplex
+   optimize.linprog-interior-point
 
 Assignment problems:
 
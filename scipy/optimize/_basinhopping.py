@@ -7,7 +7,10 @@ import numpy as np
 from numpy import cos, sin
 import scipy.optimize
 import collections
-from scipy._lib._util import check_random_state
+from scipy.spatial import cKDTree
+from scipy._lib._util import (check_random_state, MapWrapper,
+                              _normalize_workers)
+from scipy._lib.six import string_types
 
 __all__ = ['basinhopping']
 
@@ -34,6 +37,68 @@ class Storage(object):
         return self.minres
 
 
+class MinimaArchive(object):
+    """
+    Class used to store all distinct local minima found
+
+    Minima closer than `tol` to each other (in the Euclidean norm) are
+    considered the same, and only the lower of them is kept. Lookups use a
+    KD-tree, which is rebuilt as the archive grows; the minima added since
+    the last rebuild are searched linearly.
+    """
+    def __init__(self, tol):
+        self.tol = tol
+        self.x = []
+        self.fun = []
+        self._tree = None
+        self._ntree = 0
+
+    def __len__(self):
+        return len(self.x)
+
+    def find(self, x):
+        """Return the index of a stored minimum within `tol` of `x`, or
+        None."""
+        if self._tree is not None:
+            d, i = self._tree.query(x, distance_upper_bound=self.tol)
+            if d <= self.tol:
+                return i
+        for i in range(self._ntree, len(self.x)):
+            if np.linalg.norm(self.x[i] - x) <= self.tol:
+                return i
+        return None
+
+    def add(self, x, fun):
+        """Add a minimum, returning True if it was not known before."""
+        i = self.find(x)
+        if i is not None:
+            if fun < self.fun[i]:
+                self.x[i] = np.copy(x)
+                self.fun[i] = fun
+                if i < self._ntree:
+                    self._rebuild()
+            return False
+        self.x.append(np.copy(x))
+        self.fun.append(fun)
+        if len(self.x) - self._ntree > max(16, self._ntree // 4):
+            self._rebuild()
+        return True
+
+    def _rebuild(self):
+        self._tree = cKDTree(np.array(self.x))
+        self._ntree = len(self.x)
+
+    def known(self):
+        """The minima as arrays ``(x, fun)``, in the order found."""
+        return np.array(self.x), np.array(self.fun)
+
+    def sorted(self):
+        """The minima as arrays ``(x, fun)``, sorted by function value."""
+        x, fun = self.known()
+        order = np.argsort(fun, kind='mergesort')
+        return x[order], fun[order]
+
+
 class BasinHoppingRunner(object):
     """This class implements the core of the basinhopping algorithm.
 
@@ -55,14 +120,27 @@ class BasinHoppingRunner(object):
         from a local minimum that ``basinhopping`` is trapped in.
     disp : bool, optional
         Display status messages.
+    n_chains : int, optional
+        The number of Markov chains advanced in each cycle. The first chain
+        starts at `x0`, the others at random steps away from it.
+    mapper : map-like callable, optional
+        Used to run the local minimizations of all chains, as
+        ``mapper(minimizer, tasks)``. If `archive` is given, `minimizer`
+        must then accept ``(x, known)`` tuples, where `known` are the
+        minima found so far.
+    archive : MinimaArchive, optional
+        If given, all local minima found are stored in it.
 
     """
-    def __init__(self, x0, minimizer, step_taking, accept_tests, disp=False):
-        self.x = np.copy(x0)
+    def __init__(self, x0, minimizer, step_taking, accept_tests, disp=False,
+                 n_chains=1, mapper=map, archive=None):
         self.minimizer = minimizer
         self.step_taking = step_taking
         self.accept_tests = accept_tests
         self.disp = disp
+        self.n_chains = n_chains
+        self.mapper = mapper
+        self.archive = archive
 
         self.nstep = 0
 
@@ -71,76 +149,97 @@ class BasinHoppingRunner(object):
         self.res.minimization_failures = 0
 
         # do initial minimization
-        minres = minimizer(self.x)
-        if not minres.success:
-            self.res.minimization_failures += 1
+        starts = [np.copy(x0)]
+        for k in range(1, n_chains):
+            starts.append(self.step_taking(np.copy(x0)))
+        results = self._minimize(starts)
+
+        self.x = []
+        self.energy = []
+        for minres in results:
+            self.x.append(np.copy(minres.x))
+            self.energy.append(minres.fun)
             if self.disp:
-                print("warning: basinhopping: local minimization failure")
-        self.x = np.copy(minres.x)
-        self.energy = minres.fun
-        if self.disp:
-            print("basinhopping step %d: f %g" % (self.nstep, self.energy))
+                print("basinhopping step %d: f %g" % (self.nstep, minres.fun))
 
         # initialize storage class
-        self.storage = Storage(minres)
-
-        if hasattr(minres, "nfev"):
-            self.res.nfev = minres.nfev
-        if hasattr(minres, "njev"):
-            self.res.njev = minres.njev
-        if hasattr(minres, "nhev"):
-            self.res.nhev = minres.nhev
+        self.storage = Storage(results[int(np.argmin(self.energy))])
+
+        minres = results[0]
+        for name in ["nfev", "njev", "nhev"]:
+            if hasattr(minres, name):
+                setattr(self.res, name, sum(getattr(r, name, 0)
+                                            for r in results))
+
+    def _minimize(self, starts):
+        """Run the local minimizations of a list of starting points"""
+        if self.archive is None:
+            tasks = starts
+        else:
+            known = self.archive.known()
+            tasks = [(x, known) for x in starts]
+        results = list(self.mapper(self.minimizer, tasks))
+
+        for minres in results:
+            if not minres.success:
+                self.res.minimization_failures += 1
+                if self.disp:
+                    print("warning: basinhopping: local minimization failure")
+            elif self.archive is not None:
+                self.archive.add(minres.x, minres.fun)
+        return results
 
     def _monte_carlo_step(self):
         """Do one monte carlo iteration
 
-        Randomly displace the coordinates, minimize, and decide whether
-        or not to accept the new coordinates.
+        Randomly displace the coordinates of each chain, minimize, and decide
+        whether or not to accept the new coordinates.
         """
         # Take a random step.  Make a copy of x because the step_taking
         # algorithm might change x in place
-        x_after_step = np.copy(self.x)
-        x_after_step = self.step_taking(x_after_step)
-
-        # do a local minimization
-        minres = self.minimizer(x_after_step)
-        x_after_quench = minres.x
-        energy_after_quench = minres.fun
-        if not minres.success:
-            self.res.minimization_failures += 1
-            if self.disp:
-                print("warning: basinhopping: local minimization failure")
-
-        if hasattr(minres, "nfev"):
-            self.res.nfev += minres.nfev
-        if hasattr(minres, "njev"):
-            self.res.njev += minres.njev
-        if hasattr(minres, "nhev"):
-            self.res.nhev += minres.nhev
-
-        # accept the move based on self.accept_tests. If any test is False,
-        # than reject the step.  If any test returns the special value, the
-        # string 'force accept', accept the step regardless.  This can be used
-        # to forcefully escape from a local minimum if normal basin hopping
-        # steps are not sufficient.
-        accept = True
-        for test in self.accept_tests:
-            testres = test(f_new=energy_after_quench, x_new=x_after_quench,
-                           f_old=self.energy, x_old=self.x)
-            if testres == 'force accept':
-                accept = True
-                break
-            elif not testres:
-                accept = False
+        starts = [self.step_taking(np.copy(x)) for x in self.x]
+
+        # do the local minimizations
+        results = self._minimize(starts)
+
+        accepts = []
+        for k, minres in enumerate(results):
+            x_after_quench = minres.x
+            energy_after_quench = minres.fun
+
+            if hasattr(minres, "nfev"):
+                self.res.nfev += minres.nfev
+            if hasattr(minres, "njev"):
+                self.res.njev += minres.njev
+            if hasattr(minres, "nhev"):
+                self.res.nhev += minres.nhev
+
+            # accept the move based on self.accept_tests. If any test is
+            # False, than reject the step.  If any test returns the special
+            # value, the string 'force accept', accept the step regardless.
+            # This can be used to forcefully escape from a local minimum if
+            # normal basin hopping steps are not sufficient.
+            accept = True
+            for test in self.accept_tests:
+                testres = test(f_new=energy_after_quench,
+                               x_new=x_after_quench, f_old=self.energy[k],
+                               x_old=self.x[k])
+                if testres == 'force accept':
+                    accept = True
+                    break
+                elif not testres:
+                    accept = False
 
-        # Report the result of the acceptance test to the take step class.
-        # This is for adaptive step taking
-        if hasattr(self.step_taking, "report"):
-            self.step_taking.report(accept, f_new=energy_after_quench,
-                                    x_new=x_after_quench, f_old=self.energy,
-                                    x_old=self.x)
+            # Report the result of the acceptance test to the take step
+            # class. This is for adaptive step taking
+            if hasattr(self.step_taking, "report"):
+                self.step_taking.report(accept, f_new=energy_after_quench,
+                                        x_new=x_after_quench,
+                                        f_old=self.energy[k],
+                                        x_old=self.x[k])
+            accepts.append(accept)
 
-        return accept, minres
+        return accepts, results
 
     def one_cycle(self):
         """Do one cycle of the basinhopping algorithm
@@ -148,32 +247,36 @@ class BasinHoppingRunner(object):
         self.nstep += 1
         new_global_min = False
 
-        accept, minres = self._monte_carlo_step()
+        accepts, results = self._monte_carlo_step()
 
-        if accept:
-            self.energy = minres.fun
-            self.x = np.copy(minres.x)
-            new_global_min = self.storage.update(minres)
+        for k, (accept, minres) in enumerate(zip(accepts, results)):
+            new_min = False
+            if accept:
+                self.energy[k] = minres.fun
+                self.x[k] = np.copy(minres.x)
+                new_min = self.storage.update(minres)
+                new_global_min = new_global_min or new_min
 
-        # print some information
-        if self.disp:
-            self.print_report(minres.fun, accept)
-            if new_global_min:
-                print("found new global minimum on step %d with function"
-                      " value %g" % (self.nstep, self.energy))
+            # print some information
+            if self.disp:
+                self.print_report(k, minres.fun, accept)
+                if new_min:
+                    print("found new global minimum on step %d with function"
+                          " value %g" % (self.nstep, self.energy[k]))
 
-        # save some variables as BasinHoppingRunner attributes
-        self.xtrial = minres.x
-        self.energy_trial = minres.fun
-        self.accept = accept
+        # save the trials as BasinHoppingRunner attributes
+        self.trials = [(minres.x, minres.fun, accept)
+                       for accept, minres in zip(accepts, results)]
 
         return new_global_min
 
-    def print_report(self, energy_trial, accept):
+    def print_report(self, chain, energy_trial, accept):
         """print a status update"""
         minres = self.storage.get_lowest()
-        print("basinhopping step %d: f %g trial_f %g accepted %d "
-              " lowest_f %g" % (self.nstep, self.energy, energy_trial,
+        step = ("%d" % self.nstep if self.n_chains == 1 else
+                "%d chain %d" % (self.nstep, chain))
+        print("basinhopping step %s: f %g trial_f %g accepted %d "
+              " lowest_f %g" % (step, self.energy[chain], energy_trial,
                                 accept, minres.fun))
 
 
@@ -282,6 +385,67 @@ class MinimizerWrapper(object):
             return self.minimizer(self.func, x0, **self.kwargs)
 
 
+class _KnownMinimum(Exception):
+    def __init__(self, index):
+        self.index = index
+
+
+class ArchiveMinimizerWrapper(object):
+    """
+    wrap a `MinimizerWrapper` of `scipy.optimize.minimize` so that a local
+    minimization stops early, returning the known minimum, when its start or
+    one of its iterates comes within `tol` of a known minimum.
+
+    The wrapper is called with tuples ``(x0, (known_x, known_fun))``.
+    """
+    def __init__(self, minimizer, tol):
+        self.minimizer = minimizer
+        self.tol = tol
+
+    def __call__(self, task):
+        x0, (known_x, known_fun) = task
+        if len(known_x) == 0:
+            return self.minimizer(x0)
+        tree = cKDTree(known_x)
+
+        def check(x):
+            d, i = tree.query(x, distance_upper_bound=self.tol)
+            if d <= self.tol:
+                raise _KnownMinimum(i)
+
+        kwargs = dict(self.minimizer.kwargs)
+        nfev = [0]
+        func = self.minimizer.func
+
+        def counted_func(x, *args):
+            nfev[0] += 1
+            return func(x, *args)
+
+        # methods without a callback, or whose callback is called from C
+        # where the exception cannot propagate, are only checked on the
+        # starting point
+        method = kwargs.get('method')
+        if not (isinstance(method, string_types) and
+                method.lower() in ('cobyla', 'tnc')):
+            user_callback = kwargs.get('callback')
+
+            def callback(xk, *args):
+                if user_callback is not None:
+                    user_callback(xk, *args)
+                check(xk)
+
+            kwargs['callback'] = callback
+
+        try:
+            check(x0)
+            return self.minimizer.minimizer(counted_func, x0, **kwargs)
+        except _KnownMinimum as e:
+            return scipy.optimize.OptimizeResult(
+                x=np.copy(known_x[e.index]), fun=known_fun[e.index],
+                success=True, nfev=nfev[0],
+                message="Reached a known minimum.")
+
+
 class Metropolis(object):
     """
     Metropolis acceptance criterion
@@ -311,7 +475,7 @@ class Metropolis(object):
 def basinhopping(func, x0, niter=100, T=1.0, stepsize=0.5,
                  minimizer_kwargs=None, take_step=None, accept_test=None,
                  callback=None, interval=50, disp=False, niter_success=None,
-                 seed=None):
+                 seed=None, workers=1, n_chains=None, archive_tol=None):
     """
     Find the global minimum of a function using the basin-hopping algorithm
 
@@ -323,7 +487,8 @@ def basinhopping(func, x0, niter=100, T=1.0, stepsize=0.5,
     x0 : ndarray
         Initial guess.
     niter : integer, optional
-        The number of basin hopping iterations
+        The number of basin hopping iterations.  Each iteration does one local
+        minimization per chain, see `n_chains`.
     T : float, optional
         The "temperature" parameter for the accept or reject criterion.  Higher
         "temperatures" mean that larger jumps in function value will be
@@ -366,6 +531,8 @@ def basinhopping(func, x0, niter=100, T=1.0, stepsize=0.5,
         used, for example, to save the lowest N minima found.  Also,
         ``callback`` can be used to specify a user defined stop criterion by
         optionally returning True to stop the ``basinhopping`` routine.
+        With several chains it is called once for each chain, in order, on
+        every iteration.
     interval : integer, optional
         interval for how often to update the ``stepsize``
     disp : bool, optional
@@ -385,6 +552,33 @@ def basinhopping(func, x0, niter=100, T=1.0, stepsize=0.5,
         `take_step` and `accept_test`, and these functions use random
         number generation, then those functions are responsible for the state
         of their random number generator.
+    workers : int or map-like callable, optional
+        If `workers` is an int the local minimizations of the chains are
+        run in parallel, using `multiprocessing.Pool` with that many
+        processes. Supply -1 to use all cores available to the process.
+        Alternatively supply a map-like callable, such as
+        `multiprocessing.Pool.map`, for evaluating the minimizations in
+        parallel. This evaluation is carried out as
+        ``workers(minimizer, iterable)``.
+        With more than one worker `func` (and the other callables in
+        `minimizer_kwargs`) must be pickleable.
+    n_chains : int, optional
+        The number of Markov chains advanced simultaneously.  The first chain
+        starts at `x0`, the others at a random step away from it; they share
+        the step size adaptation and the lowest minimum found.  The default
+        is the number of processes implied by an int `workers`, and 1 if
+        `workers` is a map-like callable.
+    archive_tol : float, optional
+        If given, all distinct local minima found are kept in an archive,
+        two minima being the same if their coordinates are less than
+        `archive_tol` apart.  A local minimization whose starting point or
+        one of its iterates comes within `archive_tol` of an archived
+        minimum is stopped early, returning that minimum.  The ``"cobyla"``
+        method, which has no callback, and the ``"tnc"`` method, whose
+        callback is called from C, are only stopped on their starting
+        point.
+
+        .. versionadded:: 1.0.0
 
     Returns
     -------
@@ -395,6 +589,8 @@ def basinhopping(func, x0, niter=100, T=1.0, stepsize=0.5,
         the termination. The ``OptimzeResult`` object returned by the selected
         minimizer at the lowest minimum is also contained within this object
         and can be accessed through the ``lowest_optimization_result`` attribute.
+        If `archive_tol` is given, the archived minima are returned in the
+        ``minima_x`` and ``minima_fun`` attributes, sorted by function value.
         See `OptimizeResult` for a description of other attributes.
 
     See Also
@@ -631,34 +827,55 @@ def basinhopping(func, x0, niter=100, T=1.0, stepsize=0.5,
     if niter_success is None:
         niter_success = niter + 2
 
-    bh = BasinHoppingRunner(x0, wrapped_minimizer, take_step_wrapped,
-                            accept_tests, disp=disp)
-
-    # start main iteration loop
-    count, i = 0, 0
-    message = ["requested number of basinhopping iterations completed"
-               " successfully"]
-    for i in range(niter):
-        new_global_min = bh.one_cycle()
-
-        if isinstance(callback, collections.Callable):
-            # should we pass a copy of x?
-            val = callback(bh.xtrial, bh.energy_trial, bh.accept)
-            if val is not None:
-                if val:
-                    message = ["callback function requested stop early by"
-                               "returning True"]
-                    break
-
-        count += 1
-        if new_global_min:
-            count = 0
-        elif count > niter_success:
-            message = ["success condition satisfied"]
-            break
+    if n_chains is None:
+        n_chains = 1 if callable(workers) else _normalize_workers(workers)
+    n_chains = int(n_chains)
+    if n_chains < 1:
+        raise ValueError("n_chains must be a positive integer")
+
+    if archive_tol is not None:
+        if not archive_tol >= 0:
+            raise ValueError("archive_tol must be non-negative")
+        archive = MinimaArchive(archive_tol)
+        wrapped_minimizer = ArchiveMinimizerWrapper(wrapped_minimizer,
+                                                    archive_tol)
+    else:
+        archive = None
+
+    with MapWrapper(workers) as mapper:
+        bh = BasinHoppingRunner(x0, wrapped_minimizer, take_step_wrapped,
+                                accept_tests, disp=disp, n_chains=n_chains,
+                                mapper=mapper, archive=archive)
+
+        # start main iteration loop
+        count, i = 0, 0
+        message = ["requested number of basinhopping iterations completed"
+                   " successfully"]
+        for i in range(niter):
+            new_global_min = bh.one_cycle()
+
+            if isinstance(callback, collections.Callable):
+                # should we pass a copy of x?
+                val = None
+                for xtrial, energy_trial, accept in bh.trials:
+                    val = callback(xtrial, energy_trial, accept) or val
+                if val is not None:
+                    if val:
+                        message = ["callback function requested stop early"
+                                   " by returning True"]
+                        break
+
+            count += 1
+            if new_global_min:
+                count = 0
+            elif count > niter_success:
+                message = ["success condition satisfied"]
+                break
 
     # prepare return object
     res = bh.res
+    if archive is not None:
+        res.minima_x, res.minima_fun = archive.sorted()
     res.lowest_optimization_result = bh.storage.get_lowest()
     res.x = np.copy(res.lowest_optimization_result.x)
     res.fun = res.lowest_optimization_result.fun
@@ -6,7 +6,8 @@ from __future__ import division, print_function, absolute_import
 import numpy as np
 from scipy.optimize import OptimizeResult, minimize
 from scipy.optimize.optimize import _status_message
-from scipy._lib._util import check_random_state
+from scipy._lib._util import (check_random_state, MapWrapper,
+                              _FunctionWrapper)
 from scipy._lib.six import xrange
 import warnings
 
@@ -20,7 +21,8 @@ def differential_evolution(func, bounds, args=(), strategy='best1bin',
                            maxiter=1000, popsize=15, tol=0.01,
                            mutation=(0.5, 1), recombination=0.7, seed=None,
                            callback=None, disp=False, polish=True,
-                           init='latinhypercube', atol=0):
+                           init='latinhypercube', atol=0, updating='immediate',
+                           workers=1, vectorized=False):
     """Finds the global minimum of a multivariate function.
     Differential Evolution is stochastic in nature (does not use gradient
     methods) to find the minimium, and can search large areas of candidate
@@ -122,6 +124,34 @@ def differential_evolution(func, bounds, args=(), strategy='best1bin',
         ``np.std(pop) <= atol + tol * np.abs(np.mean(population_energies))``,
         where and `atol` and `tol` are the absolute and relative tolerance
         respectively.
+    updating : {'immediate', 'deferred'}, optional
+        If ``'immediate'``, the best solution vector is continuously updated
+        within a single generation. This can lead to faster convergence as
+        trial vectors can take advantage of continuous improvements in the
+        best solution.
+        With ``'deferred'``, the best solution vector is updated once per
+        generation, and all trial vectors of a generation are evaluated
+        together. Only ``'deferred'`` is compatible with parallelization or
+        vectorization, and the `workers` and `vectorized` keywords override
+        this option.
+    workers : int or map-like callable, optional
+        If `workers` is an int the population is subdivided into `workers`
+        sections and evaluated in parallel (uses `multiprocessing.Pool`).
+        Supply -1 to use all available CPU cores.
+        Alternatively supply a map-like callable, such as
+        `multiprocessing.Pool.map` for evaluating the population in parallel.
+        This evaluation is carried out as ``workers(func, iterable)``.
+        This option will override the `updating` keyword to
+        ``updating='deferred'`` if ``workers != 1``.
+        Requires that `func` be pickleable.
+    vectorized : bool, optional
+        If ``vectorized is True``, `func` is sent an `x` array with
+        ``x.shape == (N, S)``, and is expected to return an array of shape
+        ``(S,)``, where `S` is the number of solution vectors to be
+        calculated. This can be much faster than one call per solution
+        vector if `func` is written with numpy operations. This option will
+        override the `updating` keyword to ``updating='deferred'``, and is
+        ignored (with a warning) if ``workers != 1``.
 
     Returns
     -------
@@ -168,6 +198,12 @@ def differential_evolution(func, bounds, args=(), strategy='best1bin',
 
     .. versionadded:: 0.15.0
 
+    With ``updating='deferred'`` the whole generation of trial vectors is
+    built from the population at the start of the generation, and the
+    population is updated once all of them have been evaluated. The trial
+    vectors are then independent of the order in which they are evaluated,
+    so the result does not depend on `workers` for a given `seed`.
+
     Examples
     --------
     Let us consider the problem of minimizing the Rosenbrock function. This
@@ -193,6 +229,18 @@ def differential_evolution(func, bounds, args=(), strategy='best1bin',
     >>> result.x, result.fun
     (array([ 0.,  0.]), 4.4408920985006262e-16)
 
+    The same problem can be solved with a vectorized objective, which
+    evaluates a whole generation of solution vectors in one call:
+
+    >>> def ackley_vec(x):
+    ...     arg1 = -0.2 * np.sqrt(0.5 * (x[0] ** 2 + x[1] ** 2))
+    ...     arg2 = 0.5 * (np.cos(2. * np.pi * x[0]) + np.cos(2. * np.pi * x[1]))
+    ...     return -20. * np.exp(arg1) - np.exp(arg2) + 20. + np.e
+    >>> result = differential_evolution(ackley_vec, bounds, vectorized=True,
+    ...                                 updating='deferred')
+    >>> result.x, result.fun
+    (array([ 0.,  0.]), 4.4408920985006262e-16)
+
     References
     ----------
     .. [1] Storn, R and Price, K, Differential Evolution - a Simple and
@@ -202,15 +250,21 @@ def differential_evolution(func, bounds, args=(), strategy='best1bin',
     .. [3] http://en.wikipedia.org/wiki/Differential_evolution
     """
 
-    solver = DifferentialEvolutionSolver(func, bounds, args=args,
-                                         strategy=strategy, maxiter=maxiter,
-                                         popsize=popsize, tol=tol,
-                                         mutation=mutation,
-                                         recombination=recombination,
-                                         seed=seed, polish=polish,
-                                         callback=callback,
-                                         disp=disp, init=init, atol=atol)
-    return solver.solve()
+    # using a context manager means that any created Pool objects are
+    # cleared up.
+    with DifferentialEvolutionSolver(func, bounds, args=args,
+                                     strategy=strategy, maxiter=maxiter,
+                                     popsize=popsize, tol=tol,
+                                     mutation=mutation,
+                                     recombination=recombination,
+                                     seed=seed, polish=polish,
+                                     callback=callback,
+                                     disp=disp, init=init, atol=atol,
+                                     updating=updating, workers=workers,
+                                     vectorized=vectorized) as solver:
+        ret = solver.solve()
+
+    return ret
 
 
 class DifferentialEvolutionSolver(object):
@@ -310,6 +364,34 @@ class DifferentialEvolutionSolver(object):
         ``np.std(pop) <= atol + tol * np.abs(np.mean(population_energies))``,
         where and `atol` and `tol` are the absolute and relative tolerance
         respectively.
+    updating : {'immediate', 'deferred'}, optional
+        If ``'immediate'``, the best solution vector is continuously updated
+        within a single generation. This can lead to faster convergence as
+        trial vectors can take advantage of continuous improvements in the
+        best solution.
+        With ``'deferred'``, the best solution vector is updated once per
+        generation, and all trial vectors of a generation are evaluated
+        together. Only ``'deferred'`` is compatible with parallelization or
+        vectorization, and the `workers` and `vectorized` keywords override
+        this option.
+    workers : int or map-like callable, optional
+        If `workers` is an int the population is subdivided into `workers`
+        sections and evaluated in parallel (uses `multiprocessing.Pool`).
+        Supply -1 to use all available CPU cores.
+        Alternatively supply a map-like callable, such as
+        `multiprocessing.Pool.map` for evaluating the population in parallel.
+        This evaluation is carried out as ``workers(func, iterable)``.
+        This option will override the `updating` keyword to
+        ``updating='deferred'`` if ``workers != 1``.
+        Requires that `func` be pickleable.
+    vectorized : bool, optional
+        If ``vectorized is True``, `func` is sent an `x` array with
+        ``x.shape == (N, S)``, and is expected to return an array of shape
+        ``(S,)``, where `S` is the number of solution vectors to be
+        calculated. This can be much faster than one call per solution
+        vector if `func` is written with numpy operations. This option will
+        override the `updating` keyword to ``updating='deferred'``, and is
+        ignored (with a warning) if ``workers != 1``.
     """
 
     # Dispatch of mutation strategy method (binomial or exponential).
@@ -328,7 +410,8 @@ class DifferentialEvolutionSolver(object):
                  strategy='best1bin', maxiter=1000, popsize=15,
                  tol=0.01, mutation=(0.5, 1), recombination=0.7, seed=None,
                  maxfun=np.inf, callback=None, disp=False, polish=True,
-                 init='latinhypercube', atol=0):
+                 init='latinhypercube', atol=0, updating='immediate',
+                 workers=1, vectorized=False):
 
         if strategy in self._binomial:
             self.mutation_func = getattr(self, self._binomial[strategy])
@@ -410,6 +493,30 @@ class DifferentialEvolutionSolver(object):
 
         self.disp = disp
 
+        if updating not in ('immediate', 'deferred'):
+            raise ValueError("updating must be one of 'immediate' or "
+                             "'deferred'")
+        self._updating = updating
+
+        parallel = callable(workers) or workers != 1
+        if vectorized and parallel:
+            warnings.warn("differential_evolution: the 'workers' keyword "
+                          "overrides the 'vectorized' keyword", stacklevel=2)
+            vectorized = False
+        self.vectorized = vectorized
+
+        if (parallel or vectorized) and updating == 'immediate':
+            warnings.warn("differential_evolution: the 'workers' and "
+                          "'vectorized' keywords override "
+                          "updating='immediate' to updating='deferred'",
+                          UserWarning, stacklevel=2)
+            self._updating = 'deferred'
+
+        # the map-like callable used to evaluate the population; the pool
+        # is created last so that a failed validation doesn't leave it open
+        self._wrapped_func = _FunctionWrapper(func, args)
+        self._mapwrapper = MapWrapper(workers)
+
     def init_population_lhs(self):
         """
         Initializes the population with Latin Hypercube Sampling.
@@ -556,7 +663,14 @@ class DifferentialEvolutionSolver(object):
             success=(warning_flag is not True))
 
         if self.polish:
-            result = minimize(self.func,
+            polish_func = self.func
+            if self.vectorized:
+                def polish_func(x, *args):
+                    # a single solution vector, sent as an (N, 1) array
+                    return float(np.squeeze(self.func(x[:, np.newaxis],
+                                                      *args)))
+
+            result = minimize(polish_func,
                               np.copy(DE_result.x),
                               method='L-BFGS-B',
                               bounds=self.limits.T,
@@ -581,18 +695,49 @@ class DifferentialEvolutionSolver(object):
         Puts the best member in first place. Useful if the population has just
         been initialised.
         """
-        for index, candidate in enumerate(self.population):
-            if self._nfev > self.maxfun:
-                break
+        self.population_energies = self._evaluate(self.population)
+        self._promote_lowest_energy()
 
-            parameters = self._scale_parameters(candidate)
-            self.population_energies[index] = self.func(parameters,
-                                                        *self.args)
-            self._nfev += 1
+    def _evaluate(self, trials):
+        """
+        Calculate the energies of the scaled solution vectors in `trials`
+        with a single call to the map-like callable, or to `func` itself if
+        it is vectorized. Members that don't fit in the remaining budget of
+        function evaluations are not evaluated, and get an energy of inf.
+        """
+        num_members = np.size(trials, 0)
+        energies = np.ones(num_members) * np.inf
 
-        minval = np.argmin(self.population_energies)
+        # the solver only stops once maxfun has been exceeded, so there is
+        # room for one more evaluation
+        S = int(min(num_members, max(self.maxfun + 1 - self._nfev, 0)))
+        if S == 0:
+            return energies
 
+        parameters = self._scale_parameters(trials[:S])
+        if self.vectorized:
+            calc_energies = self.func(parameters.T, *self.args)
+        else:
+            calc_energies = list(self._mapwrapper(self._wrapped_func,
+                                                  parameters))
+        calc_energies = np.squeeze(np.asarray(calc_energies, dtype=float))
+
+        if calc_energies.size != S:
+            if self.vectorized:
+                raise RuntimeError("The vectorized function must return an"
+                                   " array of shape (S,) when given an"
+                                   " array of shape (len(x), S)")
+            raise RuntimeError("func(x, *args) must return a scalar value,"
+                               " and the map-like callable must return a"
+                               " sequence the same length as its iterable")
+
+        energies[:S] = calc_energies
+        self._nfev += S
+        return energies
+
+    def _promote_lowest_energy(self):
         # put the lowest energy into the best solution position.
+        minval = np.argmin(self.population_energies)
         lowest_energy = self.population_energies[minval]
         self.population_energies[minval] = self.population_energies[0]
         self.population_energies[0] = lowest_energy
@@ -622,6 +767,28 @@ class DifferentialEvolutionSolver(object):
             self.scale = (self.random_number_generator.rand()
                           * (self.dither[1] - self.dither[0]) + self.dither[0])
 
+        if self._updating == 'deferred':
+            if self._nfev > self.maxfun:
+                raise StopIteration
+
+            # the whole generation of trial solutions is created from the
+            # current population, and evaluated in one go
+            trials = np.empty_like(self.population)
+            for candidate in range(self.num_population_members):
+                trials[candidate] = self._mutate(candidate)
+                self._ensure_constraint(trials[candidate])
+
+            energies = self._evaluate(trials)
+
+            # replace population members by trials with a lower energy, then
+            # put the best solution in first place
+            loc = energies < self.population_energies
+            self.population[loc] = trials[loc]
+            self.population_energies[loc] = energies[loc]
+            self._promote_lowest_energy()
+
+            return self.x, self.population_energies[0]
+
         for candidate in range(self.num_population_members):
             if self._nfev > self.maxfun:
                 raise StopIteration
@@ -653,6 +820,13 @@ class DifferentialEvolutionSolver(object):
 
         return self.x, self.population_energies[0]
 
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        # clean up any pool created by the map wrapper
+        return self._mapwrapper.__exit__(*args)
+
     def next(self):
         """
         Evolve the population by a single generation
@@ -786,3 +960,4 @@ class DifferentialEvolutionSolver(object):
         idxs = idxs[:number_samples]
         return idxs
 
+
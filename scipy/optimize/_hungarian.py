@@ -1,13 +1,17 @@
-# Hungarian algorithm (Kuhn-Munkres) for solving the linear sum assignment
-# problem. Taken from scikit-learn. Based on original code by Brian Clapper,
-# adapted to NumPy by Gael Varoquaux.
-# Further improvements by Ben Root, Vlad Niculae and Lars Buitinck.
+# Linear sum assignment problem. The interface was taken from scikit-learn,
+# based on original code by Brian Clapper, adapted to NumPy by Gael
+# Varoquaux, with further improvements by Ben Root, Vlad Niculae and Lars
+# Buitinck. The problem is now solved by the shortest augmenting path
+# algorithm in _lsap.pyx.
 #
 # Copyright (c) 2008 Brian M. Clapper <bmc@clapper.org>, Gael Varoquaux
 # Author: Brian M. Clapper, Gael Varoquaux
 # License: 3-clause BSD
 
 import numpy as np
+from scipy.sparse import issparse, csr_matrix
+
+from ._lsap import solve_dense, solve_sparse
 
 
 def linear_sum_assignment(cost_matrix):
@@ -33,12 +37,13 @@ def linear_sum_assignment(cost_matrix):
     columns, then not every row needs to be assigned to a column, and vice
     versa.
 
-    The method used is the Hungarian algorithm, also known as the Munkres or
-    Kuhn-Munkres algorithm.
+    The cost matrix may also be sparse, in which case only the pairs with a
+    stored entry can be matched. Stored zeros are allowed pairs of zero
+    cost.
 
     Parameters
     ----------
-    cost_matrix : array
+    cost_matrix : array or sparse matrix
         The cost matrix of the bipartite graph.
 
     Returns
@@ -50,10 +55,28 @@ def linear_sum_assignment(cost_matrix):
         sorted; in the case of a square cost matrix they will be equal to
         ``numpy.arange(cost_matrix.shape[0])``.
 
+    Raises
+    ------
+    ValueError
+        If `cost_matrix` is sparse and no assignment of all the rows (or of
+        all the columns, if there are fewer) to allowed pairs exists.
+
     Notes
     -----
+    The problem is solved by the shortest augmenting path algorithm of
+    Jonker and Volgenant in the rectangular form described in [6]_. Rows are
+    assigned one at a time, by a Dijkstra search for the cheapest augmenting
+    path in the reduced costs, which takes :math:`O(n^2 m)` time for an
+    ``n x m`` matrix with ``n <= m``; rectangular matrices need no padding.
+    For a sparse matrix the search runs over the stored entries only, using
+    a binary heap, so its cost depends on the pairs reached by the search.
+
     .. versionadded:: 0.17.0
 
+    .. versionchanged:: 1.0.0
+        The Hungarian algorithm was replaced by a compiled shortest
+        augmenting path solver, and sparse cost matrices are supported.
+
     Examples
     --------
     >>> cost = np.array([[4, 1, 3], [2, 0, 5], [3, 2, 2]])
@@ -64,6 +87,14 @@ def linear_sum_assignment(cost_matrix):
     >>> cost[row_ind, col_ind].sum()
     5
 
+    With a sparse cost matrix only the stored pairs can be matched:
+
+    >>> from scipy.sparse import csr_matrix
+    >>> cost = csr_matrix([[0, 1, 3], [2, 0, 0], [0, 2, 2]])
+    >>> row_ind, col_ind = linear_sum_assignment(cost)
+    >>> col_ind
+    array([1, 0, 2])
+
     References
     ----------
     1. http://csclab.murraystate.edu/bob.pilgrim/445/munkres.html
@@ -78,7 +109,14 @@ def linear_sum_assignment(cost_matrix):
        *J. SIAM*, 5(1):32-38, March, 1957.
 
     5. https://en.wikipedia.org/wiki/Hungarian_algorithm
+
+    .. [6] D. F. Crouse, "On implementing 2D rectangular assignment
+           algorithms", IEEE Transactions on Aerospace and Electronic
+           Systems, 52(4):1679-1696, 2016.
     """
+    if issparse(cost_matrix):
+        return _linear_sum_assignment_sparse(cost_matrix)
+
     cost_matrix = np.asarray(cost_matrix)
     if len(cost_matrix.shape) != 2:
         raise ValueError("expected a matrix (2-d array), got a %r array"
@@ -92,191 +130,40 @@ def linear_sum_assignment(cost_matrix):
     if np.any(np.isinf(cost_matrix) | np.isnan(cost_matrix)):
         raise ValueError("matrix contains invalid numeric entries")
 
-    if cost_matrix.dtype == np.dtype(np.bool):
-        cost_matrix = cost_matrix.astype(np.int)
-
     # The algorithm expects more columns than rows in the cost matrix.
-    if cost_matrix.shape[1] < cost_matrix.shape[0]:
+    transposed = cost_matrix.shape[1] < cost_matrix.shape[0]
+    if transposed:
         cost_matrix = cost_matrix.T
-        transposed = True
-    else:
-        transposed = False
+    cost_matrix = np.ascontiguousarray(cost_matrix, dtype=np.float64)
 
-    state = _Hungary(cost_matrix)
+    col4row = solve_dense(cost_matrix)
+    return _indices(col4row, transposed)
 
-    # No need to bother with assignments if one of the dimensions
-    # of the cost matrix is zero-length.
-    step = None if 0 in cost_matrix.shape else _step1
 
-    while step is not None:
-        step = step(state)
+def _linear_sum_assignment_sparse(cost_matrix):
+    cost_matrix = csr_matrix(cost_matrix, dtype=np.float64)
+    if not np.all(np.isfinite(cost_matrix.data)):
+        raise ValueError("matrix contains invalid numeric entries")
 
+    transposed = cost_matrix.shape[1] < cost_matrix.shape[0]
     if transposed:
-        marked = state.marked.T
+        cost_matrix = cost_matrix.T.tocsr()
     else:
-        marked = state.marked
-    return np.where(marked == 1)
-
-
-class _Hungary(object):
-    """State of the Hungarian algorithm.
-
-    Parameters
-    ----------
-    cost_matrix : 2D matrix
-        The cost matrix. Must have shape[1] >= shape[0].
-    """
-
-    def __init__(self, cost_matrix):
-        self.C = cost_matrix.copy()
-
-        n, m = self.C.shape
-        self.row_uncovered = np.ones(n, dtype=bool)
-        self.col_uncovered = np.ones(m, dtype=bool)
-        self.Z0_r = 0
-        self.Z0_c = 0
-        self.path = np.zeros((n + m, 2), dtype=int)
-        self.marked = np.zeros((n, m), dtype=int)
-
-    def _clear_covers(self):
-        """Clear all covered matrix cells"""
-        self.row_uncovered[:] = True
-        self.col_uncovered[:] = True
-
-
-# Individual steps of the algorithm follow, as a state machine: they return
-# the next step to be taken (function to be called), if any.
-
-def _step1(state):
-    """Steps 1 and 2 in the Wikipedia page."""
-
-    # Step 1: For each row of the matrix, find the smallest element and
-    # subtract it from every element in its row.
-    state.C -= state.C.min(axis=1)[:, np.newaxis]
-    # Step 2: Find a zero (Z) in the resulting matrix. If there is no
-    # starred zero in its row or column, star Z. Repeat for each element
-    # in the matrix.
-    for i, j in zip(*np.where(state.C == 0)):
-        if state.col_uncovered[j] and state.row_uncovered[i]:
-            state.marked[i, j] = 1
-            state.col_uncovered[j] = False
-            state.row_uncovered[i] = False
-
-    state._clear_covers()
-    return _step3
-
+        cost_matrix = cost_matrix.copy()
+    cost_matrix.sum_duplicates()
 
-def _step3(state):
-    """
-    Cover each column containing a starred zero. If n columns are covered,
-    the starred zeros describe a complete set of unique assignments.
-    In this case, Go to DONE, otherwise, Go to Step 4.
-    """
-    marked = (state.marked == 1)
-    state.col_uncovered[np.any(marked, axis=0)] = False
-
-    if marked.sum() < state.C.shape[0]:
-        return _step4
+    nr, nc = cost_matrix.shape
+    col4row = solve_sparse(nr, nc, cost_matrix.indptr.astype(np.intp),
+                           cost_matrix.indices.astype(np.intp),
+                           cost_matrix.data)
+    if col4row is None:
+        raise ValueError("cost matrix is infeasible")
+    return _indices(col4row, transposed)
 
 
-def _step4(state):
-    """
-    Find a noncovered zero and prime it. If there is no starred zero
-    in the row containing this primed zero, Go to Step 5. Otherwise,
-    cover this row and uncover the column containing the starred
-    zero. Continue in this manner until there are no uncovered zeros
-    left. Save the smallest uncovered value and Go to Step 6.
-    """
-    # We convert to int as numpy operations are faster on int
-    C = (state.C == 0).astype(int)
-    covered_C = C * state.row_uncovered[:, np.newaxis]
-    covered_C *= np.asarray(state.col_uncovered, dtype=int)
-    n = state.C.shape[0]
-    m = state.C.shape[1]
-
-    while True:
-        # Find an uncovered zero
-        row, col = np.unravel_index(np.argmax(covered_C), (n, m))
-        if covered_C[row, col] == 0:
-            return _step6
-        else:
-            state.marked[row, col] = 2
-            # Find the first starred element in the row
-            star_col = np.argmax(state.marked[row] == 1)
-            if state.marked[row, star_col] != 1:
-                # Could not find one
-                state.Z0_r = row
-                state.Z0_c = col
-                return _step5
-            else:
-                col = star_col
-                state.row_uncovered[row] = False
-                state.col_uncovered[col] = True
-                covered_C[:, col] = C[:, col] * (
-                    np.asarray(state.row_uncovered, dtype=int))
-                covered_C[row] = 0
-
-
-def _step5(state):
-    """
-    Construct a series of alternating primed and starred zeros as follows.
-    Let Z0 represent the uncovered primed zero found in Step 4.
-    Let Z1 denote the starred zero in the column of Z0 (if any).
-    Let Z2 denote the primed zero in the row of Z1 (there will always be one).
-    Continue until the series terminates at a primed zero that has no starred
-    zero in its column. Unstar each starred zero of the series, star each
-    primed zero of the series, erase all primes and uncover every line in the
-    matrix. Return to Step 3
-    """
-    count = 0
-    path = state.path
-    path[count, 0] = state.Z0_r
-    path[count, 1] = state.Z0_c
-
-    while True:
-        # Find the first starred element in the col defined by
-        # the path.
-        row = np.argmax(state.marked[:, path[count, 1]] == 1)
-        if state.marked[row, path[count, 1]] != 1:
-            # Could not find one
-            break
-        else:
-            count += 1
-            path[count, 0] = row
-            path[count, 1] = path[count - 1, 1]
-
-        # Find the first prime element in the row defined by the
-        # first path step
-        col = np.argmax(state.marked[path[count, 0]] == 2)
-        if state.marked[row, col] != 2:
-            col = -1
-        count += 1
-        path[count, 0] = path[count - 1, 0]
-        path[count, 1] = col
-
-    # Convert paths
-    for i in range(count + 1):
-        if state.marked[path[i, 0], path[i, 1]] == 1:
-            state.marked[path[i, 0], path[i, 1]] = 0
-        else:
-            state.marked[path[i, 0], path[i, 1]] = 1
-
-    state._clear_covers()
-    # Erase all prime markings
-    state.marked[state.marked == 2] = 0
-    return _step3
-
-
-def _step6(state):
-    """
-    Add the value found in Step 4 to every element of each covered row,
-    and subtract it from every element of each uncovered column.
-    Return to Step 4 without altering any stars, primes, or covered lines.
-    """
-    # the smallest uncovered value in the matrix
-    if np.any(state.row_uncovered) and np.any(state.col_uncovered):
-        minval = np.min(state.C[state.row_uncovered], axis=0)
-        minval = np.min(minval[state.col_uncovered])
-        state.C[~state.row_uncovered] += minval
-        state.C[:, state.col_uncovered] -= minval
-    return _step4
+def _indices(col4row, transposed):
+    """Row and column indices of an assignment, sorted by row."""
+    if transposed:
+        order = np.argsort(col4row)
+        return col4row[order], order
+    return np.arange(len(col4row)), col4row
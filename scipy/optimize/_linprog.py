@@ -1,6 +1,7 @@
 """
-A top-level linear programming interface. Currently this interface only
-solves linear programming problems via the Simplex Method.
+A top-level linear programming interface. Linear programming problems can
+be solved via the Simplex Method, the revised Simplex Method, or an
+interior-point method.
 
 .. versionadded:: 0.15.0
 
@@ -19,6 +20,8 @@ from __future__ import division, print_function, absolute_import
 
 import numpy as np
 from .optimize import OptimizeResult, _check_unknown_options
+from ._linprog_ip import _linprog_ip
+from ._linprog_rs import _linprog_rs
 
 __all__ = ['linprog', 'linprog_verbose_callback', 'linprog_terse_callback']
 
@@ -839,15 +842,17 @@ def linprog(c, A_ub=None, b_ub=None, A_eq=None, b_eq=None,
     ----------
     c : array_like
         Coefficients of the linear objective function to be minimized.
-    A_ub : array_like, optional
+    A_ub : array_like or sparse matrix, optional
         2-D array which, when matrix-multiplied by x, gives the values of the
-        upper-bound inequality constraints at x.
+        upper-bound inequality constraints at x. Sparse matrices are only
+        supported by the 'interior-point' and 'revised simplex' methods.
     b_ub : array_like, optional
         1-D array of values representing the upper-bound of each inequality
         constraint (row) in A_ub.
-    A_eq : array_like, optional
+    A_eq : array_like or sparse matrix, optional
         2-D array which, when matrix-multiplied by x, gives the values of the
-        equality constraints at x.
+        equality constraints at x. Sparse matrices are only supported by the
+        'interior-point' and 'revised simplex' methods.
     b_eq : array_like, optional
         1-D array of values representing the RHS of each equality constraint
         (row) in A_eq.
@@ -859,13 +864,18 @@ def linprog(c, A_ub=None, b_ub=None, A_eq=None, b_eq=None,
         If a sequence containing a single tuple is provided, then ``min`` and
         ``max`` will be applied to all variables in the problem.
     method : str, optional
-        Type of solver.  At this time only 'simplex' is supported
-        :ref:`(see here) <optimize.linprog-simplex>`.
+        Type of solver. Should be one of
+
+            - 'simplex'         :ref:`(see here) <optimize.linprog-simplex>`
+            - 'revised simplex' :ref:`(see here) <optimize.linprog-revised_simplex>`
+            - 'interior-point'  :ref:`(see here) <optimize.linprog-interior-point>`
+
     callback : callable, optional
         If a callback function is provide, it will be called within each
-        iteration of the simplex algorithm. The callback must have the signature
+        iteration of the algorithm. The callback must have the signature
         `callback(xk, **kwargs)` where xk is the current solution vector
-        and kwargs is a dictionary containing the following::
+        and kwargs is a dictionary. For the 'simplex' method it contains
+        the following::
 
             "tableau" : The current Simplex algorithm tableau
             "nit" : The current iteration.
@@ -873,6 +883,9 @@ def linprog(c, A_ub=None, b_ub=None, A_eq=None, b_eq=None,
             "phase" : Whether the algorithm is in Phase 1 or Phase 2.
             "basis" : The indices of the columns of the basic variables.
 
+        The other methods pass "nit" and "complete", and the 'revised
+        simplex' method also "phase" and "basis".
+
     options : dict, optional
         A dictionary of solver options. All methods accept the following
         generic options:
@@ -907,6 +920,7 @@ def linprog(c, A_ub=None, b_ub=None, A_eq=None, b_eq=None,
                  1 : Iteration limit reached
                  2 : Problem appears to be infeasible
                  3 : Problem appears to be unbounded
+                 4 : Numerical difficulties encountered
 
         nit : int
             The number of iterations performed.
@@ -924,10 +938,33 @@ def linprog(c, A_ub=None, b_ub=None, A_eq=None, b_eq=None,
 
     Method *Simplex* uses the Simplex algorithm (as it relates to Linear
     Programming, NOT the Nelder-Mead Simplex) [1]_, [2]_. This algorithm
-    should be reasonably reliable and fast.
+    should be reasonably reliable and fast for small problems.
 
     .. versionadded:: 0.15.0
 
+    Method *revised simplex* is a two-phase revised simplex method [4]_.
+    Instead of a dense tableau it keeps an LU factorization of the basis,
+    computed with `scipy.linalg.lu_factor` or, for sparse problems,
+    `scipy.sparse.linalg.splu`, and applies basis changes as product form
+    updates. It should be faster than *simplex* for all but the smallest
+    problems, and gives a vertex of the feasible set.
+
+    Method *interior-point* uses the primal-dual path following algorithm
+    outlined in [5]_, applied to the homogeneous self-dual formulation of
+    the problem, so that infeasibility and unboundedness are detected too.
+    Each iteration solves the normal equations, either with a Cholesky
+    factorization or, for sparse problems, a symmetric sparse LU
+    factorization; very large problems can use the conjugate gradient
+    method instead (option ``linear_solver='cg'``). It is usually the
+    fastest method for large, sparse problems, but its solution is only
+    accurate to the tolerance `tol` and may not be a vertex.
+
+    Both of these methods presolve the problem by default: empty rows
+    and columns, singleton rows and fixed variables are removed before the
+    problem is solved.
+
+    .. versionadded:: 1.0.0
+
     References
     ----------
     .. [1] Dantzig, George B., Linear programming and extensions. Rand
@@ -936,6 +973,12 @@ def linprog(c, A_ub=None, b_ub=None, A_eq=None, b_eq=None,
            Mathematical Programming", McGraw-Hill, Chapter 4.
     .. [3] Bland, Robert G. New finite pivoting rules for the simplex method.
            Mathematics of Operations Research (2), 1977: pp. 103-107.
+    .. [4] Bertsimas, Dimitris, and J. Tsitsiklis. "Introduction to linear
+           optimization." Athena Scientific 1 (1997): 997.
+    .. [5] Andersen, Erling D., and Knud D. Andersen. "The MOSEK interior
+           point optimizer for linear programming: an implementation of the
+           homogeneous algorithm." High performance optimization. Springer
+           US, 2000. 197-232.
 
     Examples
     --------
@@ -991,5 +1034,11 @@ def linprog(c, A_ub=None, b_ub=None, A_eq=None, b_eq=None,
     if meth == 'simplex':
         return _linprog_simplex(c, A_ub=A_ub, b_ub=b_ub, A_eq=A_eq, b_eq=b_eq,
                                 bounds=bounds, callback=callback, **options)
+    elif meth == 'revised simplex':
+        return _linprog_rs(c, A_ub=A_ub, b_ub=b_ub, A_eq=A_eq, b_eq=b_eq,
+                           bounds=bounds, callback=callback, **options)
+    elif meth == 'interior-point':
+        return _linprog_ip(c, A_ub=A_ub, b_ub=b_ub, A_eq=A_eq, b_eq=b_eq,
+                           bounds=bounds, callback=callback, **options)
     else:
         raise ValueError('Unknown solver %s' % method)
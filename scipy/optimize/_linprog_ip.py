@@ -0,0 +1,359 @@
+"""
+Interior-point method for linear programming.
+
+The problem is brought to standard form and solved with the homogeneous
+self-dual formulation of Andersen & Andersen [1]_, using Mehrotra's
+predictor-corrector steps. Each iteration solves two systems with the
+normal matrix ``A D A^T``, either directly (dense Cholesky, or a sparse
+symmetric LU factorization) or with preconditioned conjugate gradients.
+
+.. [1] Andersen, Erling D., and Knud D. Andersen. "The MOSEK interior point
+       optimizer for linear programming: an implementation of the
+       homogeneous algorithm." High performance optimization. Springer US,
+       2000. 197-232.
+"""
+
+from __future__ import division, print_function, absolute_import
+
+import numpy as np
+import scipy.sparse as sps
+from scipy.linalg import cho_factor, cho_solve, LinAlgError
+from scipy.sparse.linalg import splu, cg, LinearOperator
+from .optimize import _check_unknown_options
+from ._linprog_util import (_clean_inputs, _presolve, _get_standard_form,
+                            _linprog_result)
+
+__all__ = []
+
+
+def _normal_equations_solver(A, d, linear_solver):
+    """
+    Return a function solving ``(A diag(d) A^T) y = r``.
+
+    Direct factorizations that fail because the matrix is numerically
+    singular (as happens close to the solution, or when `A` has redundant
+    rows) are retried with an increasing diagonal regularization.
+    """
+    m = A.shape[0]
+    if m == 0:
+        return lambda r: np.zeros(0)
+
+    if linear_solver == 'cg':
+        if sps.issparse(A):
+            M_diag = A.multiply(A).dot(d)
+        else:
+            M_diag = np.dot(A**2, d)
+        M_diag[M_diag == 0] = 1
+        M = LinearOperator((m, m), matvec=lambda v: A.dot(d * A.T.dot(v)),
+                           dtype=float)
+        P = LinearOperator((m, m), matvec=lambda v: v / M_diag, dtype=float)
+
+        def solve(r):
+            y, info = cg(M, r, tol=1e-12, maxiter=10 * m, M=P)
+            return y
+        return solve
+
+    if sps.issparse(A):
+        M = A.dot(sps.diags(d)).dot(A.T).tocsc()
+        M_diag = M.diagonal()
+    else:
+        M = np.dot(A * d, A.T)
+        M_diag = np.diag(M)
+
+    reg = 0
+    scale = np.finfo(float).eps * max(M_diag.max(), 1)
+    for k in range(12):
+        try:
+            if sps.issparse(A):
+                # a symmetric ordering, and pivoting on the diagonal, makes
+                # this in effect a sparse Cholesky factorization
+                R = M + reg * sps.eye(m, format='csc')
+                return splu(R, permc_spec='MMD_AT_PLUS_A',
+                            diag_pivot_thresh=0,
+                            options=dict(SymmetricMode=True)).solve
+            R = M + reg * np.eye(m)
+            factor = cho_factor(R, check_finite=False)
+            return lambda r: cho_solve(factor, r, check_finite=False)
+        except (LinAlgError, RuntimeError):
+            reg = scale if reg == 0 else 100 * reg
+    raise LinAlgError("The normal equations are singular.")
+
+
+def _step_length(v, dv, alpha0):
+    # the largest step in (0, 1] keeping v + alpha * dv >= 0, damped by
+    # alpha0 so that the iterates stay strictly inside the positive orthant
+    neg = dv < 0
+    if not np.any(neg):
+        return 1.
+    return min(1., alpha0 * np.min(-v[neg] / dv[neg]))
+
+
+def _ip_hsd(A, b, c, alpha0, maxiter, tol, linear_solver, callback=None):
+    """
+    Solve ``min c^T x`` subject to ``A x == b``, ``x >= 0`` with the
+    homogeneous self-dual interior-point method.
+
+    Returns the scaled primal solution ``x / tau``, the status and the
+    number of iterations. `callback` is called with the current solution
+    estimate and the iteration number.
+    """
+    m, n = A.shape
+    x = np.ones(n)
+    z = np.ones(n)
+    y = np.zeros(m)
+    tau = kappa = 1.
+
+    def residuals(x, y, z, tau, kappa):
+        rp = b * tau - A.dot(x)
+        rd = c * tau - A.T.dot(y) - z
+        rg = c.dot(x) - b.dot(y) + kappa
+        mu = (x.dot(z) + tau * kappa) / (n + 1)
+        return rp, rd, rg, mu
+
+    rp0, rd0, rg0, mu0 = residuals(x, y, z, tau, kappa)
+    rp0_norm = max(1, np.linalg.norm(rp0))
+    rd0_norm = max(1, np.linalg.norm(rd0))
+    rg0_norm = max(1, abs(rg0))
+
+    status = 1
+    nit = 0
+    while nit < maxiter:
+        rp, rd, rg, mu = residuals(x, y, z, tau, kappa)
+
+        # relative measures of the distance to a solution, or to a
+        # certificate of infeasibility
+        rho_p = np.linalg.norm(rp) / rp0_norm
+        rho_d = np.linalg.norm(rd) / rd0_norm
+        rho_g = abs(rg) / rg0_norm
+        rho_mu = mu / mu0
+        rho_A = abs(c.dot(x) - b.dot(y)) / (tau + abs(b.dot(y)))
+
+        if callback is not None:
+            callback(x / tau, nit)
+
+        if rho_p <= tol and rho_d <= tol and rho_A <= tol:
+            status = 0
+            break
+        if ((rho_p <= tol and rho_d <= tol and rho_g <= tol and
+                tau <= tol * max(1, kappa)) or
+                (rho_mu <= tol and tau <= tol * min(1, kappa))):
+            # b^T y > 0 certifies that the primal is infeasible, and
+            # c^T x < 0 that it is unbounded (when it is feasible)
+            status = 2 if b.dot(y) > tol else 3
+            break
+
+        d = x / z
+        try:
+            solve = _normal_equations_solver(A, d, linear_solver)
+        except LinAlgError:
+            status = 4
+            break
+
+        # dy = p + q * dtau; q is the same for both steps
+        q = solve(A.dot(d * c) + b)
+        v = d * (A.T.dot(q) - c)
+
+        def direction(gamma, rxs, rtk):
+            eta = 1 - gamma
+            r1 = eta * rd - rxs / x
+            p = solve(eta * rp + A.dot(d * r1))
+            u = d * (A.T.dot(p) - r1)
+            dtau = ((eta * rg + rtk / tau - b.dot(p) + c.dot(u)) /
+                    (b.dot(q) - c.dot(v) + kappa / tau))
+            dx = u + v * dtau
+            dy = p + q * dtau
+            dz = (rxs - z * dx) / x
+            dkappa = (rtk - kappa * dtau) / tau
+            return dx, dy, dz, dtau, dkappa
+
+        def step(dx, dz, dtau, dkappa, alpha0):
+            return min(_step_length(x, dx, alpha0),
+                       _step_length(z, dz, alpha0),
+                       _step_length(np.array([tau]), np.array([dtau]),
+                                    alpha0),
+                       _step_length(np.array([kappa]), np.array([dkappa]),
+                                    alpha0))
+
+        # predictor: the affine scaling direction
+        dx, dy, dz, dtau, dkappa = direction(0, -x * z, -tau * kappa)
+        alpha = step(dx, dz, dtau, dkappa, 1.)
+
+        # corrector: centering with Mehrotra's heuristic, and a second
+        # order correction
+        mu_aff = ((x + alpha * dx).dot(z + alpha * dz) +
+                  (tau + alpha * dtau) * (kappa + alpha * dkappa)) / (n + 1)
+        gamma = (mu_aff / mu)**3
+        dx, dy, dz, dtau, dkappa = direction(
+            gamma, gamma * mu - x * z - dx * dz,
+            gamma * mu - tau * kappa - dtau * dkappa)
+        alpha = step(dx, dz, dtau, dkappa, alpha0)
+
+        x = x + alpha * dx
+        y = y + alpha * dy
+        z = z + alpha * dz
+        tau = tau + alpha * dtau
+        kappa = kappa + alpha * dkappa
+        nit += 1
+
+        if not (np.all(np.isfinite(x)) and np.isfinite(tau)):
+            status = 4
+            break
+
+    return x / tau, status, nit
+
+
+def _linprog_ip(c, A_ub=None, b_ub=None, A_eq=None, b_eq=None, bounds=None,
+                callback=None, maxiter=1000, disp=False, tol=1e-8,
+                presolve=True, sparse=None, linear_solver='direct',
+                alpha0=.99995, **unknown_options):
+    """
+    Minimize a linear objective function subject to linear equality and
+    inequality constraints using the interior-point method of [1]_.
+
+    Linear programming is intended to solve problems of the following form:
+
+    Minimize::
+
+        c^T * x
+
+    Subject to::
+
+        A_ub * x <= b_ub
+        A_eq * x == b_eq
+        bounds[i][0] < x_i < bounds[i][1]
+
+    Parameters
+    ----------
+    c : array_like
+        Coefficients of the linear objective function to be minimized.
+    A_ub : array_like or sparse matrix, optional
+        2-D array which, when matrix-multiplied by ``x``, gives the values of
+        the upper-bound inequality constraints at ``x``.
+    b_ub : array_like, optional
+        1-D array of values representing the upper-bound of each inequality
+        constraint (row) in ``A_ub``.
+    A_eq : array_like or sparse matrix, optional
+        2-D array which, when matrix-multiplied by ``x``, gives the values of
+        the equality constraints at ``x``.
+    b_eq : array_like, optional
+        1-D array of values representing the RHS of each equality constraint
+        (row) in ``A_eq``.
+    bounds : sequence, optional
+        ``(min, max)`` pairs for each element in ``x``, defining
+        the bounds on that parameter. Use None for one of ``min`` or
+        ``max`` when there is no bound in that direction. By default
+        bounds are ``(0, None)`` (non-negative).
+        If a sequence containing a single tuple is provided, then ``min`` and
+        ``max`` will be applied to all variables in the problem.
+    callback : callable, optional
+        If a callback function is provided, it will be called once per
+        iteration with the current estimate of the solution, as
+        ``callback(xk, **{"nit": nit, "complete": complete})``.
+
+    Options
+    -------
+    maxiter : int
+        The maximum number of iterations of the algorithm.
+    disp : bool
+        Set to True to print convergence messages.
+    tol : float
+        Termination tolerance for the relative primal and dual
+        infeasibilities and the relative duality gap.
+    presolve : bool
+        Remove empty rows and columns, singleton rows and fixed variables
+        before the problem is solved. Presolve can also detect trivial
+        infeasibility or unboundedness. Default is True.
+    sparse : bool or None
+        Whether to store the constraints, and solve the normal equations,
+        with sparse matrices. The default (None) is True if `A_ub` or `A_eq`
+        is a sparse matrix.
+    linear_solver : {'direct', 'cg'}
+        How the normal equations are solved in each iteration. 'direct'
+        (default) uses a Cholesky factorization for dense problems and a
+        symmetric sparse LU factorization (`scipy.sparse.linalg.splu`) for
+        sparse ones. 'cg' uses the Jacobi-preconditioned conjugate gradient
+        method (`scipy.sparse.linalg.cg`) without forming the normal
+        matrix, which saves memory on very large problems where a
+        factorization would fill in, at the cost of more, less accurate
+        iterations.
+    alpha0 : float
+        The fraction of the maximal step to the boundary of the positive
+        orthant taken in each iteration.
+
+    Returns
+    -------
+    A `scipy.optimize.OptimizeResult` consisting of the following fields:
+
+        x : ndarray
+            The independent variable vector which optimizes the linear
+            programming problem.
+        fun : float
+            Value of the objective function.
+        slack : ndarray
+            The values of the slack variables, ``b_ub - A_ub * x``.
+        success : bool
+            Returns True if the algorithm succeeded in finding an optimal
+            solution.
+        status : int
+            An integer representing the exit status of the optimization::
+
+                 0 : Optimization terminated successfully
+                 1 : Iteration limit reached
+                 2 : Problem appears to be infeasible
+                 3 : Problem appears to be unbounded
+                 4 : Numerical difficulties encountered
+
+        nit : int
+            The number of iterations performed.
+        message : str
+            A string descriptor of the exit status of the optimization.
+
+    Notes
+    -----
+    The solution is only accurate to about `tol`; unlike the simplex
+    methods, the interior-point method does not return a vertex of the
+    feasible set when the solution is not unique.
+
+    References
+    ----------
+    .. [1] Andersen, Erling D., and Knud D. Andersen. "The MOSEK interior
+           point optimizer for linear programming: an implementation of the
+           homogeneous algorithm." High performance optimization. Springer
+           US, 2000. 197-232.
+    """
+    _check_unknown_options(unknown_options)
+    if linear_solver not in ('direct', 'cg'):
+        raise ValueError("linear_solver must be 'direct' or 'cg'")
+
+    lp = _clean_inputs(c, A_ub, b_ub, A_eq, b_eq, bounds, sparse=sparse,
+                       method='interior-point')
+    x = np.zeros(lp.c.size)
+    cols = np.arange(lp.c.size)
+    reduced = lp
+    status = 0
+    nit = 0
+    if presolve:
+        reduced, x, cols, status = _presolve(lp, tol)
+
+    if status == 0 and cols.size:
+        A, b, cs, restore = _get_standard_form(reduced)
+
+        def ip_callback(x_std, nit):
+            x[cols] = restore(x_std)
+            callback(x.copy(), **{"nit": nit, "complete": False})
+
+        x_std, status, nit = _ip_hsd(
+            A, b, cs, alpha0, maxiter, tol, linear_solver,
+            callback=None if callback is None else ip_callback)
+        if status in (2, 3):
+            # x_std is a certificate of infeasibility or unboundedness
+            x = None
+        else:
+            x[cols] = restore(x_std)
+    elif status != 0:
+        x = None
+
+    result = _linprog_result(lp, x, nit, status, disp)
+    if callback is not None and x is not None:
+        callback(result.x, **{"nit": nit, "complete": True})
+    return result
@@ -0,0 +1,376 @@
+"""
+Revised simplex method for linear programming.
+
+Rather than updating a dense tableau, the revised simplex method keeps an LU
+factorization of the basis matrix and solves with it to obtain the pricing
+vector and the entering column. Basis changes are applied in product form
+(an "eta file") and the basis is refactored periodically, so that each
+iteration costs two triangular solves and a sparse update instead of a
+rank-one update of the full tableau.
+"""
+
+from __future__ import division, print_function, absolute_import
+
+import numpy as np
+import scipy.sparse as sps
+from scipy.linalg import lu_factor, lu_solve
+from scipy.sparse.linalg import splu
+from .optimize import _check_unknown_options
+from ._linprog_util import (_clean_inputs, _presolve, _get_standard_form,
+                            _linprog_result)
+
+__all__ = []
+
+
+class _BasisFactor(object):
+    """
+    An LU factorization ``B0 = L U`` of a basis matrix, together with the
+    eta matrices of the basis changes applied since, such that the current
+    basis is ``B = B0 E_1 ... E_k``.
+    """
+
+    def __init__(self, B):
+        if sps.issparse(B):
+            lu = splu(sps.csc_matrix(B))
+            self._solve0 = lu.solve
+            self._solve0_t = lambda r: lu.solve(r, trans='T')
+        else:
+            lu = lu_factor(B, check_finite=False)
+            self._solve0 = lambda r: lu_solve(lu, r, check_finite=False)
+            self._solve0_t = lambda r: lu_solve(lu, r, trans=1,
+                                                check_finite=False)
+        self.etas = []
+
+    def solve(self, r):
+        """Solve ``B x = r``."""
+        x = self._solve0(r)
+        for p, d in self.etas:
+            x[p] /= d[p]
+            xp = x[p]
+            x -= xp * d
+            x[p] = xp
+        return x
+
+    def solve_transposed(self, r):
+        """Solve ``B^T y = r``."""
+        y = np.array(r, dtype=float)
+        for p, d in reversed(self.etas):
+            y[p] = (y[p] - d.dot(y) + d[p] * y[p]) / d[p]
+        return self._solve0_t(y)
+
+    def update(self, p, d):
+        """Replace the basic variable of row `p`; ``d = B^{-1} a_q``."""
+        self.etas.append((p, d.copy()))
+
+
+def _solve_simplex_rs(A, b, c, basis, maxiter, nit, tol, bland, refactor,
+                      allowed=None, callback=None, phase=2):
+    """
+    Run the revised simplex method on ``min c^T x`` subject to ``A x == b``
+    and ``x >= 0``, starting from a feasible `basis`.
+
+    `A` must be a 2-D array or a CSC matrix. Only columns with `allowed`
+    True may enter the basis. Returns the final basis, the values of the
+    basic variables, the status and the total iteration count.
+    """
+    m, n = A.shape
+    basis = np.array(basis)
+    if allowed is None:
+        allowed = np.ones(n, dtype=bool)
+
+    def factor():
+        B = _BasisFactor(A[:, basis])
+        return B, B.solve(b)
+
+    B, x_B = factor()
+    status = 0
+    while True:
+        if callback is not None:
+            x = np.zeros(n)
+            x[basis] = x_B
+            callback(x, nit, phase, basis)
+
+        # pricing
+        y = B.solve_transposed(c[basis])
+        r = c - A.T.dot(y)
+        r[basis] = 0
+        candidates = np.nonzero((r < -tol) & allowed)[0]
+        if candidates.size == 0:
+            break
+        if nit >= maxiter:
+            status = 1
+            break
+        if bland:
+            q = candidates[0]
+        else:
+            q = candidates[np.argmin(r[candidates])]
+
+        # ratio test
+        a_q = A[:, [q]]
+        a_q = a_q.toarray().ravel() if sps.issparse(a_q) else a_q.ravel()
+        d = B.solve(a_q)
+        pos = np.nonzero(d > tol)[0]
+        if pos.size == 0:
+            status = 3
+            break
+        ratios = x_B[pos] / d[pos]
+        theta = ratios.min()
+        ties = pos[ratios <= theta + tol]
+        if bland:
+            p = ties[np.argmin(basis[ties])]
+        else:
+            p = ties[np.argmax(d[ties])]
+        theta = max(x_B[p] / d[p], 0)
+
+        x_B = x_B - theta * d
+        x_B[p] = theta
+        basis[p] = q
+        nit += 1
+        if len(B.etas) >= refactor:
+            B, x_B = factor()
+        else:
+            B.update(p, d)
+
+    return basis, x_B, status, nit
+
+
+def _revised_simplex(A, b, c, maxiter, tol, bland, refactor, callback=None):
+    """
+    Solve ``min c^T x`` subject to ``A x == b``, ``x >= 0`` with the
+    two-phase revised simplex method.
+
+    Phase 1 starts from a basis of the columns that are positive unit
+    vectors (typically slack variables) completed with artificial
+    variables, and minimizes the sum of the artificial variables.
+    """
+    m, n = A.shape
+    if m == 0:
+        return (None, 3, 0) if np.any(c < -tol) else (np.zeros(n), 0, 0)
+    sparse = sps.issparse(A)
+    flip = b < 0
+    sign = np.where(flip, -1., 1.)
+    if sparse:
+        A = sps.diags(sign).dot(A).tocsc()
+        A.eliminate_zeros()
+        nnz = np.diff(A.indptr)
+        single = np.nonzero(nnz == 1)[0]
+        rows = A.indices[A.indptr[single]]
+        vals = A.data[A.indptr[single]]
+    else:
+        A = A * sign[:, None]
+        nnz = (A != 0).sum(axis=0)
+        single = np.nonzero(nnz == 1)[0]
+        rows = np.argmax(A[:, single] != 0, axis=0)
+        vals = A[rows, single]
+    b = b * sign
+
+    # use positive unit columns for the initial basis where possible
+    basis = -np.ones(m, dtype=int)
+    for j, i, v in zip(single, rows, vals):
+        if v > 0 and basis[i] < 0:
+            basis[i] = j
+    artificial = np.nonzero(basis < 0)[0]
+    n_art = artificial.size
+    basis[artificial] = n + np.arange(n_art)
+
+    nit = 0
+    if n_art:
+        I = sps.csc_matrix((np.ones(n_art), (artificial, np.arange(n_art))),
+                           shape=(m, n_art))
+        A1 = sps.hstack([A, I], format='csc') if sparse else \
+            np.hstack([A, I.toarray()])
+        c1 = np.concatenate([np.zeros(n), np.ones(n_art)])
+
+        def callback1(x, nit, phase, basis):
+            callback(x[:n], nit, phase, basis)
+
+        basis, x_B, status, nit = _solve_simplex_rs(
+            A1, b, c1, basis, maxiter, nit, tol, bland, refactor,
+            callback=None if callback is None else callback1, phase=1)
+        if status == 1:
+            x = np.zeros(n)
+            x[basis[basis < n]] = x_B[basis < n]
+            return x, 1, nit
+        if c1[basis].dot(x_B) > tol * max(1, np.abs(b).max()):
+            return None, 2, nit
+
+        # drive the artificial variables that are still basic (at zero
+        # level) out of the basis. If that is impossible the row is
+        # redundant, and the artificial variable stays, never to change.
+        B = _BasisFactor(A1[:, basis])
+        for p in np.nonzero(basis >= n)[0]:
+            e = np.zeros(m)
+            e[p] = 1
+            row = A.T.dot(B.solve_transposed(e))
+            row[basis[basis < n]] = 0
+            j = np.argmax(np.abs(row))
+            if abs(row[j]) > tol:
+                a_j = A[:, [j]]
+                a_j = a_j.toarray().ravel() if sparse else a_j.ravel()
+                B.update(p, B.solve(a_j))
+                basis[p] = j
+
+        A2, c2 = A1, np.concatenate([c, np.zeros(n_art)])
+        allowed = np.arange(n + n_art) < n
+    else:
+        A2, c2, allowed = A, c, None
+
+    def callback2(x, nit, phase, basis):
+        callback(x[:n], nit, phase, basis)
+
+    basis, x_B, status, nit = _solve_simplex_rs(
+        A2, b, c2, basis, maxiter, nit, tol, bland, refactor, allowed,
+        callback=None if callback is None else callback2, phase=2)
+    if status == 3:
+        return None, 3, nit
+    x = np.zeros(n)
+    original = basis < n
+    x[basis[original]] = x_B[original]
+    return x, status, nit
+
+
+def _linprog_rs(c, A_ub=None, b_ub=None, A_eq=None, b_eq=None, bounds=None,
+                callback=None, maxiter=1000, disp=False, tol=1.0E-9,
+                bland=False, presolve=True, sparse=None, refactor=50,
+                **unknown_options):
+    """
+    Minimize a linear objective function subject to linear equality and
+    inequality constraints using the revised simplex method.
+
+    Linear programming is intended to solve problems of the following form:
+
+    Minimize::
+
+        c^T * x
+
+    Subject to::
+
+        A_ub * x <= b_ub
+        A_eq * x == b_eq
+        bounds[i][0] < x_i < bounds[i][1]
+
+    Parameters
+    ----------
+    c : array_like
+        Coefficients of the linear objective function to be minimized.
+    A_ub : array_like or sparse matrix, optional
+        2-D array which, when matrix-multiplied by ``x``, gives the values of
+        the upper-bound inequality constraints at ``x``.
+    b_ub : array_like, optional
+        1-D array of values representing the upper-bound of each inequality
+        constraint (row) in ``A_ub``.
+    A_eq : array_like or sparse matrix, optional
+        2-D array which, when matrix-multiplied by ``x``, gives the values of
+        the equality constraints at ``x``.
+    b_eq : array_like, optional
+        1-D array of values representing the RHS of each equality constraint
+        (row) in ``A_eq``.
+    bounds : sequence, optional
+        ``(min, max)`` pairs for each element in ``x``, defining
+        the bounds on that parameter. Use None for one of ``min`` or
+        ``max`` when there is no bound in that direction. By default
+        bounds are ``(0, None)`` (non-negative).
+        If a sequence containing a single tuple is provided, then ``min`` and
+        ``max`` will be applied to all variables in the problem.
+    callback : callable, optional
+        If a callback function is provided, it will be called once per
+        iteration with the current basic solution, as
+        ``callback(xk, **{"nit": nit, "phase": phase, "basis": basis,
+        "complete": complete})``. `basis` holds the indices of the basic
+        variables of the problem in standard form.
+
+    Options
+    -------
+    maxiter : int
+        The maximum number of iterations to perform.
+    disp : bool
+        If True, print exit status message to sys.stdout
+    tol : float
+        The tolerance which determines when a reduced cost or an entry of
+        the entering column is considered zero, and when phase 1 is
+        considered to have found a feasible point.
+    bland : bool
+        If True, use Bland's anti-cycling rule [1]_ to choose the entering
+        and leaving variables. If False (default), choose the entering
+        variable with the most negative reduced cost.
+    presolve : bool
+        Remove empty rows and columns, singleton rows and fixed variables
+        before the problem is solved. Default is True.
+    sparse : bool or None
+        Whether to store the constraints, and factor the basis, with sparse
+        matrices (`scipy.sparse.linalg.splu`) rather than with
+        `scipy.linalg.lu_factor`. The default (None) is True if `A_ub` or
+        `A_eq` is a sparse matrix.
+    refactor : int
+        The number of basis changes applied in product form before the
+        basis is factored from scratch.
+
+    Returns
+    -------
+    A `scipy.optimize.OptimizeResult` consisting of the following fields:
+
+        x : ndarray
+            The independent variable vector which optimizes the linear
+            programming problem.
+        fun : float
+            Value of the objective function.
+        slack : ndarray
+            The values of the slack variables, ``b_ub - A_ub * x``.
+        success : bool
+            Returns True if the algorithm succeeded in finding an optimal
+            solution.
+        status : int
+            An integer representing the exit status of the optimization::
+
+                 0 : Optimization terminated successfully
+                 1 : Iteration limit reached
+                 2 : Problem appears to be infeasible
+                 3 : Problem appears to be unbounded
+
+        nit : int
+            The number of iterations performed.
+        message : str
+            A string descriptor of the exit status of the optimization.
+
+    References
+    ----------
+    .. [1] Bland, Robert G. New finite pivoting rules for the simplex method.
+           Mathematics of Operations Research (2), 1977: pp. 103-107.
+    .. [2] Bertsimas, Dimitris, and J. Tsitsiklis. "Introduction to linear
+           optimization." Athena Scientific 1 (1997): 997.
+    """
+    _check_unknown_options(unknown_options)
+
+    lp = _clean_inputs(c, A_ub, b_ub, A_eq, b_eq, bounds, sparse=sparse,
+                       method='revised simplex')
+    x = np.zeros(lp.c.size)
+    cols = np.arange(lp.c.size)
+    reduced = lp
+    status = 0
+    nit = 0
+    if presolve:
+        reduced, x, cols, status = _presolve(lp, tol)
+
+    if status == 0 and cols.size:
+        A, b, cs, restore = _get_standard_form(reduced)
+
+        def rs_callback(x_std, nit, phase, basis):
+            x[cols] = restore(x_std)
+            callback(x.copy(), **{"nit": nit, "phase": phase,
+                                  "basis": basis, "complete": False})
+
+        x_std, status, nit = _revised_simplex(
+            A, b, cs, maxiter, tol, bland, refactor,
+            callback=None if callback is None else rs_callback)
+        if x_std is None:
+            x = None
+        else:
+            x[cols] = restore(x_std)
+    elif status != 0:
+        x = None
+
+    result = _linprog_result(lp, x, nit, status, disp)
+    if callback is not None and x is not None:
+        callback(result.x, **{"nit": nit, "phase": 2, "basis": None,
+                              "complete": True})
+    return result
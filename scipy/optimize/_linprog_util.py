@@ -0,0 +1,307 @@
+"""
+Utilities shared by the linprog methods that work on a problem in standard
+form: input validation, presolve, and the conversion to and from standard
+form.
+"""
+
+from __future__ import division, print_function, absolute_import
+
+from collections import namedtuple
+
+import numpy as np
+import scipy.sparse as sps
+from .optimize import OptimizeResult
+
+# A linear program ``min c^T x`` subject to ``A_ub x <= b_ub``,
+# ``A_eq x == b_eq`` and ``lb <= x <= ub``. The constraint matrices are
+# either both 2-D arrays or both CSR matrices.
+_LPProblem = namedtuple('_LPProblem', 'c A_ub b_ub A_eq b_eq lb ub')
+
+_messages = {0: "Optimization terminated successfully.",
+             1: "Iteration limit reached.",
+             2: "Optimization failed. The problem appears to be infeasible.",
+             3: "Optimization failed. The problem appears to be unbounded.",
+             4: "Optimization failed. Numerical difficulties encountered."}
+
+
+def _clean_inputs(c, A_ub=None, b_ub=None, A_eq=None, b_eq=None, bounds=None,
+                  sparse=None, method=''):
+    """
+    Validate the inputs of `linprog` and return them as an `_LPProblem`.
+
+    The constraint matrices are returned as CSR matrices if `sparse` is
+    True, or if `sparse` is None and either of them is a sparse matrix, and
+    as 2-D arrays otherwise. Missing bounds are returned as infinite.
+    """
+    def error(msg):
+        return ValueError("Invalid input for linprog with method = '%s'.  %s"
+                          % (method, msg))
+
+    c = np.asarray(c, dtype=float)
+    if c.ndim != 1:
+        raise error("c must be a 1-D array")
+    n = c.size
+    if sparse is None:
+        sparse = sps.issparse(A_ub) or sps.issparse(A_eq)
+
+    def clean_constraints(A, b, a_name, b_name):
+        if A is None:
+            A = np.empty((0, n))
+        if sps.issparse(A):
+            A = sps.csr_matrix(A, dtype=float)
+        else:
+            A = np.asarray(A, dtype=float)
+            if A.size == 0:
+                A = A.reshape(0, n)
+            if A.ndim != 2:
+                raise error("%s must be two-dimensional" % a_name)
+        if A.shape[1] != n:
+            raise error("Number of columns in %s must be equal to the size "
+                        "of c" % a_name)
+        if sparse:
+            A = sps.csr_matrix(A)
+        elif sps.issparse(A):
+            A = A.toarray()
+        b = np.empty(0) if b is None else np.asarray(b, dtype=float).ravel()
+        if b.size != A.shape[0]:
+            raise error("The number of rows in %s must be equal to the "
+                        "number of values in %s" % (a_name, b_name))
+        data = A.data if sparse else A
+        if not (np.all(np.isfinite(data)) and np.all(np.isfinite(b))):
+            raise error("%s and %s must be finite" % (a_name, b_name))
+        return A, b
+
+    A_ub, b_ub = clean_constraints(A_ub, b_ub, 'A_ub', 'b_ub')
+    A_eq, b_eq = clean_constraints(A_eq, b_eq, 'A_eq', 'b_eq')
+    if not np.all(np.isfinite(c)):
+        raise error("c must be finite")
+
+    lb = np.zeros(n)
+    ub = np.ones(n) * np.inf
+    if bounds is None or len(bounds) == 0:
+        pass
+    elif len(bounds) == 2 and not hasattr(bounds[0], '__len__'):
+        # All bounds are the same
+        lb[:] = bounds[0] if bounds[0] is not None else -np.inf
+        ub[:] = bounds[1] if bounds[1] is not None else np.inf
+    else:
+        if len(bounds) != n:
+            raise error("Length of bounds is inconsistent with the length "
+                        "of c")
+        for i in range(n):
+            if not hasattr(bounds[i], '__len__') or len(bounds[i]) != 2:
+                raise error("bounds must be a n x 2 sequence/array where "
+                            "n = len(c).")
+            lb[i] = bounds[i][0] if bounds[i][0] is not None else -np.inf
+            ub[i] = bounds[i][1] if bounds[i][1] is not None else np.inf
+
+    if np.any(lb > ub):
+        raise error("Lower bound %d is greater than upper bound"
+                    % np.nonzero(lb > ub)[0][0])
+    if np.any(lb == np.inf):
+        raise error("Lower bound may not be +infinity")
+    if np.any(ub == -np.inf):
+        raise error("Upper bound may not be -infinity")
+
+    return _LPProblem(c, A_ub, b_ub, A_eq, b_eq, lb, ub)
+
+
+def _row_nnz(A):
+    # the number of nonzero entries in each row of an array or sparse matrix
+    return np.asarray((A != 0).sum(axis=1)).ravel()
+
+
+def _presolve(lp, tol=1e-9):
+    """
+    Simplify a linear program before it is solved.
+
+    Removes fixed variables, empty rows, singleton rows (an equality fixes
+    its variable, an inequality becomes a bound) and empty columns, which
+    are set to their best bound. The rules are applied repeatedly, as each
+    removal can create new singletons.
+
+    Returns
+    -------
+    lp : _LPProblem
+        The reduced problem.
+    x : ndarray
+        The values of the removed variables, in a vector the size of the
+        original problem.
+    cols : ndarray
+        The indices of the variables that remain in the reduced problem.
+    status : int
+        0, or 2 if the problem was found to be infeasible.
+    """
+    c, A_ub, b_ub, A_eq, b_eq, lb, ub = lp
+    lb, ub = lb.copy(), ub.copy()
+    x = np.zeros(c.size)
+    cols = np.arange(c.size)
+
+    while True:
+        # equality rows with a single entry fix their variable
+        rows = np.nonzero(_row_nnz(A_eq) == 1)[0]
+        if rows.size:
+            S = sps.coo_matrix(A_eq[rows])
+            val = b_eq[rows][S.row] / S.data
+            for j, v in zip(S.col, val):
+                # this also catches a variable fixed by several rows
+                if v < lb[j] - tol or v > ub[j] + tol:
+                    return lp, x, cols, 2
+                lb[j] = ub[j] = v
+            keep = np.ones(b_eq.size, dtype=bool)
+            keep[rows] = False
+            A_eq, b_eq = A_eq[np.nonzero(keep)[0]], b_eq[keep]
+
+        # inequality rows with a single entry are bounds
+        rows = np.nonzero(_row_nnz(A_ub) == 1)[0]
+        if rows.size:
+            S = sps.coo_matrix(A_ub[rows])
+            val = b_ub[rows][S.row] / S.data
+            for j, a, v in zip(S.col, S.data, val):
+                if a > 0:
+                    ub[j] = min(ub[j], v)
+                else:
+                    lb[j] = max(lb[j], v)
+            if np.any(lb > ub + tol):
+                return lp, x, cols, 2
+            # bounds that cross within the tolerance fix the variable
+            ub = np.maximum(lb, ub)
+            keep = np.ones(b_ub.size, dtype=bool)
+            keep[rows] = False
+            A_ub, b_ub = A_ub[np.nonzero(keep)[0]], b_ub[keep]
+
+        # empty rows must be satisfied by the right-hand side
+        empty_eq = _row_nnz(A_eq) == 0
+        empty_ub = _row_nnz(A_ub) == 0
+        if (np.any(np.abs(b_eq[empty_eq]) > tol) or
+                np.any(b_ub[empty_ub] < -tol)):
+            return lp, x, cols, 2
+        keep = np.nonzero(~empty_eq)[0]
+        A_eq, b_eq = A_eq[keep], b_eq[keep]
+        keep = np.nonzero(~empty_ub)[0]
+        A_ub, b_ub = A_ub[keep], b_ub[keep]
+
+        # variables that appear in no constraint go to their best bound. If
+        # that is infinite the problem is unbounded unless it is infeasible,
+        # which is left to the solver to find out.
+        empty = ((_row_nnz(A_eq.T) == 0) & (_row_nnz(A_ub.T) == 0) &
+                 (lb != ub))
+        for j in np.nonzero(empty)[0]:
+            if c[j] > 0 or (c[j] == 0 and np.isfinite(lb[j])):
+                best = lb[j]
+            elif c[j] < 0 or np.isfinite(ub[j]):
+                best = ub[j]
+            else:
+                best = 0
+            if np.isfinite(best):
+                lb[j] = ub[j] = best
+
+        # remove the fixed variables
+        fixed = lb == ub
+        if not np.any(fixed):
+            break
+        j = np.nonzero(fixed)[0]
+        x[cols[j]] = lb[j]
+        b_eq = b_eq - A_eq[:, j].dot(lb[j])
+        b_ub = b_ub - A_ub[:, j].dot(lb[j])
+        keep = np.nonzero(~fixed)[0]
+        c, A_ub, A_eq = c[keep], A_ub[:, keep], A_eq[:, keep]
+        lb, ub, cols = lb[keep], ub[keep], cols[keep]
+
+    return _LPProblem(c, A_ub, b_ub, A_eq, b_eq, lb, ub), x, cols, 0
+
+
+def _get_standard_form(lp):
+    """
+    Convert a linear program to the standard form ``min c^T x`` subject to
+    ``A x == b`` and ``x >= 0``.
+
+    Variables with a finite lower bound are shifted by it, variables with
+    only an upper bound are mirrored, and free variables are split into a
+    difference of two nonnegative ones. Upper bounds of variables with both
+    bounds finite become inequality constraints, and every inequality gets
+    a slack variable.
+
+    Returns
+    -------
+    A : ndarray or csr_matrix
+        The constraint matrix; sparse if the input matrices are.
+    b, c : ndarray
+        The right-hand side and the objective.
+    restore : callable
+        ``restore(x)`` maps a point of the standard form problem back to the
+        variables of `lp`.
+    """
+    c, A_ub, b_ub, A_eq, b_eq, lb, ub = lp
+    n = c.size
+    sparse = sps.issparse(A_ub)
+
+    finite_lb = np.isfinite(lb)
+    finite_ub = np.isfinite(ub)
+    sign = np.where(finite_lb | ~finite_ub, 1., -1.)
+    shift = np.where(finite_lb, lb, np.where(finite_ub, ub, 0.))
+    free = np.nonzero(~finite_lb & ~finite_ub)[0]
+    boxed = np.nonzero(finite_lb & finite_ub)[0]
+    m_ub, m_eq, m_box = b_ub.size, b_eq.size, boxed.size
+
+    if sparse:
+        D = sps.diags(sign)
+        A = sps.vstack([A_ub.dot(D), A_eq.dot(D)], format='csr')
+        A = sps.hstack([
+            A, -A[:, free],
+            sps.vstack([sps.eye(m_ub, m_ub + m_box),
+                        sps.csr_matrix((m_eq, m_ub + m_box))])],
+            format='csr')
+        bound_rows = sps.csr_matrix(
+            (np.ones(m_box), (np.arange(m_box), boxed)),
+            shape=(m_box, A.shape[1]))
+        bound_rows = bound_rows + sps.csr_matrix(
+            (np.ones(m_box), (np.arange(m_box), n + free.size + m_ub +
+                              np.arange(m_box))), shape=(m_box, A.shape[1]))
+        A = sps.vstack([A[:m_ub], bound_rows, A[m_ub:]], format='csr')
+        b_shift = (A_ub.dot(shift), A_eq.dot(shift))
+    else:
+        A = np.vstack([A_ub * sign, A_eq * sign])
+        A = np.hstack([A, -A[:, free],
+                       np.vstack([np.eye(m_ub, m_ub + m_box),
+                                  np.zeros((m_eq, m_ub + m_box))])])
+        bound_rows = np.zeros((m_box, A.shape[1]))
+        bound_rows[np.arange(m_box), boxed] = 1
+        bound_rows[np.arange(m_box), n + free.size + m_ub +
+                   np.arange(m_box)] = 1
+        A = np.vstack([A[:m_ub], bound_rows, A[m_ub:]])
+        b_shift = (A_ub.dot(shift), A_eq.dot(shift))
+
+    b = np.concatenate([b_ub - b_shift[0], ub[boxed] - lb[boxed],
+                        b_eq - b_shift[1]])
+    c = np.concatenate([c * sign, -c[free] * sign[free],
+                        np.zeros(m_ub + m_box)])
+
+    def restore(x):
+        xr = shift + sign * x[:n]
+        xr[free] -= x[n:n + free.size]
+        return xr
+
+    return A, b, c, restore
+
+
+def _linprog_result(lp, x, nit, status, disp=False):
+    """
+    Assemble the `OptimizeResult` of the standard form linprog methods from
+    the original problem and the solution `x`.
+    """
+    if x is None:
+        x = np.ones(lp.c.size) * np.nan
+    fun = lp.c.dot(x)
+    slack = lp.b_ub - lp.A_ub.dot(x)
+    message = _messages[status]
+
+    if disp:
+        print(message)
+        if status in (0, 1):
+            print("         Current function value: {0: <12.6f}".format(fun))
+        print("         Iterations: {0:d}".format(nit))
+
+    return OptimizeResult(x=x, fun=fun, slack=slack, nit=int(nit),
+                          status=status, message=message,
+                          success=(status == 0))
@@ -0,0 +1,320 @@
+"""
+Cython implementation of the shortest augmenting path algorithm for the
+linear sum assignment problem. Used by ._hungarian.linear_sum_assignment.
+
+Both solvers assign every row of a cost matrix with at most as many rows as
+columns. Rows are added one at a time: a Dijkstra search in the reduced
+costs finds the cheapest augmenting path from the new row to an unassigned
+column, after which the dual variables are updated and the assignment is
+flipped along the path [1]_.
+
+The search starts from a greedy assignment: each row gets its cheapest
+column if that column is still free, with the row minimum as its dual
+variable, so that only the rows which lost out have to be augmented.
+
+References
+----------
+.. [1] D. F. Crouse, "On implementing 2D rectangular assignment
+       algorithms", IEEE Transactions on Aerospace and Electronic Systems,
+       52(4):1679-1696, 2016.
+"""
+
+cimport cython
+
+import numpy as np
+
+cimport numpy as np
+
+from libc.math cimport INFINITY
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.cdivision(True)
+def solve_dense(double[:, ::1] cost):
+    """Return the column assigned to each row of a dense cost matrix.
+
+    The matrix must not have more rows than columns. Returns None if no
+    complete assignment of finite cost exists.
+    """
+    cdef Py_ssize_t nr = cost.shape[0], nc = cost.shape[1]
+    cdef Py_ssize_t cur_row, i, j, k, it, index, sink, num_remaining
+
+    col4row_arr = np.full(nr, -1, dtype=np.intp)
+    cdef np.npy_intp[::1] col4row = col4row_arr
+    cdef np.npy_intp[::1] row4col = np.full(nc, -1, dtype=np.intp)
+    cdef np.npy_intp[::1] path = np.full(nc, -1, dtype=np.intp)
+    cdef np.npy_intp[::1] remaining = np.empty(nc, dtype=np.intp)
+    cdef double[::1] u = np.zeros(nr)
+    cdef double[::1] v = np.zeros(nc)
+    cdef double[::1] spc = np.empty(nc)
+    cdef np.uint8_t[::1] SR = np.empty(nr, dtype=np.uint8)
+    cdef np.uint8_t[::1] SC = np.empty(nc, dtype=np.uint8)
+    cdef double min_val, lowest, r
+
+    # Greedy initial assignment.
+    for i in range(nr):
+        index = 0
+        for j in range(1, nc):
+            if cost[i, j] < cost[i, index]:
+                index = j
+        u[i] = cost[i, index]
+        if row4col[index] == -1:
+            row4col[index] = i
+            col4row[i] = index
+
+    for cur_row in range(nr):
+        if col4row[cur_row] != -1:
+            continue
+        for j in range(nc):
+            spc[j] = INFINITY
+            SC[j] = 0
+            remaining[j] = j
+        for i in range(nr):
+            SR[i] = 0
+        num_remaining = nc
+        min_val = 0
+        i = cur_row
+        sink = -1
+
+        # Find the shortest augmenting path.
+        while sink == -1:
+            SR[i] = 1
+            index = -1
+            lowest = INFINITY
+            for it in range(num_remaining):
+                j = remaining[it]
+                r = min_val + cost[i, j] - u[i] - v[j]
+                if r < spc[j]:
+                    path[j] = i
+                    spc[j] = r
+                # Prefer unassigned columns among those of lowest cost,
+                # which shortens the search.
+                if spc[j] < lowest or (spc[j] == lowest and
+                                       row4col[j] == -1):
+                    lowest = spc[j]
+                    index = it
+
+            min_val = lowest
+            if min_val == INFINITY:
+                return None
+
+            j = remaining[index]
+            if row4col[j] == -1:
+                sink = j
+            else:
+                i = row4col[j]
+            SC[j] = 1
+            num_remaining -= 1
+            remaining[index] = remaining[num_remaining]
+
+        # Update the dual variables.
+        u[cur_row] += min_val
+        for i in range(nr):
+            if SR[i] and i != cur_row:
+                u[i] += min_val - spc[col4row[i]]
+        for j in range(nc):
+            if SC[j]:
+                v[j] -= min_val - spc[j]
+
+        # Augment the assignment along the path.
+        j = sink
+        while True:
+            i = path[j]
+            row4col[j] = i
+            k = col4row[i]
+            col4row[i] = j
+            j = k
+            if i == cur_row:
+                break
+
+    return col4row_arr
+
+
+# A binary min-heap of (distance, column) pairs for the sparse solver. Ties
+# in distance go to unassigned columns first, as in the dense solver.
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef inline bint _heap_less(double[::1] key, np.npy_intp[::1] col,
+                            np.npy_intp[::1] row4col,
+                            Py_ssize_t a, Py_ssize_t b) nogil:
+    if key[a] != key[b]:
+        return key[a] < key[b]
+    return row4col[col[a]] == -1 and row4col[col[b]] != -1
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef inline Py_ssize_t _heap_push(double[::1] key, np.npy_intp[::1] col,
+                                  np.npy_intp[::1] row4col, Py_ssize_t size,
+                                  double d, np.npy_intp j) nogil:
+    cdef Py_ssize_t pos = size, parent
+    key[pos] = d
+    col[pos] = j
+    while pos > 0:
+        parent = (pos - 1) // 2
+        if not _heap_less(key, col, row4col, pos, parent):
+            break
+        key[pos], key[parent] = key[parent], key[pos]
+        col[pos], col[parent] = col[parent], col[pos]
+        pos = parent
+    return size + 1
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef inline Py_ssize_t _heap_pop(double[::1] key, np.npy_intp[::1] col,
+                                 np.npy_intp[::1] row4col,
+                                 Py_ssize_t size) nogil:
+    cdef Py_ssize_t pos = 0, child
+    size -= 1
+    key[0] = key[size]
+    col[0] = col[size]
+    while True:
+        child = 2 * pos + 1
+        if child >= size:
+            break
+        if child + 1 < size and _heap_less(key, col, row4col,
+                                           child + 1, child):
+            child += 1
+        if not _heap_less(key, col, row4col, child, pos):
+            break
+        key[pos], key[child] = key[child], key[pos]
+        col[pos], col[child] = col[child], col[pos]
+        pos = child
+    return size
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def solve_sparse(Py_ssize_t nr, Py_ssize_t nc, np.npy_intp[::1] indptr,
+                 np.npy_intp[::1] indices, double[::1] data):
+    """Return the column assigned to each row of a CSR cost matrix.
+
+    Pairs without a stored entry are forbidden. The matrix must not have
+    more rows than columns. Returns None if no complete assignment exists.
+
+    Only the columns reached by a search are visited and reset, so the cost
+    of adding a row depends on the size of its search tree rather than on
+    the number of columns.
+    """
+    cdef Py_ssize_t cur_row, i, j, k, p, sink, heap_size
+    cdef Py_ssize_t n_rows_seen, n_cols_seen
+
+    col4row_arr = np.full(nr, -1, dtype=np.intp)
+    cdef np.npy_intp[::1] col4row = col4row_arr
+    cdef np.npy_intp[::1] row4col = np.full(nc, -1, dtype=np.intp)
+    cdef np.npy_intp[::1] path = np.full(nc, -1, dtype=np.intp)
+    cdef double[::1] u = np.zeros(nr)
+    cdef double[::1] v = np.zeros(nc)
+    cdef double[::1] spc = np.full(nc, INFINITY)
+    cdef np.uint8_t[::1] SC = np.zeros(nc, dtype=np.uint8)
+    # Rows visited and columns reached by the current search.
+    cdef np.npy_intp[::1] rows_seen = np.empty(nr, dtype=np.intp)
+    cdef np.npy_intp[::1] cols_seen = np.empty(nc, dtype=np.intp)
+    # Columns are pushed at most once per stored entry in a search.
+    cdef Py_ssize_t heap_cap = indices.shape[0] + 1
+    cdef double[::1] heap_key = np.empty(heap_cap)
+    cdef np.npy_intp[::1] heap_col = np.empty(heap_cap, dtype=np.intp)
+    cdef double min_val, r
+
+    sink = 0
+    with nogil:
+        # Greedy initial assignment.
+        for i in range(nr):
+            k = -1
+            for p in range(indptr[i], indptr[i + 1]):
+                if k == -1 or data[p] < data[k]:
+                    k = p
+            if k == -1:
+                continue
+            u[i] = data[k]
+            j = indices[k]
+            if row4col[j] == -1:
+                row4col[j] = i
+                col4row[i] = j
+
+        for cur_row in range(nr):
+            if col4row[cur_row] != -1:
+                continue
+            n_rows_seen = 0
+            n_cols_seen = 0
+            heap_size = 0
+            min_val = 0
+            i = cur_row
+            sink = -1
+
+            # Find the shortest augmenting path.
+            while sink == -1:
+                rows_seen[n_rows_seen] = i
+                n_rows_seen += 1
+                for p in range(indptr[i], indptr[i + 1]):
+                    j = indices[p]
+                    if SC[j]:
+                        continue
+                    r = min_val + data[p] - u[i] - v[j]
+                    if r < spc[j]:
+                        if spc[j] == INFINITY:
+                            cols_seen[n_cols_seen] = j
+                            n_cols_seen += 1
+                        path[j] = i
+                        spc[j] = r
+                        heap_size = _heap_push(heap_key, heap_col, row4col,
+                                               heap_size, r, j)
+
+                # Pop the closest column not finalised yet, skipping stale
+                # heap entries.
+                j = -1
+                while heap_size > 0:
+                    k = heap_col[0]
+                    r = heap_key[0]
+                    heap_size = _heap_pop(heap_key, heap_col, row4col,
+                                          heap_size)
+                    if not SC[k] and r == spc[k]:
+                        j = k
+                        break
+                if j == -1:
+                    break
+
+                min_val = spc[j]
+                SC[j] = 1
+                if row4col[j] == -1:
+                    sink = j
+                else:
+                    i = row4col[j]
+
+            if sink != -1:
+                # Update the dual variables.
+                u[cur_row] += min_val
+                for k in range(1, n_rows_seen):
+                    i = rows_seen[k]
+                    u[i] += min_val - spc[col4row[i]]
+                for k in range(n_cols_seen):
+                    j = cols_seen[k]
+                    if SC[j]:
+                        v[j] -= min_val - spc[j]
+
+                # Augment the assignment along the path.
+                j = sink
+                while True:
+                    i = path[j]
+                    row4col[j] = i
+                    k = col4row[i]
+                    col4row[i] = j
+                    j = k
+                    if i == cur_row:
+                        break
+
+            # Reset the search state of the columns reached.
+            for k in range(n_cols_seen):
+                j = cols_seen[k]
+                spc[j] = INFINITY
+                SC[j] = 0
+
+            if sink == -1:
+                break
+
+    if sink == -1:
+        return None
+    return col4row_arr
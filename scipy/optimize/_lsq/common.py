@@ -614,6 +614,42 @@ def compute_jac_scale(J, scale_inv_old=None):
     return 1 / scale_inv, scale_inv
 
 
+def update_jac(J, s, y):
+    """Update the Jacobian after a step `s` which changed residuals by `y`.
+
+    Uses Broyden's rank-one update for dense `J`. For sparse `J` the update
+    of each row is restricted to its sparsity structure (Schubert's update),
+    so that the structure is preserved. `J` is modified in place.
+    """
+    r = y - J.dot(s)
+    if issparse(J):
+        rows = np.repeat(np.arange(J.shape[0]), np.diff(J.indptr))
+        s_data = s[J.indices]
+        s_norm = np.bincount(rows, s_data**2, minlength=J.shape[0])
+        mask = s_norm > 0
+        r[mask] /= s_norm[mask]
+        r[~mask] = 0
+        J.data += r[rows] * s_data
+    else:
+        s_norm = np.dot(s, s)
+        if s_norm > 0:
+            J += np.outer(r / s_norm, s)
+    return J
+
+
+def lsmr_warm_start(A, b, x):
+    """Scale `x` to minimize ``norm(A x - b)``.
+
+    Returns a starting point for `lsmr` which is never worse than zero, or
+    None if `x` is in the null space of `A`.
+    """
+    Ax = A.dot(x)
+    Ax_norm = np.dot(Ax, Ax)
+    if Ax_norm == 0:
+        return None
+    return x * (np.dot(Ax, b) / Ax_norm)
+
+
 def left_multiplied_operator(J, d):
     """Return diag(d) J as LinearOperator."""
     J = aslinearoperator(J)
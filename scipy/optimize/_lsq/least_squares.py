@@ -11,10 +11,11 @@ from scipy.sparse.linalg import LinearOperator
 from scipy.optimize import _minpack, OptimizeResult
 from scipy.optimize._numdiff import approx_derivative, group_columns
 from scipy._lib.six import string_types
+from scipy._lib._util import MapWrapper
 
 from .trf import trf
 from .dogbox import dogbox
-from .common import EPS, in_bounds, make_strictly_feasible
+from .common import EPS, in_bounds, make_strictly_feasible, update_jac
 
 
 TERMINATION_MESSAGES = {
@@ -235,7 +236,8 @@ def least_squares(
         fun, x0, jac='2-point', bounds=(-np.inf, np.inf), method='trf',
         ftol=1e-8, xtol=1e-8, gtol=1e-8, x_scale=1.0, loss='linear',
         f_scale=1.0, diff_step=None, tr_solver=None, tr_options={},
-        jac_sparsity=None, max_nfev=None, verbose=0, args=(), kwargs={}):
+        jac_sparsity=None, max_nfev=None, verbose=0, args=(), kwargs={},
+        workers=1, vectorized=False, jac_reuse=0):
     """Solve a nonlinear least-squares problem with bounds on the variables.
 
     Given the residuals f(x) (an m-dimensional real function of n real
@@ -420,6 +422,30 @@ def least_squares(
         Additional arguments passed to `fun` and `jac`. Both empty by default.
         The calling signature is ``fun(x, *args, **kwargs)`` and the same for
         `jac`.
+    workers : int or map-like callable, optional
+        If `workers` is an int the finite difference points are evaluated in
+        parallel by that many processes (uses `multiprocessing.Pool`), -1
+        meaning all available CPU cores. Alternatively supply a map-like
+        callable, such as `multiprocessing.Pool.map`, which is called as
+        ``workers(func, iterable)``. Requires that `fun` be pickleable when a
+        process pool is used. Has no effect for 'lm' method or when `jac` is
+        callable.
+    vectorized : bool, optional
+        If True, the finite difference points are sent to `fun` in a single
+        call, as the columns of an array of shape ``(n, k)``, and `fun` must
+        return an array of shape ``(m, k)``. `fun` is still called with
+        arrays of shape ``(n,)`` during the iterations. Has no effect for
+        'lm' method or when `jac` is callable. Default is False.
+    jac_reuse : int, optional
+        The number of consecutive iterations in which the finite difference
+        Jacobian is not estimated anew, but updated from the last step and
+        the change of the residuals: by Broyden's rank-one formula for dense
+        Jacobians, and by Schubert's update, which keeps the sparsity
+        structure, with `jac_sparsity`. This saves function evaluations when
+        estimating the Jacobian dominates the cost of an iteration, at the
+        expense of less accurate steps. Default is 0, which estimates the
+        Jacobian in every iteration. Has no effect for 'lm' method or when
+        `jac` is callable.
 
     Returns
     -------
@@ -456,8 +482,9 @@ def least_squares(
         count function calls for numerical Jacobian approximation, as opposed
         to 'lm' method.
     njev : int or None
-        Number of Jacobian evaluations done. If numerical Jacobian
-        approximation is used in 'lm' method, it is set to None.
+        Number of Jacobian evaluations done, not counting the updates made
+        with `jac_reuse`. If numerical Jacobian approximation is used in 'lm'
+        method, it is set to None.
     status : int
         The reason for algorithm termination:
 
@@ -763,6 +790,9 @@ def least_squares(
     if max_nfev is not None and max_nfev <= 0:
         raise ValueError("`max_nfev` must be None or positive integer.")
 
+    if jac_reuse < 0 or int(jac_reuse) != jac_reuse:
+        raise ValueError("`jac_reuse` must be a non-negative integer.")
+
     if np.iscomplexobj(x0):
         raise ValueError("`x0` must be real.")
 
@@ -823,100 +853,134 @@ def least_squares(
     else:
         initial_cost = 0.5 * np.dot(f0, f0)
 
-    if callable(jac):
-        J0 = jac(x0, *args, **kwargs)
-
-        if issparse(J0):
-            J0 = csr_matrix(J0)
-
-            def jac_wrapped(x, _=None):
-                return csr_matrix(jac(x, *args, **kwargs))
-
-        elif isinstance(J0, LinearOperator):
-            def jac_wrapped(x, _=None):
-                return jac(x, *args, **kwargs)
-
-        else:
-            J0 = np.atleast_2d(J0)
-
-            def jac_wrapped(x, _=None):
-                return np.atleast_2d(jac(x, *args, **kwargs))
-
-    else:  # Estimate Jacobian by finite differences.
-        if method == 'lm':
-            if jac_sparsity is not None:
-                raise ValueError("method='lm' does not support "
-                                 "`jac_sparsity`.")
-
-            if jac != '2-point':
-                warn("jac='{0}' works equivalently to '2-point' "
-                     "for method='lm'.".format(jac))
-
-            J0 = jac_wrapped = None
-        else:
-            if jac_sparsity is not None and tr_solver == 'exact':
-                raise ValueError("tr_solver='exact' is incompatible "
-                                 "with `jac_sparsity`.")
+    jac_state = None
+    mapper = None
+    try:
+        if callable(jac):
+            J0 = jac(x0, *args, **kwargs)
 
-            jac_sparsity = check_jac_sparsity(jac_sparsity, m, n)
+            if issparse(J0):
+                J0 = csr_matrix(J0)
 
-            def jac_wrapped(x, f):
-                J = approx_derivative(fun, x, rel_step=diff_step, method=jac,
-                                      f0=f, bounds=bounds, args=args,
-                                      kwargs=kwargs, sparsity=jac_sparsity)
-                if J.ndim != 2:  # J is guaranteed not sparse.
-                    J = np.atleast_2d(J)
+                def jac_wrapped(x, _=None):
+                    return csr_matrix(jac(x, *args, **kwargs))
 
-                return J
+            elif isinstance(J0, LinearOperator):
+                def jac_wrapped(x, _=None):
+                    return jac(x, *args, **kwargs)
 
-            J0 = jac_wrapped(x0, f0)
+            else:
+                J0 = np.atleast_2d(J0)
 
-    if J0 is not None:
-        if J0.shape != (m, n):
-            raise ValueError(
-                "The return value of `jac` has wrong shape: expected {0}, "
-                "actual {1}.".format((m, n), J0.shape))
+                def jac_wrapped(x, _=None):
+                    return np.atleast_2d(jac(x, *args, **kwargs))
 
-        if not isinstance(J0, np.ndarray):
+        else:  # Estimate Jacobian by finite differences.
             if method == 'lm':
-                raise ValueError("method='lm' works only with dense "
-                                 "Jacobian matrices.")
+                if jac_sparsity is not None:
+                    raise ValueError("method='lm' does not support "
+                                     "`jac_sparsity`.")
 
-            if tr_solver == 'exact':
-                raise ValueError(
-                    "tr_solver='exact' works only with dense "
-                    "Jacobian matrices.")
+                if jac != '2-point':
+                    warn("jac='{0}' works equivalently to '2-point' "
+                         "for method='lm'.".format(jac))
 
-        jac_scale = isinstance(x_scale, string_types) and x_scale == 'jac'
-        if isinstance(J0, LinearOperator) and jac_scale:
-            raise ValueError("x_scale='jac' can't be used when `jac` "
-                             "returns LinearOperator.")
-
-        if tr_solver is None:
-            if isinstance(J0, np.ndarray):
-                tr_solver = 'exact'
+                J0 = jac_wrapped = None
             else:
-                tr_solver = 'lsmr'
-
-    if method == 'lm':
-        result = call_minpack(fun_wrapped, x0, jac_wrapped, ftol, xtol, gtol,
-                              max_nfev, x_scale, diff_step)
-
-    elif method == 'trf':
-        result = trf(fun_wrapped, jac_wrapped, x0, f0, J0, lb, ub, ftol, xtol,
-                     gtol, max_nfev, x_scale, loss_function, tr_solver,
-                     tr_options.copy(), verbose)
-
-    elif method == 'dogbox':
-        if tr_solver == 'lsmr' and 'regularize' in tr_options:
-            warn("The keyword 'regularize' in `tr_options` is not relevant "
-                 "for 'dogbox' method.")
-            tr_options = tr_options.copy()
-            del tr_options['regularize']
-
-        result = dogbox(fun_wrapped, jac_wrapped, x0, f0, J0, lb, ub, ftol,
-                        xtol, gtol, max_nfev, x_scale, loss_function,
-                        tr_solver, tr_options, verbose)
+                if jac_sparsity is not None and tr_solver == 'exact':
+                    raise ValueError("tr_solver='exact' is incompatible "
+                                     "with `jac_sparsity`.")
+
+                jac_sparsity = check_jac_sparsity(jac_sparsity, m, n)
+
+                # a process pool, if any, is kept for the whole solve and
+                # released below
+                mapper = MapWrapper(1 if vectorized else workers)
+
+                def jac_estimate(x, f):
+                    J = approx_derivative(fun, x, rel_step=diff_step, method=jac,
+                                          f0=f, bounds=bounds, args=args,
+                                          kwargs=kwargs, sparsity=jac_sparsity,
+                                          workers=mapper, vectorized=vectorized)
+                    if J.ndim != 2:  # J is guaranteed not sparse.
+                        J = np.atleast_2d(J)
+
+                    return J
+
+                if jac_reuse:
+                    jac_state = dict(x=None, f=None, J=None, age=0, njev=0)
+
+                    def jac_wrapped(x, f):
+                        if (jac_state['J'] is not None and
+                                jac_state['age'] < jac_reuse):
+                            J = update_jac(jac_state['J'], x - jac_state['x'],
+                                           f - jac_state['f'])
+                            jac_state['age'] += 1
+                        else:
+                            J = jac_estimate(x, f)
+                            jac_state['age'] = 0
+                            jac_state['njev'] += 1
+                        jac_state.update(x=x.copy(), f=f.copy(), J=J)
+                        # the solvers may scale the returned Jacobian in place
+                        return J.copy()
+                else:
+                    jac_wrapped = jac_estimate
+
+                J0 = jac_wrapped(x0, f0)
+
+        if J0 is not None:
+            if J0.shape != (m, n):
+                raise ValueError(
+                    "The return value of `jac` has wrong shape: expected {0}, "
+                    "actual {1}.".format((m, n), J0.shape))
+
+            if not isinstance(J0, np.ndarray):
+                if method == 'lm':
+                    raise ValueError("method='lm' works only with dense "
+                                     "Jacobian matrices.")
+
+                if tr_solver == 'exact':
+                    raise ValueError(
+                        "tr_solver='exact' works only with dense "
+                        "Jacobian matrices.")
+
+            jac_scale = isinstance(x_scale, string_types) and x_scale == 'jac'
+            if isinstance(J0, LinearOperator) and jac_scale:
+                raise ValueError("x_scale='jac' can't be used when `jac` "
+                                 "returns LinearOperator.")
+
+            if tr_solver is None:
+                if isinstance(J0, np.ndarray):
+                    tr_solver = 'exact'
+                else:
+                    tr_solver = 'lsmr'
+
+        if method == 'lm':
+            result = call_minpack(fun_wrapped, x0, jac_wrapped, ftol, xtol, gtol,
+                                  max_nfev, x_scale, diff_step)
+
+        elif method == 'trf':
+            result = trf(fun_wrapped, jac_wrapped, x0, f0, J0, lb, ub, ftol, xtol,
+                         gtol, max_nfev, x_scale, loss_function, tr_solver,
+                         tr_options.copy(), verbose)
+
+        elif method == 'dogbox':
+            if tr_solver == 'lsmr' and 'regularize' in tr_options:
+                warn("The keyword 'regularize' in `tr_options` is not relevant "
+                     "for 'dogbox' method.")
+                tr_options = tr_options.copy()
+                del tr_options['regularize']
+
+            result = dogbox(fun_wrapped, jac_wrapped, x0, f0, J0, lb, ub, ftol,
+                            xtol, gtol, max_nfev, x_scale, loss_function,
+                            tr_solver, tr_options, verbose)
+    finally:
+        if mapper is not None:
+            mapper.close()
+            mapper.join()
+
+    if jac_state is not None:
+        result.njev = jac_state['njev']
 
     result.message = TERMINATION_MESSAGES[result.status]
     result.success = result.status > 0
@@ -13,6 +13,7 @@ __all__ = ['minimize', 'minimize_scalar']
 
 
 from warnings import warn
+from timeit import default_timer
 
 import numpy as np
 
@@ -22,10 +23,12 @@ from scipy._lib.six import callable
 from .optimize import (_minimize_neldermead, _minimize_powell, _minimize_cg,
                       _minimize_bfgs, _minimize_newtoncg,
                       _minimize_scalar_brent, _minimize_scalar_bounded,
-                      _minimize_scalar_golden, MemoizeJac)
+                      _minimize_scalar_golden, MemoizeJac,
+                      _EvaluationCache, _CachedFunction, _ProfiledFunction)
 from ._trustregion_dogleg import _minimize_dogleg
 from ._trustregion_ncg import _minimize_trust_ncg
 from ._trustregion_exact import _minimize_trustregion_exact
+from ._trustregion_krylov import _minimize_trust_krylov
 
 # constrained minimization
 from .lbfgsb import _minimize_lbfgsb
@@ -36,7 +39,7 @@ from .slsqp import _minimize_slsqp
 
 def minimize(fun, x0, args=(), method=None, jac=None, hess=None,
              hessp=None, bounds=None, constraints=(), tol=None,
-             callback=None, options=None):
+             callback=None, options=None, cache_size=0, profile=False):
     """Minimization of scalar function of one or more variables.
 
     In general, the optimization problems are of the form::
@@ -81,6 +84,7 @@ def minimize(fun, x0, args=(), method=None, jac=None, hess=None,
             - 'dogleg'      :ref:`(see here) <optimize.minimize-dogleg>`
             - 'trust-ncg'   :ref:`(see here) <optimize.minimize-trustncg>`
             - 'trust-exact' :ref:`(see here) <optimize.minimize-trustexact>`
+            - 'trust-krylov' :ref:`(see here) <optimize.minimize-trustkrylov>`
             - custom - a callable object (added in version 0.14.0),
               see below for description.
 
@@ -88,7 +92,8 @@ def minimize(fun, x0, args=(), method=None, jac=None, hess=None,
         depending if the problem has constraints or bounds.
     jac : bool or callable, optional
         Jacobian (gradient) of objective function. Only for CG, BFGS,
-        Newton-CG, L-BFGS-B, TNC, SLSQP, dogleg, trust-ncg.
+        Newton-CG, L-BFGS-B, TNC, SLSQP, dogleg, trust-ncg, trust-exact,
+        trust-krylov.
         If `jac` is a Boolean and is True, `fun` is assumed to return the
         gradient along with the objective function. If False, the
         gradient will be estimated numerically.
@@ -97,7 +102,9 @@ def minimize(fun, x0, args=(), method=None, jac=None, hess=None,
     hess, hessp : callable, optional
         Hessian (matrix of second-order derivatives) of objective function or
         Hessian of objective function times an arbitrary vector p.  Only for
-        Newton-CG, dogleg, trust-ncg.
+        Newton-CG, dogleg, trust-ncg, trust-exact (`hess` only) and
+        trust-krylov. For trust-exact and trust-krylov, `hess` may return
+        a sparse matrix, and for trust-krylov also a `LinearOperator`.
         Only one of `hessp` or `hess` needs to be given.  If `hess` is
         provided, then `hessp` will be ignored.  If neither `hess` nor
         `hessp` is provided, then the Hessian product will be approximated
@@ -140,6 +147,39 @@ def minimize(fun, x0, args=(), method=None, jac=None, hess=None,
     callback : callable, optional
         Called after each iteration, as ``callback(xk)``, where ``xk`` is the
         current parameter vector.
+    cache_size : int, optional
+        Number of values of the objective function, its gradient and its
+        Hessian (or Hessian-vector product) to keep in a least recently used
+        cache, keyed on the exact value of ``x``. A solver evaluating one of
+        these functions at a point where it was already evaluated, for
+        instance in a line search or when estimating the gradient by finite
+        differences, then reuses the value instead of calling the function
+        again. The ``nfev``, ``njev`` and ``nhev`` counts of the result
+        include the calls answered by the cache. Default is 0, no caching.
+
+        .. versionadded:: 1.0.0
+    profile : bool, optional
+        If True, record the number of calls of, and the wall time spent in,
+        each user-supplied function. They are returned in the ``profile``
+        attribute of the result, a dict with the items
+
+            ncalls, time : dict
+                The number of calls and the total time in seconds, keyed by
+                ``'fun'``, ``'jac'``, ``'hess'``, ``'hessp'``,
+                ``'callback'``, ``'constr'`` and ``'constr_jac'`` for the
+                functions given.
+            total_time : float
+                Wall time of the whole minimization.
+            user_time, solver_time : float
+                The parts of ``total_time`` spent in the user functions and
+                in the solver itself.
+            cache_hits, cache_misses : int
+                Number of function values found in, or missing from, the
+                cache. Only present if `cache_size` is given.
+
+        Default is False.
+
+        .. versionadded:: 1.0.0
 
     Returns
     -------
@@ -216,6 +256,14 @@ def minimize(fun, x0, args=(), method=None, jac=None, hess=None,
     *not* required to be positive definite). It is, in many
     situations, the Newton method to converge in fewer iteraction
     and the most recommended for small and medium-size problems.
+    Sparse Hessians are factorized with a sparse LDL decomposition.
+
+    Method :ref:`trust-krylov <optimize.minimize-trustkrylov>` uses
+    the generalized Lanczos trust-region algorithm [14]_ for
+    unconstrained minimization. Like trust-ncg it only needs products
+    with the Hessian, but it keeps improving the step along the boundary
+    of the trust region, and it accepts a preconditioner. Suitable for
+    large-scale problems.
 
     **Constrained minimization**
 
@@ -307,6 +355,9 @@ def minimize(fun, x0, args=(), method=None, jac=None, hess=None,
        Center -- Institute for Flight Mechanics, Koln, Germany.
     .. [13] Conn, A. R., Gould, N. I., and Toint, P. L.
        Trust region methods. 2000. Siam. pp. 169-200.
+    .. [14] Gould, N. I. M., Lucidi, S., Roma, M., and Toint, P. L.
+       Solving the trust-region subproblem using the Lanczos method.
+       1999. SIAM Journal on Optimization, 9(2), 504-525.
 
     Examples
     --------
@@ -398,16 +449,17 @@ def minimize(fun, x0, args=(), method=None, jac=None, hess=None,
              RuntimeWarning)
     # - hess
     if meth not in ('newton-cg', 'dogleg', 'trust-ncg',
-                    'trust-exact', '_custom') and hess is not None:
+                    'trust-exact', 'trust-krylov', '_custom') and hess is not None:
         warn('Method %s does not use Hessian information (hess).' % method,
              RuntimeWarning)
     # - hessp
-    if meth not in ('newton-cg', 'dogleg', 'trust-ncg', '_custom') and hessp is not None:
+    if meth not in ('newton-cg', 'dogleg', 'trust-ncg', 'trust-krylov',
+                    '_custom') and hessp is not None:
         warn('Method %s does not use Hessian-vector product '
                 'information (hessp).' % method, RuntimeWarning)
     # - constraints or bounds
     if (meth in ['nelder-mead', 'powell', 'cg', 'bfgs', 'newton-cg', 'dogleg',
-                 'trust-ncg'] and (bounds is not None or np.any(constraints))):
+                 'trust-ncg', 'trust-exact', 'trust-krylov'] and (bounds is not None or np.any(constraints))):
         warn('Method %s cannot handle constraints nor bounds.' % method,
              RuntimeWarning)
     if meth in ['l-bfgs-b', 'tnc'] and np.any(constraints):
@@ -425,6 +477,33 @@ def minimize(fun, x0, args=(), method=None, jac=None, hess=None,
         warn('Method %s does not support the return_all option.' % method,
              RuntimeWarning)
 
+    if profile:
+        start_time = default_timer()
+        stats = {}
+        fun = _ProfiledFunction(fun, 'fun', stats)
+        if callable(jac):
+            jac = _ProfiledFunction(jac, 'jac', stats)
+        if callable(hess):
+            hess = _ProfiledFunction(hess, 'hess', stats)
+        if callable(hessp):
+            hessp = _ProfiledFunction(hessp, 'hessp', stats)
+        if callable(callback):
+            callback = _ProfiledFunction(callback, 'callback', stats)
+        if constraints:
+            constraints = _profile_constraints(constraints, stats)
+
+    if cache_size:
+        cache = _EvaluationCache(cache_size)
+        # with jac=True the values of fun are (f, g) tuples, shared by
+        # MemoizeJac below
+        fun = _CachedFunction(fun, 'fun', cache)
+        if callable(jac):
+            jac = _CachedFunction(jac, 'jac', cache)
+        if callable(hess):
+            hess = _CachedFunction(hess, 'hess', cache)
+        if callable(hessp):
+            hessp = _CachedFunction(hessp, 'hessp', cache, narg=2)
+
     # fun also returns the jacobian
     if not callable(jac):
         if bool(jac):
@@ -444,49 +523,81 @@ def minimize(fun, x0, args=(), method=None, jac=None, hess=None,
         if meth in ['powell', 'l-bfgs-b', 'tnc', 'slsqp']:
             options.setdefault('ftol', tol)
         if meth in ['bfgs', 'cg', 'l-bfgs-b', 'tnc', 'dogleg',
-                    'trust-ncg', 'trust-exact']:
+                    'trust-ncg', 'trust-exact', 'trust-krylov']:
             options.setdefault('gtol', tol)
         if meth in ['cobyla', '_custom']:
             options.setdefault('tol', tol)
 
     if meth == '_custom':
-        return method(fun, x0, args=args, jac=jac, hess=hess, hessp=hessp,
-                      bounds=bounds, constraints=constraints,
-                      callback=callback, **options)
+        res = method(fun, x0, args=args, jac=jac, hess=hess, hessp=hessp,
+                     bounds=bounds, constraints=constraints,
+                     callback=callback, **options)
     elif meth == 'nelder-mead':
-        return _minimize_neldermead(fun, x0, args, callback, **options)
+        res = _minimize_neldermead(fun, x0, args, callback, **options)
     elif meth == 'powell':
-        return _minimize_powell(fun, x0, args, callback, **options)
+        res = _minimize_powell(fun, x0, args, callback, **options)
     elif meth == 'cg':
-        return _minimize_cg(fun, x0, args, jac, callback, **options)
+        res = _minimize_cg(fun, x0, args, jac, callback, **options)
     elif meth == 'bfgs':
-        return _minimize_bfgs(fun, x0, args, jac, callback, **options)
+        res = _minimize_bfgs(fun, x0, args, jac, callback, **options)
     elif meth == 'newton-cg':
-        return _minimize_newtoncg(fun, x0, args, jac, hess, hessp, callback,
-                                  **options)
+        res = _minimize_newtoncg(fun, x0, args, jac, hess, hessp, callback,
+                                 **options)
     elif meth == 'l-bfgs-b':
-        return _minimize_lbfgsb(fun, x0, args, jac, bounds,
-                                callback=callback, **options)
+        res = _minimize_lbfgsb(fun, x0, args, jac, bounds,
+                               callback=callback, **options)
     elif meth == 'tnc':
-        return _minimize_tnc(fun, x0, args, jac, bounds, callback=callback,
-                             **options)
+        res = _minimize_tnc(fun, x0, args, jac, bounds, callback=callback,
+                            **options)
     elif meth == 'cobyla':
-        return _minimize_cobyla(fun, x0, args, constraints, **options)
+        res = _minimize_cobyla(fun, x0, args, constraints, **options)
     elif meth == 'slsqp':
-        return _minimize_slsqp(fun, x0, args, jac, bounds,
-                               constraints, callback=callback, **options)
+        res = _minimize_slsqp(fun, x0, args, jac, bounds,
+                              constraints, callback=callback, **options)
     elif meth == 'dogleg':
-        return _minimize_dogleg(fun, x0, args, jac, hess,
-                                callback=callback, **options)
+        res = _minimize_dogleg(fun, x0, args, jac, hess,
+                               callback=callback, **options)
     elif meth == 'trust-ncg':
-        return _minimize_trust_ncg(fun, x0, args, jac, hess, hessp,
-                                   callback=callback, **options)
+        res = _minimize_trust_ncg(fun, x0, args, jac, hess, hessp,
+                                  callback=callback, **options)
     elif meth == 'trust-exact':
-        return _minimize_trustregion_exact(fun, x0, args, jac, hess,
-                                           callback=callback, **options)
+        res = _minimize_trustregion_exact(fun, x0, args, jac, hess,
+                                          callback=callback, **options)
+    elif meth == 'trust-krylov':
+        res = _minimize_trust_krylov(fun, x0, args, jac, hess, hessp,
+                                     callback=callback, **options)
     else:
         raise ValueError('Unknown solver %s' % method)
 
+    if profile:
+        ncalls = dict((name, entry[0]) for name, entry in stats.items())
+        times = dict((name, entry[1]) for name, entry in stats.items())
+        total_time = default_timer() - start_time
+        user_time = sum(times.values())
+        res.profile = {'ncalls': ncalls, 'time': times,
+                       'total_time': total_time, 'user_time': user_time,
+                       'solver_time': max(total_time - user_time, 0.)}
+        if cache_size:
+            res.profile['cache_hits'] = cache.hits
+            res.profile['cache_misses'] = cache.misses
+
+    return res
+
+
+def _profile_constraints(constraints, stats):
+    """Wrap the functions of constraint dicts with `_ProfiledFunction`."""
+    if isinstance(constraints, dict):
+        constraints = (constraints,)
+    profiled = []
+    for con in constraints:
+        con = dict(con)
+        if callable(con.get('fun')):
+            con['fun'] = _ProfiledFunction(con['fun'], 'constr', stats)
+        if callable(con.get('jac')):
+            con['jac'] = _ProfiledFunction(con['jac'], 'constr_jac', stats)
+        profiled.append(con)
+    return profiled
+
 
 def minimize_scalar(fun, bracket=None, bounds=None, args=(),
                     method='brent', tol=None, options=None):
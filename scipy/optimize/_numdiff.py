@@ -5,10 +5,17 @@ from __future__ import division
 import numpy as np
 
 from ..sparse import issparse, csc_matrix, csr_matrix, coo_matrix, find
+from .._lib._util import MapWrapper, _FunctionWrapper
 from ._group_columns import group_dense, group_sparse
 
 EPS = np.finfo(np.float64).eps
 
+# Perturbed points are built and evaluated in blocks such that neither the
+# points nor their function values exceed this many elements, which bounds
+# the memory used beyond that of the Jacobian itself while still giving the
+# map-like callable a large batch.
+_BLOCK_SIZE = 2**20
+
 
 def _adjust_scheme_to_bounds(x0, h, num_steps, scheme, lb, ub):
     """Adjust final difference scheme to the presence of bounds.
@@ -178,7 +185,7 @@ def group_columns(A, order=0):
 
 def approx_derivative(fun, x0, method='3-point', rel_step=None, f0=None,
                       bounds=(-np.inf, np.inf), sparsity=None, args=(),
-                      kwargs={}):
+                      kwargs={}, workers=1, vectorized=False):
     """Compute finite difference approximation of the derivatives of a
     vector-valued function.
 
@@ -243,6 +250,19 @@ def approx_derivative(fun, x0, method='3-point', rel_step=None, f0=None,
     args, kwargs : tuple and dict, optional
         Additional arguments passed to `fun`. Both empty by default.
         The calling signature is ``fun(x, *args, **kwargs)``.
+    workers : int or map-like callable, optional
+        If `workers` is an int the perturbed points are evaluated in parallel
+        by that many processes (uses `multiprocessing.Pool`), -1 meaning
+        all available CPU cores. Alternatively supply a map-like callable,
+        such as `multiprocessing.Pool.map`, which is called as
+        ``workers(func, iterable)``. Requires that `fun` be pickleable when a
+        process pool is used. Default is 1, evaluating the points in turn.
+    vectorized : bool, optional
+        If True, `fun` is called with all perturbed points at once, as the
+        columns of an array `x` of shape ``(n, k)``, and must return an
+        array of shape ``(m, k)`` (or ``(k,)`` when ``m == 1``). `fun` is
+        still called with an array of shape ``(n,)`` to compute `f0`.
+        `workers` is ignored in this case. Default is False.
 
     Returns
     -------
@@ -341,6 +361,27 @@ def approx_derivative(fun, x0, method='3-point', rel_step=None, f0=None,
         if f0.ndim > 1:
             raise ValueError("`f0` passed has more than 1 dimension.")
 
+    if vectorized:
+        def fun_batch(xs):
+            f = np.asarray(fun(xs.T, *args, **kwargs))
+            if f.ndim == 1 and f0.size == 1:
+                f = f[np.newaxis]
+            if f.shape != (f0.size, xs.shape[0]):
+                raise RuntimeError("vectorized `fun` must return an array of "
+                                   "shape (m, k) when called with an array "
+                                   "of shape (n, k).")
+            return f.T
+    else:
+        func = _FunctionWrapper(fun, args, kwargs)
+
+        def fun_batch(xs):
+            # `mapper` is bound below, for the duration of the differencing
+            f = [np.atleast_1d(fi) for fi in mapper(func, xs)]
+            if any(fi.ndim > 1 for fi in f):
+                raise RuntimeError(("`fun` return value has "
+                                    "more than 1 dimension."))
+            return np.array(f)
+
     if np.any((x0 < lb) | (x0 > ub)):
         raise ValueError("`x0` violates bound constraints.")
 
@@ -355,9 +396,7 @@ def approx_derivative(fun, x0, method='3-point', rel_step=None, f0=None,
     elif method == 'cs':
         use_one_sided = False
 
-    if sparsity is None:
-        return _dense_difference(fun_wrapped, x0, f0, h, use_one_sided, method)
-    else:
+    if sparsity is not None:
         if not issparse(sparsity) and len(sparsity) == 2:
             structure, groups = sparsity
         else:
@@ -370,43 +409,53 @@ def approx_derivative(fun, x0, method='3-point', rel_step=None, f0=None,
             structure = np.atleast_2d(structure)
 
         groups = np.atleast_1d(groups)
-        return _sparse_difference(fun_wrapped, x0, f0, h, use_one_sided,
-                                  structure, groups, method)
+
+    with MapWrapper(1 if vectorized else workers) as mapper:
+        if sparsity is None:
+            return _dense_difference(fun_batch, x0, f0, h, use_one_sided,
+                                     method)
+        else:
+            return _sparse_difference(fun_batch, x0, f0, h, use_one_sided,
+                                      structure, groups, method)
 
 
 def _dense_difference(fun, x0, f0, h, use_one_sided, method):
+    # `fun` evaluates the rows of a 2-D array of points, returning the
+    # function values as rows, so that each block of perturbed points is
+    # handed over in a single call.
     m = f0.size
     n = x0.size
     J_transposed = np.empty((n, m))
-    h_vecs = np.diag(h)
+    block = max(1, _BLOCK_SIZE // max(n, m))
+
+    for start in range(0, n, block):
+        stop = min(start + block, n)
+        i = np.arange(start, stop)
+        h_vecs = np.zeros((stop - start, n))
+        h_vecs[i - start, i] = h[i]
 
-    for i in range(h.size):
         if method == '2-point':
-            x = x0 + h_vecs[i]
-            dx = x[i] - x0[i]  # Recompute dx as exactly representable number.
+            x = x0 + h_vecs
+            # Recompute dx as exactly representable number.
+            dx = x[i - start, i] - x0[i]
             df = fun(x) - f0
-        elif method == '3-point' and use_one_sided[i]:
-            x1 = x0 + h_vecs[i]
-            x2 = x0 + 2 * h_vecs[i]
-            dx = x2[i] - x0[i]
-            f1 = fun(x1)
-            f2 = fun(x2)
-            df = -3.0 * f0 + 4 * f1 - f2
-        elif method == '3-point' and not use_one_sided[i]:
-            x1 = x0 - h_vecs[i]
-            x2 = x0 + h_vecs[i]
-            dx = x2[i] - x1[i]
-            f1 = fun(x1)
-            f2 = fun(x2)
-            df = f2 - f1
+        elif method == '3-point':
+            one_sided = use_one_sided[i, np.newaxis]
+            x1 = x0 + np.where(one_sided, h_vecs, -h_vecs)
+            x2 = x0 + np.where(one_sided, 2 * h_vecs, h_vecs)
+            f = fun(np.vstack((x1, x2)))
+            f1, f2 = f[:stop - start], f[stop - start:]
+            dx = np.where(use_one_sided[i], x2[i - start, i] - x0[i],
+                          x2[i - start, i] - x1[i - start, i])
+            df = np.where(one_sided, -3.0 * f0 + 4 * f1 - f2, f2 - f1)
         elif method == 'cs':
-            f1 = fun(x0 + h_vecs[i]*1.j)
+            f1 = fun(x0 + h_vecs*1.j)
             df = f1.imag
-            dx = h_vecs[i, i]
+            dx = h[i]
         else:
             raise RuntimeError("Never be here.")
 
-        J_transposed[i] = df / dx
+        J_transposed[start:stop] = df / dx[:, np.newaxis]
 
     if m == 1:
         J_transposed = np.ravel(J_transposed)
@@ -423,69 +472,88 @@ def _sparse_difference(fun, x0, f0, h, use_one_sided,
     fractions = []
 
     n_groups = np.max(groups) + 1
-    for group in range(n_groups):
-        # Perturb variables which are in the same group simultaneously.
-        e = np.equal(group, groups)
-        h_vec = h * e
-        if method == '2-point':
-            x = x0 + h_vec
-            dx = x - x0
-            df = fun(x) - f0
-            # The result is  written to columns which correspond to perturbed
-            # variables.
-            cols, = np.nonzero(e)
-            # Find all non-zero elements in selected columns of Jacobian.
-            i, j, _ = find(structure[:, cols])
-            # Restore column indices in the full array.
-            j = cols[j]
-        elif method == '3-point':
-            # Here we do conceptually the same but separate one-sided
-            # and two-sided schemes.
-            x1 = x0.copy()
-            x2 = x0.copy()
-
-            mask_1 = use_one_sided & e
-            x1[mask_1] += h_vec[mask_1]
-            x2[mask_1] += 2 * h_vec[mask_1]
-
-            mask_2 = ~use_one_sided & e
-            x1[mask_2] -= h_vec[mask_2]
-            x2[mask_2] += h_vec[mask_2]
-
-            dx = np.zeros(n)
-            dx[mask_1] = x2[mask_1] - x0[mask_1]
-            dx[mask_2] = x2[mask_2] - x1[mask_2]
-
-            f1 = fun(x1)
-            f2 = fun(x2)
-
-            cols, = np.nonzero(e)
-            i, j, _ = find(structure[:, cols])
-            j = cols[j]
-
-            mask = use_one_sided[j]
-            df = np.empty(m)
-
-            rows = i[mask]
-            df[rows] = -3 * f0[rows] + 4 * f1[rows] - f2[rows]
-
-            rows = i[~mask]
-            df[rows] = f2[rows] - f1[rows]
-        elif method == 'cs':
-            f1 = fun(x0 + h_vec*1.j)
-            df = f1.imag
-            dx = h_vec
-            cols, = np.nonzero(e)
-            i, j, _ = find(structure[:, cols])
-            j = cols[j]
-        else:
-            raise ValueError("Never be here.")
-
-        # All that's left is to compute the fraction. We store i, j and
-        # fractions as separate arrays and later construct coo_matrix.
-        row_indices.append(i)
-        col_indices.append(j)
-        fractions.append(df[i] / dx[j])
+    block = max(1, _BLOCK_SIZE // max(n, m))
+    for start in range(0, n_groups, block):
+        block_groups = range(start, min(start + block, n_groups))
+
+        # Build the perturbed points of a block of groups, so that they are
+        # evaluated in a single call.
+        points = []
+        for group in block_groups:
+            # Perturb variables which are in the same group simultaneously.
+            e = np.equal(group, groups)
+            h_vec = h * e
+            if method == '2-point':
+                points.append(x0 + h_vec)
+            elif method == '3-point':
+                # Here we do conceptually the same but separate one-sided
+                # and two-sided schemes.
+                x1 = x0.copy()
+                x2 = x0.copy()
+
+                mask_1 = use_one_sided & e
+                x1[mask_1] += h_vec[mask_1]
+                x2[mask_1] += 2 * h_vec[mask_1]
+
+                mask_2 = ~use_one_sided & e
+                x1[mask_2] -= h_vec[mask_2]
+                x2[mask_2] += h_vec[mask_2]
+
+                points.extend([x1, x2])
+            elif method == 'cs':
+                points.append(x0 + h_vec*1.j)
+            else:
+                raise ValueError("Never be here.")
+
+        f_points = fun(np.array(points))
+
+        for k, group in enumerate(block_groups):
+            e = np.equal(group, groups)
+            if method == '2-point':
+                x = points[k]
+                dx = x - x0
+                df = f_points[k] - f0
+                # The result is  written to columns which correspond to
+                # perturbed variables.
+                cols, = np.nonzero(e)
+                # Find all non-zero elements in selected columns of Jacobian.
+                i, j, _ = find(structure[:, cols])
+                # Restore column indices in the full array.
+                j = cols[j]
+            elif method == '3-point':
+                x1, x2 = points[2 * k], points[2 * k + 1]
+                f1, f2 = f_points[2 * k], f_points[2 * k + 1]
+
+                mask_1 = use_one_sided & e
+                mask_2 = ~use_one_sided & e
+                dx = np.zeros(n)
+                dx[mask_1] = x2[mask_1] - x0[mask_1]
+                dx[mask_2] = x2[mask_2] - x1[mask_2]
+
+                cols, = np.nonzero(e)
+                i, j, _ = find(structure[:, cols])
+                j = cols[j]
+
+                mask = use_one_sided[j]
+                df = np.empty(m)
+
+                rows = i[mask]
+                df[rows] = -3 * f0[rows] + 4 * f1[rows] - f2[rows]
+
+                rows = i[~mask]
+                df[rows] = f2[rows] - f1[rows]
+            else:
+                df = f_points[k].imag
+                dx = h * e
+                cols, = np.nonzero(e)
+                i, j, _ = find(structure[:, cols])
+                j = cols[j]
+
+            # All that's left is to compute the fraction. We store i, j and
+            # fractions as separate arrays and later construct coo_matrix.
+            row_indices.append(i)
+            col_indices.append(j)
+            fractions.append(df[i] / dx[j])
 
     row_indices = np.hstack(row_indices)
     col_indices = np.hstack(col_indices)
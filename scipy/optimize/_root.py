@@ -10,14 +10,18 @@ from __future__ import division, print_function, absolute_import
 __all__ = ['root']
 
 import numpy as np
+from numpy.linalg import norm
 
 from scipy._lib.six import callable
+from scipy.sparse import csc_matrix, issparse
+from scipy.sparse.linalg import splu
 
 from warnings import warn
 
 from .optimize import MemoizeJac, OptimizeResult, _check_unknown_options
 from .minpack import _root_hybr, leastsq
 from ._spectral import _root_df_sane
+from ._numdiff import approx_derivative, group_columns
 from . import nonlin
 
 
@@ -47,6 +51,7 @@ def root(fun, x0, args=(), method='hybr', jac=None, tol=None, callback=None,
             - 'excitingmixing'   :ref:`(see here) <optimize.root-excitingmixing>`
             - 'krylov'           :ref:`(see here) <optimize.root-krylov>`
             - 'df-sane'          :ref:`(see here) <optimize.root-dfsane>`
+            - 'newton-sparse'    :ref:`(see here) <optimize.root-newtonsparse>`
 
     jac : bool or callable, optional
         If `jac` is a Boolean and is True, `fun` is assumed to return the
@@ -92,6 +97,12 @@ def root(fun, x0, args=(), method='hybr', jac=None, tol=None, callback=None,
 
     Method *df-sane* is a derivative-free spectral method. [3]_
 
+    Method *newton-sparse* is Newton's method for large systems with a
+    sparse Jacobian. The Jacobian, given by `jac` or estimated by finite
+    differences from its sparsity structure (the ``jac_sparsity`` option),
+    is factorized with a sparse LU decomposition that is reused as long as
+    it keeps reducing the residual quickly [4]_.
+
     Methods *broyden1*, *broyden2*, *anderson*, *linearmixing*,
     *diagbroyden*, *excitingmixing*, *krylov* are inexact Newton methods,
     with backtracking or full line searches [2]_. Each method corresponds
@@ -126,6 +137,8 @@ def root(fun, x0, args=(), method='hybr', jac=None, tol=None, callback=None,
         Equations. Society for Industrial and Applied Mathematics.
         <http://www.siam.org/books/kelley/>
     .. [3] W. La Cruz, J.M. Martinez, M. Raydan. Math. Comp. 75, 1429 (2006).
+    .. [4] C. T. Kelley. 2003. Solving Nonlinear Equations with Newton's
+        Method. Society for Industrial and Applied Mathematics.
 
     Examples
     --------
@@ -161,7 +174,7 @@ def root(fun, x0, args=(), method='hybr', jac=None, tol=None, callback=None,
              RuntimeWarning)
 
     # fun also returns the jacobian
-    if not callable(jac) and meth in ('hybr', 'lm'):
+    if not callable(jac) and meth in ('hybr', 'lm', 'newton-sparse'):
         if bool(jac):
             fun = MemoizeJac(fun)
             jac = fun.derivative
@@ -171,7 +184,7 @@ def root(fun, x0, args=(), method='hybr', jac=None, tol=None, callback=None,
     # set default tolerances
     if tol is not None:
         options = dict(options)
-        if meth in ('hybr', 'lm'):
+        if meth in ('hybr', 'lm', 'newton-sparse'):
             options.setdefault('xtol', tol)
         elif meth in ('df-sane',):
             options.setdefault('ftol', tol)
@@ -186,6 +199,9 @@ def root(fun, x0, args=(), method='hybr', jac=None, tol=None, callback=None,
         sol = _root_hybr(fun, x0, args=args, jac=jac, **options)
     elif meth == 'lm':
         sol = _root_leastsq(fun, x0, args=args, jac=jac, **options)
+    elif meth == 'newton-sparse':
+        sol = _root_newton_sparse(fun, x0, args=args, jac=jac,
+                                  _callback=callback, **options)
     elif meth == 'df-sane':
         _warn_jac_unused(jac, method)
         sol = _root_df_sane(fun, x0, args=args, callback=callback,
@@ -637,3 +653,158 @@ def _root_krylov_doc():
             See `scipy.sparse.linalg.lgmres` for details.
     """
     pass
+
+
+def _root_newton_sparse(func, x0, args=(), jac=None, _callback=None,
+                        jac_sparsity=None, maxiter=100, xtol=1.49012e-08,
+                        fatol=6e-6, rdiff=None, reuse_rate=0.5,
+                        **unknown_options):
+    """
+    Solve using Newton's method with a sparse LU decomposition of the
+    Jacobian.
+
+    Options
+    -------
+    jac_sparsity : {None, array_like, sparse matrix}, optional
+        Sparsity structure of the Jacobian, of shape (N, N). A zero entry
+        means that the corresponding element of the Jacobian is identically
+        zero. If given and `jac` is not, columns that do not share a nonzero
+        row are estimated together by finite differences, so that a
+        Jacobian costs as many function evaluations as there are groups
+        of columns, see `approx_derivative`. If None (default), dense
+        finite differencing is used.
+    maxiter : int, optional
+        Maximum number of Newton iterations.
+    xtol : float, optional
+        The iteration terminates if the relative step between two
+        consecutive iterates is at most `xtol`.
+    fatol : float, optional
+        The iteration terminates if the residual is at most `fatol` in the
+        max-norm.
+    rdiff : float, optional
+        Relative step size for the finite difference approximation of the
+        Jacobian. If None (default), it is selected automatically.
+    reuse_rate : float, optional
+        The LU decomposition of the Jacobian is reused for later steps as
+        long as each step reduces the 2-norm of the residual by at least
+        this factor. Zero means that the Jacobian is evaluated at every
+        iteration. Default is 0.5.
+
+    Notes
+    -----
+    The Jacobian is recomputed and factorized with `scipy.sparse.linalg.splu`
+    whenever the convergence stalls, that is when a step made with an old
+    decomposition reduces the residual by less than `reuse_rate` or fails
+    the sufficient decrease test ``||f(x + dx)|| <= (1 - 1e-4) ||f(x)||``.
+    Steps made with a fresh decomposition are shortened by backtracking
+    until they pass that test.
+    """
+    _check_unknown_options(unknown_options)
+
+    if not 0 <= reuse_rate < 1:
+        raise ValueError("`reuse_rate` must be in [0, 1).")
+
+    x0 = np.asarray(x0)
+    shape = x0.shape
+    x = x0.astype(float).ravel()
+    n = x.size
+    nfev = [0]
+
+    def fun(x):
+        nfev[0] += 1
+        return np.ravel(func(x.reshape(shape), *args)).astype(float)
+
+    if callable(jac):
+        def jacobian(x, f):
+            return csc_matrix(jac(x.reshape(shape), *args))
+    else:
+        if jac_sparsity is None:
+            sparsity = None
+        else:
+            if issparse(jac_sparsity):
+                structure = csc_matrix(jac_sparsity)
+            else:
+                structure = np.atleast_2d(jac_sparsity)
+            if structure.shape != (n, n):
+                raise ValueError("`jac_sparsity` has wrong shape.")
+            sparsity = (structure, group_columns(structure))
+
+        def jacobian(x, f):
+            return csc_matrix(approx_derivative(fun, x, method='2-point',
+                                                rel_step=rdiff, f0=f,
+                                                sparsity=sparsity))
+
+    messages = {1: "The residual is within the tolerance.",
+                2: "The relative step is within the tolerance.",
+                3: "The maximum number of iterations is reached.",
+                4: "The Jacobian is singular.",
+                5: "No further progress can be made."}
+
+    f = fun(x)
+    fnorm = norm(f)
+    lu = None
+    fresh = False
+    nit = 0
+    njev = 0
+    status = 1 if np.max(np.abs(f)) <= fatol else 0
+
+    while status == 0:
+        if nit >= maxiter:
+            status = 3
+            break
+
+        if lu is None:
+            J = jacobian(x, f)
+            njev += 1
+            if J.shape != (n, n):
+                raise ValueError("The Jacobian must be a square matrix.")
+            try:
+                lu = splu(J)
+            except RuntimeError:
+                status = 4
+                break
+            fresh = True
+
+        dx = -lu.solve(f)
+
+        t = 1.
+        accept = False
+        if np.all(np.isfinite(dx)):
+            while t > 1e-10:
+                x_new = x + t * dx
+                f_new = fun(x_new)
+                fnorm_new = norm(f_new)
+                if fnorm_new <= (1 - 1e-4 * t) * fnorm:
+                    accept = True
+                    break
+                if not fresh:
+                    break
+                t *= 0.5
+
+        if not accept:
+            if fresh:
+                status = 5
+                break
+            # a stale decomposition is not good enough any more
+            lu = None
+            continue
+
+        nit += 1
+        step_norm = t * norm(dx)
+        if fnorm_new > reuse_rate * fnorm:
+            lu = None
+        x, f, fnorm = x_new, f_new, fnorm_new
+        fresh = False
+
+        if _callback is not None:
+            _callback(x.reshape(shape), f.reshape(shape))
+
+        if np.max(np.abs(f)) <= fatol:
+            status = 1
+        elif step_norm <= xtol * (xtol + norm(x)):
+            status = 2
+
+    return OptimizeResult(x=x.reshape(shape), fun=f.reshape(shape),
+                          success=status in (1, 2), status=status,
+                          message=messages[status], nfev=nfev[0],
+                          njev=njev, nit=nit)
@@ -5,6 +5,8 @@ import math
 
 import numpy as np
 import scipy.linalg
+from scipy.sparse import issparse
+from scipy.sparse.linalg import LinearOperator
 from .optimize import (_check_unknown_options, wrap_function, _status_message,
                        OptimizeResult)
 
@@ -61,6 +63,8 @@ class BaseQuadraticSubproblem(object):
     def hessp(self, p):
         if self._hessp is not None:
             return self._hessp(self._x, p)
+        elif issparse(self.hess) or isinstance(self.hess, LinearOperator):
+            return self.hess.dot(p)
         else:
             return np.dot(self.hess, p)
 
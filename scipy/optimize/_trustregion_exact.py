@@ -4,11 +4,14 @@ from __future__ import division, print_function, absolute_import
 import numpy as np
 from scipy.linalg import (norm, get_lapack_funcs, solve_triangular,
                           cho_solve)
+from scipy.sparse import issparse, csc_matrix, identity
+from scipy.sparse.linalg import splu
 from ._trustregion import (_minimize_trust_region, BaseQuadraticSubproblem)
 
 __all__ = ['_minimize_trustregion_exact',
            'estimate_smallest_singular_value',
            'singular_leading_submatrix',
+           'sparse_ldl',
            'IterativeSubproblem']
 
 
@@ -30,6 +33,11 @@ def _minimize_trustregion_exact(fun, x0, args=(), jac=None, hess=None,
     gtol : float
         Gradient norm must be less than ``gtol`` before successful
         termination.
+
+    Notes
+    -----
+    If `hess` returns a sparse matrix, the shifted Hessians are factorized
+    with `sparse_ldl` instead of a dense Cholesky decomposition.
     """
 
     if jac is None:
@@ -134,9 +142,13 @@ def gershgorin_bounds(H):
            Trust region methods. 2000. Siam. pp. 19.
     """
 
-    H_diag = np.diag(H)
+    if issparse(H):
+        H_diag = H.diagonal()
+        H_row_sums = np.asarray(abs(H).sum(axis=1)).ravel()
+    else:
+        H_diag = np.diag(H)
+        H_row_sums = np.sum(np.abs(H), axis=1)
     H_diag_abs = np.abs(H_diag)
-    H_row_sums = np.sum(np.abs(H), axis=1)
     lb = np.min(H_diag + H_diag_abs - H_row_sums)
     ub = np.max(H_diag - H_diag_abs + H_row_sums)
 
@@ -185,6 +197,54 @@ def singular_leading_submatrix(A, U, k):
     return delta, v
 
 
+def sparse_ldl(H):
+    """Factorize a sparse symmetric matrix as ``P H P.T = L D L.T``.
+
+    Parameters
+    ----------
+    H : sparse matrix
+        Symmetric matrix.
+
+    Returns
+    -------
+    lu : SuperLU or None
+        The factorization, whose ``solve`` method solves systems with `H`.
+        None if `H` is not positive definite.
+
+    Notes
+    -----
+    The decomposition is computed by SuperLU in symmetric mode: a fill
+    reducing ordering of ``H + H.T`` is applied to the rows and columns,
+    and the pivots are always taken on the diagonal. The factor ``U`` is
+    then ``D L.T``, so that `H` is positive definite if and only if all
+    the pivots are positive (Sylvester's law of inertia).
+    """
+    try:
+        lu = splu(csc_matrix(H), permc_spec='MMD_AT_PLUS_A',
+                  diag_pivot_thresh=0., options=dict(SymmetricMode=True))
+    except RuntimeError:
+        # exactly singular
+        return None
+    if (not np.array_equal(lu.perm_r, lu.perm_c) or
+            not np.all(lu.U.diagonal() > 0)):
+        return None
+    return lu
+
+
+def _smallest_eigenpair(lu, n, niter=5):
+    """Estimate the smallest eigenvalue of a positive definite matrix, and
+    a corresponding eigenvector, by inverse iteration with its `sparse_ldl`
+    factorization.
+    """
+    z = np.random.RandomState(1234).uniform(-1, 1, n)
+    z /= norm(z)
+    for k in range(niter):
+        y = lu.solve(z)
+        theta = np.dot(z, y)
+        z = y / norm(y)
+    return 1 / theta, z
+
+
 class IterativeSubproblem(BaseQuadraticSubproblem):
     """Quadratic subproblem solved by nearly exact iterative method.
 
@@ -235,6 +295,18 @@ class IterativeSubproblem(BaseQuadraticSubproblem):
         self.k_easy = k_easy
         self.k_hard = k_hard
 
+        if issparse(self.hess):
+            # the bounds and norms need duplicate entries to be summed
+            self._h = csc_matrix(self.hess, copy=True)
+            self._h.sum_duplicates()
+            self.dimension = self._h.shape[0]
+            self.hess_gershgorin_lb,\
+                self.hess_gershgorin_ub = gershgorin_bounds(self._h)
+            self.hess_inf = abs(self._h).sum(axis=1).max()
+            self.hess_fro = norm(self._h.data)
+            self.CLOSE_TO_ZERO = self.dimension * self.EPS * self.hess_inf
+            return
+
         # Get Lapack function for cholesky decomposition.
         # The implemented Scipy wrapper does not return
         # the incomplete factorization needed by the method.
@@ -284,9 +356,121 @@ class IterativeSubproblem(BaseQuadraticSubproblem):
 
         return lambda_initial, lambda_lb, lambda_ub
 
+    def _update_lambda(self, lambda_lb, lambda_ub):
+        return max(np.sqrt(lambda_lb * lambda_ub),
+                   lambda_lb + self.UPDATE_COEFF*(lambda_ub-lambda_lb))
+
+    def _solve_sparse(self, tr_radius):
+        """Solve quadratic subproblem with a sparse Hessian.
+
+        This follows `solve`, with `sparse_ldl` factorizations. The
+        smallest eigenvalue of the shifted Hessian and its eigenvector are
+        estimated by inverse iteration, and a failed factorization only
+        tells that the damping factor is too small.
+        """
+
+        lambda_current, lambda_lb, lambda_ub = self._initial_values(tr_radius)
+        n = self.dimension
+        eye = identity(n, format='csc')
+        hits_boundary = True
+        self.niter = 0
+
+        while True:
+
+            H = self.hess + lambda_current*eye
+            lu = sparse_ldl(H)
+
+            self.niter += 1
+
+            if lu is None:  # Unsuccessfull factorization
+                lambda_lb = max(lambda_lb, lambda_current)
+                lambda_current = self._update_lambda(lambda_lb, lambda_ub)
+
+            elif self.jac_mag > self.CLOSE_TO_ZERO:
+                p = lu.solve(-self.jac)
+                p_norm = norm(p)
+
+                # Check for interior convergence
+                if p_norm <= tr_radius and lambda_current == 0:
+                    hits_boundary = False
+                    break
+
+                # Newton step of formula (4.44) p.87 from ref [2]_, where
+                # ``w_norm**2 == p.T H^-1 p``.
+                w_norm2 = np.dot(p, lu.solve(p))
+                delta_lambda = p_norm**2/w_norm2 * (p_norm-tr_radius)/tr_radius
+                lambda_new = lambda_current + delta_lambda
+
+                if p_norm < tr_radius:  # Inside boundary
+                    s_min2, z_min = _smallest_eigenpair(lu, n)
+
+                    ta, tb = self.get_boundaries_intersections(p, z_min,
+                                                               tr_radius)
+                    step_len = min([ta, tb], key=abs)
+
+                    quadratic_term = np.dot(p, H.dot(p))
+
+                    # Check stop criteria
+                    relative_error = (step_len**2 * s_min2) / (quadratic_term + lambda_current*tr_radius**2)
+                    if relative_error <= self.k_hard:
+                        p += step_len * z_min
+                        break
+
+                    # Update uncertanty bounds
+                    lambda_ub = lambda_current
+                    lambda_lb = max(lambda_lb, lambda_current - s_min2)
+
+                    # An unsuccessfull factorization at ``lambda_new``
+                    # raises ``lambda_lb`` in the next iteration.
+                    lambda_current = lambda_new
+
+                else:  # Outside boundary
+                    # Check stop criteria
+                    relative_error = abs(p_norm - tr_radius) / tr_radius
+                    if relative_error <= self.k_easy:
+                        break
+
+                    # Update uncertanty bounds
+                    lambda_lb = lambda_current
+
+                    # Update damping factor
+                    lambda_current = lambda_new
+
+            else:  # jac_mag very close to zero
+
+                # Check for interior convergence
+                if lambda_current == 0:
+                    p = np.zeros(n)
+                    hits_boundary = False
+                    break
+
+                s_min2, z_min = _smallest_eigenpair(lu, n)
+                step_len = tr_radius
+
+                # Check stop criteria
+                if step_len**2 * s_min2 <= self.k_hard * lambda_current * tr_radius**2:
+                    p = step_len * z_min
+                    break
+
+                # Update uncertanty bounds
+                lambda_ub = lambda_current
+                lambda_lb = max(lambda_lb, lambda_current - s_min2)
+
+                # Update damping factor
+                lambda_current = self._update_lambda(lambda_lb, lambda_ub)
+
+        self.lambda_lb = lambda_lb
+        self.lambda_current = lambda_current
+        self.previous_tr_radius = tr_radius
+
+        return p, hits_boundary
+
     def solve(self, tr_radius):
         """Solve quadratic subproblem"""
 
+        if issparse(self.hess):
+            return self._solve_sparse(tr_radius)
+
         lambda_current, lambda_lb, lambda_ub = self._initial_values(tr_radius)
         n = self.dimension
         hits_boundary = True
@@ -0,0 +1,261 @@
+"""Generalized Lanczos trust-region optimization."""
+from __future__ import division, print_function, absolute_import
+
+import math
+from functools import partial
+
+import numpy as np
+from scipy.linalg import eig_banded, norm, solveh_banded, LinAlgError
+from scipy.sparse.linalg import aslinearoperator
+from ._trustregion import (_minimize_trust_region, BaseQuadraticSubproblem)
+
+__all__ = []
+
+
+def _minimize_trust_krylov(fun, x0, args=(), jac=None, hess=None, hessp=None,
+                           precond=None, lanczos_maxiter=None,
+                           **trust_region_options):
+    """
+    Minimization of scalar function of one or more variables using
+    the generalized Lanczos trust-region algorithm.
+
+    Options
+    -------
+    initial_trust_radius : float
+        Initial trust-region radius.
+    max_trust_radius : float
+        Maximum value of the trust-region radius. No steps that are longer
+        than this value will be proposed.
+    eta : float
+        Trust region related acceptance stringency for proposed steps.
+    gtol : float
+        Gradient norm must be less than `gtol` before successful
+        termination.
+    precond : {LinearOperator, sparse matrix, ndarray}, optional
+        Symmetric positive definite approximation of the inverse of the
+        Hessian, used as a preconditioner. The trust region is then
+        measured in the norm defined by the inverse of `precond`. Default
+        is the identity.
+    lanczos_maxiter : int, optional
+        Maximum number of Lanczos iterations per subproblem. Default is
+        the number of variables.
+
+    Notes
+    -----
+    The Hessian returned by `hess` may be a dense array, a sparse matrix
+    or a `LinearOperator`; only products with it are used.
+
+    """
+    if jac is None:
+        raise ValueError('Jacobian is required for trust region '
+                         'Krylov minimization.')
+    if hess is None and hessp is None:
+        raise ValueError('Either the Hessian or the Hessian-vector product '
+                         'is required for trust region Krylov minimization.')
+    subproblem = partial(KrylovSubproblem, precond=precond,
+                         lanczos_maxiter=lanczos_maxiter)
+    return _minimize_trust_region(fun, x0, args=args, jac=jac, hess=hess,
+                                  hessp=hessp, subproblem=subproblem,
+                                  **trust_region_options)
+
+
+def solve_tridiagonal_subproblem(alpha, beta, gamma0, tr_radius):
+    """Solve the trust-region subproblem of a symmetric tridiagonal matrix.
+
+    Minimize ``gamma0*h[0] + 0.5*h.T T h`` subject to
+    ``norm(h) <= tr_radius``, where ``T`` has the diagonal `alpha` and the
+    off-diagonal `beta`.
+
+    Returns
+    -------
+    h : ndarray
+        The solution.
+    hits_boundary : bool
+        True if the solution is on the boundary of the trust region.
+
+    Notes
+    -----
+    The problem is solved through the eigendecomposition of ``T``, which is
+    cheap because the Lanczos process keeps ``T`` small. It is skipped if
+    a banded Cholesky factorization shows that ``T`` is positive definite
+    and the Newton step is inside the trust region. The multiplier of
+    the trust-region constraint is found by a safeguarded Newton iteration
+    on the secular equation ``1/norm(h(lambda)) = 1/tr_radius`` [1]_.
+
+    References
+    ----------
+    .. [1] J.J. More and D.C. Sorensen, "Computing a trust region step",
+           SIAM Journal on Scientific and Statistical Computing, vol. 4(3),
+           pp. 553-572, 1983.
+    """
+    k = len(alpha)
+    band = np.zeros((2, k))
+    band[0] = alpha
+    band[1, :-1] = beta
+
+    rhs = np.zeros(k)
+    rhs[0] = -gamma0
+    if k == 1:
+        if alpha[0] > 0 and gamma0 <= alpha[0] * tr_radius:
+            return rhs / alpha[0], False
+    else:
+        try:
+            h = solveh_banded(band, rhs, lower=True)
+        except LinAlgError:
+            # not positive definite
+            pass
+        else:
+            if norm(h) <= tr_radius:
+                return h, False
+
+    theta, Q = eig_banded(band, lower=True)
+    c = gamma0 * Q[0]
+
+    # The eigenvalues close to the smallest one, in whose eigenvectors the
+    # gradient has (almost) no component, are excluded from the secular
+    # equation. If the rest of the step is inside the trust region at
+    # ``lambda = -theta[0]``, this is the hard case.
+    scale = max(abs(theta[0]), abs(theta[-1]), gamma0)
+    eps = np.finfo(float).eps
+    lambda_min = max(0., -theta[0])
+    small = np.abs(theta - theta[0]) <= k * eps * scale
+    hard = np.all(np.abs(c[small]) <= k * eps * gamma0) and theta[0] <= 0
+    if hard:
+        with np.errstate(divide='ignore'):
+            h = -np.dot(Q[:, ~small], c[~small] / (theta[~small] + lambda_min))
+        h_norm = norm(h)
+        if h_norm <= tr_radius:
+            tau = math.sqrt(tr_radius**2 - h_norm**2)
+            return h + tau * Q[:, 0], True
+
+    def secular(lam):
+        d = theta + lam
+        h_norm = norm(c / d)
+        phi = 1 / h_norm - 1 / tr_radius
+        dphi = np.sum(c**2 / d**3) / h_norm**3
+        return phi, dphi
+
+    # ``norm(h(lambda)) <= gamma0 / (theta[0] + lambda)``, so that ``hi``
+    # is on the inner side of the root
+    lo = lambda_min
+    hi = max(lambda_min, gamma0 / tr_radius - theta[0])
+    lam = hi
+    for i in range(100):
+        phi, dphi = secular(lam)
+        if abs(phi) <= 1e-10 / tr_radius:
+            break
+        if phi < 0:
+            lo = lam
+        else:
+            hi = lam
+        lam_new = lam - phi / dphi
+        if not lo < lam_new < hi:
+            lam_new = 0.5 * (lo + hi)
+        if lam_new == lam:
+            break
+        lam = lam_new
+
+    h = -np.dot(Q, c / (theta + lam))
+    return h, True
+
+
+class KrylovSubproblem(BaseQuadraticSubproblem):
+    """Quadratic subproblem solved by the generalized Lanczos method.
+
+    Notes
+    -----
+    This is the GLTR algorithm of [1]_. A preconditioned Lanczos process
+    reduces the subproblem to one with a tridiagonal Hessian in the Krylov
+    space of the gradient, which is solved by
+    `solve_tridiagonal_subproblem`. While the iterates stay inside the trust
+    region they coincide with the truncated conjugate gradient ones, but
+    unlike the Steihaug method the iteration continues along the boundary
+    once it is reached. The Lanczos vectors are kept to assemble the step.
+
+    References
+    ----------
+    .. [1] N.I.M. Gould, S. Lucidi, M. Roma, and P.L. Toint, "Solving the
+           trust-region subproblem using the Lanczos method", SIAM Journal
+           on Optimization, vol. 9(2), pp. 504-525, 1999.
+    """
+
+    def __init__(self, x, fun, jac, hess=None, hessp=None, precond=None,
+                 lanczos_maxiter=None):
+        super(KrylovSubproblem, self).__init__(x, fun, jac, hess, hessp)
+        if precond is not None:
+            precond = aslinearoperator(precond)
+        self.precond = precond
+        self.lanczos_maxiter = lanczos_maxiter
+        self.niter = 0
+
+    def _apply_precond(self, r):
+        if self.precond is None:
+            return r
+        return np.ravel(self.precond.matvec(r))
+
+    def solve(self, trust_radius):
+        """
+        Solve the subproblem using the generalized Lanczos method.
+
+        Parameters
+        ----------
+        trust_radius : float
+            We are allowed to wander only this far away from the origin.
+
+        Returns
+        -------
+        p : ndarray
+            The proposed step.
+        hits_boundary : bool
+            True if the proposed step is on the boundary of the trust region.
+        """
+        r = np.asarray(self.jac, dtype=float)
+        n = r.size
+        z = self._apply_precond(r)
+        gamma0 = math.sqrt(max(np.dot(r, z), 0))
+        self.niter = 0
+        if gamma0 == 0:
+            return np.zeros(n), False
+
+        # define a default tolerance for the preconditioned gradient of the
+        # model at the step
+        tolerance = min(0.5, math.sqrt(gamma0)) * gamma0
+
+        maxiter = n if self.lanczos_maxiter is None else self.lanczos_maxiter
+        W = np.empty((min(maxiter, 16), n))
+        alpha = []
+        beta = []
+        gamma = gamma0
+        u_prev = None
+
+        for j in range(maxiter):
+            self.niter += 1
+            if j == W.shape[0]:
+                W = np.concatenate((W, np.empty((min(j, maxiter - j), n))))
+            W[j] = z / gamma
+            u = r / gamma
+            Hw = np.ravel(self.hessp(W[j]))
+            alpha.append(np.dot(W[j], Hw))
+            r = Hw - alpha[j] * u
+            if u_prev is not None:
+                r -= gamma * u_prev
+            z = self._apply_precond(r)
+            gamma_next = math.sqrt(max(np.dot(r, z), 0))
+
+            h, hits_boundary = solve_tridiagonal_subproblem(
+                alpha, beta, gamma0, trust_radius)
+
+            # The preconditioned gradient of the model at the step lies
+            # along the next Lanczos vector.
+            if gamma_next * abs(h[-1]) <= tolerance:
+                break
+            if gamma_next <= np.finfo(float).eps * gamma0:
+                # invariant subspace
+                break
+
+            beta.append(gamma_next)
+            gamma = gamma_next
+            u_prev = u
+
+        p = np.dot(h, W[:len(h)])
+        return p, hits_boundary
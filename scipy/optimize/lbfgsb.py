@@ -40,7 +40,7 @@ from numpy import array, asarray, float64, int32, zeros
 from . import _lbfgsb
 from .optimize import (approx_fprime, MemoizeJac, OptimizeResult,
                        _check_unknown_options, wrap_function,
-                       _approx_fprime_helper)
+                       _prepare_approx_fprime)
 from scipy.sparse.linalg import LinearOperator
 
 __all__ = ['fmin_l_bfgs_b', 'LbfgsInvHessProduct']
@@ -211,7 +211,8 @@ def fmin_l_bfgs_b(func, x0, fprime=None, args=(),
 def _minimize_lbfgsb(fun, x0, args=(), jac=None, bounds=None,
                      disp=None, maxcor=10, ftol=2.2204460492503131e-09,
                      gtol=1e-5, eps=1e-8, maxfun=15000, maxiter=15000,
-                     iprint=-1, callback=None, maxls=20, **unknown_options):
+                     iprint=-1, callback=None, maxls=20, workers=1,
+                     vectorized=False, **unknown_options):
     """
     Minimize a scalar function of one or more variables using the L-BFGS-B
     algorithm.
@@ -242,6 +243,13 @@ def _minimize_lbfgsb(fun, x0, args=(), jac=None, bounds=None,
         Maximum number of iterations.
     maxls : int, optional
         Maximum number of line search steps (per iteration). Default is 20.
+    workers : int or map-like callable, optional
+        If `jac` is approximated, evaluate the finite differences in
+        parallel, see `approx_fprime`.
+    vectorized : bool, optional
+        If `jac` is approximated, call `fun` once per gradient with all
+        perturbed points as the columns of an ``(n, n)`` array, see
+        `approx_fprime`.
 
     Notes
     -----
@@ -274,15 +282,22 @@ def _minimize_lbfgsb(fun, x0, args=(), jac=None, bounds=None,
         else:
             iprint = disp
 
-    n_function_evals, fun = wrap_function(fun, ())
+    n_function_evals, wrapped_fun = wrap_function(fun, ())
+    approx_grad = None
     if jac is None:
+        # the finite differences are computed from the user's function,
+        # which can be sent to a process pool
+        approx_grad = _prepare_approx_fprime(fun, args, epsilon,
+                                             n_function_evals, workers,
+                                             vectorized)
+
         def func_and_grad(x):
-            f = fun(x, *args)
-            g = _approx_fprime_helper(x, fun, epsilon, args=args, f0=f)
+            f = wrapped_fun(x, *args)
+            g = approx_grad(x, f)
             return f, g
     else:
         def func_and_grad(x):
-            f = fun(x, *args)
+            f = wrapped_fun(x, *args)
             g = jac(x, *args)
             return f, g
 
@@ -321,31 +336,35 @@ def _minimize_lbfgsb(fun, x0, args=(), jac=None, bounds=None,
 
     n_iterations = 0
 
-    while 1:
-        # x, f, g, wa, iwa, task, csave, lsave, isave, dsave = \
-        _lbfgsb.setulb(m, x, low_bnd, upper_bnd, nbd, f, g, factr,
-                       pgtol, wa, iwa, task, iprint, csave, lsave,
-                       isave, dsave, maxls)
-        task_str = task.tostring()
-        if task_str.startswith(b'FG'):
-            # The minimization routine wants f and g at the current x.
-            # Note that interruptions due to maxfun are postponed
-            # until the completion of the current minimization iteration.
-            # Overwrite f and g:
-            f, g = func_and_grad(x)
-        elif task_str.startswith(b'NEW_X'):
-            # new iteration
-            if n_iterations > maxiter:
-                task[:] = 'STOP: TOTAL NO. of ITERATIONS EXCEEDS LIMIT'
-            elif n_function_evals[0] > maxfun:
-                task[:] = ('STOP: TOTAL NO. of f AND g EVALUATIONS '
-                           'EXCEEDS LIMIT')
+    try:
+        while 1:
+            # x, f, g, wa, iwa, task, csave, lsave, isave, dsave = \
+            _lbfgsb.setulb(m, x, low_bnd, upper_bnd, nbd, f, g, factr,
+                           pgtol, wa, iwa, task, iprint, csave, lsave,
+                           isave, dsave, maxls)
+            task_str = task.tostring()
+            if task_str.startswith(b'FG'):
+                # The minimization routine wants f and g at the current x.
+                # Note that interruptions due to maxfun are postponed
+                # until the completion of the current minimization iteration.
+                # Overwrite f and g:
+                f, g = func_and_grad(x)
+            elif task_str.startswith(b'NEW_X'):
+                # new iteration
+                if n_iterations > maxiter:
+                    task[:] = 'STOP: TOTAL NO. of ITERATIONS EXCEEDS LIMIT'
+                elif n_function_evals[0] > maxfun:
+                    task[:] = ('STOP: TOTAL NO. of f AND g EVALUATIONS '
+                               'EXCEEDS LIMIT')
+                else:
+                    n_iterations += 1
+                    if callback is not None:
+                        callback(x)
             else:
-                n_iterations += 1
-                if callback is not None:
-                    callback(x)
-        else:
-            break
+                break
+    finally:
+        if approx_grad is not None:
+            approx_grad.close()
 
     task_str = task.tostring().strip(b'\x00').strip()
     if task_str.startswith(b'CONV'):
@@ -9,7 +9,9 @@ from numpy import (atleast_1d, dot, take, triu, shape, eye,
                    all, where, isscalar, asarray, inf, abs,
                    finfo, inexact, issubdtype, dtype)
 from scipy.linalg import svd, cholesky, solve_triangular, LinAlgError
-from scipy._lib._util import _asarray_validated, _lazywhere
+from scipy._lib._util import (_asarray_validated, _lazywhere,
+                              _threaded_ranges)
+from scipy._lib._numpy_compat import broadcast_to
 from .optimize import OptimizeResult, _check_unknown_options, OptimizeWarning
 from ._lsq import least_squares
 from ._lsq.common import make_strictly_feasible
@@ -18,7 +20,8 @@ from ._lsq.least_squares import prepare_bounds
 
 error = _minpack.error
 
-__all__ = ['fsolve', 'leastsq', 'fixed_point', 'curve_fit']
+__all__ = ['fsolve', 'leastsq', 'fixed_point', 'curve_fit',
+           'curve_fit_batch']
 
 
 def _check_func(checker, argname, thefunc, x0, args, numinputs,
@@ -789,6 +792,326 @@ def curve_fit(f, xdata, ydata, p0=None, sigma=None, absolute_sigma=False,
     else:
         return popt, pcov
 
+def curve_fit_batch(f, xdata, ydata, p0, sigma=None, absolute_sigma=False,
+                    check_finite=True, jac=None, ftol=1e-8, xtol=1e-8,
+                    gtol=1e-8, max_nfev=None, chunksize=4096, workers=1):
+    """
+    Fit the same function to many independent datasets.
+
+    Assumes ``ydata[i] = f(xdata, *params[i]) + eps`` for every dataset
+    ``i``, and fits all of them with a Levenberg-Marquardt algorithm which
+    advances the problems in lock-step, each with its own damping, so that
+    the model is evaluated once per iteration for all the datasets which
+    have not converged yet.
+
+    Parameters
+    ----------
+    f : callable
+        The vectorized model function, ``f(x, *params)``. It is called with
+        each parameter as an array of shape ``(k, 1)``, holding its values
+        for ``k`` of the datasets, and must return an array broadcastable to
+        shape ``(k, M)``. Models written with NumPy operations, such as
+        ``a * np.exp(-b * x) + c``, usually work unchanged.
+    xdata : array_like
+        The independent variable where the data is measured, shared by all
+        datasets and passed straight to `f`.
+    ydata : array_like, shape (K, M)
+        The dependent data of the ``K`` datasets, one per row.
+    p0 : array_like, shape (N,) or (K, N)
+        Initial guess for the parameters, either for all datasets or for
+        each of them.
+    sigma : None or array_like, shape (M,) or (K, M), optional
+        The standard deviations of the errors in `ydata`, either for all
+        datasets or for each of them. The fits then minimize
+        ``chisq = sum((r / sigma) ** 2)``. None (default) is equivalent to
+        a `sigma` filled with ones.
+    absolute_sigma : bool, optional
+        If True, `sigma` is used in an absolute sense and the estimated
+        parameter covariances reflect these absolute values. If False, the
+        covariances are scaled by the reduced ``chisq``, as in `curve_fit`.
+    check_finite : bool, optional
+        If True, check that the input arrays do not contain nans of infs,
+        and raise a ValueError if they do. Default is True.
+    jac : callable, optional
+        The vectorized Jacobian of `f` with respect to the parameters,
+        ``jac(x, *params)``, called like `f` and returning an array of shape
+        ``(k, M, N)``. If None (default), it is estimated by forward
+        differences, which takes ``N`` extra evaluations of `f`.
+    ftol : float, optional
+        Tolerance for termination by the change of the cost function.
+        Default is 1e-8. A dataset converges when ``dF < ftol * F`` and
+        there was an adequate agreement between the local quadratic model
+        and the true model in the last step.
+    xtol : float, optional
+        Tolerance for termination by the change of the parameters. Default
+        is 1e-8. A dataset converges when
+        ``norm(dp) < xtol * (xtol + norm(p))``.
+    gtol : float, optional
+        Tolerance for termination by the norm of the gradient. Default is
+        1e-8. A dataset converges when ``norm(g, ord=np.inf) < gtol``.
+    max_nfev : int, optional
+        Maximum number of evaluations of the model for each dataset, not
+        counting those used to estimate the Jacobian. Default is
+        ``100 * N``.
+    chunksize : int, optional
+        The datasets are fitted in chunks of this many at a time, which
+        bounds the memory used by the Jacobians (``chunksize * M * N``
+        floats). Default is 4096.
+    workers : int, optional
+        Number of threads to fit the chunks with. If -1 is given all CPU
+        threads are used. Default: 1. `f` and `jac` must be thread-safe,
+        and spend their time in NumPy operations releasing the GIL to
+        benefit from several threads.
+
+    Returns
+    -------
+    popt : ndarray, shape (K, N)
+        The optimal parameters of each dataset.
+    pcov : ndarray, shape (K, N, N)
+        The estimated covariance of each row of `popt`. It is computed with
+        the Moore-Penrose pseudoinverse of ``J.T J``, discarding directions
+        of negligible curvature, and is filled with ``np.inf`` when there
+        are no more data points than parameters and `absolute_sigma` is
+        False.
+    status : ndarray of int, shape (K,)
+        The reason each fit terminated, as in `least_squares`:
+
+            * -1 : the residuals or the Jacobian are not finite at the
+              current parameters. Trial steps to non-finite residuals are
+              rejected, so this mostly happens at the initial guess.
+            *  0 : the maximum number of function evaluations is exceeded.
+            *  1 : `gtol` termination condition is satisfied.
+            *  2 : `ftol` termination condition is satisfied.
+            *  3 : `xtol` termination condition is satisfied.
+            *  4 : Both `ftol` and `xtol` termination conditions are
+               satisfied.
+
+        Unlike `curve_fit`, failed fits do not raise an error.
+
+    Raises
+    ------
+    ValueError
+        if `xdata`, `ydata` or `sigma` contain NaNs, or if the shapes of
+        the arguments are incompatible.
+
+    See Also
+    --------
+    curve_fit : Fit a single dataset, with more options.
+
+    Notes
+    -----
+    Each iteration solves the damped normal equations
+    ``(J.T J + mu * diag(D)) dp = -J.T r`` for all the datasets at once,
+    where ``D`` is the largest diagonal of ``J.T J`` seen so far, as in
+    MINPACK. The damping ``mu`` of each dataset is updated from the ratio
+    of the actual to the predicted reduction of the cost [1]_. Datasets
+    which have converged are masked out of the following iterations.
+
+    .. versionadded:: 1.0.0
+
+    References
+    ----------
+    .. [1] H. B. Nielsen, "Damping Parameter in Marquardt's Method",
+           Technical Report IMM-REP-1999-05, Technical University of
+           Denmark, 1999.
+
+    Examples
+    --------
+    >>> from scipy.optimize import curve_fit_batch
+
+    >>> def func(x, a, b, c):
+    ...     return a * np.exp(-b * x) + c
+
+    Fit three noisy decays at once:
+
+    >>> xdata = np.linspace(0, 4, 50)
+    >>> params = np.array([[2.5, 1.3, 0.5], [1., 0.5, 0.2], [3., 2., 1.]])
+    >>> np.random.seed(1729)
+    >>> ydata = func(xdata, *params[:, :, None].transpose(1, 0, 2))
+    >>> ydata += 0.01 * np.random.normal(size=ydata.shape)
+    >>> popt, pcov, status = curve_fit_batch(func, xdata, ydata, p0=[1, 1, 1])
+    >>> np.round(popt, 1)
+    array([[ 2.5,  1.3,  0.5],
+           [ 1. ,  0.5,  0.2],
+           [ 3. ,  2. ,  1. ]])
+    >>> status
+    array([2, 2, 2])
+
+    """
+    if check_finite:
+        ydata = np.asarray_chkfinite(ydata, dtype=float)
+    else:
+        ydata = np.asarray(ydata, dtype=float)
+    if ydata.ndim != 2:
+        raise ValueError("`ydata` must be a 2-d array.")
+    k, m = ydata.shape
+
+    p0 = np.array(p0, dtype=float, ndmin=1)
+    n = p0.shape[-1]
+    if p0.ndim > 2 or p0.ndim == 2 and p0.shape[0] != k:
+        raise ValueError("`p0` must have shape (N,) or (K, N).")
+    p0 = broadcast_to(p0, (k, n))
+
+    if isinstance(xdata, (list, tuple, np.ndarray)):
+        if check_finite:
+            xdata = np.asarray_chkfinite(xdata)
+        else:
+            xdata = np.asarray(xdata)
+
+    if sigma is not None:
+        sigma = np.asarray(sigma, dtype=float)
+        if check_finite:
+            sigma = np.asarray_chkfinite(sigma)
+        if sigma.shape not in [(m,), (k, m)]:
+            raise ValueError("`sigma` has incorrect shape.")
+        transform = broadcast_to(1.0 / sigma, (k, m))
+    else:
+        transform = None
+
+    if max_nfev is None:
+        max_nfev = 100 * n
+    chunksize = max(int(chunksize), 1)
+
+    popt = np.empty((k, n))
+    pcov = np.empty((k, n, n))
+    status = np.empty(k, dtype=int)
+
+    def _fit(start, stop):
+        for i in range(start, stop, chunksize):
+            chunk = slice(i, min(i + chunksize, stop))
+            w = None if transform is None else transform[chunk]
+            res = _lm_batch(f, jac, xdata, ydata[chunk], w, p0[chunk],
+                            ftol, xtol, gtol, max_nfev)
+            popt[chunk], pcov[chunk], status[chunk], cost = res
+
+            if not absolute_sigma:
+                if m > n:
+                    pcov[chunk] *= (2 * cost / (m - n))[:, None, None]
+                else:
+                    pcov[chunk] = inf
+            pcov[chunk][status[chunk] == -1] = inf
+
+    _threaded_ranges(_fit, k, workers)
+    return popt, pcov, status
+
+
+def _lm_batch(f, jac, xdata, ydata, w, p, ftol, xtol, gtol, max_nfev):
+    """Levenberg-Marquardt iterations over a stack of problems.
+
+    Returns the parameters, the unscaled covariances, the termination
+    status and the cost ``sum(r**2) / 2`` of each problem.
+    """
+    k, n = p.shape
+    EPS = np.finfo(float).eps
+
+    def fun(p, idx):
+        r = f(xdata, *[p[:, j:j + 1] for j in range(n)]) - ydata[idx]
+        if w is not None:
+            r = r * w[idx]
+        return broadcast_to(r, ydata[idx].shape)
+
+    def jacobian(p, r, idx):
+        if jac is not None:
+            J = np.asarray(jac(xdata, *[p[:, j:j + 1] for j in range(n)]),
+                           dtype=float)
+            J = broadcast_to(J, r.shape + (n,))
+            if w is not None:
+                J = J * w[idx][:, :, None]
+            return J
+        J = np.empty(r.shape + (n,))
+        for j in range(n):
+            h = EPS**0.5 * np.maximum(1.0, np.abs(p[:, j]))
+            h = np.where(p[:, j] >= 0, h, -h)
+            p1 = p.copy()
+            p1[:, j] += h
+            # use the step actually taken, as in approx_derivative
+            h = p1[:, j] - p[:, j]
+            J[:, :, j] = (fun(p1, idx) - r) / h[:, None]
+        return J
+
+    p = p.copy()
+    idx = np.arange(k)
+    r = np.array(fun(p, idx), dtype=float)
+    J = np.array(jacobian(p, r, idx), dtype=float)
+    cost = 0.5 * np.sum(r**2, axis=1)
+    nfev = np.ones(k, dtype=int)
+    status = np.full(k, -1, dtype=int)
+    mu = np.full(k, 1e-3)
+    nu = np.full(k, 2.0)
+    D = np.zeros((k, n))
+
+    # the normal matrices of the problems, kept for the covariances
+    A = np.einsum('kmi,kmj->kij', J, J)
+    g = np.einsum('kmi,km->ki', J, r)
+
+    active = np.isfinite(cost) & np.isfinite(A).all(axis=(1, 2))
+    active = idx[active]
+    while active.size:
+        a = active
+        converged = np.linalg.norm(g[a], ord=np.inf, axis=1) < gtol
+        status[a[converged]] = 1
+        a = a[~converged]
+        if not a.size:
+            break
+
+        diag = np.diagonal(A[a], axis1=1, axis2=2)
+        D[a] = np.maximum(D[a], diag)
+        scale = np.where(D[a] > 0, D[a], 1.0)
+        M = A[a] + (mu[a][:, None] * scale)[:, :, None] * np.eye(n)
+        dp = -np.linalg.solve(M, g[a][:, :, None])[:, :, 0]
+
+        p_new = p[a] + dp
+        r_new = fun(p_new, a)
+        nfev[a] += 1
+        cost_new = 0.5 * np.sum(r_new**2, axis=1)
+
+        actual = cost[a] - cost_new
+        predicted = 0.5 * np.sum(dp * (mu[a][:, None] * scale * dp - g[a]),
+                                 axis=1)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            rho = np.where(predicted > 0, actual / predicted, -1.0)
+        accept = (rho > 0) & np.isfinite(cost_new)
+
+        # update the damping, following Nielsen
+        mu[a] = np.where(accept,
+                         mu[a] * np.maximum(1/3, 1 - (2*rho - 1)**3),
+                         mu[a] * nu[a])
+        nu[a] = np.where(accept, 2.0, 2 * nu[a])
+
+        ftol_ok = accept & (actual < ftol * cost[a]) & (rho > 0.25)
+        xtol_ok = (np.linalg.norm(dp, axis=1) <
+                   xtol * (xtol + np.linalg.norm(p[a], axis=1)))
+
+        b = a[accept]
+        if b.size:
+            p[b] = p_new[accept]
+            r[b] = r_new[accept]
+            cost[b] = cost_new[accept]
+            J[b] = jacobian(p[b], r[b], b)
+            A[b] = np.einsum('kmi,kmj->kij', J[b], J[b])
+            g[b] = np.einsum('kmi,km->ki', J[b], r[b])
+
+        status[a] = 0
+        status[a[ftol_ok]] = 2
+        status[a[xtol_ok]] = 3
+        status[a[ftol_ok & xtol_ok]] = 4
+
+        bad = ~(np.isfinite(A[a]).all(axis=(1, 2)) &
+                np.isfinite(g[a]).all(axis=1))
+        status[a[bad]] = -1
+
+        done = ftol_ok | xtol_ok | bad | (nfev[a] >= max_nfev)
+        active = a[~done]
+
+    # pseudoinverse of the normal matrices, discarding the directions of
+    # negligible curvature as curve_fit does for the Jacobian
+    evals, evecs = np.linalg.eigh(np.where(np.isfinite(A), A, 0))
+    threshold = EPS * max(J.shape[1], n) * evals[:, -1:]
+    with np.errstate(divide='ignore'):
+        inv_evals = np.where(evals > threshold, 1 / evals, 0)
+    pcov = np.einsum('kij,kj,klj->kil', evecs, inv_evals, evecs)
+    return p, pcov, status, cost
+
 
 def check_gradient(fcn, Dfcn, x0, args=(), col_deriv=0):
     """Perform a simple check on the gradient for correctness.
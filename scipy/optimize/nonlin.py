@@ -116,7 +116,6 @@ from scipy.linalg import norm, solve, inv, qr, svd, LinAlgError
 from numpy import asarray, dot, vdot
 import scipy.sparse.linalg
 import scipy.sparse
-from scipy.linalg import get_blas_funcs
 import inspect
 from scipy._lib._util import getargspec_no_self as _getargspec
 from .linesearch import scalar_search_wolfe1, scalar_search_armijo
@@ -696,87 +695,93 @@ class LowRankMatrix(object):
     However, if the rank of the matrix reaches the dimension of the vectors,
     full matrix representation will be used thereon.
 
+    The vectors :math:`c_n` and :math:`d_n` are stored as the first `rank`
+    rows of two 2-D arrays, whose capacity is doubled when they fill up.
+
     """
 
     def __init__(self, alpha, n, dtype):
         self.alpha = alpha
-        self.cs = []
-        self.ds = []
         self.n = n
         self.dtype = dtype
         self.collapsed = None
+        self.rank = 0
+        self._C = np.empty((0, n), dtype=dtype)
+        self._D = np.empty((0, n), dtype=dtype)
+
+    @property
+    def C(self):
+        """The vectors :math:`c_n`, as the rows of an array."""
+        return self._C[:self.rank]
+
+    @property
+    def D(self):
+        """The vectors :math:`d_n`, as the rows of an array."""
+        return self._D[:self.rank]
 
     @staticmethod
-    def _matvec(v, alpha, cs, ds):
-        axpy, scal, dotc = get_blas_funcs(['axpy', 'scal', 'dotc'],
-                                          cs[:1] + [v])
+    def _matvec(v, alpha, C, D):
         w = alpha * v
-        for c, d in zip(cs, ds):
-            a = dotc(d, v)
-            w = axpy(c, w, w.size, a)
+        if C.shape[0]:
+            w = w + dot(dot(D.conj(), v), C)
         return w
 
     @staticmethod
-    def _solve(v, alpha, cs, ds):
+    def _solve(v, alpha, C, D):
         """Evaluate w = M^-1 v"""
-        if len(cs) == 0:
+        if C.shape[0] == 0:
             return v/alpha
 
         # (B + C D^H)^-1 = B^-1 - B^-1 C (I + D^H B^-1 C)^-1 D^H B^-1
 
-        axpy, dotc = get_blas_funcs(['axpy', 'dotc'], cs[:1] + [v])
-
-        c0 = cs[0]
-        A = alpha * np.identity(len(cs), dtype=c0.dtype)
-        for i, d in enumerate(ds):
-            for j, c in enumerate(cs):
-                A[i,j] += dotc(d, c)
-
-        q = np.zeros(len(cs), dtype=c0.dtype)
-        for j, d in enumerate(ds):
-            q[j] = dotc(d, v)
-        q /= alpha
-        q = solve(A, q)
-
-        w = v/alpha
-        for c, qc in zip(cs, q):
-            w = axpy(c, w, w.size, -qc)
-
-        return w
+        Dh = D.conj()
+        A = alpha * np.identity(C.shape[0], dtype=C.dtype) + dot(Dh, C.T)
+        q = solve(A, dot(Dh, v) / alpha)
+        return v/alpha - dot(q, C)
 
     def matvec(self, v):
         """Evaluate w = M v"""
         if self.collapsed is not None:
             return np.dot(self.collapsed, v)
-        return LowRankMatrix._matvec(v, self.alpha, self.cs, self.ds)
+        return LowRankMatrix._matvec(v, self.alpha, self.C, self.D)
 
     def rmatvec(self, v):
         """Evaluate w = M^H v"""
         if self.collapsed is not None:
             return np.dot(self.collapsed.T.conj(), v)
-        return LowRankMatrix._matvec(v, np.conj(self.alpha), self.ds, self.cs)
+        return LowRankMatrix._matvec(v, np.conj(self.alpha), self.D, self.C)
 
     def solve(self, v, tol=0):
         """Evaluate w = M^-1 v"""
         if self.collapsed is not None:
             return solve(self.collapsed, v)
-        return LowRankMatrix._solve(v, self.alpha, self.cs, self.ds)
+        return LowRankMatrix._solve(v, self.alpha, self.C, self.D)
 
     def rsolve(self, v, tol=0):
         """Evaluate w = M^-H v"""
         if self.collapsed is not None:
             return solve(self.collapsed.T.conj(), v)
-        return LowRankMatrix._solve(v, np.conj(self.alpha), self.ds, self.cs)
+        return LowRankMatrix._solve(v, np.conj(self.alpha), self.D, self.C)
 
     def append(self, c, d):
         if self.collapsed is not None:
             self.collapsed += c[:,None] * d[None,:].conj()
             return
 
-        self.cs.append(c)
-        self.ds.append(d)
+        dtype = np.result_type(self._C, c, d)
+        if self.rank == self._C.shape[0] or dtype != self._C.dtype:
+            capacity = max(4, 2*self._C.shape[0])
+            for name in ('_C', '_D'):
+                old = getattr(self, name)
+                new = np.empty((capacity, self.n), dtype=dtype)
+                new[:self.rank] = old[:self.rank]
+                setattr(self, name, new)
+
+        self._C[self.rank] = c
+        self._D[self.rank] = d
+        self.rank += 1
 
-        if len(self.cs) > c.size:
+        if self.rank > c.size:
             self.collapse()
 
     def __array__(self):
@@ -784,15 +789,14 @@ class LowRankMatrix(object):
             return self.collapsed
 
         Gm = self.alpha*np.identity(self.n, dtype=self.dtype)
-        for c, d in zip(self.cs, self.ds):
-            Gm += c[:,None]*d[None,:].conj()
-        return Gm
+        return Gm + dot(self.C.T, self.D.conj())
 
     def collapse(self):
         """Collapse the low-rank matrix to a full-rank one."""
         self.collapsed = np.array(self)
-        self.cs = None
-        self.ds = None
+        self._C = None
+        self._D = None
+        self.rank = 0
         self.alpha = None
 
     def restart_reduce(self, rank):
@@ -802,9 +806,8 @@ class LowRankMatrix(object):
         if self.collapsed is not None:
             return
         assert rank > 0
-        if len(self.cs) > rank:
-            del self.cs[:]
-            del self.ds[:]
+        if self.rank > rank:
+            self.rank = 0
 
     def simple_reduce(self, rank):
         """
@@ -813,9 +816,11 @@ class LowRankMatrix(object):
         if self.collapsed is not None:
             return
         assert rank > 0
-        while len(self.cs) > rank:
-            del self.cs[0]
-            del self.ds[0]
+        if self.rank > rank:
+            drop = self.rank - rank
+            self._C[:rank] = self._C[drop:self.rank].copy()
+            self._D[:rank] = self._D[drop:self.rank].copy()
+            self.rank = rank
 
     def svd_reduce(self, max_rank, to_retain=None):
         """
@@ -855,17 +860,17 @@ class LowRankMatrix(object):
         else:
             q = p - 2
 
-        if self.cs:
-            p = min(p, len(self.cs[0]))
+        if self.rank:
+            p = min(p, self.n)
         q = max(0, min(q, p-1))
 
-        m = len(self.cs)
+        m = self.rank
         if m < p:
             # nothing to do
             return
 
-        C = np.array(self.cs).T
-        D = np.array(self.ds).T
+        C = self.C.T
+        D = self.D.T
 
         D, R = qr(D, mode='economic')
         C = dot(C, R.T.conj())
@@ -875,12 +880,9 @@ class LowRankMatrix(object):
         C = dot(C, inv(WH))
         D = dot(D, WH.T.conj())
 
-        for k in xrange(q):
-            self.cs[k] = C[:,k].copy()
-            self.ds[k] = D[:,k].copy()
-
-        del self.cs[q:]
-        del self.ds[q:]
+        self._C[:q] = C[:,:q].T
+        self._D[:q] = D[:,:q].T
+        self.rank = q
 
 _doc_parts['broyden_params'] = """
     alpha : float, optional
@@ -1098,80 +1100,80 @@ class Anderson(GenericBroyden):
         GenericBroyden.__init__(self)
         self.alpha = alpha
         self.M = M
-        self.dx = []
-        self.df = []
+        # the last (at most M) steps and changes of the residual, as the
+        # first nvec rows of preallocated arrays, oldest first
+        self._dX = None
+        self._dF = None
+        self.nvec = 0
         self.gamma = None
         self.w0 = w0
 
+    @property
+    def dx(self):
+        return self._dX[:self.nvec]
+
+    @property
+    def df(self):
+        return self._dF[:self.nvec]
+
     def solve(self, f, tol=0):
         dx = -self.alpha*f
 
-        n = len(self.dx)
-        if n == 0:
+        if self.nvec == 0:
             return dx
 
-        df_f = np.empty(n, dtype=f.dtype)
-        for k in xrange(n):
-            df_f[k] = vdot(self.df[k], f)
+        df_f = dot(self.df.conj(), f)
 
         try:
             gamma = solve(self.a, df_f)
         except LinAlgError:
             # singular; reset the Jacobian approximation
-            del self.dx[:]
-            del self.df[:]
+            self.nvec = 0
             return dx
 
-        for m in xrange(n):
-            dx += gamma[m]*(self.dx[m] + self.alpha*self.df[m])
-        return dx
+        return dx + dot(gamma, self.dx + self.alpha*self.df)
 
     def matvec(self, f):
         dx = -f/self.alpha
 
-        n = len(self.dx)
-        if n == 0:
+        if self.nvec == 0:
             return dx
 
-        df_f = np.empty(n, dtype=f.dtype)
-        for k in xrange(n):
-            df_f[k] = vdot(self.df[k], f)
+        df_f = dot(self.df.conj(), f)
 
-        b = np.empty((n, n), dtype=f.dtype)
-        for i in xrange(n):
-            for j in xrange(n):
-                b[i,j] = vdot(self.df[i], self.dx[j])
-                if i == j and self.w0 != 0:
-                    b[i,j] -= vdot(self.df[i], self.df[i])*self.w0**2*self.alpha
+        b = dot(self.df.conj(), self.dx.T)
+        if self.w0 != 0:
+            b[np.diag_indices_from(b)] -= (np.diagonal(self.a) /
+                                           (1 + self.w0**2) *
+                                           self.w0**2*self.alpha)
         gamma = solve(b, df_f)
 
-        for m in xrange(n):
-            dx += gamma[m]*(self.df[m] + self.dx[m]/self.alpha)
-        return dx
+        return dx + dot(gamma, self.df + self.dx/self.alpha)
 
     def _update(self, x, f, dx, df, dx_norm, df_norm):
         if self.M == 0:
             return
 
-        self.dx.append(dx)
-        self.df.append(df)
-
-        while len(self.dx) > self.M:
-            self.dx.pop(0)
-            self.df.pop(0)
-
-        n = len(self.dx)
-        a = np.zeros((n, n), dtype=f.dtype)
-
-        for i in xrange(n):
-            for j in xrange(i, n):
-                if i == j:
-                    wd = self.w0**2
-                else:
-                    wd = 0
-                a[i,j] = (1+wd)*vdot(self.df[i], self.df[j])
-
-        a += np.triu(a, 1).T.conj()
+        dtype = np.result_type(f, dx, df)
+        if self._dX is None or self._dX.dtype != dtype:
+            dX = np.empty((self.M, dx.size), dtype=dtype)
+            dF = np.empty((self.M, df.size), dtype=dtype)
+            if self._dX is not None:
+                dX[:self.nvec] = self.dx
+                dF[:self.nvec] = self.df
+            self._dX, self._dF = dX, dF
+
+        if self.nvec == self.M:
+            # drop the oldest vectors
+            self._dX[:-1] = self._dX[1:].copy()
+            self._dF[:-1] = self._dF[1:].copy()
+            self.nvec -= 1
+        self._dX[self.nvec] = dx
+        self._dF[self.nvec] = df
+        self.nvec += 1
+
+        a = dot(self.df.conj(), self.df.T)
+        a[np.diag_indices_from(a)] *= 1 + self.w0**2
         self.a = a
 
 #------------------------------------------------------------------------------
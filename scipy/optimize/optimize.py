@@ -29,6 +29,8 @@ __docformat__ = "restructuredtext en"
 
 import warnings
 import sys
+import collections
+from timeit import default_timer
 import numpy
 from scipy._lib.six import callable, xrange
 from numpy import (atleast_1d, eye, mgrid, argmin, zeros, shape, squeeze,
@@ -38,6 +40,7 @@ from .linesearch import (line_search_wolfe1, line_search_wolfe2,
                          line_search_wolfe2 as line_search,
                          LineSearchWarning)
 from scipy._lib._util import getargspec_no_self as _getargspec
+from scipy._lib._util import MapWrapper, _FunctionWrapper
 from scipy.linalg import get_blas_funcs
 
 
@@ -73,6 +76,87 @@ class MemoizeJac(object):
             return self.jac
 
 
+class _EvaluationCache(object):
+    """ Least recently used cache of function values, keyed on the exact
+    bytes of the evaluation point. The values of several functions
+    (objective, gradient, Hessian) are kept in the same cache, so that
+    `maxsize` bounds the total number of values stored. """
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._values = collections.OrderedDict()
+
+    def get(self, key):
+        try:
+            value = self._values.pop(key)
+        except KeyError:
+            self.misses += 1
+            raise
+        self._values[key] = value
+        self.hits += 1
+        return value
+
+    def put(self, key, value):
+        self._values[key] = value
+        while len(self._values) > self.maxsize:
+            self._values.popitem(last=False)
+
+
+def _copy_value(value):
+    # so that a solver modifying a returned array does not alter the cache
+    if isinstance(value, numpy.ndarray):
+        return value.copy()
+    elif isinstance(value, tuple):
+        return tuple(_copy_value(v) for v in value)
+    return value
+
+
+class _CachedFunction(object):
+    """ Wrap a function so that its values are looked up in an
+    `_EvaluationCache` first. The key is made of the name of the function
+    and of its first `narg` arguments (the point, and for a Hessian-vector
+    product the vector); the remaining arguments are those passed through
+    ``args`` and do not change during a minimization. """
+    def __init__(self, fun, name, cache, narg=1):
+        self.fun = fun
+        self.name = name
+        self.cache = cache
+        self.narg = narg
+
+    def __call__(self, *args):
+        key = (self.name,)
+        for a in args[:self.narg]:
+            a = numpy.asarray(a)
+            key += (a.shape, a.dtype.str, a.tostring())
+        try:
+            value = self.cache.get(key)
+        except KeyError:
+            value = self.fun(*args)
+            self.cache.put(key, _copy_value(value))
+            return value
+        return _copy_value(value)
+
+
+class _ProfiledFunction(object):
+    """ Wrap a function to record the number of calls and the wall time spent
+    in it, accumulated in ``stats[name] = [ncalls, time]``. """
+    def __init__(self, fun, name, stats):
+        self.fun = fun
+        self.name = name
+        self.stats = stats
+        stats.setdefault(name, [0, 0.])
+
+    def __call__(self, *args, **kwargs):
+        start = default_timer()
+        try:
+            return self.fun(*args, **kwargs)
+        finally:
+            entry = self.stats[self.name]
+            entry[0] += 1
+            entry[1] += default_timer() - start
+
+
 class OptimizeResult(dict):
     """ Represents the optimization result.
 
@@ -102,6 +186,9 @@ class OptimizeResult(dict):
         Number of iterations performed by the optimizer.
     maxcv : float
         The maximum constraint violation.
+    profile : dict
+        Call counts and timings of the user functions, when requested with
+        the ``profile`` argument of `minimize`.
 
     Notes
     -----
@@ -614,13 +701,33 @@ def _minimize_neldermead(func, x0, args=(), callback=None,
     return result
 
 
-def _approx_fprime_helper(xk, f, epsilon, args=(), f0=None):
+def _approx_fprime_helper(xk, f, epsilon, args=(), f0=None, workers=None,
+                          vectorized=False):
     """
     See ``approx_fprime``.  An optional initial function value arg is added.
 
+    If `workers` is given, it is a map-like callable used to evaluate `f` at
+    all the perturbed points in one call. If `vectorized` is True, `f` is
+    instead called once with the perturbed points as the columns of an
+    ``(n, n)`` array, and must return the ``n`` function values.
+
     """
     if f0 is None:
         f0 = f(*((xk,) + args))
+    if workers is not None or vectorized:
+        xk = asarray(xk)
+        d = epsilon * numpy.ones(len(xk))
+        points = xk + numpy.diag(d)
+        if vectorized:
+            fk = f(*((points.T,) + args))
+        else:
+            fk = list(workers(_FunctionWrapper(f, args), points))
+        fk = numpy.asarray(fk, dtype=float).ravel()
+        if fk.size != len(xk):
+            raise RuntimeError("The function must return one value per "
+                               "point at which it is evaluated.")
+        return (fk - f0) / d
+
     grad = numpy.zeros((len(xk),), float)
     ei = numpy.zeros((len(xk),), float)
     for k in range(len(xk)):
@@ -631,7 +738,43 @@ def _approx_fprime_helper(xk, f, epsilon, args=(), f0=None):
     return grad
 
 
-def approx_fprime(xk, f, epsilon, *args):
+def _prepare_approx_fprime(fun, args, epsilon, ncalls, workers=1,
+                           vectorized=False):
+    """
+    Return a function ``grad(x, f0=None)`` computing the forward-difference
+    gradient of ``fun(x, *args)`` for the scalar minimizers. The function
+    evaluations are added to the counter ``ncalls[0]``.
+
+    `fun` must be the user's function rather than a counting wrapper, so
+    that it can be sent to a process pool. The pool, if `workers` needs
+    one, is created by the first call and released by ``grad.close()``.
+    """
+    use_mapper = not vectorized and (callable(workers) or workers != 1)
+    mapper = []
+
+    def grad(x, f0=None):
+        if use_mapper and not mapper:
+            mapper.append(MapWrapper(workers))
+        if f0 is None:
+            f0 = fun(*((x,) + args))
+            ncalls[0] += 1
+        g = _approx_fprime_helper(x, fun, epsilon, args=args, f0=f0,
+                                  workers=mapper[0] if mapper else None,
+                                  vectorized=vectorized)
+        ncalls[0] += len(x)
+        return g
+
+    def close():
+        if mapper:
+            pool = mapper.pop()
+            pool.close()
+            pool.join()
+
+    grad.close = close
+    return grad
+
+
+def approx_fprime(xk, f, epsilon, *args, **kwargs):
     """Finite-difference approximation of the gradient of a scalar function.
 
     Parameters
@@ -650,6 +793,18 @@ def approx_fprime(xk, f, epsilon, *args):
         `xk`.
     \\*args : args, optional
         Any other arguments that are to be passed to `f`.
+    workers : int or map-like callable, optional
+        If `workers` is an int the function is evaluated at the perturbed
+        points in parallel by that many processes (uses
+        `multiprocessing.Pool`), -1 meaning all available CPU cores.
+        Alternatively supply a map-like callable, such as
+        `multiprocessing.Pool.map`, which is called as
+        ``workers(func, iterable)``. Default is 1, evaluating the points in
+        turn. Keyword only.
+    vectorized : bool, optional
+        If True, `f` is called once with all the perturbed points as the
+        columns of an array of shape ``(len(xk), len(xk))``, and must return
+        an array of the ``len(xk)`` function values. Keyword only.
 
     Returns
     -------
@@ -686,7 +841,17 @@ def approx_fprime(xk, f, epsilon, *args):
     array([   2.        ,  400.00004198])
 
     """
-    return _approx_fprime_helper(xk, f, epsilon, args=args)
+    workers = kwargs.pop('workers', 1)
+    vectorized = kwargs.pop('vectorized', False)
+    if kwargs:
+        raise ValueError("Unknown keyword arguments: %r" %
+                         (list(kwargs.keys()),))
+    if vectorized or not (callable(workers) or workers != 1):
+        return _approx_fprime_helper(xk, f, epsilon, args=args,
+                                     vectorized=vectorized)
+    with MapWrapper(workers) as mapper:
+        return _approx_fprime_helper(xk, f, epsilon, args=args,
+                                     workers=mapper)
 
 
 def check_grad(func, grad, x0, *args, **kwargs):
@@ -707,6 +872,11 @@ def check_grad(func, grad, x0, *args, **kwargs):
     epsilon : float, optional
         Step size used for the finite difference approximation. It defaults to
         ``sqrt(numpy.finfo(float).eps)``, which is approximately 1.49e-08.
+    workers : int or map-like callable, optional
+        Evaluate the finite differences in parallel, see `approx_fprime`.
+    vectorized : bool, optional
+        Evaluate the finite differences with a single call to `func`, see
+        `approx_fprime`.
 
     Returns
     -------
@@ -731,11 +901,14 @@ def check_grad(func, grad, x0, *args, **kwargs):
 
     """
     step = kwargs.pop('epsilon', _epsilon)
+    workers = kwargs.pop('workers', 1)
+    vectorized = kwargs.pop('vectorized', False)
     if kwargs:
         raise ValueError("Unknown keyword arguments: %r" %
                          (list(kwargs.keys()),))
     return sqrt(sum((grad(x0, *args) -
-                     approx_fprime(x0, func, step, *args))**2))
+                     approx_fprime(x0, func, step, *args, workers=workers,
+                                   vectorized=vectorized))**2))
 
 
 def approx_fhess_p(x0, p, fprime, epsilon, *args):
@@ -889,7 +1062,7 @@ def fmin_bfgs(f, x0, fprime=None, args=(), gtol=1e-5, norm=Inf,
 
 def _minimize_bfgs(fun, x0, args=(), jac=None, callback=None,
                    gtol=1e-5, norm=Inf, eps=_epsilon, maxiter=None,
-                   disp=False, return_all=False,
+                   disp=False, return_all=False, workers=1, vectorized=False,
                    **unknown_options):
     """
     Minimization of scalar function of one or more variables using the
@@ -908,6 +1081,13 @@ def _minimize_bfgs(fun, x0, args=(), jac=None, callback=None,
         Order of norm (Inf is max, -Inf is min).
     eps : float or ndarray
         If `jac` is approximated, use this value for the step size.
+    workers : int or map-like callable
+        If `jac` is approximated, evaluate the finite differences in
+        parallel, see `approx_fprime`.
+    vectorized : bool
+        If `jac` is approximated, call `fun` once per gradient with all
+        perturbed points as the columns of an ``(n, n)`` array, see
+        `approx_fprime`.
 
     """
     _check_unknown_options(unknown_options)
@@ -922,93 +1102,100 @@ def _minimize_bfgs(fun, x0, args=(), jac=None, callback=None,
     if maxiter is None:
         maxiter = len(x0) * 200
     func_calls, f = wrap_function(f, args)
+    approx_grad = None
     if fprime is None:
-        grad_calls, myfprime = wrap_function(approx_fprime, (f, epsilon))
+        approx_grad = _prepare_approx_fprime(fun, args, epsilon, func_calls,
+                                             workers, vectorized)
+        grad_calls, myfprime = wrap_function(approx_grad, ())
     else:
         grad_calls, myfprime = wrap_function(fprime, args)
-    gfk = myfprime(x0)
-    k = 0
-    N = len(x0)
-    I = numpy.eye(N, dtype=int)
-    Hk = I
+    try:
+        gfk = myfprime(x0)
+        k = 0
+        N = len(x0)
+        I = numpy.eye(N, dtype=int)
+        Hk = I
 
-    # get needed blas functions
-    syr = get_blas_funcs('syr', dtype='d')  # Symetric rank 1 update
-    syr2 = get_blas_funcs('syr2', dtype='d')  # Symetric rank 2 update
-    symv = get_blas_funcs('symv', dtype='d')  # Symetric matrix-vector product
+        # get needed blas functions
+        syr = get_blas_funcs('syr', dtype='d')  # Symetric rank 1 update
+        syr2 = get_blas_funcs('syr2', dtype='d')  # Symetric rank 2 update
+        symv = get_blas_funcs('symv', dtype='d')  # Symetric matrix-vector product
 
-    # Sets the initial step guess to dx ~ 1
-    old_fval = f(x0)
-    old_old_fval = old_fval + np.linalg.norm(gfk) / 2
+        # Sets the initial step guess to dx ~ 1
+        old_fval = f(x0)
+        old_old_fval = old_fval + np.linalg.norm(gfk) / 2
 
-    xk = x0
-    if retall:
-        allvecs = [x0]
-    sk = [2 * gtol]
-    warnflag = 0
-    gnorm = vecnorm(gfk, ord=norm)
-    while (gnorm > gtol) and (k < maxiter):
-        pk = symv(-1, Hk, gfk)
-        try:
-            alpha_k, fc, gc, old_fval, old_old_fval, gfkp1 = \
-                     _line_search_wolfe12(f, myfprime, xk, pk, gfk,
-                                          old_fval, old_old_fval, amin=1e-100, amax=1e100)
-        except _LineSearchError:
-            # Line search failed to find a better solution.
-            warnflag = 2
-            break
-
-        xkp1 = xk + alpha_k * pk
+        xk = x0
         if retall:
-            allvecs.append(xkp1)
-        sk = xkp1 - xk
-        xk = xkp1
-        if gfkp1 is None:
-            gfkp1 = myfprime(xkp1)
-
-        yk = gfkp1 - gfk
-        gfk = gfkp1
-        if callback is not None:
-            callback(xk)
+            allvecs = [x0]
+        sk = [2 * gtol]
+        warnflag = 0
         gnorm = vecnorm(gfk, ord=norm)
-        if (gnorm <= gtol):
-            break
+        while (gnorm > gtol) and (k < maxiter):
+            pk = symv(-1, Hk, gfk)
+            try:
+                alpha_k, fc, gc, old_fval, old_old_fval, gfkp1 = \
+                         _line_search_wolfe12(f, myfprime, xk, pk, gfk,
+                                              old_fval, old_old_fval, amin=1e-100, amax=1e100)
+            except _LineSearchError:
+                # Line search failed to find a better solution.
+                warnflag = 2
+                break
 
-        if not numpy.isfinite(old_fval):
-            # We correctly found +-Inf as optimal value, or something went
-            # wrong.
-            warnflag = 2
-            break
+            xkp1 = xk + alpha_k * pk
+            if retall:
+                allvecs.append(xkp1)
+            sk = xkp1 - xk
+            xk = xkp1
+            if gfkp1 is None:
+                gfkp1 = myfprime(xkp1)
 
-        yk_sk = np.dot(yk, sk)
-        try:  # this was handled in numeric, let it remaines for more safety
-            rhok = 1.0 / yk_sk
-        except ZeroDivisionError:
-            rhok = 1000.0
-            if disp:
-                print("Divide-by-zero encountered: rhok assumed large")
-        if isinf(rhok):  # this is patch for numpy
-            rhok = 1000.0
-            if disp:
-                print("Divide-by-zero encountered: rhok assumed large")
-
-        # Heristic to adjust Hk for k == 0
-        # described at Nocedal/Wright "Numerical Optimization"
-        # p.143 formula (6.20)
-        if k == 0:
-            Hk = yk_sk / np.dot(yk, yk)*I
-
-        # Implement BFGS update using the formula:
-        # Hk <- Hk + ((Hk yk).T yk+sk.T yk)*(rhok**2)*sk sk.T -rhok*[(Hk yk)sk.T +sk(Hk yk).T]
-        # This formula is equivalent to (6.17) from
-        # Nocedal/Wright "Numerical Optimization"
-        # written in a more efficient way for implementation.
-        Hk_yk = symv(1, Hk, yk)
-        c = rhok**2 * (yk_sk+Hk_yk.dot(yk))
-        Hk = syr2(-rhok, sk, Hk_yk, a=Hk)
-        Hk = syr(c, sk, a=Hk)
+            yk = gfkp1 - gfk
+            gfk = gfkp1
+            if callback is not None:
+                callback(xk)
+            gnorm = vecnorm(gfk, ord=norm)
+            if (gnorm <= gtol):
+                break
 
-        k += 1
+            if not numpy.isfinite(old_fval):
+                # We correctly found +-Inf as optimal value, or something went
+                # wrong.
+                warnflag = 2
+                break
+
+            yk_sk = np.dot(yk, sk)
+            try:  # this was handled in numeric, let it remaines for more safety
+                rhok = 1.0 / yk_sk
+            except ZeroDivisionError:
+                rhok = 1000.0
+                if disp:
+                    print("Divide-by-zero encountered: rhok assumed large")
+            if isinf(rhok):  # this is patch for numpy
+                rhok = 1000.0
+                if disp:
+                    print("Divide-by-zero encountered: rhok assumed large")
+
+            # Heristic to adjust Hk for k == 0
+            # described at Nocedal/Wright "Numerical Optimization"
+            # p.143 formula (6.20)
+            if k == 0:
+                Hk = yk_sk / np.dot(yk, yk)*I
+
+            # Implement BFGS update using the formula:
+            # Hk <- Hk + ((Hk yk).T yk+sk.T yk)*(rhok**2)*sk sk.T -rhok*[(Hk yk)sk.T +sk(Hk yk).T]
+            # This formula is equivalent to (6.17) from
+            # Nocedal/Wright "Numerical Optimization"
+            # written in a more efficient way for implementation.
+            Hk_yk = symv(1, Hk, yk)
+            c = rhok**2 * (yk_sk+Hk_yk.dot(yk))
+            Hk = syr2(-rhok, sk, Hk_yk, a=Hk)
+            Hk = syr(c, sk, a=Hk)
+
+            k += 1
+    finally:
+        if approx_grad is not None:
+            approx_grad.close()
 
     # The matrix Hk is obtained from the
     # symmetric representation that were being
@@ -1232,7 +1419,7 @@ def fmin_cg(f, x0, fprime=None, args=(), gtol=1e-5, norm=Inf, epsilon=_epsilon,
 
 def _minimize_cg(fun, x0, args=(), jac=None, callback=None,
                  gtol=1e-5, norm=Inf, eps=_epsilon, maxiter=None,
-                 disp=False, return_all=False,
+                 disp=False, return_all=False, workers=1, vectorized=False,
                  **unknown_options):
     """
     Minimization of scalar function of one or more variables using the
@@ -1251,6 +1438,13 @@ def _minimize_cg(fun, x0, args=(), jac=None, callback=None,
         Order of norm (Inf is max, -Inf is min).
     eps : float or ndarray
         If `jac` is approximated, use this value for the step size.
+    workers : int or map-like callable
+        If `jac` is approximated, evaluate the finite differences in
+        parallel, see `approx_fprime`.
+    vectorized : bool
+        If `jac` is approximated, call `fun` once per gradient with all
+        perturbed points as the columns of an ``(n, n)`` array, see
+        `approx_fprime`.
 
     """
     _check_unknown_options(unknown_options)
@@ -1263,79 +1457,86 @@ def _minimize_cg(fun, x0, args=(), jac=None, callback=None,
     if maxiter is None:
         maxiter = len(x0) * 200
     func_calls, f = wrap_function(f, args)
+    approx_grad = None
     if fprime is None:
-        grad_calls, myfprime = wrap_function(approx_fprime, (f, epsilon))
+        approx_grad = _prepare_approx_fprime(fun, args, epsilon, func_calls,
+                                             workers, vectorized)
+        grad_calls, myfprime = wrap_function(approx_grad, ())
     else:
         grad_calls, myfprime = wrap_function(fprime, args)
-    gfk = myfprime(x0)
-    k = 0
-    xk = x0
-
-    # Sets the initial step guess to dx ~ 1
-    old_fval = f(xk)
-    old_old_fval = old_fval + np.linalg.norm(gfk) / 2
-
-    if retall:
-        allvecs = [xk]
-    warnflag = 0
-    pk = -gfk
-    gnorm = vecnorm(gfk, ord=norm)
+    try:
+        gfk = myfprime(x0)
+        k = 0
+        xk = x0
 
-    sigma_3 = 0.01
+        # Sets the initial step guess to dx ~ 1
+        old_fval = f(xk)
+        old_old_fval = old_fval + np.linalg.norm(gfk) / 2
 
-    while (gnorm > gtol) and (k < maxiter):
-        deltak = numpy.dot(gfk, gfk)
-
-        cached_step = [None]
-
-        def polak_ribiere_powell_step(alpha, gfkp1=None):
-            xkp1 = xk + alpha * pk
-            if gfkp1 is None:
-                gfkp1 = myfprime(xkp1)
-            yk = gfkp1 - gfk
-            beta_k = max(0, numpy.dot(yk, gfkp1) / deltak)
-            pkp1 = -gfkp1 + beta_k * pk
-            gnorm = vecnorm(gfkp1, ord=norm)
-            return (alpha, xkp1, pkp1, gfkp1, gnorm)
-
-        def descent_condition(alpha, xkp1, fp1, gfkp1):
-            # Polak-Ribiere+ needs an explicit check of a sufficient
-            # descent condition, which is not guaranteed by strong Wolfe.
-            #
-            # See Gilbert & Nocedal, "Global convergence properties of
-            # conjugate gradient methods for optimization",
-            # SIAM J. Optimization 2, 21 (1992).
-            cached_step[:] = polak_ribiere_powell_step(alpha, gfkp1)
-            alpha, xk, pk, gfk, gnorm = cached_step
-
-            # Accept step if it leads to convergence.
-            if gnorm <= gtol:
-                return True
-
-            # Accept step if sufficient descent condition applies.
-            return numpy.dot(pk, gfk) <= -sigma_3 * numpy.dot(gfk, gfk)
+        if retall:
+            allvecs = [xk]
+        warnflag = 0
+        pk = -gfk
+        gnorm = vecnorm(gfk, ord=norm)
 
-        try:
-            alpha_k, fc, gc, old_fval, old_old_fval, gfkp1 = \
-                     _line_search_wolfe12(f, myfprime, xk, pk, gfk, old_fval,
-                                          old_old_fval, c2=0.4, amin=1e-100, amax=1e100,
-                                          extra_condition=descent_condition)
-        except _LineSearchError:
-            # Line search failed to find a better solution.
-            warnflag = 2
-            break
+        sigma_3 = 0.01
+
+        while (gnorm > gtol) and (k < maxiter):
+            deltak = numpy.dot(gfk, gfk)
+
+            cached_step = [None]
+
+            def polak_ribiere_powell_step(alpha, gfkp1=None):
+                xkp1 = xk + alpha * pk
+                if gfkp1 is None:
+                    gfkp1 = myfprime(xkp1)
+                yk = gfkp1 - gfk
+                beta_k = max(0, numpy.dot(yk, gfkp1) / deltak)
+                pkp1 = -gfkp1 + beta_k * pk
+                gnorm = vecnorm(gfkp1, ord=norm)
+                return (alpha, xkp1, pkp1, gfkp1, gnorm)
+
+            def descent_condition(alpha, xkp1, fp1, gfkp1):
+                # Polak-Ribiere+ needs an explicit check of a sufficient
+                # descent condition, which is not guaranteed by strong Wolfe.
+                #
+                # See Gilbert & Nocedal, "Global convergence properties of
+                # conjugate gradient methods for optimization",
+                # SIAM J. Optimization 2, 21 (1992).
+                cached_step[:] = polak_ribiere_powell_step(alpha, gfkp1)
+                alpha, xk, pk, gfk, gnorm = cached_step
+
+                # Accept step if it leads to convergence.
+                if gnorm <= gtol:
+                    return True
+
+                # Accept step if sufficient descent condition applies.
+                return numpy.dot(pk, gfk) <= -sigma_3 * numpy.dot(gfk, gfk)
+
+            try:
+                alpha_k, fc, gc, old_fval, old_old_fval, gfkp1 = \
+                         _line_search_wolfe12(f, myfprime, xk, pk, gfk, old_fval,
+                                              old_old_fval, c2=0.4, amin=1e-100, amax=1e100,
+                                              extra_condition=descent_condition)
+            except _LineSearchError:
+                # Line search failed to find a better solution.
+                warnflag = 2
+                break
 
-        # Reuse already computed results if possible
-        if alpha_k == cached_step[0]:
-            alpha_k, xk, pk, gfk, gnorm = cached_step
-        else:
-            alpha_k, xk, pk, gfk, gnorm = polak_ribiere_powell_step(alpha_k, gfkp1)
+            # Reuse already computed results if possible
+            if alpha_k == cached_step[0]:
+                alpha_k, xk, pk, gfk, gnorm = cached_step
+            else:
+                alpha_k, xk, pk, gfk, gnorm = polak_ribiere_powell_step(alpha_k, gfkp1)
 
-        if retall:
-            allvecs.append(xk)
-        if callback is not None:
-            callback(xk)
-        k += 1
+            if retall:
+                allvecs.append(xk)
+            if callback is not None:
+                callback(xk)
+            k += 1
+    finally:
+        if approx_grad is not None:
+            approx_grad.close()
 
     fval = old_fval
     if warnflag == 2:
@@ -2855,6 +3056,8 @@ def show_options(solver=None, method=None, disp=True):
     - :ref:`SLSQP       <optimize.minimize-slsqp>`
     - :ref:`dogleg      <optimize.minimize-dogleg>`
     - :ref:`trust-ncg   <optimize.minimize-trustncg>`
+    - :ref:`trust-exact <optimize.minimize-trustexact>`
+    - :ref:`trust-krylov <optimize.minimize-trustkrylov>`
 
     `scipy.optimize.root`
 
@@ -2868,6 +3071,7 @@ def show_options(solver=None, method=None, disp=True):
     - :ref:`excitingmixing    <optimize.root-excitingmixing>`
     - :ref:`krylov            <optimize.root-krylov>`
     - :ref:`df-sane           <optimize.root-dfsane>`
+    - :ref:`newton-sparse     <optimize.root-newtonsparse>`
 
     `scipy.optimize.minimize_scalar`
 
@@ -2878,6 +3082,8 @@ def show_options(solver=None, method=None, disp=True):
     `scipy.optimize.linprog`
 
     - :ref:`simplex     <optimize.linprog-simplex>`
+    - :ref:`revised simplex <optimize.linprog-revised_simplex>`
+    - :ref:`interior-point <optimize.linprog-interior-point>`
 
     """
     import textwrap
@@ -2895,6 +3101,8 @@ def show_options(solver=None, method=None, disp=True):
             ('slsqp', 'scipy.optimize.slsqp._minimize_slsqp'),
             ('tnc', 'scipy.optimize.tnc._minimize_tnc'),
             ('trust-ncg', 'scipy.optimize._trustregion_ncg._minimize_trust_ncg'),
+            ('trust-exact', 'scipy.optimize._trustregion_exact._minimize_trustregion_exact'),
+            ('trust-krylov', 'scipy.optimize._trustregion_krylov._minimize_trust_krylov'),
         ),
         'root': (
             ('hybr', 'scipy.optimize.minpack._root_hybr'),
@@ -2907,9 +3115,12 @@ def show_options(solver=None, method=None, disp=True):
             ('linearmixing', 'scipy.optimize._root._root_linearmixing_doc'),
             ('krylov', 'scipy.optimize._root._root_krylov_doc'),
             ('df-sane', 'scipy.optimize._spectral._root_df_sane'),
+            ('newton-sparse', 'scipy.optimize._root._root_newton_sparse'),
         ),
         'linprog': (
             ('simplex', 'scipy.optimize._linprog._linprog_simplex'),
+            ('revised simplex', 'scipy.optimize._linprog_rs._linprog_rs'),
+            ('interior-point', 'scipy.optimize._linprog_ip._linprog_ip'),
         ),
         'minimize_scalar': (
             ('brent', 'scipy.optimize.optimize._minimize_scalar_brent'),
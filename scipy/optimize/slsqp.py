@@ -21,7 +21,8 @@ import numpy as np
 from scipy.optimize._slsqp import slsqp
 from numpy import zeros, array, linalg, append, asfarray, concatenate, finfo, \
                   sqrt, vstack, exp, inf, where, isfinite, atleast_1d
-from .optimize import wrap_function, OptimizeResult, _check_unknown_options
+from .optimize import (wrap_function, OptimizeResult, _check_unknown_options,
+                       _prepare_approx_fprime)
 
 __docformat__ = "restructuredtext en"
 
@@ -214,7 +215,7 @@ def fmin_slsqp(func, x0, eqcons=(), f_eqcons=None, ieqcons=(), f_ieqcons=None,
 def _minimize_slsqp(func, x0, args=(), jac=None, bounds=None,
                     constraints=(),
                     maxiter=100, ftol=1.0E-6, iprint=1, disp=False,
-                    eps=_epsilon, callback=None,
+                    eps=_epsilon, callback=None, workers=1, vectorized=False,
                     **unknown_options):
     """
     Minimize a scalar function of one or more variables using Sequential
@@ -231,6 +232,13 @@ def _minimize_slsqp(func, x0, args=(), jac=None, bounds=None,
         `verbosity` is ignored and set to 0.
     maxiter : int
         Maximum number of iterations.
+    workers : int or map-like callable
+        If `jac` is approximated, evaluate the finite differences in
+        parallel, see `approx_fprime`.
+    vectorized : bool
+        If `jac` is approximated, call `func` once per gradient with all
+        perturbed points as the columns of an ``(n, n)`` array, see
+        `approx_fprime`.
 
     """
     _check_unknown_options(unknown_options)
@@ -295,13 +303,22 @@ def _minimize_slsqp(func, x0, args=(), jac=None, bounds=None,
                     9: "Iteration limit exceeded"}
 
     # Wrap func
-    feval, func = wrap_function(func, args)
+    feval, wrapped_func = wrap_function(func, args)
 
-    # Wrap fprime, if provided, or approx_jacobian if not
+    # Wrap fprime, if provided, or approx_jacobian if not. Parallel or
+    # vectorized differences are computed from the unwrapped func, which
+    # can be sent to a process pool.
+    approx_grad = None
     if fprime:
         geval, fprime = wrap_function(fprime, args)
+    elif vectorized or callable(workers) or workers != 1:
+        approx_grad = _prepare_approx_fprime(func, args, epsilon, feval,
+                                             workers, vectorized)
+        geval, fprime = wrap_function(approx_grad, ())
     else:
-        geval, fprime = wrap_function(approx_jacobian, (func, epsilon))
+        geval, fprime = wrap_function(approx_jacobian,
+                                      (wrapped_func, epsilon))
+    func = wrapped_func
 
     # Transform x0 into an array.
     x = asfarray(x0).flatten()
@@ -365,75 +382,79 @@ def _minimize_slsqp(func, x0, args=(), jac=None, bounds=None,
     if iprint >= 2:
         print("%5s %5s %16s %16s" % ("NIT","FC","OBJFUN","GNORM"))
 
-    while 1:
-
-        if mode == 0 or mode == 1:  # objective and constraint evaluation requird
-
-            # Compute objective function
-            fx = func(x)
-            try:
-                fx = float(np.asarray(fx))
-            except (TypeError, ValueError):
-                raise ValueError("Objective function must return a scalar")
-            # Compute the constraints
-            if cons['eq']:
-                c_eq = concatenate([atleast_1d(con['fun'](x, *con['args']))
-                                     for con in cons['eq']])
-            else:
-                c_eq = zeros(0)
-            if cons['ineq']:
-                c_ieq = concatenate([atleast_1d(con['fun'](x, *con['args']))
-                                     for con in cons['ineq']])
-            else:
-                c_ieq = zeros(0)
-
-            # Now combine c_eq and c_ieq into a single matrix
-            c = concatenate((c_eq, c_ieq))
-
-        if mode == 0 or mode == -1:  # gradient evaluation required
-
-            # Compute the derivatives of the objective function
-            # For some reason SLSQP wants g dimensioned to n+1
-            g = append(fprime(x),0.0)
-
-            # Compute the normals of the constraints
-            if cons['eq']:
-                a_eq = vstack([con['jac'](x, *con['args'])
-                               for con in cons['eq']])
-            else:  # no equality constraint
-                a_eq = zeros((meq, n))
-
-            if cons['ineq']:
-                a_ieq = vstack([con['jac'](x, *con['args'])
-                                for con in cons['ineq']])
-            else:  # no inequality constraint
-                a_ieq = zeros((mieq, n))
-
-            # Now combine a_eq and a_ieq into a single a matrix
-            if m == 0:  # no constraints
-                a = zeros((la, n))
-            else:
-                a = vstack((a_eq, a_ieq))
-            a = concatenate((a,zeros([la,1])),1)
-
-        # Call SLSQP
-        slsqp(m, meq, x, xl, xu, fx, c, g, a, acc, majiter, mode, w, jw)
-
-        # call callback if major iteration has incremented
-        if callback is not None and majiter > majiter_prev:
-            callback(x)
-
-        # Print the status of the current iterate if iprint > 2 and the
-        # major iteration has incremented
-        if iprint >= 2 and majiter > majiter_prev:
-            print("%5i %5i % 16.6E % 16.6E" % (majiter,feval[0],
-                                               fx,linalg.norm(g)))
-
-        # If exit mode is not -1 or 1, slsqp has completed
-        if abs(mode) != 1:
-            break
-
-        majiter_prev = int(majiter)
+    try:
+        while 1:
+
+            if mode == 0 or mode == 1:  # objective and constraint evaluation requird
+
+                # Compute objective function
+                fx = func(x)
+                try:
+                    fx = float(np.asarray(fx))
+                except (TypeError, ValueError):
+                    raise ValueError("Objective function must return a scalar")
+                # Compute the constraints
+                if cons['eq']:
+                    c_eq = concatenate([atleast_1d(con['fun'](x, *con['args']))
+                                         for con in cons['eq']])
+                else:
+                    c_eq = zeros(0)
+                if cons['ineq']:
+                    c_ieq = concatenate([atleast_1d(con['fun'](x, *con['args']))
+                                         for con in cons['ineq']])
+                else:
+                    c_ieq = zeros(0)
+
+                # Now combine c_eq and c_ieq into a single matrix
+                c = concatenate((c_eq, c_ieq))
+
+            if mode == 0 or mode == -1:  # gradient evaluation required
+
+                # Compute the derivatives of the objective function
+                # For some reason SLSQP wants g dimensioned to n+1
+                g = append(fprime(x),0.0)
+
+                # Compute the normals of the constraints
+                if cons['eq']:
+                    a_eq = vstack([con['jac'](x, *con['args'])
+                                   for con in cons['eq']])
+                else:  # no equality constraint
+                    a_eq = zeros((meq, n))
+
+                if cons['ineq']:
+                    a_ieq = vstack([con['jac'](x, *con['args'])
+                                    for con in cons['ineq']])
+                else:  # no inequality constraint
+                    a_ieq = zeros((mieq, n))
+
+                # Now combine a_eq and a_ieq into a single a matrix
+                if m == 0:  # no constraints
+                    a = zeros((la, n))
+                else:
+                    a = vstack((a_eq, a_ieq))
+                a = concatenate((a,zeros([la,1])),1)
+
+            # Call SLSQP
+            slsqp(m, meq, x, xl, xu, fx, c, g, a, acc, majiter, mode, w, jw)
+
+            # call callback if major iteration has incremented
+            if callback is not None and majiter > majiter_prev:
+                callback(x)
+
+            # Print the status of the current iterate if iprint > 2 and the
+            # major iteration has incremented
+            if iprint >= 2 and majiter > majiter_prev:
+                print("%5i %5i % 16.6E % 16.6E" % (majiter,feval[0],
+                                                   fx,linalg.norm(g)))
+
+            # If exit mode is not -1 or 1, slsqp has completed
+            if abs(mode) != 1:
+                break
+
+            majiter_prev = int(majiter)
+    finally:
+        if approx_grad is not None:
+            approx_grad.close()
 
     # Optimization loop complete.  Print status if requested
     if iprint >= 1:
@@ -11,7 +11,7 @@ from numpy import cos, sin
 
 from scipy.optimize import (basinhopping, OptimizeResult)
 from scipy.optimize._basinhopping import (
-    Storage, RandomDisplacement, Metropolis, AdaptiveStepsize)
+    Storage, MinimaArchive, RandomDisplacement, Metropolis, AdaptiveStepsize)
 
 
 def func1d(x):
@@ -304,6 +304,80 @@ class TestBasinHopping(TestCase):
                      niter=10, callback=callback2, seed=10)
         assert_equal(np.array(f_1), np.array(f_2))
 
+    def test_n_chains(self):
+        # several chains are advanced on each iteration, with one callback
+        # call per chain
+        i = 1
+        f = []
+
+        def callback(x, fx, accepted):
+            f.append(fx)
+
+        res = basinhopping(func2d, self.x0[i], minimizer_kwargs=self.kwargs,
+                           niter=self.niter, disp=self.disp, n_chains=3,
+                           workers=map, callback=callback)
+        assert_almost_equal(res.x, self.sol[i], self.tol)
+        assert_equal(len(f), 3 * self.niter)
+        assert_equal(res.fun, min(f + [res.fun]))
+
+    def test_n_chains_seed_reproducibility(self):
+        minimizer_kwargs = {"method": "L-BFGS-B", "jac": True}
+        results = []
+        for workers in [1, 2]:
+            f = []
+
+            def callback(x, fx, accepted):
+                f.append(fx)
+
+            basinhopping(func2d, [1.0, 1.0], minimizer_kwargs=minimizer_kwargs,
+                         niter=10, callback=callback, seed=10, n_chains=2,
+                         workers=workers)
+            results.append(f)
+        assert_equal(np.array(results[0]), np.array(results[1]))
+
+    def test_n_chains_invalid(self):
+        assert_raises(ValueError, basinhopping, func2d, [1.0, 1.0],
+                      n_chains=0)
+        assert_raises(ValueError, basinhopping, func2d, [1.0, 1.0],
+                      archive_tol=-1)
+
+    def test_archive(self):
+        # the archive holds distinct minima, sorted by function value
+        i = 1
+        res = basinhopping(func2d, self.x0[i], minimizer_kwargs=self.kwargs,
+                           niter=self.niter, disp=self.disp, n_chains=2,
+                           archive_tol=1e-3)
+        assert_almost_equal(res.x, self.sol[i], self.tol)
+        assert_(len(res.minima_fun) > 1)
+        assert_equal(res.minima_x.shape, (len(res.minima_fun), 2))
+        assert_equal(res.minima_fun[0], res.fun)
+        assert_(np.all(np.diff(res.minima_fun) >= 0))
+        dist = np.sqrt(((res.minima_x[:, None] -
+                         res.minima_x[None, :])**2).sum(-1))
+        assert_(np.all(dist[np.triu_indices(len(dist), 1)] > 1e-3))
+
+    def test_archive_early_stopping(self):
+        # minimizations reaching known minima stop early, saving function
+        # evaluations
+        i = 1
+        kwargs = dict(x0=self.x0[i], minimizer_kwargs=self.kwargs,
+                      niter=50, seed=1234)
+        res = basinhopping(func2d, **kwargs)
+        res_archive = basinhopping(func2d, archive_tol=0.1, **kwargs)
+        assert_almost_equal(res_archive.x, self.sol[i], self.tol)
+        assert_(res_archive.nfev < res.nfev)
+
+    def test_archive_tnc(self):
+        # the TNC callback is called from C, so TNC is only stopped early on
+        # its starting point
+        i = 1
+        minimizer_kwargs = dict(method='TNC', jac=True)
+        res = basinhopping(func2d, self.x0[i],
+                           minimizer_kwargs=minimizer_kwargs,
+                           niter=self.niter, disp=self.disp, seed=1234,
+                           archive_tol=0.1)
+        assert_almost_equal(res.x, self.sol[i], self.tol)
+
 
 class Test_Storage(TestCase):
     def setUp(self):
@@ -339,6 +413,31 @@ class Test_Storage(TestCase):
         assert_(ret)
 
 
+class Test_MinimaArchive(TestCase):
+    def test_add(self):
+        archive = MinimaArchive(0.1)
+        assert_(archive.add(np.array([0., 0.]), 1.))
+        assert_(archive.add(np.array([1., 0.]), 0.))
+        # a nearby minimum with a lower value replaces the known one
+        assert_(not archive.add(np.array([0., 0.05]), -1.))
+        assert_(not archive.add(np.array([1.05, 0.]), 2.))
+        assert_equal(len(archive), 2)
+        x, fun = archive.sorted()
+        assert_equal(x, [[0., 0.05], [1., 0.]])
+        assert_equal(fun, [-1., 0.])
+
+    def test_find_many(self):
+        # minima are found both in the KD-tree and in the unindexed tail
+        archive = MinimaArchive(1e-6)
+        for k in range(100):
+            assert_(archive.add(np.array([k, -k], dtype=float), -k))
+        assert_equal(len(archive), 100)
+        for k in range(100):
+            assert_equal(archive.find(np.array([k, -k + 1e-7])), k)
+        assert_(archive.find(np.array([0.5, 0.5])) is None)
+        assert_equal(archive.sorted()[1], -np.arange(100)[::-1])
+
+
 class Test_RandomDisplacement(TestCase):
     def setUp(self):
         self.stepsize = 1.0
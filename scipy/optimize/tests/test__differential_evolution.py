@@ -4,6 +4,9 @@ Unit tests for the differential global minimization algorithm.
 from scipy.optimize import _differentialevolution
 from scipy.optimize._differentialevolution import DifferentialEvolutionSolver
 from scipy.optimize import differential_evolution
+import warnings
+from multiprocessing import Pool
+
 import numpy as np
 from scipy.optimize import rosen
 from numpy.testing import (assert_equal, TestCase, assert_allclose,
@@ -426,6 +429,102 @@ class TestDifferentialEvolutionSolver(TestCase):
         assert_equal(solver._nfev, 0)
         assert_(np.all(np.isinf(solver.population_energies)))
 
+    def test_deferred_updating(self):
+        # check setting of deferred updating, with default workers
+        bounds = [(0., 2.), (0., 2.), (0, 2), (0, 2)]
+        solver = DifferentialEvolutionSolver(rosen, bounds,
+                                             updating='deferred', seed=1)
+        assert_equal(solver._updating, 'deferred')
+        result = solver.solve()
+        assert_almost_equal(result.fun, 0, decimal=6)
+
+        assert_raises(ValueError, DifferentialEvolutionSolver, rosen, bounds,
+                      updating='rubbish')
+
+        # maxfun is honoured in the same way as for immediate updating
+        solver = DifferentialEvolutionSolver(rosen, self.bounds, popsize=5,
+                                             polish=False, maxfun=40,
+                                             updating='deferred')
+        result = solver.solve()
+        assert_equal(result.nfev, 41)
+        assert_equal(result.success, False)
+
+    def test_parallel(self):
+        # smoke test for parallelisation with deferred updating
+        bounds = [(0., 2.), (0., 2.)]
+        kwds = dict(polish=False, seed=1, tol=0.01, maxiter=20)
+
+        serial = differential_evolution(rosen, bounds, updating='deferred',
+                                        **kwds)
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", UserWarning)
+            res = differential_evolution(rosen, bounds, workers=2, **kwds)
+        assert_equal(res.x, serial.x)
+        assert_equal(res.nfev, serial.nfev)
+
+        p = Pool(2)
+        try:
+            with DifferentialEvolutionSolver(rosen, bounds, workers=p.map,
+                                             updating='deferred',
+                                             **kwds) as solver:
+                res = solver.solve()
+        finally:
+            p.close()
+            p.join()
+        assert_equal(res.x, serial.x)
+
+        # setting workers overrides immediate updating, with a warning
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter("always")
+            solver = DifferentialEvolutionSolver(rosen, bounds, workers=map)
+        assert_equal(solver._updating, 'deferred')
+        assert_(any(issubclass(x.category, UserWarning) for x in w))
+
+    def test_bad_map(self):
+        # a map-like callable that doesn't return one value per member
+        def bad_map(func, iterable):
+            return [0.]
+
+        solver = DifferentialEvolutionSolver(rosen, self.bounds,
+                                             updating='deferred',
+                                             workers=bad_map)
+        assert_raises(RuntimeError, solver.solve)
+
+    def test_vectorized(self):
+        def quadratic_vec(x):
+            # x has shape (N, S)
+            assert_equal(np.ndim(x), 2)
+            return x[0]**2 + x[1]**2
+
+        bounds = [(-3, 3), (-3, 3)]
+        kwds = dict(seed=1, polish=False, tol=0.01)
+        serial = differential_evolution(lambda x: x[0]**2 + x[1]**2, bounds,
+                                        updating='deferred', **kwds)
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", UserWarning)
+            res = differential_evolution(quadratic_vec, bounds,
+                                         vectorized=True, **kwds)
+        assert_allclose(res.x, serial.x)
+        assert_equal(res.nfev, serial.nfev)
+
+        res = differential_evolution(quadratic_vec, bounds, vectorized=True,
+                                     updating='deferred', seed=1)
+        assert_allclose(res.x, [0, 0], atol=1e-8)
+
+        # the objective must return one energy per solution vector
+        solver = DifferentialEvolutionSolver(lambda x: x.sum(), bounds,
+                                             vectorized=True,
+                                             updating='deferred')
+        assert_raises(RuntimeError, solver.solve)
+
+        # workers takes precedence over vectorized
+        with warnings.catch_warnings(record=True):
+            warnings.simplefilter("always")
+            solver = DifferentialEvolutionSolver(rosen, bounds, workers=map,
+                                                 vectorized=True)
+        assert_(not solver.vectorized)
 
 if __name__ == '__main__':
     run_module_suite()
@@ -8,6 +8,7 @@ from numpy.testing import (assert_raises, assert_allclose, assert_equal,
                            assert_, run_module_suite)
 from scipy.sparse import csr_matrix, csc_matrix, lil_matrix
 
+from scipy.optimize import _numdiff
 from scipy.optimize._numdiff import (
     _adjust_scheme_to_bounds, approx_derivative, check_derivative,
     group_columns)
@@ -379,6 +380,54 @@ class TestApproxDerivativesDense(object):
                                     self.jac_zero_jacobian, x0)
         assert_(accuracy == 0)
 
+    def test_workers_vectorized(self):
+        x0 = np.array([-1.0, 2.0])
+        old_block_size = _numdiff._BLOCK_SIZE
+        try:
+            for method, lb, block_size in product(
+                    ['2-point', '3-point', 'cs'], [-np.inf, [-1.0, 1.0]],
+                    [old_block_size, 2]):
+                _numdiff._BLOCK_SIZE = block_size
+                for fun in [self.fun_vector_vector, self.fun_vector_scalar]:
+                    J = approx_derivative(fun, x0, method=method,
+                                          bounds=(lb, np.inf))
+                    J_map = approx_derivative(fun, x0, method=method,
+                                              bounds=(lb, np.inf),
+                                              workers=map)
+                    J_vec = approx_derivative(fun, x0, method=method,
+                                              bounds=(lb, np.inf),
+                                              vectorized=True)
+                    assert_equal(J_map, J)
+                    assert_equal(J_vec, J)
+        finally:
+            _numdiff._BLOCK_SIZE = old_block_size
+
+        # blocks are also limited by the size of the function values
+        batches = []
+
+        def recording_map(func, iterable):
+            points = list(iterable)
+            batches.append(len(points))
+            return map(func, points)
+
+        old_block_size = _numdiff._BLOCK_SIZE
+        try:
+            _numdiff._BLOCK_SIZE = 100
+            J = approx_derivative(lambda x: np.outer(np.arange(50), x).sum(1),
+                                  np.ones(4), method='2-point',
+                                  workers=recording_map)
+        finally:
+            _numdiff._BLOCK_SIZE = old_block_size
+        assert_equal(batches, [2, 2])
+        assert_allclose(J, np.outer(np.arange(50), np.ones(4)))
+
+        J = approx_derivative(np.sinh, x0, workers=2)
+        assert_allclose(J, np.diag(np.cosh(x0)), rtol=1e-9)
+
+        # a vectorized function must return one column per point
+        assert_raises(RuntimeError, approx_derivative, np.sum, x0,
+                      vectorized=True)
+
 
 class TestApproxDerivativeSparse(object):
     # Example from Numerical Optimization 2nd edition, p. 198.
@@ -457,6 +506,36 @@ class TestApproxDerivativeSparse(object):
                 self.fun, self.x0, sparsity=(structure, groups), method=method)
             assert_equal(J_dense, J_sparse.toarray())
 
+    def test_workers_vectorized(self):
+        def fun_vectorized(x):
+            e = x[1:]**3 - x[:-1]**2
+            z = np.zeros_like(x[:1])
+            return (np.concatenate((z, 3 * e)) +
+                    np.concatenate((2 * e, z)))
+
+        A = self.structure(self.n)
+        groups = group_columns(A)
+        old_block_size = _numdiff._BLOCK_SIZE
+        try:
+            for method, block_size in product(['2-point', '3-point', 'cs'],
+                                              [old_block_size, 120]):
+                _numdiff._BLOCK_SIZE = block_size
+                J = approx_derivative(self.fun, self.x0, method=method,
+                                      bounds=(self.lb, self.ub),
+                                      sparsity=(A, groups))
+                J_map = approx_derivative(self.fun, self.x0, method=method,
+                                          bounds=(self.lb, self.ub),
+                                          sparsity=(A, groups), workers=map)
+                J_vec = approx_derivative(fun_vectorized, self.x0,
+                                          method=method,
+                                          bounds=(self.lb, self.ub),
+                                          sparsity=(A, groups),
+                                          vectorized=True)
+                assert_equal(J_map.toarray(), J.toarray())
+                assert_equal(J_vec.toarray(), J.toarray())
+        finally:
+            _numdiff._BLOCK_SIZE = old_block_size
+
     def test_check_derivative(self):
         def jac(x):
             return csr_matrix(self.jac(x))
@@ -3,10 +3,11 @@ Unit tests for optimization routines from _root.py.
 """
 from __future__ import division, print_function, absolute_import
 
-from numpy.testing import assert_
+from numpy.testing import assert_, assert_allclose, assert_equal
 import numpy as np
 
 from scipy.optimize import root
+from scipy.sparse import diags
 
 
 class TestRoot(object):
@@ -21,12 +22,12 @@ class TestRoot(object):
             return np.array([[3*x**2, 0], [0, 3*y**2]])
 
         for method in ['hybr', 'lm', 'broyden1', 'broyden2', 'anderson',
-                       'diagbroyden', 'krylov']:
+                       'diagbroyden', 'krylov', 'newton-sparse']:
             if method in ('linearmixing', 'excitingmixing'):
                 # doesn't converge
                 continue
 
-            if method in ('hybr', 'lm'):
+            if method in ('hybr', 'lm', 'newton-sparse'):
                 jac = dfunc
             else:
                 jac = None
@@ -45,3 +46,65 @@ class TestRoot(object):
             x, y = z
             return np.array([x**3 - 1, y**3 - f])
         root(func, [1.1, 1.1], args=1.5)
+
+
+class TestNewtonSparse(object):
+    # Bratu problem u'' + exp(u) = 0, u(0) = u(1) = 0, discretised with
+    # central differences
+    n = 2000
+
+    def fun(self, u):
+        h = 1. / (self.n + 1)
+        d2u = -2 * u
+        d2u[1:] += u[:-1]
+        d2u[:-1] += u[1:]
+        return d2u / h**2 + np.exp(u)
+
+    def jac(self, u):
+        h = 1. / (self.n + 1)
+        return diags([np.ones(self.n - 1) / h**2,
+                      -2 / h**2 + np.exp(u),
+                      np.ones(self.n - 1) / h**2], [-1, 0, 1])
+
+    def sparsity(self):
+        return diags([1, 1, 1], [-1, 0, 1], shape=(self.n, self.n))
+
+    def test_sparsity(self):
+        sol = root(self.fun, np.zeros(self.n), method='newton-sparse',
+                   options={'jac_sparsity': self.sparsity()})
+        assert_(sol.success, sol.message)
+        assert_(np.abs(self.fun(sol.x)).max() <= 6e-6)
+        # three groups of columns are evaluated per Jacobian
+        assert_(sol.nfev <= sol.nit + 1 + 3 * sol.njev + 10)
+
+        dense = root(self.fun, np.zeros(self.n), method='newton-sparse',
+                     options={'jac_sparsity': self.sparsity().toarray()})
+        assert_allclose(dense.x, sol.x)
+
+    def test_jac(self):
+        sol1 = root(self.fun, np.zeros(self.n), jac=self.jac,
+                    method='newton-sparse')
+        sol2 = root(lambda u: (self.fun(u), self.jac(u)), np.zeros(self.n),
+                    jac=True, method='newton-sparse')
+        assert_(sol1.success, sol1.message)
+        assert_allclose(sol1.x, sol2.x)
+        assert_equal(sol1.njev, sol2.njev)
+
+    def test_reuse(self):
+        sol1 = root(self.fun, np.zeros(self.n), jac=self.jac,
+                    method='newton-sparse', options={'reuse_rate': 0})
+        sol2 = root(self.fun, np.zeros(self.n), jac=self.jac,
+                    method='newton-sparse', options={'reuse_rate': 0.9})
+        assert_(sol1.success and sol2.success)
+        assert_equal(sol1.njev, sol1.nit)
+        assert_(sol2.njev < sol2.nit)
+        assert_allclose(sol1.x, sol2.x, atol=1e-6)
+
+    def test_singular(self):
+        def fun(x):
+            return np.array([x[0]**2, x[0] - x[0]])
+
+        sol = root(fun, [1., 1.], method='newton-sparse',
+                   options={'jac_sparsity': np.ones((2, 2))})
+        assert_(not sol.success)
+        assert_equal(sol.status, 4)
@@ -1,11 +1,14 @@
 # Author: Brian M. Clapper, G. Varoquaux, Lars Buitinck
 # License: BSD
 
-from numpy.testing import assert_array_equal, assert_raises
+import itertools
+
+from numpy.testing import assert_array_equal, assert_raises, assert_allclose
 
 import numpy as np
 
 from scipy.optimize import linear_sum_assignment
+from scipy.sparse import csr_matrix
 
 
 def test_linear_sum_assignment():
@@ -71,3 +74,78 @@ def test_linear_sum_assignment_input_validation():
     I = np.identity(3)
     I[1][1] = np.inf
     assert_raises(ValueError, linear_sum_assignment, I)
+
+
+def _brute_force_cost(cost_matrix):
+    # Cost of the best assignment found by trying all of them; forbidden
+    # pairs have infinite cost.
+    if cost_matrix.shape[0] > cost_matrix.shape[1]:
+        cost_matrix = cost_matrix.T
+    n, m = cost_matrix.shape
+    rows = np.arange(n)
+    return min(cost_matrix[rows, list(cols)].sum()
+               for cols in itertools.permutations(range(m), n))
+
+
+def test_linear_sum_assignment_small_random():
+    rng = np.random.RandomState(1234)
+    for n, m in itertools.product(range(1, 6), repeat=2):
+        cost_matrix = rng.randint(-5, 10, (n, m))
+        row_ind, col_ind = linear_sum_assignment(cost_matrix)
+        assert_array_equal(row_ind, np.unique(row_ind))
+        assert_array_equal(np.sort(col_ind), np.unique(col_ind))
+        assert_array_equal(len(row_ind), min(n, m))
+        assert_array_equal(cost_matrix[row_ind, col_ind].sum(),
+                           _brute_force_cost(cost_matrix))
+
+
+def test_linear_sum_assignment_large():
+    rng = np.random.RandomState(1234)
+    # a permutation matrix with the lowest costs hidden in noise
+    perm = rng.permutation(500)
+    cost_matrix = rng.uniform(1, 2, (500, 700))
+    cost_matrix[np.arange(500), perm] = 0
+    row_ind, col_ind = linear_sum_assignment(cost_matrix)
+    assert_array_equal(row_ind, np.arange(500))
+    assert_array_equal(col_ind, perm)
+
+    row_ind, col_ind = linear_sum_assignment(cost_matrix.T)
+    assert_array_equal(row_ind, np.sort(perm))
+    assert_array_equal(perm[col_ind], row_ind)
+
+
+def test_linear_sum_assignment_sparse():
+    rng = np.random.RandomState(1234)
+    for n, m in itertools.product(range(1, 6), repeat=2):
+        cost_matrix = rng.randint(-5, 10, (n, m)).astype(float)
+        allowed = rng.rand(n, m) < 0.6
+        sparse = csr_matrix((cost_matrix[allowed], np.nonzero(allowed)),
+                            shape=(n, m))
+        dense = np.where(allowed, cost_matrix, np.inf)
+        expected = _brute_force_cost(dense)
+        if np.isinf(expected):
+            assert_raises(ValueError, linear_sum_assignment, sparse)
+            continue
+
+        row_ind, col_ind = linear_sum_assignment(sparse)
+        assert_array_equal(row_ind, np.unique(row_ind))
+        assert_array_equal(len(row_ind), min(n, m))
+        assert_allclose(dense[row_ind, col_ind].sum(), expected)
+
+
+def test_linear_sum_assignment_sparse_stored_zeros():
+    # stored zeros are allowed pairs, other zeros are not
+    cost_matrix = csr_matrix(([0., 0., 5., 1.], ([0, 1, 1, 2], [1, 1, 0, 2])),
+                             shape=(3, 3))
+    row_ind, col_ind = linear_sum_assignment(cost_matrix)
+    assert_array_equal(col_ind, [1, 0, 2])
+
+    cost_matrix = csr_matrix([[0, 1], [0, 2]])
+    assert_raises(ValueError, linear_sum_assignment, cost_matrix)
+
+    cost_matrix = csr_matrix(([np.nan], ([0], [0])), shape=(1, 1))
+    assert_raises(ValueError, linear_sum_assignment, cost_matrix)
+
+    row_ind, col_ind = linear_sum_assignment(csr_matrix((0, 3)))
+    assert_array_equal(row_ind, [])
+    assert_array_equal(col_ind, [])
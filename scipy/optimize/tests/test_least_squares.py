@@ -521,6 +521,25 @@ class SparseMixin(object):
                 assert_allclose(res_2.optimality, 0, atol=1e-10)
                 assert_allclose(res_3.optimality, 0, atol=1e-10)
 
+    def test_jac_reuse(self):
+        p = BroydenTridiagonal()
+        for jac_sparsity in [None, p.sparsity]:
+            res = least_squares(p.fun, p.x0, method=self.method,
+                                jac_sparsity=jac_sparsity)
+            res_reuse = least_squares(p.fun, p.x0, method=self.method,
+                                      jac_sparsity=jac_sparsity,
+                                      jac_reuse=3)
+            # Broyden updates converge superlinearly, not quadratically
+            assert_allclose(res_reuse.cost, 0, atol=1e-15)
+            assert_allclose(res_reuse.x, res.x, atol=1e-7)
+            assert_(res_reuse.njev < res.njev)
+            if jac_sparsity is not None:
+                assert_(issparse(res_reuse.jac))
+        assert_raises(ValueError, least_squares, p.fun, p.x0,
+                      method=self.method, jac_reuse=-1)
+        assert_raises(ValueError, least_squares, p.fun, p.x0,
+                      method=self.method, jac_reuse=1.5)
+
     def test_wrong_jac_sparsity(self):
         p = BroydenTridiagonal()
         sparsity = p.sparsity[:-1]
@@ -736,5 +755,22 @@ def test_basic():
     assert_allclose(res.x, 0, atol=1e-10)
 
 
+def test_finite_difference_workers():
+    # parallel and vectorized evaluation of the finite differences give
+    # the same iterates
+    x0 = [-2.0, 1.0]
+    for method, jac in product(['trf', 'dogbox'], ['2-point', '3-point']):
+        res = least_squares(fun_rosenbrock, x0, jac=jac, method=method)
+        res_map = least_squares(fun_rosenbrock, x0, jac=jac, method=method,
+                                workers=map)
+        res_vec = least_squares(fun_rosenbrock, x0, jac=jac, method=method,
+                                vectorized=True)
+        assert_allclose(res_map.x, res.x, rtol=1e-15)
+        assert_allclose(res_vec.x, res.x, rtol=1e-15)
+        assert_equal(res_vec.nfev, res.nfev)
+
+    res = least_squares(fun_rosenbrock, x0, workers=2)
+    assert_allclose(res.x, [1, 1])
+
 if __name__ == "__main__":
     run_module_suite()
@@ -1,5 +1,5 @@
 """
-Unit test for Linear Programming via Simplex Algorithm.
+Unit test for Linear Programming
 """
 from __future__ import division, print_function, absolute_import
 
@@ -7,6 +7,7 @@ import numpy as np
 from numpy.testing import (assert_, assert_array_almost_equal, assert_allclose,
         assert_almost_equal, assert_raises, assert_equal, run_module_suite)
 
+import scipy.sparse as sps
 from scipy.optimize import linprog, OptimizeWarning
 from scipy._lib._numpy_compat import _assert_warns
 
@@ -450,5 +451,195 @@ def test_basic_artificial_vars():
     _assert_success(res, desired_fun=0, desired_x=np.zeros_like(c))
 
 
+def _lp_examples():
+    # (c, A_ub, b_ub, A_eq, b_eq, bounds) of the problems above that have
+    # a solution
+    A, b, c = lpgen_2d(20, 20)
+    n, p = -1, 1
+    return [
+        ([-3, -2], [[2, 1], [1, 1], [1, 0]], [10, 8, 4], None, None, None),
+        ([-1, 8, 4, -6], [[-7, -7, 6, 9], [1, -1, -3, 0], [10, -10, -7, 7],
+                          [6, -1, 3, 4]], [-3, 6, -6, 6],
+         [[-10, 1, 1, -8]], [-4], None),
+        ([1, -4], [[-3, 1], [1, 2]], [6, 4], None, None,
+         ((None, None), (-3, None))),
+        (c, A, b, None, None, None),
+        ([2, 2, 1, 3, 1], None, None,
+         [[n, n, 0, 0, 0], [p, 0, n, n, 0], [0, p, p, 0, n], [0, 0, 0, p, p]],
+         [-4, 0, 0, 4], [(0, 4), (0, 2), (0, 2), (0, 3), (0, 5)]),
+        ([4, 8, 3, 0, 0, 0], None, None,
+         [[2, 5, 3, -1, 0, 0], [3, 2.5, 8, 0, -1, 0], [8, 10, 4, 0, 0, -1]],
+         [185, 155, 600], None),
+        ([2.8, 6.3, 10.8, -2.8, -6.3, -10.8], None, None,
+         [[-1, -1, -1, 0, 0, 0], [0, 0, 0, 1, 1, 1], [1, 0, 0, 1, 0, 0],
+          [0, 1, 0, 0, 1, 0], [0, 0, 1, 0, 0, 1]],
+         [-0.5, 0.4, 0.3, 0.3, 0.3], None),
+        ([-0.1, -0.07, 0.004, 0.004, 0.004, 0.004],
+         [[1.0, 0, 0, 0, 0, 0], [-1.0, 0, 0, 0, 0, 0], [0, -1.0, 0, 0, 0, 0],
+          [0, 1.0, 0, 0, 0, 0], [1.0, 1.0, 0, 0, 0, 0]], [3, 3, 3, 3, 20],
+         [[1.0, 0, -1, 1, -1, 1], [0, -1.0, -1, 1, -1, 1]], [0, 0], None),
+    ]
+
+
+def test_methods_match_simplex():
+    for c, A_ub, b_ub, A_eq, b_eq, bounds in _lp_examples():
+        ref = linprog(c, A_ub, b_ub, A_eq, b_eq, bounds=bounds)
+        _assert_success(ref)
+        for method in ('revised simplex', 'interior-point'):
+            for sparse in (False, True):
+                for presolve in (False, True):
+                    options = dict(sparse=sparse, presolve=presolve)
+                    res = linprog(c, A_ub, b_ub, A_eq, b_eq, bounds=bounds,
+                                  method=method, options=options)
+                    _assert_success(res)
+                    assert_allclose(res.fun, ref.fun, rtol=1e-6, atol=1e-6)
+                    assert_allclose(res.slack, b_ub - np.dot(A_ub, res.x)
+                                    if A_ub is not None else [], atol=1e-9)
+                    if A_eq is not None:
+                        assert_allclose(np.dot(A_eq, res.x), b_eq,
+                                        atol=1e-6)
+
+
+def test_methods_infeasible_unbounded():
+    m = 50
+    tmp = 2*np.pi*np.arange(m)/(m+1)
+    A_cyc = np.vstack((np.cos(tmp)-1, np.sin(tmp)))
+    for method in ('revised simplex', 'interior-point'):
+        for presolve in (False, True):
+            options = dict(presolve=presolve)
+            res = linprog([-1, -1], A_ub=[[1, 0], [0, 1], [-1, -1]],
+                          b_ub=[2, 2, -5], method=method, options=options)
+            _assert_infeasible(res)
+            res = linprog(-np.ones(m), A_eq=A_cyc, b_eq=[1, 1],
+                          method=method, options=options)
+            _assert_infeasible(res)
+            res = linprog([-1, -1], A_ub=[[-1, 1], [-1, -1]], b_ub=[-1, -2],
+                          method=method, options=options)
+            _assert_unbounded(res)
+            res = linprog(-np.ones(m), A_eq=A_cyc, b_eq=[0, 0],
+                          method=method, options=options)
+            _assert_unbounded(res)
+            assert_(np.all(np.isnan(res.x)))
+
+
+def test_revised_simplex_bland():
+    c = np.array([-10, 57, 9, 24.])
+    A_ub = np.array([[0.5, -5.5, -2.5, 9],
+                     [0.5, -1.5, -0.5, 1],
+                     [1, 0, 0, 0]])
+    b_ub = [0, 0, 1]
+    for sparse in (False, True):
+        res = linprog(c, A_ub=A_ub, b_ub=b_ub, method='revised simplex',
+                      options=dict(maxiter=100, bland=True, sparse=sparse))
+        _assert_success(res, desired_x=[1, 0, 1, 0])
+
+
+def test_sparse_constraints():
+    # a random sparse problem with a known feasible point, given as sparse
+    # matrices
+    np.random.seed(1234)
+    n = 300
+    A_ub = sps.rand(150, n, density=0.03, format='csr')
+    A_eq = sps.rand(50, n, density=0.03, format='csc')
+    x0 = np.random.rand(n)
+    b_ub = A_ub.dot(x0) + np.random.rand(150)
+    b_eq = A_eq.dot(x0)
+    c = np.random.rand(n) - 0.2
+    bounds = (0, 2)
+
+    ref = linprog(c, A_ub.toarray(), b_ub, A_eq.toarray(), b_eq,
+                  bounds=bounds, method='revised simplex')
+    _assert_success(ref)
+    for method, options in [('revised simplex', {}),
+                            ('revised simplex', dict(refactor=1)),
+                            ('interior-point', {}),
+                            ('interior-point', dict(linear_solver='cg'))]:
+        res = linprog(c, A_ub, b_ub, A_eq, b_eq, bounds=bounds,
+                      method=method, options=options)
+        _assert_success(res, desired_fun=ref.fun)
+        assert_(np.all(res.x >= -1e-7) and np.all(res.x <= 2 + 1e-7))
+        assert_allclose(A_eq.dot(res.x), b_eq, atol=1e-6)
+        assert_(np.all(res.slack >= -1e-6))
+
+    assert_raises(ValueError, linprog, c, A_ub, b_ub, A_eq, b_eq,
+                  method='interior-point',
+                  options=dict(linear_solver='spam'))
+
+
+def test_presolve():
+    # x0 is fixed by its bounds, x1 by an equality, x2 is bounded by a
+    # singleton inequality, x4 appears in no constraint and the third
+    # inequality is empty.
+    c = [1, 1, -1, 0, 2]
+    A_ub = [[1, 0, 1, 1, 0], [0, 0, 2, 0, 0], [0, 0, 0, 0, 0]]
+    b_ub = [4, 3, 1]
+    A_eq = [[0, 2, 0, 0, 0], [1, 1, 1, -1, 0]]
+    b_eq = [1, 2]
+    bounds = [(1, 1), (None, None), (0, None), (0, None), (-1, 3)]
+    for method in ('revised simplex', 'interior-point'):
+        res = [linprog(c, A_ub, b_ub, A_eq, b_eq, bounds=bounds,
+                       method=method, options=dict(presolve=presolve))
+               for presolve in (False, True)]
+        for r in res:
+            _assert_success(r, desired_fun=-2,
+                            desired_x=[1, 0.5, 1.5, 1, -1])
+        assert_allclose(res[0].x, res[1].x, atol=1e-7)
+        assert_allclose(res[1].slack, [0.5, 0, 1], atol=1e-7)
+
+        # infeasibility found by presolve, without iterating
+        res = linprog(c, A_ub, b_ub, A_eq, [1, 2, 0][:2], bounds=[(1, 1),
+                      (1, 2), (0, None), (0, None), (-1, 3)],
+                      method=method)
+        _assert_infeasible(res)
+        assert_equal(res.nit, 0)
+        res = linprog(c, [[0, 0, 0, 0, 0]], [-1], method=method)
+        _assert_infeasible(res)
+        assert_equal(res.nit, 0)
+
+
+def test_methods_callback():
+    c = np.array([-3, -2])
+    A_ub = [[2, 1], [1, 1], [1, 0]]
+    b_ub = [10, 8, 4]
+    for method, keys in [('revised simplex',
+                          {'nit', 'phase', 'basis', 'complete'}),
+                         ('interior-point', {'nit', 'complete'})]:
+        last_xk = []
+
+        def cb(xk, **kwargs):
+            assert_equal(set(kwargs), keys)
+            assert_equal(xk.shape, (2,))
+            assert_(isinstance(kwargs['nit'], int))
+            if kwargs['complete']:
+                last_xk.append(xk)
+            else:
+                assert_(not last_xk)
+
+        res = linprog(c, A_ub=A_ub, b_ub=b_ub, method=method, callback=cb)
+        assert_equal(len(last_xk), 1)
+        assert_allclose(last_xk[0], res.x)
+        _assert_success(res, desired_fun=-18, desired_x=[2, 6])
+
+
+def test_methods_invalid_inputs():
+    for method in ('revised simplex', 'interior-point'):
+        for bad_bound in [[(5, 0), (1, 2), (3, 4)],
+                          [(1, 2), (3, 4)],
+                          [(1, 2), (3, 4), (3, 4, 5)],
+                          [(1, 2), (np.inf, np.inf), (3, 4)],
+                          [(1, 2), (-np.inf, -np.inf), (3, 4)],
+                          ]:
+            assert_raises(ValueError, linprog, [1, 2, 3], bounds=bad_bound,
+                          method=method)
+        assert_raises(ValueError, linprog, [1, 2], A_ub=[[1, 2]],
+                      b_ub=[1, 2], method=method)
+        assert_raises(ValueError, linprog, [1, 2], A_eq=sps.eye(2, 3),
+                      b_eq=[1, 2], method=method)
+        assert_raises(ValueError, linprog, [1, 2], A_ub=np.zeros((1, 1, 3)),
+                      b_ub=1, method=method)
+        _assert_warns(OptimizeWarning, linprog, [1, 2], method=method,
+                      options=dict(spam='42'))
+
+
 if __name__ == '__main__':
     run_module_suite()
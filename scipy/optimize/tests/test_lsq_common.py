@@ -1,11 +1,13 @@
 from numpy.testing import (run_module_suite, assert_, assert_allclose,
                            assert_raises, assert_equal)
 import numpy as np
+from scipy.sparse import csr_matrix
 
 from scipy.optimize._lsq.common import (
     step_size_to_bound, find_active_constraints, make_strictly_feasible,
     CL_scaling_vector, intersect_trust_region, build_quadratic_1d,
-    minimize_quadratic_1d, evaluate_quadratic, reflective_transformation)
+    minimize_quadratic_1d, evaluate_quadratic, reflective_transformation,
+    update_jac, lsmr_warm_start)
 
 
 class TestBounds(object):
@@ -247,5 +249,34 @@ def test_reflective_transformation():
     assert_equal(g, [-1, 1])
 
 
+def test_update_jac():
+    np.random.seed(0)
+    J = np.random.randn(4, 3)
+    s = np.random.randn(3)
+    y = np.random.randn(4)
+
+    # the secant condition holds after the update
+    J_dense = update_jac(J.copy(), s, y)
+    assert_allclose(J_dense.dot(s), y)
+
+    J[[0, 1, 3], [2, 0, 1]] = 0
+    J[2] = 0
+    J_sparse = update_jac(csr_matrix(J), s, y)
+    assert_equal(J_sparse.nnz, 6)
+    assert_equal(J_sparse.toarray()[J == 0], 0)
+    assert_allclose(J_sparse.dot(s)[[0, 1, 3]], y[[0, 1, 3]])
+    assert_equal(J_sparse.dot(s)[2], 0)
+
+    assert_equal(update_jac(J.copy(), np.zeros(3), y), J)
+
+
+def test_lsmr_warm_start():
+    A = np.array([[1.0, 2.0], [0.0, 1.0], [1.0, 0.0]])
+    b = np.array([1.0, 2.0, 3.0])
+    x = lsmr_warm_start(A, b, np.array([1.0, 1.0]))
+    assert_allclose(x, [8. / 11, 8. / 11])
+    assert_(lsmr_warm_start(np.zeros((3, 2)), b, x) is None)
+
+
 if __name__ == '__main__':
     run_module_suite()
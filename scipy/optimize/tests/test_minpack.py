@@ -7,13 +7,14 @@ import warnings
 
 from numpy.testing import (assert_, assert_almost_equal, assert_array_equal,
         assert_array_almost_equal, TestCase, run_module_suite, assert_raises,
-        assert_allclose)
+        assert_allclose, assert_equal)
 import numpy as np
 from numpy import array, float64, matrix
 
 from scipy import optimize
 from scipy.special import lambertw
-from scipy.optimize.minpack import leastsq, curve_fit, fixed_point
+from scipy.optimize.minpack import (leastsq, curve_fit, curve_fit_batch,
+                                   fixed_point)
 from scipy._lib._numpy_compat import _assert_warns
 from scipy.optimize import OptimizeWarning
 
@@ -589,6 +590,124 @@ class TestCurveFit(TestCase):
                 assert_allclose(pcov1, pcov2, atol=1e-14)
 
 
+class TestCurveFitBatch(TestCase):
+    def setUp(self):
+        np.random.seed(1234)
+        self.xdata = np.linspace(0, 4, 30)
+        self.params = np.column_stack([np.random.uniform(1, 3, 20),
+                                       np.random.uniform(0.5, 2, 20),
+                                       np.random.uniform(-1, 1, 20)])
+        self.ydata = (self.func(self.xdata, *self.params.T[:, :, None]) +
+                      0.05 * np.random.normal(size=(20, 30)))
+        self.sigma = np.random.uniform(0.5, 2, (20, 30))
+
+    @staticmethod
+    def func(x, a, b, c):
+        return a * np.exp(-b * x) + c
+
+    @staticmethod
+    def jac(x, a, b, c):
+        e = np.exp(-b * x)
+        db = -a * x * e
+        J = np.empty(np.broadcast(e, db).shape + (3,))
+        J[..., 0] = e
+        J[..., 1] = db
+        J[..., 2] = 1
+        return J
+
+    def test_matches_curve_fit(self):
+        for jac in [None, self.jac]:
+            for absolute_sigma in [False, True]:
+                popt, pcov, status = curve_fit_batch(
+                    self.func, self.xdata, self.ydata, [1, 1, 0],
+                    sigma=self.sigma, absolute_sigma=absolute_sigma, jac=jac)
+                assert_equal(popt.shape, (20, 3))
+                assert_equal(pcov.shape, (20, 3, 3))
+                assert_(np.all(status > 0))
+                for i in range(20):
+                    popt1, pcov1 = curve_fit(
+                        self.func, self.xdata, self.ydata[i], p0=[1, 1, 0],
+                        sigma=self.sigma[i], absolute_sigma=absolute_sigma)
+                    assert_allclose(popt[i], popt1, rtol=1e-5, atol=1e-6)
+                    assert_allclose(pcov[i], pcov1, rtol=1e-3, atol=1e-10)
+
+    def test_pcov(self):
+        xdata = np.array([0, 1, 2, 3, 4, 5])
+        ydata = np.array([[1, 1, 5, 7, 8, 12]] * 2)
+        sigma = np.array([[1, 2, 1, 2, 1, 2], [3, 6, 3, 6, 3, 6]])
+
+        def f(x, a, b):
+            return a*x + b
+
+        popt, pcov, status = curve_fit_batch(f, xdata, ydata, [2, 0],
+                                             sigma=sigma)
+        perr = np.sqrt(np.diagonal(pcov, axis1=1, axis2=2))
+        assert_allclose(perr, [[0.20659803, 0.57204404]] * 2, rtol=1e-3)
+
+        popt, pcov, status = curve_fit_batch(f, xdata, ydata, [2, 0],
+                                             sigma=sigma, absolute_sigma=True)
+        perr = np.sqrt(np.diagonal(pcov, axis1=1, axis2=2))
+        assert_allclose(perr, [[0.30714756, 0.85045308],
+                               [3*0.30714756, 3*0.85045308]], rtol=1e-3)
+
+        # infinite variances without enough data points
+        popt, pcov, status = curve_fit_batch(f, xdata[:2], ydata[:, :2],
+                                             [2, 0])
+        assert_array_equal(pcov, np.inf)
+        assert_allclose(popt, [[0, 1]] * 2, atol=1e-6)
+
+    def test_p0_per_problem(self):
+        p0 = self.params + 0.1
+        popt, pcov, status = curve_fit_batch(self.func, self.xdata,
+                                             self.ydata, p0)
+        popt1, pcov1, status1 = curve_fit_batch(self.func, self.xdata,
+                                                self.ydata, [1, 1, 0])
+        assert_allclose(popt, popt1, rtol=1e-5, atol=1e-6)
+
+    def test_status(self):
+        # a fit starting at non-finite values is reported, not raised, and
+        # trial steps to non-finite values are rejected
+        def f(x, a, b):
+            return np.where(a < 0.5, np.nan, a) * x + b
+
+        ydata = np.array([[1., 2., 3.], [0., 0.1, 0.2], [3., 5., 7.]])
+        popt, pcov, status = curve_fit_batch(f, [0, 1, 2], ydata,
+                                             [[1, 0], [0, 0], [1, 0]])
+        assert_equal(status[0] > 0, True)
+        assert_equal(status[1], -1)
+        assert_equal(status[2] > 0, True)
+        assert_allclose(popt[[0, 2]], [[1, 1], [2, 3]])
+        assert_array_equal(pcov[1], np.inf)
+
+        popt, pcov, status = curve_fit_batch(self.func, self.xdata,
+                                             self.ydata, [1, 1, 0],
+                                             max_nfev=2)
+        assert_array_equal(status, 0)
+
+    def test_chunks_and_workers(self):
+        popt, pcov, status = curve_fit_batch(self.func, self.xdata,
+                                             self.ydata, [1, 1, 0])
+        for chunksize, workers in [(3, 1), (7, 2), (1, -1)]:
+            popt1, pcov1, status1 = curve_fit_batch(
+                self.func, self.xdata, self.ydata, [1, 1, 0],
+                chunksize=chunksize, workers=workers)
+            assert_array_equal(popt, popt1)
+            assert_array_equal(pcov, pcov1)
+            assert_array_equal(status, status1)
+
+    def test_input_validation(self):
+        assert_raises(ValueError, curve_fit_batch, self.func, self.xdata,
+                      self.ydata[0], [1, 1, 0])
+        assert_raises(ValueError, curve_fit_batch, self.func, self.xdata,
+                      self.ydata, np.ones((3, 3)))
+        assert_raises(ValueError, curve_fit_batch, self.func, self.xdata,
+                      self.ydata, [1, 1, 0], sigma=np.ones(3))
+        ydata = self.ydata.copy()
+        ydata[3, 3] = np.nan
+        assert_raises(ValueError, curve_fit_batch, self.func, self.xdata,
+                      ydata, [1, 1, 0])
+
+
 class TestFixedPoint(TestCase):
 
     def test_scalar_trivial(self):
@@ -337,9 +337,19 @@ class TestJacobianDotSolve(object):
         self._check_dot(nonlin.BroydenSecond, complex=False)
         self._check_dot(nonlin.BroydenSecond, complex=True)
 
+    def test_broyden_reduced(self):
+        # history is reduced before it fills the vector space
+        for method in ('restart', 'simple', 'svd'):
+            for cls in (nonlin.BroydenFirst, nonlin.BroydenSecond):
+                self._check_dot(cls, complex=False, max_rank=4,
+                                reduction_method=method)
+                self._check_dot(cls, complex=True, max_rank=4,
+                                reduction_method=method)
+
     def test_anderson(self):
         self._check_dot(nonlin.Anderson, complex=False)
         self._check_dot(nonlin.Anderson, complex=True)
+        self._check_dot(nonlin.Anderson, complex=False, M=3)
 
     def test_diagbroyden(self):
         self._check_dot(nonlin.DiagBroyden, complex=False)
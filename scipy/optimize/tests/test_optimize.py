@@ -507,6 +507,35 @@ class TestOptimizeSimple(CheckOptimize):
         assert_allclose(self.func(params), self.func(self.solution),
                         atol=1e-6)
 
+    def test_finite_difference_workers(self):
+        # parallel and vectorized finite differences give the same iterates
+        # as evaluating the perturbed points in turn
+        x0 = np.array([-1.2, 1.0, 0.5])
+        for method in ['BFGS', 'CG', 'L-BFGS-B', 'SLSQP', 'TNC']:
+            res = optimize.minimize(optimize.rosen, x0, method=method)
+            for options in [{'workers': map}, {'vectorized': True}]:
+                res2 = optimize.minimize(optimize.rosen, x0, method=method,
+                                         options=options)
+                assert_allclose(res2.x, res.x, rtol=1e-12)
+                assert_equal(res2.nfev, res.nfev)
+
+        res = optimize.minimize(optimize.rosen, x0, method='BFGS',
+                                options={'workers': 2})
+        assert_allclose(res.x, np.ones(3), rtol=1e-4)
+
+        eps = np.sqrt(np.finfo(float).eps)
+        g = optimize.approx_fprime(x0, optimize.rosen, eps)
+        assert_equal(optimize.approx_fprime(x0, optimize.rosen, eps,
+                                            workers=2), g)
+        assert_equal(optimize.approx_fprime(x0, optimize.rosen, eps,
+                                            vectorized=True), g)
+        assert_equal(optimize.check_grad(optimize.rosen, optimize.rosen_der,
+                                         x0, vectorized=True),
+                     optimize.check_grad(optimize.rosen, optimize.rosen_der,
+                                         x0))
+        assert_raises(ValueError, optimize.approx_fprime, x0,
+                      optimize.rosen, eps, spam=1)
+
     def test_bfgs_gh_2169(self):
         def f(x):
             if x < 0:
@@ -1140,6 +1169,100 @@ class TestOptimizeResultAttributes(TestCase):
                 assert_(attribute in dir(res))
 
 
+class TestMinimizeCacheProfile(TestCase):
+    # Test the evaluation cache and the profiling of minimize
+    def setUp(self):
+        self.x0 = np.array([1.3, 0.7, 0.8, 1.9, 1.2])
+        self.calls = []
+
+    def func(self, x):
+        self.calls.append(np.array(x))
+        return optimize.rosen(x)
+
+    def test_cache_same_result(self):
+        methods = ['Nelder-Mead', 'Powell', 'CG', 'BFGS', 'L-BFGS-B',
+                   'TNC', 'SLSQP', 'COBYLA']
+        for method in methods:
+            self.calls = []
+            res = optimize.minimize(self.func, self.x0, method=method)
+            ncalls = len(self.calls)
+            self.calls = []
+            res_cached = optimize.minimize(self.func, self.x0, method=method,
+                                           cache_size=16)
+            assert_allclose(res_cached.x, res.x, rtol=1e-14)
+            assert_equal(res_cached.nfev, res.nfev)
+            assert_(len(self.calls) <= ncalls)
+
+            # each point is evaluated once
+            points = set(x.tostring() for x in self.calls)
+            assert_equal(len(points), len(self.calls))
+
+    def test_cache_saves_calls(self):
+        # the finite difference gradient of BFGS reevaluates the point
+        res = optimize.minimize(self.func, self.x0, method='BFGS',
+                                cache_size=1, profile=True)
+        assert_equal(len(self.calls), res.profile['cache_misses'])
+        assert_equal(res.nfev, res.profile['cache_misses'] +
+                     res.profile['cache_hits'])
+        assert_(res.profile['cache_hits'] > 0)
+
+    def test_cache_shared_jac(self):
+        def func_grad(x):
+            self.calls.append(np.array(x))
+            return optimize.rosen(x), optimize.rosen_der(x)
+
+        res = optimize.minimize(func_grad, self.x0, jac=True,
+                                method='trust-ncg', hess=optimize.rosen_hess,
+                                cache_size=4, profile=True)
+        assert_(res.success)
+        assert_equal(res.profile['ncalls']['fun'], len(self.calls))
+        assert_(res.profile['ncalls']['hess'] > 0)
+
+        kwargs = dict(jac=optimize.rosen_der, method='newton-cg',
+                      hessp=optimize.rosen_hess_prod)
+        res = optimize.minimize(optimize.rosen, self.x0, **kwargs)
+        res_cached = optimize.minimize(optimize.rosen, self.x0,
+                                       cache_size=4, **kwargs)
+        assert_allclose(res_cached.x, res.x, rtol=1e-14)
+
+    def test_cache_returns_copies(self):
+        def grad(x):
+            return np.ones_like(x)
+
+        cache = optimize.optimize._EvaluationCache(2)
+        cached = optimize.optimize._CachedFunction(grad, 'jac', cache)
+        x = np.zeros(3)
+        g = cached(x)
+        g[0] = 5
+        assert_equal(cached(x), np.ones(3))
+        assert_equal(cache.hits, 1)
+        # least recently used values are evicted
+        cached(x + 1)
+        cached(x + 2)
+        cached(x)
+        assert_equal((cache.hits, cache.misses), (1, 4))
+
+    def test_profile(self):
+        cons = {'type': 'ineq', 'fun': lambda x: x[0],
+                'jac': lambda x: np.eye(5)[0]}
+        res = optimize.minimize(self.func, self.x0, jac=optimize.rosen_der,
+                                method='SLSQP', constraints=cons,
+                                callback=lambda x: None, profile=True)
+        profile = res.profile
+        assert_equal(sorted(profile['ncalls']),
+                     ['callback', 'constr', 'constr_jac', 'fun', 'jac'])
+        assert_equal(profile['ncalls']['fun'], len(self.calls))
+        assert_equal(profile['ncalls']['callback'], res.nit)
+        assert_(profile['ncalls']['constr'] > 0)
+        assert_allclose(profile['user_time'], sum(profile['time'].values()))
+        assert_allclose(profile['user_time'] + profile['solver_time'],
+                        profile['total_time'])
+        assert_('cache_hits' not in profile)
+
+        res = optimize.minimize(self.func, self.x0)
+        assert_('profile' not in res)
+
+
 class TestBrute:
     # Test the "brute force" method
     def setUp(self):
@@ -10,6 +10,8 @@ from __future__ import division, print_function, absolute_import
 import numpy as np
 from scipy.optimize import (minimize, rosen, rosen_der, rosen_hess,
                             rosen_hess_prod)
+from scipy.sparse import csr_matrix, diags
+from scipy.sparse.linalg import aslinearoperator
 from numpy.testing import (TestCase, assert_, assert_equal, assert_allclose,
                            run_module_suite)
 
@@ -81,12 +83,71 @@ class TestTrustRegionSolvers(TestCase):
             assert_allclose(self.x_opt, r_iterative['x'])
             assert_(len(r_dogleg['allvecs']) < len(r_ncg['allvecs']))
 
+    def test_hessian_as_list(self):
+        # a Hessian returned as nested lists is used as a dense matrix
+        for method in ('dogleg', 'trust-ncg'):
+            r = minimize(rosen, self.easy_guess, jac=rosen_der,
+                         hess=lambda x: rosen_hess(x).tolist(), tol=1e-8,
+                         method=method)
+            assert_allclose(self.x_opt, r['x'])
+
     def test_trust_ncg_hessp(self):
         for x0 in (self.easy_guess, self.hard_guess):
             r = minimize(rosen, x0, jac=rosen_der, hessp=rosen_hess_prod,
                          tol=1e-8, method='trust-ncg')
             assert_allclose(self.x_opt, r['x'])
 
+    def test_trust_krylov(self):
+        def hess_sparse(x):
+            return csr_matrix(rosen_hess(x))
+
+        def hess_operator(x):
+            return aslinearoperator(rosen_hess(x))
+
+        for x0 in (self.easy_guess, self.hard_guess):
+            r = minimize(rosen, x0, jac=rosen_der, hess=rosen_hess,
+                         tol=1e-8, method='trust-krylov')
+            assert_allclose(self.x_opt, r['x'])
+            for kw in ({'hessp': rosen_hess_prod}, {'hess': hess_sparse},
+                       {'hess': hess_operator}):
+                r2 = minimize(rosen, x0, jac=rosen_der, tol=1e-8,
+                              method='trust-krylov', **kw)
+                assert_allclose(r['x'], r2['x'])
+                assert_equal(r['nit'], r2['nit'])
+
+    def test_sparse_hessian(self):
+        # a sparse problem with a badly scaled diagonal
+        n = 1000
+        d = np.logspace(0, 3, n)
+
+        def f(x):
+            return (0.5*np.sum(d*x**2) + 0.25*np.sum(x**4) +
+                    0.5*np.sum((x[1:] - x[:-1])**2) - np.sum(x))
+
+        def g(x):
+            r = d*x + x**3 - 1
+            r[1:] += x[1:] - x[:-1]
+            r[:-1] -= x[1:] - x[:-1]
+            return r
+
+        def h(x):
+            main = d + 3*x**2 + 2
+            main[[0, -1]] -= 1
+            return diags([-np.ones(n-1), main, -np.ones(n-1)], [-1, 0, 1],
+                         format='csr')
+
+        x0 = np.zeros(n)
+        r_exact = minimize(f, x0, jac=g, hess=h, method='trust-exact')
+        r_dense = minimize(f, x0, jac=g, hess=lambda x: h(x).toarray(),
+                           method='trust-exact')
+        r_krylov = minimize(f, x0, jac=g, hess=h, method='trust-krylov')
+        r_precond = minimize(f, x0, jac=g, hess=h, method='trust-krylov',
+                             options={'precond': diags(1/d)})
+        for r in (r_exact, r_dense, r_krylov, r_precond):
+            assert_(r.success)
+            assert_allclose(r.x, r_dense.x, atol=1e-6)
+        assert_equal(r_exact.nit, r_dense.nit)
+
 
 if __name__ == '__main__':
     run_module_suite()
@@ -11,13 +11,13 @@ import numpy as np
 from scipy.optimize._trustregion_exact import (
     estimate_smallest_singular_value,
     singular_leading_submatrix,
+    sparse_ldl,
     IterativeSubproblem)
-from scipy.linalg import (svd, get_lapack_funcs, det,
-                          cho_factor, cho_solve, qr,
-                          eigvalsh, eig, norm)
+from scipy.sparse import csr_matrix, csc_matrix
+from scipy.linalg import svd, get_lapack_funcs, det, qr, norm
 from numpy.testing import (TestCase, assert_, assert_array_equal,
                            assert_equal, assert_array_almost_equal,
-                           assert_array_less, run_module_suite)
+                           run_module_suite)
 
 
 def random_entry(n, min_eig, max_eig, case):
@@ -155,6 +155,22 @@ class TestSingularLeadingSubmatrix(TestCase):
         assert_array_almost_equal(quadratic_term, 0)
 
 
+class TestSparseLDL(TestCase):
+
+    def test_positive_definite(self):
+        np.random.seed(0)
+        H, g = random_entry(6, 1, 10, 'easy')
+        lu = sparse_ldl(csr_matrix(H))
+        assert_(lu is not None)
+        assert_array_almost_equal(lu.solve(g), np.linalg.solve(H, g))
+
+    def test_not_positive_definite(self):
+        np.random.seed(0)
+        for min_eig, max_eig in [(-10, -1), (-5, 5), (0, 0)]:
+            H, g = random_entry(6, min_eig, max_eig, 'easy')
+            assert_(sparse_ldl(csr_matrix(H)) is None)
+
+
 class TestIterativeSubproblem(TestCase):
 
     def test_for_the_easy_case(self):
@@ -355,6 +371,62 @@ class TestIterativeSubproblem(TestCase):
                         # Check if it respect k_opt
                         assert_equal(J <= k_opt*J_ac, True)
 
+    def test_sparse_duplicate_entries(self):
+        # the bounds and norms of a sparse Hessian with duplicate entries
+        # are those of the summed matrix, which is left unchanged
+        n = 5
+        H, g = random_entry(n, -5, 5, 'easy')
+        Hs = csc_matrix((np.hstack([2*H, -H]).ravel(),
+                         np.tile(np.arange(n), 2*n),
+                         2*n*np.arange(n + 1)), shape=(n, n))
+        subprob = IterativeSubproblem(0, lambda x: 0, lambda x: g,
+                                      lambda x: Hs)
+        subprob_dense = IterativeSubproblem(0, lambda x: 0, lambda x: g,
+                                            lambda x: H)
+        for attr in ('hess_fro', 'hess_inf', 'hess_gershgorin_lb',
+                     'hess_gershgorin_ub'):
+            assert_array_almost_equal(getattr(subprob, attr),
+                                      getattr(subprob_dense, attr))
+        assert_equal(Hs.nnz, 2*n*n)
+
+    def test_for_random_sparse_entries(self):
+        # The sparse Hessian path meets the same stopping criteria as the
+        # dense one.
+        np.random.seed(2)
+        n = 5
+
+        for case in ('easy', 'hard', 'jac_equal_zero'):
+            for min_eig, max_eig in [(-10, -5), (-5, 5), (0, 10), (5, 10)]:
+                H, g = random_entry(n, min_eig, max_eig, case)
+
+                for trust_radius in [0.1, 1, 3.3, 10]:
+                    subprob_ac = IterativeSubproblem(0,
+                                                     lambda x: 0,
+                                                     lambda x: g,
+                                                     lambda x: H,
+                                                     k_easy=1e-10,
+                                                     k_hard=1e-10)
+                    p_ac, hits_boundary_ac = subprob_ac.solve(trust_radius)
+                    J_ac = 1/2*np.dot(p_ac, np.dot(H, p_ac))+np.dot(g, p_ac)
+
+                    k_opt, k_trf = 0.9, 1.01
+                    subprob = IterativeSubproblem(0,
+                                                  lambda x: 0,
+                                                  lambda x: g,
+                                                  lambda x: csr_matrix(H),
+                                                  k_easy=min(k_trf-1,
+                                                             1-np.sqrt(k_opt)),
+                                                  k_hard=1-k_opt)
+                    p, hits_boundary = subprob.solve(trust_radius)
+                    J = 1/2*np.dot(p, np.dot(H, p))+np.dot(g, p)
+
+                    if hits_boundary:
+                        assert_(abs(norm(p)-trust_radius) <=
+                                (k_trf-1)*trust_radius)
+                    else:
+                        assert_(norm(p) <= trust_radius)
+                    assert_(J <= k_opt*J_ac + 1e-12)
+
 
 if __name__ == '__main__':
     run_module_suite()
@@ -0,0 +1,147 @@
+"""
+Unit tests for the generalized Lanczos trust-region subproblem.
+
+To run it in its simplest form::
+  nosetests test_trustregion_krylov.py
+
+"""
+from __future__ import division, print_function, absolute_import
+
+import numpy as np
+from scipy.optimize._trustregion_krylov import (
+    solve_tridiagonal_subproblem,
+    KrylovSubproblem)
+from scipy.optimize._trustregion_exact import IterativeSubproblem
+from scipy.linalg import norm
+from scipy.sparse import diags
+from numpy.testing import (TestCase, assert_, assert_equal, assert_allclose,
+                           assert_array_almost_equal, run_module_suite)
+
+from test_trustregion_exact import random_entry
+
+
+class TestTridiagonalSubproblem(TestCase):
+
+    def _check(self, alpha, beta, gamma0, trust_radius):
+        # Check the optimality conditions: ``(T + lambda I) h = -g`` with
+        # ``T + lambda I`` positive semidefinite, ``lambda >= 0`` and
+        # ``lambda == 0`` unless ``h`` is on the boundary.
+        T = np.diag(alpha) + np.diag(beta, 1) + np.diag(beta, -1)
+        g = np.zeros(len(alpha))
+        g[0] = gamma0
+        h, hits_boundary = solve_tridiagonal_subproblem(alpha, beta, gamma0,
+                                                        trust_radius)
+        h_norm = norm(h)
+        if hits_boundary:
+            assert_allclose(h_norm, trust_radius, rtol=1e-8)
+            lam = -np.dot(h, np.dot(T, h) + g) / h_norm**2
+        else:
+            assert_(h_norm <= trust_radius)
+            lam = 0
+        assert_(lam >= -1e-8)
+        assert_allclose(np.dot(T, h) + lam * h, -g, atol=1e-8)
+        assert_(np.linalg.eigvalsh(T)[0] + lam >= -1e-8)
+
+    def test_interior(self):
+        self._check([4., 3., 5.], [1., 1.], 1., 10.)
+        self._check([4.], [], 1., 10.)
+
+    def test_boundary(self):
+        self._check([4., 3., 5.], [1., 1.], 1., 0.1)
+        self._check([4.], [], 1., 0.1)
+
+    def test_indefinite(self):
+        self._check([4., -3., 5.], [1., 2.], 1., 1.)
+        self._check([-1.], [], 1., 2.)
+
+    def test_hard_case(self):
+        # The first Lanczos vector is orthogonal to the eigenvector of the
+        # eigenvalue -2.
+        self._check([1., -2.], [0.], 1., 2.)
+
+    def test_random(self):
+        np.random.seed(1234)
+        for k in (2, 5, 20):
+            for shift in (-2, 0, 2):
+                alpha = np.random.uniform(-1, 1, k) + shift
+                beta = np.random.uniform(0.1, 1, k - 1)
+                for trust_radius in (0.1, 1, 10):
+                    self._check(alpha, beta, 1.5, trust_radius)
+
+
+class TestKrylovSubproblem(TestCase):
+
+    def test_agrees_with_exact(self):
+        np.random.seed(1)
+        n = 10
+        for min_eig, max_eig in [(-10, -5), (-5, 5), (5, 10)]:
+            H, g = random_entry(n, min_eig, max_eig, 'easy')
+            for trust_radius in (0.1, 1, 10):
+                subprob = KrylovSubproblem(0, lambda x: 0, lambda x: g,
+                                           lambda x: H)
+                p, hits_boundary = subprob.solve(trust_radius)
+                exact = IterativeSubproblem(0, lambda x: 0, lambda x: g,
+                                            lambda x: H, k_easy=1e-10,
+                                            k_hard=1e-10)
+                p_ac, hits_boundary_ac = exact.solve(trust_radius)
+                assert_(norm(p) <= trust_radius * (1 + 1e-8))
+                assert_equal(hits_boundary, hits_boundary_ac)
+                # the inexact stopping test allows a small loss
+                J = 0.5*np.dot(p, np.dot(H, p)) + np.dot(g, p)
+                J_ac = 0.5*np.dot(p_ac, np.dot(H, p_ac)) + np.dot(g, p_ac)
+                assert_(J <= J_ac + 0.1 * abs(J_ac))
+
+    def test_sparse_hessian(self):
+        np.random.seed(2)
+        n = 50
+        H = diags([-np.ones(n - 1), np.random.uniform(2, 4, n),
+                   -np.ones(n - 1)], [-1, 0, 1], format='csr')
+        g = np.random.uniform(-1, 1, n)
+        for trust_radius in (0.1, 100):
+            sparse = KrylovSubproblem(0, lambda x: 0, lambda x: g,
+                                      lambda x: H)
+            dense = KrylovSubproblem(0, lambda x: 0, lambda x: g,
+                                     lambda x: H.toarray())
+            hessp = KrylovSubproblem(0, lambda x: 0, lambda x: g,
+                                     hessp=lambda x, p: H.dot(p))
+            p1, b1 = sparse.solve(trust_radius)
+            p2, b2 = dense.solve(trust_radius)
+            p3, b3 = hessp.solve(trust_radius)
+            assert_array_almost_equal(p1, p2)
+            assert_array_almost_equal(p1, p3)
+            assert_equal(b1, trust_radius == 0.1)
+
+    def test_preconditioner(self):
+        np.random.seed(3)
+        n = 200
+        d = np.logspace(0, 4, n)
+        H = diags([-np.ones(n - 1), d + 2, -np.ones(n - 1)], [-1, 0, 1],
+                  format='csr')
+        g = np.random.uniform(-1, 1, n)
+        plain = KrylovSubproblem(0, lambda x: 0, lambda x: g, lambda x: H)
+        p1, _ = plain.solve(100)
+        precond = KrylovSubproblem(0, lambda x: 0, lambda x: g, lambda x: H,
+                                   precond=diags(1 / d))
+        p2, _ = precond.solve(100)
+        # both steps reduce the model by a good part of what the Newton step
+        # does, the preconditioned one in fewer iterations
+        newton = -np.linalg.solve(H.toarray(), g)
+
+        def model(p):
+            return np.dot(g, p) + 0.5 * np.dot(p, H.dot(p))
+
+        assert_(model(p1) <= 0.5 * model(newton))
+        assert_(model(p2) <= 0.5 * model(newton))
+        assert_(precond.niter < plain.niter)
+
+    def test_jac_equal_zero(self):
+        H = np.diag([1., -1.])
+        subprob = KrylovSubproblem(0, lambda x: 0, lambda x: np.zeros(2),
+                                   lambda x: H)
+        p, hits_boundary = subprob.solve(1.)
+        assert_equal(p, [0, 0])
+        assert_equal(hits_boundary, False)
+
+
+if __name__ == '__main__':
+    run_module_suite()
@@ -2,9 +2,10 @@ from __future__ import division, print_function, absolute_import
 
 from math import sqrt, exp, sin, cos
 
+import numpy as np
 from numpy.testing import (TestCase, assert_warns, assert_, 
                            run_module_suite, assert_allclose,
-                           assert_equal)
+                           assert_equal, assert_raises)
 from numpy import finfo
 
 from scipy.optimize import zeros as cc
@@ -39,6 +40,9 @@ class TestBasic(TestCase):
     def test_brenth(self):
         self.run_check(cc.brenth, 'brenth')
 
+    def test_chandrupatla(self):
+        self.run_check(cc.chandrupatla, 'chandrupatla')
+
     def test_newton(self):
         f1 = lambda x: x**2 - 2*x - 1
         f1_1 = lambda x: 2*x - 2
@@ -101,6 +105,96 @@ def test_gh_5557():
         assert_allclose(0.6, res, atol=atol, rtol=rtol)
 
 
+def _cube_root_problems():
+    c = np.linspace(0.5, 100, 200).reshape(20, 10)
+    return c, lambda x, c: x**3 - c
+
+
+def test_array_newton():
+    c, f = _cube_root_problems()
+    fprime = lambda x, c: 3 * x**2
+    fprime2 = lambda x, c: 6 * x
+    for kwargs in [dict(fprime=fprime), dict(fprime=fprime, fprime2=fprime2),
+                   {}]:
+        x, r = cc.newton(f, np.full(c.shape, 3.), args=(c,), tol=1e-12,
+                         full_output=True, **kwargs)
+        assert_equal(x.shape, c.shape)
+        assert_allclose(x, c ** (1. / 3), rtol=1e-12)
+        assert_(np.all(r.converged))
+        assert_equal(r.flag, 0)
+        assert_(r.iterations.min() < r.iterations.max())
+        # the same iterations as for the scalar problems
+        for i in [(0, 0), (10, 5), (19, 9)]:
+            xi = cc.newton(f, 3., args=(c[i],), tol=1e-12, **kwargs)
+            assert_allclose(x[i], xi, rtol=1e-15)
+
+    # x0 broadcast against the array arguments
+    x = cc.newton(f, [[2.], [3.]], args=(c[:2],), fprime=fprime)
+    assert_allclose(x, c[:2] ** (1. / 3))
+
+    # a scalar x0 is a single problem, even with array arguments
+    x = cc.newton(lambda x, c: np.polyval(c, x), 1.5,
+                  args=(np.array([1., 0., -2.]),))
+    assert_allclose(x, np.sqrt(2))
+
+
+def test_array_newton_masking():
+    # converged elements are no longer evaluated
+    c, f = _cube_root_problems()
+    sizes = []
+
+    def func(x, c):
+        assert_equal(x.shape, c.shape)
+        sizes.append(x.size)
+        return f(x, c)
+
+    cc.newton(func, np.full(c.size, 3.), args=(c.ravel(),),
+              fprime=lambda x, c: 3 * x**2)
+    assert_equal(sizes[0], c.size)
+    assert_(np.all(np.diff(sizes) <= 0))
+    assert_(sizes[-1] < c.size)
+
+
+def test_array_newton_failures():
+    # zero derivative and non-convergence are flagged per element
+    f = lambda x: x**2 - 1
+    fprime = lambda x: 2 * x
+    x, r = cc.newton(f, np.array([0., 2., 1e10]), fprime, maxiter=20,
+                     full_output=True, disp=False)
+    assert_equal(r.converged, [False, True, False])
+    assert_equal(r.flag, [-3, 0, -2])
+    assert_allclose(x[1], 1)
+    assert_warns(RuntimeWarning, cc.newton, f, np.array([0., 2.]), fprime)
+    assert_raises(RuntimeError, cc.newton, f, np.array([0., 0.]), fprime)
+
+
+def test_chandrupatla_array():
+    c, f = _cube_root_problems()
+    x, r = cc.chandrupatla(f, 0, 5, args=(c,), full_output=True)
+    assert_equal(x.shape, c.shape)
+    assert_allclose(x, c ** (1. / 3), atol=2e-12)
+    assert_(np.all(r.converged))
+    assert_(r.function_calls <= r.iterations.max() + 2)
+
+    # brackets without a sign change, and roots at the ends
+    x, r = cc.chandrupatla(lambda x: x - 1, [0, 2, 1, 0], [2, 3, 2, 1],
+                           full_output=True, disp=False)
+    assert_equal(r.flag, [0, -1, 0, 0])
+    assert_allclose(x, [1, np.nan, 1, 1])
+    assert_equal(r.iterations[1:], 0)
+
+    x, r = cc.chandrupatla(f, 0, 5, args=(c,), maxiter=3, full_output=True,
+                           disp=False)
+    assert_(not np.any(r.converged))
+    assert_equal(r.flag, -2)
+    assert_raises(RuntimeError, cc.chandrupatla, f, 0, 5, args=(c,),
+                  maxiter=3)
+    assert_warns(RuntimeWarning, cc.chandrupatla, lambda x: x - 1, [0, 2],
+                 [2, 3])
+    assert_raises(ValueError, cc.chandrupatla, f, 0, 5, args=(c,),
+                  xtol=0)
+
+
 class TestRootResults:
     def test_repr(self):
         r = zeros.RootResults(root=1.0,
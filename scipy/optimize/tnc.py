@@ -34,7 +34,8 @@ value of the function, and whose second argument is the gradient of the function
 
 from __future__ import division, print_function, absolute_import
 
-from scipy.optimize import moduleTNC, approx_fprime
+from scipy.optimize import moduleTNC
+from .optimize import _prepare_approx_fprime
 from .optimize import MemoizeJac, OptimizeResult, _check_unknown_options
 from numpy import inf, array, zeros, asfarray
 
@@ -281,7 +282,8 @@ def _minimize_tnc(fun, x0, args=(), jac=None, bounds=None,
                   eps=1e-8, scale=None, offset=None, mesg_num=None,
                   maxCGit=-1, maxiter=None, eta=-1, stepmx=0, accuracy=0,
                   minfev=0, ftol=-1, xtol=-1, gtol=-1, rescale=-1, disp=False,
-                  callback=None, **unknown_options):
+                  callback=None, workers=1, vectorized=False,
+                  **unknown_options):
     """
     Minimize a scalar function of one or more variables using a truncated
     Newton (TNC) algorithm.
@@ -337,6 +339,13 @@ def _minimize_tnc(fun, x0, args=(), jac=None, bounds=None,
         Scaling factor (in log10) used to trigger f value
         rescaling.  If 0, rescale at each iteration.  If a large
         value, never rescale.  If < 0, rescale is set to 1.3.
+    workers : int or map-like callable
+        If `jac` is approximated, evaluate the finite differences in
+        parallel, see `approx_fprime`.
+    vectorized : bool
+        If `jac` is approximated, call `fun` once per gradient with all
+        perturbed points as the columns of an ``(n, n)`` array, see
+        `approx_fprime`.
 
     """
     _check_unknown_options(unknown_options)
@@ -361,10 +370,15 @@ def _minimize_tnc(fun, x0, args=(), jac=None, bounds=None,
     else:
         messages = MSG_NONE
 
+    approx_grad = None
     if jac is None:
+        # TNC counts the function evaluations itself
+        approx_grad = _prepare_approx_fprime(fun, args, epsilon, [0],
+                                             workers, vectorized)
+
         def func_and_grad(x):
             f = fun(x, *args)
-            g = approx_fprime(x, fun, epsilon, *args)
+            g = approx_grad(x, f)
             return f, g
     else:
         def func_and_grad(x):
@@ -403,12 +417,16 @@ def _minimize_tnc(fun, x0, args=(), jac=None, bounds=None,
     if maxfun is None:
         maxfun = max(100, 10*len(x0))
 
-    rc, nf, nit, x = moduleTNC.minimize(func_and_grad, x0, low, up, scale,
-                                        offset, messages, maxCGit, maxfun,
-                                        eta, stepmx, accuracy, fmin, ftol,
-                                        xtol, pgtol, rescale, callback)
+    try:
+        rc, nf, nit, x = moduleTNC.minimize(func_and_grad, x0, low, up, scale,
+                                            offset, messages, maxCGit, maxfun,
+                                            eta, stepmx, accuracy, fmin, ftol,
+                                            xtol, pgtol, rescale, callback)
 
-    funv, jacv = func_and_grad(x)
+        funv, jacv = func_and_grad(x)
+    finally:
+        if approx_grad is not None:
+            approx_grad.close()
 
     return OptimizeResult(x=x, fun=funv, jac=jacv, nfev=nf, nit=nit, status=rc,
                           message=RCSTRINGS[rc], success=(-1 < rc < 3))
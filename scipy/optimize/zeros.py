@@ -1,7 +1,10 @@
 from __future__ import division, print_function, absolute_import
 
 import warnings
+from collections import namedtuple
 
+import numpy as np
+from scipy._lib._numpy_compat import broadcast_to
 from . import _zeros
 from numpy import finfo, sign, sqrt
 
@@ -9,12 +12,19 @@ _iter = 100
 _xtol = 2e-12
 _rtol = 4*finfo(float).eps
 
-__all__ = ['newton', 'bisect', 'ridder', 'brentq', 'brenth']
+__all__ = ['newton', 'bisect', 'ridder', 'brentq', 'brenth', 'chandrupatla']
 
 CONVERGED = 'converged'
 SIGNERR = 'sign error'
 CONVERR = 'convergence error'
-flag_map = {0: CONVERGED, -1: SIGNERR, -2: CONVERR}
+ZEROERR = 'zero derivative'
+flag_map = {0: CONVERGED, -1: SIGNERR, -2: CONVERR, -3: ZEROERR}
+
+# Per-element results of the solvers for arrays of problems. `flag` holds
+# the keys of `flag_map`.
+_ArrayRootResults = namedtuple('_ArrayRootResults',
+                               'root converged flag iterations '
+                               'function_calls')
 
 
 class RootResults(object):
@@ -62,9 +72,46 @@ def results_c(full_output, r):
         return r
 
 
+def _results_array(full_output, disp, x, converged, flag, iterations,
+                   funcalls, maxiter):
+    # The result of the array solvers, raising or warning about elements
+    # that did not converge if `disp` is True.
+    if disp and not np.all(converged):
+        msg = ("Failed to converge for %d of %d elements after %d iterations"
+               % (np.sum(~converged), converged.size, maxiter))
+        if not np.any(converged):
+            raise RuntimeError(msg)
+        warnings.warn(msg, RuntimeWarning)
+    if full_output:
+        return x, _ArrayRootResults(x, converged, flag, iterations, funcalls)
+    return x
+
+
+def _problem_shape(x, args):
+    # The shape of an array of problems: the broadcast shape of `x` and the
+    # array members of `args`.
+    arrays = [a for a in args if isinstance(a, np.ndarray)]
+    return np.broadcast(x, *arrays).shape
+
+
+def _active_args(args, shape, active):
+    # Array arguments are restricted to the elements still being solved;
+    # all others are passed on unchanged.
+    return tuple(broadcast_to(a, shape).ravel()[active]
+                 if isinstance(a, np.ndarray) else a
+                 for a in args)
+
+
+def _call_active(f, x, args, shape, active):
+    fx = np.asarray(f(x, *_active_args(args, shape, active)))
+    if fx.shape != x.shape:
+        fx = broadcast_to(fx, x.shape)
+    return fx
+
+
 # Newton-Raphson method
 def newton(func, x0, fprime=None, args=(), tol=1.48e-8, maxiter=50,
-           fprime2=None):
+           fprime2=None, full_output=False, disp=True):
     """
     Find a zero using the Newton-Raphson or secant method.
 
@@ -74,13 +121,17 @@ def newton(func, x0, fprime=None, args=(), tol=1.48e-8, maxiter=50,
     derivate `fprime2` of `func` is provided, parabolic Halley's method
     is used.
 
+    If `x0` is an array of more than one element, the zeros of many
+    independent problems are found at once, see Notes. For a scalar `x0`
+    the arguments in `args` are passed on unchanged, whatever their type.
+
     Parameters
     ----------
     func : function
         The function whose zero is wanted. It must be a function of a
         single variable of the form f(x,a,b,c...), where a,b,c... are extra
         arguments that can be passed in the `args` parameter.
-    x0 : float
+    x0 : float or ndarray
         An initial estimate of the zero that should be somewhere near the
         actual zero.
     fprime : function, optional
@@ -97,15 +148,26 @@ def newton(func, x0, fprime=None, args=(), tol=1.48e-8, maxiter=50,
         convenient. If it is None (default), then the normal Newton-Raphson
         or the secant method is used. If it is given, parabolic Halley's
         method is used.
+    full_output : bool, optional
+        If `full_output` is False (default), the root is returned. If True,
+        the return value is ``(x, r)``, where `x` is the root and `r` is a
+        `RootResults` object, or for array `x0` a named tuple of per-element
+        results, see Notes.
+    disp : bool, optional
+        If True (default), raise RuntimeError if the algorithm didn't
+        converge. For array `x0` a RuntimeWarning is issued instead, unless
+        no element converged.
 
     Returns
     -------
-    zero : float
+    zero : float or ndarray
         Estimated location where function is zero.
+    r : RootResults or named tuple (present if ``full_output = True``)
+        Object containing information about the convergence.
 
     See Also
     --------
-    brentq, brenth, ridder, bisect
+    brentq, brenth, ridder, bisect, chandrupatla
     fsolve : find zeroes in n dimensions.
 
     Notes
@@ -123,11 +185,39 @@ def newton(func, x0, fprime=None, args=(), tol=1.48e-8, maxiter=50,
     sign. The brentq algorithm is recommended for general use in one
     dimensional problems when such an interval has been found.
 
+    For an array `x0`, `func`, `fprime` and `fprime2` must accept and
+    return arrays. The members of `args` that are arrays are broadcast
+    with `x0` to give the shape of the array of problems. The functions are
+    called with the elements that have not yet converged only, of both `x0`
+    and the array arguments. Convergence is judged per element. With
+    `full_output` the second return value is a named tuple with fields
+    ``root``, ``converged`` (boolean array), ``flag`` (integer array; 0 if
+    converged, -2 if the iteration limit was reached and -3 if a zero
+    derivative, or in the secant method a zero difference of function
+    values, was encountered), ``iterations`` (integer array) and
+    ``function_calls``, the number of calls of `func`.
+
+    Examples
+    --------
+    Solve ``x**2 == a`` for many values of ``a`` at once:
+
+    >>> from scipy import optimize
+    >>> a = np.array([1., 2., 3., 4.])
+    >>> optimize.newton(lambda x, a: x**2 - a, np.ones(4), args=(a,),
+    ...                 fprime=lambda x, a: 2*x)
+    array([ 1.        ,  1.41421356,  1.73205081,  2.        ])
+
     """
     if tol <= 0:
         raise ValueError("tol too small (%g <= 0)" % tol)
     if maxiter < 1:
         raise ValueError("maxiter must be greater than 0")
+    if not isinstance(args, tuple):
+        args = (args,)
+    if np.size(x0) > 1:
+        return _array_newton(func, x0, fprime, args, tol, maxiter, fprime2,
+                             full_output, disp)
+    funcalls = 0
     if fprime is not None:
         # Newton-Rapheson method
         # Multiply by 1.0 to convert to floating point.  We don't use float(x0)
@@ -140,8 +230,10 @@ def newton(func, x0, fprime=None, args=(), tol=1.48e-8, maxiter=50,
             if fder == 0:
                 msg = "derivative was zero."
                 warnings.warn(msg, RuntimeWarning)
-                return p0
+                return _results_select(full_output,
+                                       (p0, funcalls, iter, -3))
             fval = func(*myargs)
+            funcalls += 1
             if fprime2 is not None:
                 fder2 = fprime2(*myargs)
             if fder2 == 0:
@@ -155,7 +247,8 @@ def newton(func, x0, fprime=None, args=(), tol=1.48e-8, maxiter=50,
                 else:
                     p = p0 - 2*fval / (fder + sign(fder) * sqrt(discr))
             if abs(p - p0) < tol:
-                return p
+                return _results_select(full_output,
+                                       (p, funcalls, iter + 1, 0))
             p0 = p
     else:
         # Secant method
@@ -166,22 +259,122 @@ def newton(func, x0, fprime=None, args=(), tol=1.48e-8, maxiter=50,
             p1 = x0*(1 + 1e-4) - 1e-4
         q0 = func(*((p0,) + args))
         q1 = func(*((p1,) + args))
+        funcalls += 2
         for iter in range(maxiter):
             if q1 == q0:
                 if p1 != p0:
                     msg = "Tolerance of %s reached" % (p1 - p0)
                     warnings.warn(msg, RuntimeWarning)
-                return (p1 + p0)/2.0
+                return _results_select(full_output,
+                                       ((p1 + p0)/2.0, funcalls, iter, -3))
             else:
                 p = p1 - q1*(p1 - p0)/(q1 - q0)
             if abs(p - p1) < tol:
-                return p
+                return _results_select(full_output,
+                                       (p, funcalls, iter + 1, 0))
             p0 = p1
             q0 = q1
             p1 = p
             q1 = func(*((p1,) + args))
-    msg = "Failed to converge after %d iterations, value is %s" % (maxiter, p)
-    raise RuntimeError(msg)
+            funcalls += 1
+    if disp:
+        msg = ("Failed to converge after %d iterations, value is %s"
+               % (maxiter, p))
+        raise RuntimeError(msg)
+    return _results_select(full_output, (p, funcalls, maxiter, -2))
+
+
+def _results_select(full_output, r):
+    # the return value of the scalar newton
+    if full_output:
+        return results_c(full_output, r)
+    return r[0]
+
+
+def _array_newton(func, x0, fprime, args, tol, maxiter, fprime2,
+                  full_output, disp):
+    """
+    Newton, Halley or secant iterations for an array of independent
+    problems. Elements are removed from the iteration once they converge.
+    """
+    x0 = np.asarray(x0)
+    shape = _problem_shape(x0, args)
+    p = np.array(broadcast_to(x0, shape),
+                 dtype=np.result_type(x0, 1.0)).ravel()
+    n = p.size
+    flag = np.full(n, -2, dtype=int)
+    iterations = np.zeros(n, dtype=int)
+    active = np.arange(n)
+    funcalls = 0
+
+    if fprime is not None:
+        for it in range(maxiter):
+            x = p[active]
+            fder = _call_active(fprime, x, args, shape, active)
+            zero = fder == 0
+            flag[active[zero]] = -3
+            iterations[active[zero]] = it
+            active, x, fder = active[~zero], x[~zero], fder[~zero]
+            if not active.size:
+                break
+            fval = _call_active(func, x, args, shape, active)
+            funcalls += 1
+            if fprime2 is None:
+                # Newton step
+                dp = fval / fder
+            else:
+                # Parabolic Halley's method, where the discriminant is
+                # nonnegative
+                fder2 = _call_active(fprime2, x, args, shape, active)
+                dp = fval / fder
+                discr = fder ** 2 - 2 * fval * fder2
+                halley = (fder2 != 0) & (discr >= 0)
+                dp[halley] = (2 * fval / (fder + sign(fder) *
+                                          sqrt(np.where(halley, discr,
+                                                        0))))[halley]
+                flat = (fder2 != 0) & (discr < 0)
+                dp[flat] = (fder / fder2)[flat]
+            p[active] = x - dp
+            done = abs(dp) < tol
+            flag[active[done]] = 0
+            iterations[active] = it + 1
+            active = active[~done]
+            if not active.size:
+                break
+    else:
+        # Secant method
+        p0 = p.copy()
+        p1 = np.where(p0 >= 0, p0*(1 + 1e-4) + 1e-4, p0*(1 + 1e-4) - 1e-4)
+        q0 = _call_active(func, p0, args, shape, active)
+        q1 = _call_active(func, p1, args, shape, active)
+        funcalls += 2
+        for it in range(maxiter):
+            flat = q1 == q0
+            p[active[flat]] = ((p1 + p0) / 2.0)[flat]
+            flag[active[flat]] = -3
+            iterations[active[flat]] = it
+            keep = ~flat
+            active, p0, p1, q0, q1 = (active[keep], p0[keep], p1[keep],
+                                      q0[keep], q1[keep])
+            if not active.size:
+                break
+            dp = q1*(p1 - p0)/(q1 - q0)
+            p[active] = p1 - dp
+            done = abs(dp) < tol
+            flag[active[done]] = 0
+            iterations[active] = it + 1
+            keep = ~done
+            active, p0, p1, q0, q1 = (active[keep], p1[keep], p[active][keep],
+                                      q1[keep], q1[keep])
+            if not active.size:
+                break
+            q1 = _call_active(func, p1, args, shape, active)
+            funcalls += 1
+
+    p = p.reshape(shape)
+    flag = flag.reshape(shape)
+    return _results_array(full_output, disp, p, flag == 0, flag,
+                          iterations.reshape(shape), funcalls, maxiter)
 
 
 def bisect(f, a, b, args=(),
@@ -527,3 +720,156 @@ def brenth(f, a, b, args=(),
         raise ValueError("rtol too small (%g < %g)" % (rtol, _rtol))
     r = _zeros._brenth(f,a, b, xtol, rtol, maxiter, args, full_output, disp)
     return results_c(full_output, r)
+
+
+def chandrupatla(f, a, b, args=(),
+                 xtol=_xtol, rtol=_rtol, maxiter=_iter,
+                 full_output=False, disp=True):
+    """
+    Find roots of a function in bracketing intervals, for arrays of
+    independent problems.
+
+    Uses Chandrupatla's method [1]_, which like Brent's method combines
+    bisection with inverse quadratic interpolation, but decides between the
+    two with a simple test that is easily evaluated for many problems at
+    once. The iteration is vectorized: `f` is called with an array of
+    abscissae, one per problem that has not yet converged.
+
+    Parameters
+    ----------
+    f : function
+        Python function of the form ``f(x, *args)`` that accepts an array
+        `x` and returns an array of the same shape. `f` must be continuous,
+        and ``f(a)`` and ``f(b)`` must have opposite signs.
+    a, b : array_like
+        The ends of the bracketing intervals.
+    args : tuple, optional
+        Extra arguments for `f`. The members that are arrays are broadcast
+        with `a` and `b` to give the shape of the array of problems, and are
+        restricted to the problems that have not yet converged when `f` is
+        called; all other members are passed on unchanged.
+    xtol, rtol : number, optional
+        The computed roots ``x0`` will satisfy ``np.allclose(x, x0,
+        atol=xtol, rtol=rtol)``, where ``x`` are the exact roots. `xtol`
+        must be positive, and `rtol` cannot be smaller than its default
+        value of ``4*np.finfo(float).eps``.
+    maxiter : int, optional
+        The maximum number of iterations.
+    full_output : bool, optional
+        If `full_output` is False, the roots are returned. If True, the
+        return value is ``(x, r)``, where `x` are the roots and `r` is a
+        named tuple with fields ``root``, ``converged`` (boolean array),
+        ``flag`` (integer array; 0 if converged, -1 if the signs of ``f(a)``
+        and ``f(b)`` are not opposite, -2 if the iteration limit was
+        reached), ``iterations`` (integer array) and ``function_calls``,
+        the number of calls of `f`.
+    disp : bool, optional
+        If True, raise RuntimeError if no problem converged, and issue a
+        RuntimeWarning if some did not.
+
+    Returns
+    -------
+    x0 : ndarray
+        Zeros of `f` between `a` and `b`. Where the signs of ``f(a)`` and
+        ``f(b)`` are not opposite, the value is NaN.
+    r : named tuple (present if ``full_output = True``)
+        Information about the convergence of each problem.
+
+    See Also
+    --------
+    brentq : Brent's method for a single problem
+    newton : Newton's method, also for arrays of problems
+
+    References
+    ----------
+    .. [1] Chandrupatla, Tirupathi R. "A new hybrid quadratic/bisection
+           algorithm for finding the zero of a nonlinear function without
+           using derivatives". Advances in Engineering Software, 28(3),
+           145-149, 1997.
+
+    Examples
+    --------
+    Solve ``x**3 == c`` for many values of ``c`` at once:
+
+    >>> from scipy import optimize
+    >>> c = np.array([1., 8., 27.])
+    >>> optimize.chandrupatla(lambda x, c: x**3 - c, 0, 4, args=(c,))
+    array([ 1.,  2.,  3.])
+
+    """
+    if not isinstance(args, tuple):
+        args = (args,)
+    if xtol <= 0:
+        raise ValueError("xtol too small (%g <= 0)" % xtol)
+    if rtol < _rtol:
+        raise ValueError("rtol too small (%g < %g)" % (rtol, _rtol))
+    a, b = np.broadcast_arrays(np.asarray(a, dtype=float),
+                               np.asarray(b, dtype=float))
+    shape = _problem_shape(a, args)
+    a, b = broadcast_to(a, shape), broadcast_to(b, shape)
+    # the last two iterates x1, x2 bracket the root; x3 is the one before
+    x1 = a.ravel().copy()
+    x2 = b.ravel().copy()
+    n = x1.size
+    active = np.arange(n)
+    f1 = _call_active(f, x1, args, shape, active).astype(float)
+    f2 = _call_active(f, x2, args, shape, active).astype(float)
+    funcalls = 2
+
+    x = np.where(abs(f1) < abs(f2), x1, x2)
+    flag = np.full(n, -2, dtype=int)
+    iterations = np.zeros(n, dtype=int)
+
+    zero = (f1 == 0) | (f2 == 0)
+    flag[zero] = 0
+    bad = ~zero & (np.sign(f1) == np.sign(f2))
+    flag[bad] = -1
+    x[bad] = np.nan
+    keep = ~zero & ~bad
+    active, x1, x2, f1, f2 = (active[keep], x1[keep], x2[keep], f1[keep],
+                              f2[keep])
+    x3, f3 = x1, f1
+    t = np.full(active.size, 0.5)
+
+    for it in range(maxiter):
+        if not active.size:
+            break
+        xt = x1 + t * (x2 - x1)
+        ft = _call_active(f, xt, args, shape, active).astype(float)
+        funcalls += 1
+        iterations[active] = it + 1
+
+        same = np.sign(ft) == np.sign(f1)
+        x3, f3 = np.where(same, x1, x2), np.where(same, f1, f2)
+        x2, f2 = np.where(same, x2, x1), np.where(same, f2, f1)
+        x1, f1 = xt, ft
+
+        best = abs(f1) < abs(f2)
+        xm = np.where(best, x1, x2)
+        fm = np.where(best, f1, f2)
+        x[active] = xm
+
+        tol = (xtol + rtol * abs(xm)) / 2
+        tlim = tol / abs(x2 - x1)
+        done = (fm == 0) | (tlim > 0.5)
+        flag[active[done]] = 0
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            xi = (x1 - x2) / (x3 - x2)
+            phi = (f1 - f2) / (f3 - f2)
+            iqi = (phi**2 < xi) & ((1 - phi)**2 < 1 - xi)
+            t = np.where(iqi,
+                         f1 / (f2 - f1) * f3 / (f2 - f3) +
+                         (x3 - x1) / (x2 - x1) * f1 / (f3 - f1) *
+                         f2 / (f3 - f2),
+                         0.5)
+        t = np.clip(t, tlim, 1 - tlim)
+
+        keep = ~done
+        active, x1, x2, x3, f1, f2, f3, t = (
+            active[keep], x1[keep], x2[keep], x3[keep], f1[keep], f2[keep],
+            f3[keep], t[keep])
+
+    flag = flag.reshape(shape)
+    return _results_array(full_output, disp, x.reshape(shape), flag == 0,
+                          flag, iterations.reshape(shape), funcalls, maxiter)
@@ -47,6 +47,7 @@ Building sparse matrices:
    vstack - Stack sparse matrices vertically (row wise)
    rand - Random values in a given shape
    random - Random values in a given shape
+   CSRBuilder - Build a CSR matrix from entries given in chunks
 
 Save and load sparse matrices:
 
@@ -56,6 +57,14 @@ Save and load sparse matrices:
    save_npz - Save a sparse matrix to a file using ``.npz`` format.
    load_npz - Load a sparse matrix from a file using ``.npz`` format.
 
+Multithreading:
+
+.. autosummary::
+   :toctree: generated/
+
+   set_workers - Set the number of threads used by sparse matrix products
+   get_workers - Number of threads used by sparse matrix products
+
 Sparse matrix tools:
 
 .. autosummary::
@@ -236,6 +245,8 @@ from .bsr import *
 from .construct import *
 from .extract import *
 from ._matrix_io import *
+from ._builder import *
+from ._parallel import *
 
 # for backward compatibility with v0.10.  This function is marked as deprecated
 from .csgraph import cs_graph_components
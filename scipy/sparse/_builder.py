@@ -0,0 +1,231 @@
+"""Incremental construction of CSR matrices."""
+
+from __future__ import division, print_function, absolute_import
+
+import numpy as np
+
+from .sputils import get_index_dtype, getdtype, isshape, upcast
+from .coo import coo_matrix
+from .csr import csr_matrix
+
+__all__ = ['CSRBuilder']
+
+
+# Minimum number of entries gathered before they are sorted into a block.
+_MIN_BLOCK_NNZ = 2**20
+
+# The blocks are merged once they hold this many times the entries of the
+# last merged block.
+_MERGE_FACTOR = 2
+
+
+class CSRBuilder(object):
+    """Build a CSR matrix from entries given in chunks.
+
+    Entries may be added in any order, and duplicate entries are summed.
+    The entries added are regularly sorted into CSR blocks, in which
+    duplicates are summed, and the blocks are merged as they accumulate,
+    so that entries added many times are not all kept.
+
+    Parameters
+    ----------
+    shape : 2-tuple
+        Shape of the matrix.
+    dtype : dtype, optional
+        Data type of the matrix. Default is float64.
+
+    Attributes
+    ----------
+    shape : 2-tuple
+        Shape of the matrix.
+    dtype : dtype
+        Data type of the matrix.
+    nnz : int
+        Number of entries kept so far. Duplicates which have not been
+        summed yet are counted separately.
+
+    See Also
+    --------
+    coo_matrix
+
+    Notes
+    -----
+    The entries are sorted into a block when at least ``max(2**20, 4*M)``
+    of them have been added, ``M`` being the number of rows, so that the
+    index pointers of the blocks take little memory. The blocks are merged
+    with a counting sort by rows, freeing each block when it has been
+    copied, after which the column indices of each row are sorted and the
+    duplicates which were in different blocks are summed. This is done
+    whenever the blocks hold more than twice the entries of the last merged
+    block, or of a block if that is larger, and by `tocsr`.
+
+    The blocks thus hold at most about twice the entries of the last merged
+    block, itself at most the number of distinct entries added so far, plus
+    one block. A merge needs room for both the blocks and their merged
+    copy, so the peak memory is about twice that held by the blocks, that
+    is up to about four times that of the final matrix.
+
+    The index arrays of the result are of type int32 if the number of
+    entries and the dimensions allow it, and int64 otherwise. Sorting the
+    indices is split over threads according to `set_workers`.
+
+    .. versionadded:: 1.0.0
+
+    Examples
+    --------
+    >>> from scipy.sparse import CSRBuilder
+    >>> builder = CSRBuilder((3, 3), dtype=int)
+    >>> builder.add([0, 2], [1, 0], [1, 2])
+    >>> builder.add([2, 1, 0], [0, 1, 1], [3, 4, 5])
+    >>> builder.tocsr().toarray()
+    array([[0, 6, 0],
+           [0, 4, 0],
+           [5, 0, 0]])
+
+    """
+
+    def __init__(self, shape, dtype=None):
+        if not isshape(shape):
+            raise ValueError('invalid shape')
+        M, N = shape
+        if M < 0 or N < 0:
+            raise ValueError('invalid shape')
+        self.shape = (int(M), int(N))
+        self.dtype = upcast(getdtype(dtype, default=float))
+        self._idx_dtype = get_index_dtype(maxval=max(self.shape))
+        self._block_nnz = max(_MIN_BLOCK_NNZ, 4 * self.shape[0])
+        self._merged_nnz = 0
+        self._pending = []
+        self._pending_nnz = 0
+        self._blocks = []
+        self.nnz = 0
+
+    def add(self, rows, cols, vals):
+        """Add entries to the matrix.
+
+        Parameters
+        ----------
+        rows, cols : array_like of int
+            Row and column indices of the entries.
+        vals : array_like
+            Values of the entries, of the same size as `rows` and `cols`.
+            A scalar gives the same value to all entries.
+
+        """
+        rows = np.asarray(rows).ravel()
+        cols = np.asarray(cols).ravel()
+        vals = np.asarray(vals, dtype=self.dtype)
+        if vals.ndim == 0:
+            vals = np.full(rows.size, vals, dtype=self.dtype)
+        else:
+            vals = np.array(vals, copy=True).ravel()
+        if not rows.size == cols.size == vals.size:
+            raise ValueError('rows, cols and vals should have the same size')
+        if rows.size == 0:
+            return
+
+        if rows.max() >= self.shape[0]:
+            raise ValueError('row index exceeds matrix dimensions')
+        if cols.max() >= self.shape[1]:
+            raise ValueError('column index exceeds matrix dimensions')
+        if rows.min() < 0:
+            raise ValueError('negative row index found')
+        if cols.min() < 0:
+            raise ValueError('negative column index found')
+        # the indices are cast only once they are known to fit
+        rows = rows.astype(self._idx_dtype)
+        cols = cols.astype(self._idx_dtype)
+
+        self._pending.append((rows, cols, vals))
+        self._pending_nnz += rows.size
+        self.nnz += rows.size
+        if self._pending_nnz >= self._block_nnz:
+            self._flush()
+
+    def _flush(self):
+        """Sort the pending entries into a new block, and merge the blocks
+        if they hold too many entries."""
+        if not self._pending:
+            return
+        rows, cols, vals = [np.concatenate(arrays)
+                            for arrays in zip(*self._pending)]
+        self._pending = []
+        self.nnz -= self._pending_nnz
+        self._pending_nnz = 0
+
+        block = coo_matrix((vals, (rows, cols)), shape=self.shape).tocsr()
+        del rows, cols, vals
+        self.nnz += block.nnz
+        self._blocks.append(block)
+
+        blocks_nnz = sum(block.nnz for block in self._blocks)
+        if blocks_nnz > _MERGE_FACTOR * max(self._merged_nnz,
+                                            self._block_nnz):
+            merged = _merge_blocks(self._blocks, self.shape, self.dtype)
+            self._blocks = [merged]
+            self._merged_nnz = merged.nnz
+            self.nnz += merged.nnz - blocks_nnz
+
+    def tocsr(self):
+        """Return the matrix in CSR format, with duplicates summed.
+
+        The builder is emptied, and can be used again to build another
+        matrix of the same shape.
+
+        Returns
+        -------
+        A : csr_matrix
+            The matrix built, in canonical format.
+
+        """
+        self._flush()
+        blocks = self._blocks
+        self._blocks = []
+        self._merged_nnz = 0
+        self.nnz = 0
+
+        if not blocks:
+            return csr_matrix(self.shape, dtype=self.dtype)
+        return _merge_blocks(blocks, self.shape, self.dtype)
+
+
+def _merge_blocks(blocks, shape, dtype):
+    """Merge the CSR `blocks` into a canonical CSR matrix.
+
+    The list `blocks` is emptied as the blocks are copied.
+    """
+    if len(blocks) == 1:
+        return blocks.pop()
+    M, N = shape
+
+    total = sum(block.nnz for block in blocks)
+    idx_dtype = get_index_dtype(maxval=max(total, N))
+    counts = np.zeros(M, dtype=idx_dtype)
+    for block in blocks:
+        counts += np.diff(block.indptr).astype(idx_dtype, copy=False)
+    indptr = np.empty(M + 1, dtype=idx_dtype)
+    indptr[0] = 0
+    np.cumsum(counts, out=indptr[1:])
+    del counts
+
+    # Counting sort by rows: the entries of each block go after those
+    # of the previous blocks in the same rows.
+    indices = np.empty(total, dtype=idx_dtype)
+    data = np.empty(total, dtype=dtype)
+    fill = indptr[:-1].copy()
+    while blocks:
+        block = blocks.pop(0)
+        block_counts = np.diff(block.indptr)
+        rows = np.repeat(np.arange(M, dtype=idx_dtype), block_counts)
+        dest = (fill[rows] +
+                np.arange(block.nnz, dtype=idx_dtype) -
+                block.indptr[rows])
+        del rows
+        indices[dest] = block.indices
+        data[dest] = block.data
+        fill += block_counts.astype(idx_dtype, copy=False)
+        del block, block_counts, dest
+
+    A = csr_matrix((data, indices, indptr), shape=shape)
+    A.sum_duplicates()
+    return A
@@ -1,6 +1,9 @@
 from __future__ import division, print_function, absolute_import
 
+import struct
 import sys
+import zipfile
+
 import numpy as np
 import scipy.sparse
 
@@ -29,7 +32,8 @@ def save_npz(file, matrix, compressed=True):
     matrix: spmatrix (format: ``csc``, ``csr``, ``bsr``, ``dia`` or coo``)
         The sparse matrix to save.
     compressed : bool, optional
-        Allow compressing the file. Default: True
+        Allow compressing the file. Default: True. Files saved without
+        compression can be memory-mapped by `load_npz`.
 
     See Also
     --------
@@ -79,7 +83,7 @@ def save_npz(file, matrix, compressed=True):
         np.savez(file, **arrays_dict)
 
 
-def load_npz(file):
+def load_npz(file, mmap_mode=None):
     """ Load a sparse matrix from a file using ``.npz`` format.
 
     Parameters
@@ -87,6 +91,17 @@ def load_npz(file):
     file : str or file-like object
         Either the file name (string) or an open file (file-like object)
         where the data will be loaded.
+    mmap_mode : {None, 'r', 'c'}, optional
+        If not None, memory-map the arrays of the matrix in the given mode
+        (see `numpy.memmap`) instead of reading them into memory. Writing
+        to the file is not supported, since it would invalidate the
+        checksums of the archive. The file
+        must have been saved with ``compressed=False`` and hold a ``csr`` or
+        ``csc`` matrix, and `file` must be a file name or a file object
+        opened on a file on disk. With ``mmap_mode='r'``, the returned
+        matrix is read-only. Default: None.
+
+        .. versionadded:: 1.0.0
 
     Returns
     -------
@@ -97,6 +112,9 @@ def load_npz(file):
     ------
     IOError
         If the input file does not exist or cannot be read.
+    ValueError
+        If `mmap_mode` is given and the file is compressed or holds a
+        matrix of another format.
 
     See Also
     --------
@@ -125,25 +143,24 @@ def load_npz(file):
     >>> sparse_matrix.todense()
     matrix([[0, 0, 3],
             [4, 0, 0]], dtype=int64)
-    """
 
-    with np.load(file, **PICKLE_KWARGS) as loaded:
-        try:
-            matrix_format = loaded['format']
-        except KeyError:
-            raise ValueError('The file {} does not contain a sparse matrix.'.format(file))
+    Large matrices saved without compression can be memory-mapped, so that
+    their arrays are only read from disk when they are used, and are shared
+    between the processes which load the same file:
 
-        matrix_format = matrix_format.item()
+    >>> scipy.sparse.save_npz('/tmp/sparse_matrix.npz', sparse_matrix,
+    ...                       compressed=False)
+    >>> sparse_matrix = scipy.sparse.load_npz('/tmp/sparse_matrix.npz',
+    ...                                       mmap_mode='r')
+    >>> sparse_matrix.data.flags.writeable
+    False
+    """
 
-        if sys.version_info[0] >= 3 and not isinstance(matrix_format, str):
-            # Play safe with Python 2 vs 3 backward compatibility;
-            # files saved with Scipy < 1.0.0 may contain unicode or bytes.
-            matrix_format = matrix_format.decode('ascii')
+    if mmap_mode is not None:
+        return _load_npz_mmap(file, mmap_mode)
 
-        try:
-            cls = getattr(scipy.sparse, '{}_matrix'.format(matrix_format))
-        except AttributeError:
-            raise ValueError('Unknown matrix format "{}"'.format(matrix_format))
+    with np.load(file, **PICKLE_KWARGS) as loaded:
+        matrix_format, cls = _matrix_class(loaded, file)
 
         if matrix_format in ('csc', 'csr', 'bsr'):
             return cls((loaded['data'], loaded['indices'], loaded['indptr']), shape=loaded['shape'])
@@ -154,3 +171,102 @@ def load_npz(file):
         else:
             raise NotImplementedError('Load is not implemented for '
                                       'sparse matrix of format {}.'.format(matrix_format))
+
+
+def _matrix_class(loaded, file):
+    """Return the format and the class of the matrix stored in `loaded`."""
+    try:
+        matrix_format = loaded['format']
+    except KeyError:
+        raise ValueError('The file {} does not contain a sparse matrix.'.format(file))
+
+    matrix_format = matrix_format.item()
+
+    if sys.version_info[0] >= 3 and not isinstance(matrix_format, str):
+        # Play safe with Python 2 vs 3 backward compatibility;
+        # files saved with Scipy < 1.0.0 may contain unicode or bytes.
+        matrix_format = matrix_format.decode('ascii')
+
+    try:
+        cls = getattr(scipy.sparse, '{}_matrix'.format(matrix_format))
+    except AttributeError:
+        raise ValueError('Unknown matrix format "{}"'.format(matrix_format))
+    return matrix_format, cls
+
+
+def _load_npz_mmap(file, mmap_mode):
+    """Load a ``csr`` or ``csc`` matrix whose arrays are memory-mapped.
+
+    The members of an uncompressed ``.npz`` file are ``.npy`` files stored
+    as is in the zip archive, so that each array can be mapped at the
+    offset of its data in the archive.
+    """
+    if mmap_mode not in ('r', 'c'):
+        raise ValueError("mmap_mode must be one of None, 'r' or 'c'")
+
+    own_file = not hasattr(file, 'read')
+    if own_file:
+        fid = open(file, 'rb')
+    else:
+        fid = file
+
+    loaded = {}
+    try:
+        with zipfile.ZipFile(fid) as archive:
+            for info in archive.infolist():
+                key = info.filename
+                if key.endswith('.npy'):
+                    key = key[:-4]
+                loaded[key] = _read_stored_array(fid, info, key, mmap_mode)
+    finally:
+        if own_file:
+            fid.close()
+
+    matrix_format, cls = _matrix_class(loaded, file)
+    if matrix_format not in ('csc', 'csr'):
+        raise ValueError('Memory-mapping is only implemented for csr and '
+                         'csc matrices, not {}.'.format(matrix_format))
+
+    # Set the arrays on an empty matrix, since the constructor may convert
+    # the index arrays to a smaller dtype.
+    matrix = cls(tuple(loaded['shape']), dtype=loaded['data'].dtype)
+    matrix.data = loaded['data']
+    matrix.indices = loaded['indices']
+    matrix.indptr = loaded['indptr']
+    matrix.check_format(full_check=False)
+    return matrix
+
+
+def _read_stored_array(fid, info, key, mmap_mode):
+    """Read the ``.npy`` member `info` of an uncompressed zip archive,
+    memory-mapping the arrays of a compressed sparse matrix.
+    """
+    if info.compress_type != zipfile.ZIP_STORED:
+        raise ValueError('Memory-mapping requires a file saved with '
+                         'compressed=False.')
+
+    # skip the local file header, whose extra field may differ from the one
+    # in the central directory
+    fid.seek(info.header_offset)
+    name_len, extra_len = struct.unpack('<2H', fid.read(30)[26:30])
+    fid.seek(info.header_offset + 30 + name_len + extra_len)
+
+    version = np.lib.format.read_magic(fid)
+    if version == (1, 0):
+        shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(fid)
+    else:
+        shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(fid)
+    if dtype.hasobject:
+        raise ValueError('Cannot memory-map arrays of objects.')
+
+    count = int(np.prod(shape))
+    if key not in ('data', 'indices', 'indptr') or count == 0:
+        # small arrays, which need not or cannot be mapped
+        data = fid.read(count * dtype.itemsize)
+        array = np.frombuffer(data, dtype=dtype).reshape(shape).copy()
+        array.flags.writeable = mmap_mode == 'c'
+        return array
+
+    order = 'F' if fortran_order else 'C'
+    return np.memmap(fid, dtype=dtype, mode=mmap_mode, offset=fid.tell(),
+                     shape=shape, order=order)
@@ -0,0 +1,278 @@
+"""Thread-parallel sparse matrix products.
+
+The sparsetools routines release the GIL, so that CSR and BSR products can
+be split over threads by blocks of rows, each thread writing its own part
+of the result. Blocks are chosen so as to hold about the same number of
+stored entries.
+"""
+
+from __future__ import division, print_function, absolute_import
+
+import threading
+
+import numpy as np
+
+from scipy._lib._util import _normalize_workers, _threaded_ranges
+from . import _sparsetools
+from .sputils import get_index_dtype
+
+__all__ = ['set_workers', 'get_workers']
+
+
+# Minimum amount of work (stored entries times vectors) given to a thread.
+# Below it the cost of starting threads is larger than the gain.
+_MIN_WORK_PER_WORKER = 50000
+
+_default_workers = 1
+_local = threading.local()
+
+
+def get_workers():
+    """Return the number of threads used by sparse matrix products.
+
+    See Also
+    --------
+    set_workers
+
+    .. versionadded:: 1.0.0
+
+    """
+    workers = getattr(_local, 'workers', None)
+    if workers is None:
+        return _default_workers
+    return workers
+
+
+class set_workers(object):
+    """Set the number of threads used by sparse matrix products.
+
+    Products of CSR and BSR matrices with vectors, dense matrices and
+    other CSR matrices are split over this many threads, by blocks of rows,
+    and so is the sorting of the indices of compressed matrices. The
+    default is 1. The setting is global; used as a context manager,
+    the previous value is restored at the exit of the block.
+
+    Parameters
+    ----------
+    workers : int
+        Number of threads. -1 means one thread per processor.
+
+    See Also
+    --------
+    get_workers, spmatrix.dot
+
+    Notes
+    -----
+    Small products always run in the calling thread.
+
+    .. versionadded:: 1.0.0
+
+    Examples
+    --------
+    >>> from scipy import sparse
+    >>> A = sparse.random(1000, 1000, density=0.01, format='csr')
+    >>> with sparse.set_workers(2):
+    ...     y = A.dot(np.ones(1000))
+    >>> sparse.get_workers()
+    1
+
+    """
+
+    def __init__(self, workers):
+        global _default_workers
+        self._previous = _default_workers
+        _default_workers = _normalize_workers(workers)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        global _default_workers
+        _default_workers = self._previous
+
+
+class _override_workers(object):
+    """Context manager for a per-call number of threads, which takes
+    precedence over `set_workers` in the calling thread only.
+    """
+
+    def __init__(self, workers):
+        self.workers = _normalize_workers(workers)
+
+    def __enter__(self):
+        self._previous = getattr(_local, 'workers', None)
+        _local.workers = self.workers
+
+    def __exit__(self, *exc_info):
+        _local.workers = self._previous
+
+
+def _partition_rows(indptr, n_row, weight=1):
+    """Split ``range(n_row)`` into blocks of rows holding about the same
+    number of stored entries, one per thread. Returns the boundaries of
+    the blocks, or None if the product should not be split.
+    """
+    workers = get_workers()
+    if workers <= 1 or n_row <= 1:
+        return None
+    nnz = int(indptr[n_row]) - int(indptr[0])
+    nblocks = min(workers, n_row, nnz * weight // _MIN_WORK_PER_WORKER)
+    if nblocks <= 1:
+        return None
+    targets = int(indptr[0]) + nnz * np.arange(1, nblocks) // nblocks
+    bounds = np.searchsorted(indptr[:n_row + 1], targets)
+    return np.unique(np.concatenate(([0], bounds, [n_row])))
+
+
+def _run_blocks(func, bounds):
+    """Call ``func(start, stop)`` for all blocks of rows in threads."""
+    def work(first, last):
+        for k in range(first, last):
+            func(bounds[k], bounds[k + 1])
+    _threaded_ranges(work, len(bounds) - 1, len(bounds) - 1)
+
+
+def csr_matvec(n_row, n_col, Ap, Aj, Ax, Xx, Yx):
+    """Threaded version of ``_sparsetools.csr_matvec``."""
+    bounds = _partition_rows(Ap, n_row)
+    if bounds is None:
+        _sparsetools.csr_matvec(n_row, n_col, Ap, Aj, Ax, Xx, Yx)
+        return
+
+    def func(start, stop):
+        _sparsetools.csr_matvec(stop - start, n_col, Ap[start:stop + 1],
+                                Aj, Ax, Xx, Yx[start:stop])
+    _run_blocks(func, bounds)
+
+
+def csr_matvecs(n_row, n_col, n_vecs, Ap, Aj, Ax, Xx, Yx):
+    """Threaded version of ``_sparsetools.csr_matvecs``. `Yx` is the
+    raveled C-contiguous result.
+    """
+    bounds = _partition_rows(Ap, n_row, n_vecs)
+    if bounds is None:
+        _sparsetools.csr_matvecs(n_row, n_col, n_vecs, Ap, Aj, Ax, Xx, Yx)
+        return
+
+    def func(start, stop):
+        _sparsetools.csr_matvecs(stop - start, n_col, n_vecs,
+                                 Ap[start:stop + 1], Aj, Ax, Xx,
+                                 Yx[start * n_vecs:stop * n_vecs])
+    _run_blocks(func, bounds)
+
+
+def bsr_matvec(n_brow, n_bcol, R, C, Ap, Aj, Ax, Xx, Yx):
+    """Threaded version of ``_sparsetools.bsr_matvec``."""
+    bounds = _partition_rows(Ap, n_brow, R * C)
+    if bounds is None:
+        _sparsetools.bsr_matvec(n_brow, n_bcol, R, C, Ap, Aj, Ax, Xx, Yx)
+        return
+
+    def func(start, stop):
+        _sparsetools.bsr_matvec(stop - start, n_bcol, R, C,
+                                Ap[start:stop + 1], Aj, Ax, Xx,
+                                Yx[start * R:stop * R])
+    _run_blocks(func, bounds)
+
+
+def bsr_matvecs(n_brow, n_bcol, n_vecs, R, C, Ap, Aj, Ax, Xx, Yx):
+    """Threaded version of ``_sparsetools.bsr_matvecs``. `Yx` is the
+    raveled C-contiguous result.
+    """
+    bounds = _partition_rows(Ap, n_brow, R * C * n_vecs)
+    if bounds is None:
+        _sparsetools.bsr_matvecs(n_brow, n_bcol, n_vecs, R, C, Ap, Aj, Ax,
+                                 Xx, Yx)
+        return
+
+    def func(start, stop):
+        _sparsetools.bsr_matvecs(stop - start, n_bcol, n_vecs, R, C,
+                                 Ap[start:stop + 1], Aj, Ax, Xx,
+                                 Yx[start * R * n_vecs:stop * R * n_vecs])
+    _run_blocks(func, bounds)
+
+
+def _is_inplace(a, dtype):
+    # Whether sparsetools writes to `a` directly rather than to a temporary
+    # copy, which each thread would copy back over the whole array.
+    flags = a.flags
+    return (a.dtype == dtype and a.dtype.isnative and flags.c_contiguous and
+            flags.aligned and flags.writeable)
+
+
+def csr_sort_indices(n_row, Ap, Aj, Ax):
+    """Threaded version of ``_sparsetools.csr_sort_indices``.
+
+    Runs in the calling thread unless `Aj` and `Ax` can be sorted in place.
+    """
+    bounds = _partition_rows(Ap, n_row)
+    if (bounds is None or not _is_inplace(Aj, Ap.dtype) or
+            not _is_inplace(Ax, Ax.dtype)):
+        _sparsetools.csr_sort_indices(n_row, Ap, Aj, Ax)
+        return
+
+    def func(start, stop):
+        _sparsetools.csr_sort_indices(stop - start, Ap[start:stop + 1], Aj, Ax)
+    _run_blocks(func, bounds)
+
+
+def csr_matmat(n_row, n_col, Ap, Aj, Ax, Bp, Bj, Bx, dtype):
+    """Threaded two-pass product of two CSR matrices.
+
+    Returns ``(data, indices, indptr)`` of the product, or None if it is
+    too small to be split.
+
+    Each block of rows of ``A`` is sized (pass 1) and then computed (pass 2)
+    independently, into its own slice of the result. As in the serial
+    product, the index dtype of pass 2 and of the result is chosen from the
+    number of stored entries found by pass 1. Pass 2 drops explicit zeros,
+    so that the blocks are compacted at the end if needed.
+    """
+    bounds = _partition_rows(Ap, n_row)
+    if bounds is None:
+        return None
+    nblocks = len(bounds) - 1
+
+    index_arrays = (Ap, Aj, Bp, Bj)
+    idx_dtype = get_index_dtype(index_arrays, maxval=n_row * n_col)
+    Ap, Aj, Bp, Bj = [np.asarray(a, dtype=idx_dtype) for a in index_arrays]
+    block_indptr = [np.empty(bounds[k + 1] - bounds[k] + 1, dtype=idx_dtype)
+                    for k in range(nblocks)]
+
+    def pass1(start, stop):
+        k = np.searchsorted(bounds, start)
+        _sparsetools.csr_matmat_pass1(stop - start, n_col,
+                                      Ap[start:stop + 1], Aj, Bp, Bj,
+                                      block_indptr[k])
+    _run_blocks(pass1, bounds)
+
+    sizes = np.array([p[-1] for p in block_indptr], dtype=np.intp)
+    offsets = np.concatenate(([0], np.cumsum(sizes)))
+
+    idx_dtype = get_index_dtype(index_arrays, maxval=offsets[-1])
+    Ap, Aj, Bp, Bj = [np.asarray(a, dtype=idx_dtype) for a in index_arrays]
+    block_indptr = [np.asarray(p, dtype=idx_dtype) for p in block_indptr]
+    indices = np.empty(offsets[-1], dtype=idx_dtype)
+    data = np.empty(offsets[-1], dtype=dtype)
+
+    def pass2(start, stop):
+        k = np.searchsorted(bounds, start)
+        block = slice(offsets[k], offsets[k + 1])
+        _sparsetools.csr_matmat_pass2(stop - start, n_col,
+                                      Ap[start:stop + 1], Aj, Ax, Bp, Bj, Bx,
+                                      block_indptr[k], indices[block],
+                                      data[block])
+    _run_blocks(pass2, bounds)
+
+    nnz = np.array([p[-1] for p in block_indptr], dtype=np.intp)
+    starts = np.concatenate(([0], np.cumsum(nnz)))
+    indptr = np.empty(n_row + 1, dtype=idx_dtype)
+    indptr[0] = 0
+    for k in range(nblocks):
+        indptr[bounds[k] + 1:bounds[k + 1] + 1] = (block_indptr[k][1:] +
+                                                   starts[k])
+    if np.any(nnz < sizes):
+        keep = [slice(offsets[k], offsets[k] + nnz[k]) for k in range(nblocks)]
+        indices = np.concatenate([indices[s] for s in keep])
+        data = np.concatenate([data[s] for s in keep])
+    return data, indices, indptr
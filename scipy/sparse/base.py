@@ -9,6 +9,7 @@ from scipy._lib.six import xrange
 from scipy._lib._numpy_compat import broadcast_to
 from .sputils import (isdense, isscalarlike, isintlike,
                       get_sum_dtype, validateaxis)
+from ._parallel import _override_workers
 
 __all__ = ['spmatrix', 'isspmatrix', 'issparse',
            'SparseWarning', 'SparseEfficiencyWarning']
@@ -287,9 +288,19 @@ class spmatrix(object):
         """Element-wise minimum between this and another matrix."""
         return self.tocsr().minimum(other)
 
-    def dot(self, other):
+    def dot(self, other, workers=None):
         """Ordinary dot product
 
+        Parameters
+        ----------
+        other : array_like or sparse matrix
+            The other operand.
+        workers : int, optional
+            Number of threads for this product, in place of the one set
+            by `set_workers`. -1 means one thread per processor.
+
+            .. versionadded:: 1.0.0
+
         Examples
         --------
         >>> import numpy as np
@@ -300,7 +311,10 @@ class spmatrix(object):
         array([ 1, -3, -1], dtype=int64)
 
         """
-        return self * other
+        if workers is None:
+            return self * other
+        with _override_workers(workers):
+            return self * other
 
     def power(self, n, dtype=None):
         """Element-wise power."""
@@ -15,8 +15,9 @@ from .compressed import _cs_matrix
 from .base import isspmatrix, _formats, spmatrix
 from .sputils import isshape, getdtype, to_native, upcast, get_index_dtype
 from . import _sparsetools
-from ._sparsetools import (bsr_matvec, bsr_matvecs, csr_matmat_pass1,
-                           bsr_matmat_pass2, bsr_transpose, bsr_sort_indices)
+from ._sparsetools import (csr_matmat_pass1, bsr_matmat_pass2,
+                           bsr_transpose, bsr_sort_indices)
+from ._parallel import bsr_matvec, bsr_matvecs
 
 
 class bsr_matrix(_cs_matrix, _minmax_mixin):
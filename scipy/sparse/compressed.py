@@ -14,6 +14,7 @@ from .base import spmatrix, isspmatrix, SparseEfficiencyWarning
 from .data import _data_matrix, _minmax_mixin
 from .dia import dia_matrix
 from . import _sparsetools
+from . import _parallel
 from .sputils import (upcast, upcast_char, to_native, isdense, isshape,
                       getdtype, isscalarlike, IndexMixin, get_index_dtype,
                       downcast_intp_index, get_sum_dtype)
@@ -455,8 +456,11 @@ class _cs_matrix(_data_matrix, _minmax_mixin, IndexMixin):
         result = np.zeros(M, dtype=upcast_char(self.dtype.char,
                                                other.dtype.char))
 
-        # csr_matvec or csc_matvec
-        fn = getattr(_sparsetools,self.format + '_matvec')
+        # csr_matvec or csc_matvec, only the former is split over threads
+        if self.format == 'csr':
+            fn = _parallel.csr_matvec
+        else:
+            fn = getattr(_sparsetools,self.format + '_matvec')
         fn(M, N, self.indptr, self.indices, self.data, other, result)
 
         return result
@@ -469,7 +473,10 @@ class _cs_matrix(_data_matrix, _minmax_mixin, IndexMixin):
                                                         other.dtype.char))
 
         # csr_matvecs or csc_matvecs
-        fn = getattr(_sparsetools,self.format + '_matvecs')
+        if self.format == 'csr':
+            fn = _parallel.csr_matvecs
+        else:
+            fn = getattr(_sparsetools,self.format + '_matvecs')
         fn(M, N, n_vecs, self.indptr, self.indices, self.data, other.ravel(), result.ravel())
 
         return result
@@ -481,6 +488,14 @@ class _cs_matrix(_data_matrix, _minmax_mixin, IndexMixin):
         major_axis = self._swap((M,N))[0]
         other = self.__class__(other)  # convert to this format
 
+        if self.format == 'csr':
+            result = _parallel.csr_matmat(
+                M, N, self.indptr, self.indices, self.data,
+                other.indptr, other.indices, other.data,
+                upcast(self.dtype, other.dtype))
+            if result is not None:
+                return self.__class__(result, shape=(M,N))
+
         idx_dtype = get_index_dtype((self.indptr, self.indices,
                                      other.indptr, other.indices),
                                     maxval=M*N)
@@ -630,7 +645,8 @@ class _cs_matrix(_data_matrix, _minmax_mixin, IndexMixin):
             ci, cj = self._swap((i.ravel(), j.ravel()))
             self._zero_many(ci, cj)
 
-            x = x.tocoo()
+            x = x.tocoo(copy=True)
+            x.sum_duplicates()
             r, c = x.row, x.col
             x = np.asarray(x.data, dtype=self.dtype)
             if broadcast_row:
@@ -1045,8 +1061,8 @@ class _cs_matrix(_data_matrix, _minmax_mixin, IndexMixin):
         """
 
         if not self.has_sorted_indices:
-            _sparsetools.csr_sort_indices(len(self.indptr) - 1, self.indptr,
-                                          self.indices, self.data)
+            _parallel.csr_sort_indices(len(self.indptr) - 1, self.indptr,
+                                       self.indices, self.data)
             self.has_sorted_indices = True
 
     def prune(self):
@@ -13,7 +13,8 @@ from scipy._lib.six import xrange
 from .base import spmatrix
 
 from ._sparsetools import csr_tocsc, csr_tobsr, csr_count_blocks, \
-        get_csr_submatrix, csr_sample_values
+        get_csr_submatrix, csr_sample_values, csr_row_index, \
+        csr_column_index1, csr_column_index2
 from .sputils import (upcast, isintlike, IndexMixin, issequence,
                       get_index_dtype, ismatrix)
 
@@ -261,23 +262,16 @@ class csr_matrix(_cs_matrix, IndexMixin):
 
             return min_indx, max_indx
 
-        def extractor(indices,N):
-            """Return a sparse matrix P so that P*self implements
-            slicing of the form self[[1,2,3],:]
+        def normalize(indices, N):
+            """Return the indices as a 1-D array of non-negative ints
+            of the index dtype of this matrix.
             """
-            indices = asindices(indices).copy()
-
+            indices = asindices(indices).ravel()
             min_indx, max_indx = check_bounds(indices, N)
-
             if min_indx < 0:
+                indices = indices.copy()
                 indices[indices < 0] += N
-
-            indptr = np.arange(len(indices)+1, dtype=indices.dtype)
-            data = np.ones(len(indices), dtype=self.dtype)
-            shape = (len(indices),N)
-
-            return csr_matrix((data,indices,indptr), shape=shape,
-                              dtype=self.dtype, copy=False)
+            return indices.astype(self.indices.dtype, copy=False)
 
         row, col = self._unpack_index(key)
 
@@ -292,8 +286,9 @@ class csr_matrix(_cs_matrix, IndexMixin):
                 return self._get_row_slice(row, col)
             # [i, [1, 2]]
             elif issequence(col):
-                P = extractor(col,self.shape[1]).T
-                return self[row, :] * P
+                col = normalize(col, self.shape[1])
+                extracted = self._get_row_slice(row, slice(None))
+                return extracted._minor_index_fancy(col)
         elif isinstance(row, slice):
             # [1:2,??]
             if ((isintlike(col) and row.step in (1, None)) or
@@ -304,17 +299,28 @@ class csr_matrix(_cs_matrix, IndexMixin):
                 return self._get_submatrix(row, col)
             elif issequence(col):
                 # row is slice, col is sequence.
-                P = extractor(col,self.shape[1]).T        # [1:2,[1,2]]
+                col = normalize(col, self.shape[1])   # [1:2,[1,2]]
                 sliced = self
                 if row != slice(None, None, None):
                     sliced = sliced[row,:]
-                return sliced * P
+                return sliced._minor_index_fancy(col)
+            elif isintlike(col) or isinstance(col, slice):
+                # row or col is slice with step != 1
+                if row.step in (1, None):
+                    sliced = self[row, :]
+                else:
+                    row = np.arange(*row.indices(self.shape[0]))
+                    sliced = self._major_index_fancy(normalize(row, self.shape[0]))
+                if isintlike(col) or col.step in (1, None):
+                    return sliced[:, col]
+                col = np.arange(*col.indices(self.shape[1]))
+                return sliced._minor_index_fancy(normalize(col, self.shape[1]))
 
         elif issequence(row):
             # [[1,2],??]
             if isintlike(col) or isinstance(col,slice):
-                P = extractor(row, self.shape[0])     # [[1,2],j] or [[1,2],1:2]
-                extracted = P * self
+                row = normalize(row, self.shape[0])   # [[1,2],j] or [[1,2],1:2]
+                extracted = self._major_index_fancy(row)
                 if col == slice(None, None, None):
                     return extracted
                 else:
@@ -323,10 +329,9 @@ class csr_matrix(_cs_matrix, IndexMixin):
         elif ismatrix(row) and issequence(col):
             if len(row[0]) == 1 and isintlike(row[0][0]):
                 # [[[1],[2]], [1,2]], outer indexing
-                row = asindices(row)
-                P_row = extractor(row[:,0], self.shape[0])
-                P_col = extractor(col, self.shape[1]).T
-                return P_row * self * P_col
+                row = normalize(asindices(row)[:,0], self.shape[0])
+                col = normalize(col, self.shape[1])
+                return self._major_index_fancy(row)._minor_index_fancy(col)
 
         if not (issequence(col) and issequence(row)):
             # Sample elementwise
@@ -430,6 +435,63 @@ class csr_matrix(_cs_matrix, IndexMixin):
         return csr_matrix((row_data, row_indices, row_indptr), shape=shape,
                           dtype=self.dtype, copy=False)
 
+    def _major_index_fancy(self, idx):
+        """Return the rows ``self[idx, :]``, for a 1-D array `idx` of
+        non-negative row indices.
+        """
+        N = self.shape[1]
+        row_nnz = self.indptr[idx + 1] - self.indptr[idx]
+        nnz = int(row_nnz.sum(dtype=np.int64))
+        idx_dtype = get_index_dtype((self.indptr, self.indices),
+                                    maxval=max(nnz, N))
+
+        res_indptr = np.zeros(len(idx) + 1, dtype=idx_dtype)
+        np.cumsum(row_nnz, dtype=idx_dtype, out=res_indptr[1:])
+        res_indices = np.empty(nnz, dtype=idx_dtype)
+        res_data = np.empty(nnz, dtype=self.dtype)
+        csr_row_index(len(idx), np.asarray(idx, dtype=idx_dtype),
+                      np.asarray(self.indptr, dtype=idx_dtype),
+                      np.asarray(self.indices, dtype=idx_dtype),
+                      self.data, res_indices, res_data)
+
+        A = csr_matrix((res_data, res_indices, res_indptr),
+                       shape=(len(idx), N), copy=False)
+        A.has_sorted_indices = self.has_sorted_indices
+        return A
+
+    def _minor_index_fancy(self, idx):
+        """Return the columns ``self[:, idx]``, for a 1-D array `idx` of
+        non-negative column indices.
+
+        The entries are gathered through the inverse map of `idx`, which
+        gives for each column of this matrix its positions in `idx`.
+        """
+        M, N = self.shape
+        # the result can hold more entries than this matrix when columns
+        # are repeated, so its size is counted before picking the dtype
+        res_nnz = np.bincount(idx, minlength=N)[
+            self.indices[:self.indptr[-1]]].sum(dtype=np.int64)
+        idx_dtype = get_index_dtype((self.indptr, self.indices),
+                                    maxval=max(res_nnz, len(idx), N))
+        idx = np.asarray(idx, dtype=idx_dtype)
+        indptr = np.asarray(self.indptr, dtype=idx_dtype)
+        indices = np.asarray(self.indices, dtype=idx_dtype)
+
+        res_indptr = np.empty(M + 1, dtype=idx_dtype)
+        col_offsets = np.zeros(N, dtype=idx_dtype)
+        csr_column_index1(len(idx), idx, M, N, indptr, indices,
+                          col_offsets, res_indptr)
+
+        col_order = np.argsort(idx, kind='mergesort').astype(idx_dtype,
+                                                             copy=False)
+        nnz = res_indptr[-1]
+        res_indices = np.empty(nnz, dtype=idx_dtype)
+        res_data = np.empty(nnz, dtype=self.dtype)
+        csr_column_index2(col_order, col_offsets, indptr[-1], indices,
+                          self.data, res_indices, res_data)
+        return csr_matrix((res_data, res_indices, res_indptr),
+                          shape=(M, len(idx)), copy=False)
+
     def _get_submatrix(self, row_slice, col_slice):
         """Return a submatrix of this matrix (new matrix is created)."""
 
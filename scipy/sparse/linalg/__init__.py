@@ -96,6 +96,7 @@ Complete or incomplete LU factorizations
    splu -- Compute a LU decomposition for a sparse matrix
    spilu -- Compute an incomplete LU decomposition for a sparse matrix
    SuperLU -- Object representing an LU factorization
+   FactorizedLU -- LU factorization which can be recomputed for new values
 
 Exceptions
 ----------
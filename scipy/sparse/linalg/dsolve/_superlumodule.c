@@ -209,22 +209,25 @@ static PyObject *Py_gstrf(PyObject * self, PyObject * args,
     SuperMatrix A = { 0 };
     PyObject *result;
     PyObject *option_dict = NULL;
+    PyObject *perm_c_obj = NULL;
+    PyArrayObject *perm_c = NULL;
     int type;
     int ilu = 0;
 
     static char *kwlist[] = { "N", "nnz", "nzvals", "colind", "rowptr",
-	"options", "ilu",
+	"options", "ilu", "perm_c",
 	NULL
     };
 
     int res =
-	PyArg_ParseTupleAndKeywords(args, keywds, "iiO!O!O!|Oi", kwlist,
+	PyArg_ParseTupleAndKeywords(args, keywds, "iiO!O!O!|OiO", kwlist,
 				    &N, &nnz,
 				    &PyArray_Type, &nzvals,
 				    &PyArray_Type, &rowind,
 				    &PyArray_Type, &colptr,
 				    &option_dict,
-				    &ilu);
+				    &ilu,
+				    &perm_c_obj);
 
     if (!res)
 	return NULL;
@@ -242,23 +245,33 @@ static PyObject *Py_gstrf(PyObject * self, PyObject * args,
 	return NULL;
     }
 
+    if (perm_c_obj != NULL && perm_c_obj != Py_None) {
+        perm_c = (PyArrayObject *)PyArray_FROMANY(perm_c_obj, NPY_INT, 1, 1,
+                                                  NPY_ARRAY_IN_ARRAY);
+        if (perm_c == NULL) {
+            return NULL;
+        }
+    }
+
     if (NCFormat_from_spMatrix(&A, N, N, nnz, nzvals, rowind, colptr,
 			       type)) {
 	goto fail;
     }
 
-    result = newSuperLUObject(&A, option_dict, type, ilu);
+    result = newSuperLUObject(&A, option_dict, type, ilu, perm_c);
     if (result == NULL) {
 	goto fail;
     }
 
     /* arrays of input matrix will not be freed */
     Destroy_SuperMatrix_Store(&A);
+    Py_XDECREF(perm_c);
     return result;
 
   fail:
     /* arrays of input matrix will not be freed */
     XDestroy_SuperMatrix_Store(&A);
+    Py_XDECREF(perm_c);
     return NULL;
 }
 
@@ -291,6 +304,8 @@ options             specifies additional options for SuperLU\n\
 \n\
 ilu                 whether to perform an incomplete LU decomposition\n\
                     (default: false)\n\
+perm_c              column permutation to use instead of computing one\n\
+                    (default: None)\n\
 ";
 
 
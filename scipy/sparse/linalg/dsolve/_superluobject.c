@@ -688,8 +688,46 @@ size_error:
 }
 
 
+/*
+ * Check that perm_c is a permutation of 0..n-1 stored as C ints.
+ */
+static int check_perm_c(PyArrayObject * perm_c, int n)
+{
+    int i, j;
+    char *seen;
+    int *p;
+
+    if (PyArray_NDIM(perm_c) != 1 || PyArray_DIM(perm_c, 0) != n ||
+        PyArray_TYPE(perm_c) != NPY_INT || !PyArray_ISCARRAY_RO(perm_c)) {
+        PyErr_SetString(PyExc_ValueError,
+                        "perm_c must be a contiguous int array of size N");
+        return -1;
+    }
+
+    seen = (char *)PyMem_Malloc(n > 0 ? n : 1);
+    if (seen == NULL) {
+        PyErr_NoMemory();
+        return -1;
+    }
+    memset(seen, 0, n);
+    p = (int *)PyArray_DATA(perm_c);
+    for (i = 0; i < n; ++i) {
+        j = p[i];
+        if (j < 0 || j >= n || seen[j]) {
+            PyMem_Free(seen);
+            PyErr_SetString(PyExc_ValueError,
+                            "perm_c is not a permutation");
+            return -1;
+        }
+        seen[j] = 1;
+    }
+    PyMem_Free(seen);
+    return 0;
+}
+
+
 PyObject *newSuperLUObject(SuperMatrix * A, PyObject * option_dict,
-                           int intype, int ilu)
+                           int intype, int ilu, PyArrayObject * perm_c)
 {
 
     /* A must be in SLU_NC format used by the factorization routine. */
@@ -715,6 +753,18 @@ PyObject *newSuperLUObject(SuperMatrix * A, PyObject * option_dict,
 	return NULL;
     }
 
+    if (perm_c != NULL) {
+        if (check_perm_c(perm_c, n)) {
+            return NULL;
+        }
+        options.ColPerm = MY_PERMC;
+    }
+    else if (options.ColPerm == MY_PERMC) {
+        PyErr_SetString(PyExc_ValueError,
+                        "ColPerm=MY_PERMC requires a column permutation");
+        return NULL;
+    }
+
     /* Create SLUObject */
     self = PyObject_New(SuperLUObject, &SuperLUType);
     if (self == NULL)
@@ -740,8 +790,13 @@ PyObject *newSuperLUObject(SuperMatrix * A, PyObject * option_dict,
     self->perm_c = intMalloc(n);
     StatInit((SuperLUStat_t *)&stat);
 
-    /* calc column permutation */
-    get_perm_c(options.ColPerm, A, self->perm_c);	
+    /* calc column permutation, unless given */
+    if (perm_c != NULL) {
+        memcpy(self->perm_c, PyArray_DATA(perm_c), n * sizeof(int));
+    }
+    else {
+        get_perm_c(options.ColPerm, A, self->perm_c);
+    }
 
     /* apply column permutation */
     sp_preorder((superlu_options_t*)&options, A, self->perm_c, (int*)etree,
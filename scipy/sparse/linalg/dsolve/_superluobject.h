@@ -58,7 +58,8 @@ int NCFormat_from_spMatrix(SuperMatrix *, int, int, int, PyArrayObject *,
 int LU_to_csc_matrix(SuperMatrix *L, SuperMatrix *U,
                      PyObject **L_csc, PyObject **U_csc);
 colperm_t superlu_module_getpermc(int);
-PyObject *newSuperLUObject(SuperMatrix *, PyObject *, int, int);
+PyObject *newSuperLUObject(SuperMatrix *, PyObject *, int, int,
+                           PyArrayObject *);
 int set_superlu_options_from_dict(superlu_options_t * options,
 				  int ilu, PyObject * option_dict,
 				  int *panel_size, int *relax);
@@ -7,6 +7,7 @@ from numpy import asarray, empty, ravel, nonzero
 from scipy.sparse import (isspmatrix_csc, isspmatrix_csr, isspmatrix,
                           SparseEfficiencyWarning, csc_matrix, csr_matrix)
 from scipy.linalg import LinAlgError
+from scipy._lib._util import _normalize_workers, _threaded_ranges
 
 from . import _superlu
 
@@ -19,7 +20,7 @@ except ImportError:
 useUmfpack = not noScikit
 
 __all__ = ['use_solver', 'spsolve', 'splu', 'spilu', 'factorized',
-           'MatrixRankWarning', 'spsolve_triangular']
+           'FactorizedLU', 'MatrixRankWarning', 'spsolve_triangular']
 
 
 class MatrixRankWarning(UserWarning):
@@ -393,6 +394,11 @@ def factorized(A):
     >>> solve(rhs1) # Uses the LU factors.
     array([ 1., -2., -2.])
 
+    See Also
+    --------
+    FactorizedLU : LU factorization which can be updated for new values
+                   of the matrix.
+
     """
     if useUmfpack:
         if noScikit:
@@ -422,6 +428,181 @@ def factorized(A):
         return splu(A).solve
 
 
+class FactorizedLU(object):
+    """
+    LU factorization of a sparse matrix, which can be recomputed for new
+    values of the matrix with the same sparsity pattern.
+
+    Parameters
+    ----------
+    A : sparse matrix
+        Sparse square matrix to factorize. Should be in CSC format.
+    permc_spec : str, optional
+        How to permute the columns of the matrix for sparsity preservation.
+        See `splu`. (default: 'COLAMD')
+    diag_pivot_thresh : float, optional
+        Threshold used for a diagonal entry to be an acceptable pivot.
+        See `splu`.
+    relax : int, optional
+        Expert option for customizing the degree of relaxing supernodes.
+        See `splu`.
+    panel_size : int, optional
+        Expert option for customizing the panel size. See `splu`.
+    options : dict, optional
+        Dictionary containing additional expert options to SuperLU.
+        See `splu`.
+
+    Attributes
+    ----------
+    shape : tuple of int
+        Shape of the matrix.
+    perm_c : ndarray
+        Column permutation, computed at the first factorization and kept
+        by `refactor`.
+    lu : SuperLU
+        The current factorization.
+
+    Methods
+    -------
+    refactor
+    solve
+    __call__
+
+    See Also
+    --------
+    splu, factorized
+
+    Notes
+    -----
+    The column permutation, which reduces the fill-in of the factors and
+    is often the most expensive part of the symbolic analysis, depends only
+    on the sparsity pattern. It is computed once and reused by `refactor`,
+    which then only performs the numerical factorization. Rows are still
+    pivoted at each factorization for numerical stability.
+
+    Solves with several right-hand sides are made by one call to SuperLU,
+    or by several threads on blocks of columns, as the solves release the
+    GIL.
+
+    This class uses SuperLU, also when UMFPACK is available.
+
+    .. versionadded:: 1.0.0
+
+    Examples
+    --------
+    >>> from scipy.sparse import csc_matrix
+    >>> from scipy.sparse.linalg import FactorizedLU
+    >>> A = csc_matrix([[4., 1., 0.], [1., 4., 1.], [0., 1., 4.]])
+    >>> lu = FactorizedLU(A)
+    >>> lu.solve(np.array([5., 6., 5.]))
+    array([ 1.,  1.,  1.])
+
+    Refactorize for new values of the matrix, with the same sparsity
+    pattern:
+
+    >>> A.data *= 2
+    >>> lu.refactor(A)
+    >>> lu.solve(np.array([5., 6., 5.]))
+    array([ 0.5,  0.5,  0.5])
+
+    """
+
+    def __init__(self, A, permc_spec=None, diag_pivot_thresh=None,
+                 relax=None, panel_size=None, options=None):
+        A = self._as_csc(A)
+        M, N = A.shape
+        if (M != N):
+            raise ValueError("can only factor square matrices")
+
+        self.shape = A.shape
+        self._indptr = A.indptr.copy()
+        self._indices = A.indices.copy()
+        self._options = dict(DiagPivotThresh=diag_pivot_thresh,
+                             ColPerm=permc_spec, PanelSize=panel_size,
+                             Relax=relax)
+        if options is not None:
+            self._options.update(options)
+
+        self.dtype = A.dtype
+        self.lu = _superlu.gstrf(N, A.nnz, A.data, A.indices, A.indptr,
+                                 ilu=False, options=self._options)
+        self.perm_c = self.lu.perm_c.copy()
+
+    @staticmethod
+    def _as_csc(A):
+        if not isspmatrix_csc(A):
+            A = csc_matrix(A)
+            warn('FactorizedLU requires CSC matrix format',
+                 SparseEfficiencyWarning)
+        A.sort_indices()
+        return A.asfptype()  # upcast to a floating point format
+
+    def refactor(self, A):
+        """
+        Factorize a matrix with the same sparsity pattern.
+
+        Parameters
+        ----------
+        A : sparse matrix
+            Matrix with the same shape and stored entries as the matrix
+            first factorized, but possibly different values.
+
+        Raises
+        ------
+        ValueError
+            If the sparsity pattern of `A` differs.
+
+        """
+        A = self._as_csc(A)
+        if (A.shape != self.shape or
+                not np.array_equal(A.indptr, self._indptr) or
+                not np.array_equal(A.indices, self._indices)):
+            raise ValueError("the sparsity pattern differs from that of the "
+                             "factorized matrix")
+
+        self.dtype = A.dtype
+        self.lu = _superlu.gstrf(self.shape[0], A.nnz, A.data, A.indices,
+                                 A.indptr, ilu=False, options=self._options,
+                                 perm_c=self.perm_c)
+
+    def solve(self, b, trans='N', workers=1):
+        """
+        Solve the linear system for one or several right-hand sides.
+
+        Parameters
+        ----------
+        b : ndarray, shape (N,) or (N, K)
+            Right-hand side(s).
+        trans : {'N', 'T', 'H'}, optional
+            Solve with the matrix (``'N'``), its transpose (``'T'``) or
+            its conjugate transpose (``'H'``).
+        workers : int, optional
+            Number of threads among which the right-hand sides are split.
+            -1 means one thread per processor. Default is 1.
+
+        Returns
+        -------
+        x : ndarray, shape (N,) or (N, K)
+            Solution(s).
+
+        """
+        b = np.asarray(b)
+        workers = _normalize_workers(workers)
+        if b.ndim != 2 or workers == 1 or b.shape[1] < 2:
+            return self.lu.solve(b, trans=trans)
+
+        x = np.empty(b.shape, dtype=self.dtype, order='F')
+
+        def _solve(start, stop):
+            x[:, start:stop] = self.lu.solve(b[:, start:stop], trans=trans)
+        _threaded_ranges(_solve, b.shape[1], workers)
+        return x
+
+    def __call__(self, b):
+        """Solve the linear system for the right-hand side(s) `b`."""
+        return self.solve(b)
+
+
 def spsolve_triangular(A, b, lower=True, overwrite_A=False, overwrite_b=False):
     """
     Solve the equation `A x = b` for `x`, assuming A is a triangular matrix.
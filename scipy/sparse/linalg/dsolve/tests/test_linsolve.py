@@ -16,7 +16,7 @@ from scipy.sparse import (spdiags, SparseEfficiencyWarning, csc_matrix,
         csr_matrix, identity, isspmatrix, dok_matrix, lil_matrix, bsr_matrix)
 from scipy.sparse.linalg import SuperLU
 from scipy.sparse.linalg.dsolve import (spsolve, use_solver, splu, spilu,
-        MatrixRankWarning, _superlu, spsolve_triangular)
+        MatrixRankWarning, _superlu, spsolve_triangular, FactorizedLU)
 
 warnings.simplefilter('ignore',SparseEfficiencyWarning)
 
@@ -512,6 +512,79 @@ class TestSplu(object):
         assert_equal(len(oks), 20)
 
 
+class TestFactorizedLU(object):
+    def setUp(self):
+        n = 40
+        d = arange(n) + 1
+        self.n = n
+        self.A = spdiags((d, 2*d, d[::-1]), (-3, 0, 5), n, n).tocsc()
+
+    def test_solve(self):
+        rng = random.RandomState(1234)
+        for dtype in [np.float32, np.float64, np.complex64, np.complex128]:
+            A = self.A.astype(dtype)
+            lu = FactorizedLU(A)
+            tol = 1e3 * np.finfo(dtype).eps
+            for b in [rng.rand(self.n), rng.rand(self.n, 1),
+                      rng.rand(self.n, 7)]:
+                b = b.astype(dtype)
+                for trans, M in [('N', A), ('T', A.T), ('H', A.H)]:
+                    for workers in [1, 3]:
+                        x = lu.solve(b, trans=trans, workers=workers)
+                        assert_equal(x.shape, b.shape)
+                        assert_equal(x.dtype, np.dtype(dtype))
+                        assert_allclose(M.dot(x), b, rtol=tol, atol=tol)
+            assert_allclose(A.dot(lu(b)), b, rtol=tol, atol=tol)
+
+    def test_refactor(self):
+        rng = random.RandomState(1234)
+        lu = FactorizedLU(self.A, permc_spec='MMD_AT_PLUS_A')
+        # the permutation does not keep the first factorization alive
+        assert_(lu.perm_c.base is None)
+        perm_c = lu.perm_c.copy()
+        b = rng.rand(self.n, 3)
+        for k in range(5):
+            A = self.A.copy()
+            A.data = rng.rand(A.nnz) + 1
+            A.data[A.indices == np.repeat(arange(self.n), np.diff(A.indptr))] += 10
+            lu.refactor(A)
+            assert_array_equal(lu.perm_c, perm_c)
+            assert_allclose(A.dot(lu.solve(b)), b, atol=1e-10)
+            assert_allclose(lu.solve(b), splu(A).solve(b), atol=1e-10)
+
+        # other patterns are rejected
+        B = self.A.tolil()
+        B[0, self.n - 1] = 1
+        assert_raises(ValueError, lu.refactor, B.tocsc())
+        assert_raises(ValueError, lu.refactor, self.A[:-1, :-1])
+
+    def test_perm_c(self):
+        A = self.A.astype(np.float64)
+        N = A.shape[0]
+        perm_c = np.arange(N, dtype=np.intc)[::-1]
+        lu = _superlu.gstrf(N, A.nnz, A.data, A.indices, A.indptr,
+                            perm_c=perm_c)
+        b = np.ones(N)
+        assert_allclose(A.dot(lu.solve(b)), b)
+
+        # the permutation is postordered by the factorization, after which
+        # it is kept as is
+        lu2 = _superlu.gstrf(N, A.nnz, A.data, A.indices, A.indptr,
+                             perm_c=lu.perm_c)
+        assert_array_equal(lu2.perm_c, lu.perm_c)
+
+        for bad in [np.zeros(N), np.arange(N - 1), np.arange(1, N + 1)]:
+            bad = bad.astype(np.intc)
+            assert_raises(ValueError, _superlu.gstrf, N, A.nnz, A.data,
+                          A.indices, A.indptr, perm_c=bad)
+        assert_raises(ValueError, _superlu.gstrf, N, A.nnz, A.data,
+                      A.indices, A.indptr, options=dict(ColPerm='MY_PERMC'))
+
+    def test_singular(self):
+        A = csc_matrix((5, 5), dtype='d')
+        assert_raises(RuntimeError, FactorizedLU, A)
+
+
 class TestSpsolveTriangular(TestCase):
 
     def test_singular(self):
@@ -1224,6 +1224,143 @@ void get_csr_submatrix(const I n_row,
 }
 
 
+/*
+ * Gather rows of a CSR matrix given by an array of row indices
+ *
+ * Input Arguments:
+ *   I  n_row_idx       - number of row indices
+ *   I  rows[n_row_idx] - row indices, possibly repeated
+ *   I  Ap[n_row+1]     - row pointer
+ *   I  Aj[nnz(A)]      - column indices
+ *   T  Ax[nnz(A)]      - nonzeros
+ *
+ * Output Arguments:
+ *   I  Bj[nnz(B)]      - column indices
+ *   T  Bx[nnz(B)]      - nonzeros
+ *
+ * Note:
+ *   Output arrays Bj, Bx must be preallocated; the row pointer of B
+ *   is the cumulative sum of the lengths of the rows gathered.
+ *
+ *   Complexity: Linear.  Specifically O(n_row_idx + nnz(B))
+ *
+ */
+template <class I, class T>
+void csr_row_index(const I n_row_idx,
+                   const I rows[],
+                   const I Ap[],
+                   const I Aj[],
+                   const T Ax[],
+                         I Bj[],
+                         T Bx[])
+{
+    for(I i = 0; i < n_row_idx; i++){
+        const I row_start = Ap[rows[i]];
+        const I row_end   = Ap[rows[i]+1];
+        Bj = std::copy(Aj + row_start, Aj + row_end, Bj);
+        Bx = std::copy(Ax + row_start, Ax + row_end, Bx);
+    }
+}
+
+
+/*
+ * Gather columns of a CSR matrix given by an array of column indices,
+ * first pass: compute the row pointer of the result
+ *
+ * Input Arguments:
+ *   I  n_idx             - number of column indices
+ *   I  col_idxs[n_idx]   - column indices, possibly repeated
+ *   I  n_row             - number of rows in A
+ *   I  n_col             - number of columns in A
+ *   I  Ap[n_row+1]       - row pointer
+ *   I  Aj[nnz(A)]        - column indices
+ *
+ * Output Arguments:
+ *   I  col_offsets[n_col] - cumulative count of each column in col_idxs
+ *   I  Bp[n_row+1]        - row pointer of the result
+ *
+ * Note:
+ *   Output arrays col_offsets, Bp must be preallocated, and col_offsets
+ *   filled with zeros.
+ *
+ *   Complexity: Linear.  Specifically O(n_idx + n_col + nnz(A))
+ *
+ */
+template <class I>
+void csr_column_index1(const I n_idx,
+                       const I col_idxs[],
+                       const I n_row,
+                       const I n_col,
+                       const I Ap[],
+                       const I Aj[],
+                             I col_offsets[],
+                             I Bp[])
+{
+    for(I jj = 0; jj < n_idx; jj++){
+        col_offsets[col_idxs[jj]]++;
+    }
+
+    // each entry of A appears once per occurrence of its column
+    I new_nnz = 0;
+    Bp[0] = 0;
+    for(I i = 0; i < n_row; i++){
+        for(I jj = Ap[i]; jj < Ap[i+1]; jj++){
+            new_nnz += col_offsets[Aj[jj]];
+        }
+        Bp[i+1] = new_nnz;
+    }
+
+    for(I j = 1; j < n_col; j++){
+        col_offsets[j] += col_offsets[j-1];
+    }
+}
+
+
+/*
+ * Gather columns of a CSR matrix given by an array of column indices,
+ * second pass: fill the column indices and nonzeros of the result
+ *
+ * Input Arguments:
+ *   I  col_order[n_idx]   - positions in col_idxs sorted by column
+ *   I  col_offsets[n_col] - from csr_column_index1
+ *   I  nnz                - number of nonzeros in A
+ *   I  Aj[nnz(A)]         - column indices
+ *   T  Ax[nnz(A)]         - nonzeros
+ *
+ * Output Arguments:
+ *   I  Bj[nnz(B)]         - column indices
+ *   T  Bx[nnz(B)]         - nonzeros
+ *
+ * Note:
+ *   Output arrays Bj, Bx must be preallocated.
+ *
+ *   Complexity: Linear.  Specifically O(nnz(A) + nnz(B))
+ *
+ */
+template <class I, class T>
+void csr_column_index2(const I col_order[],
+                       const I col_offsets[],
+                       const I nnz,
+                       const I Aj[],
+                       const T Ax[],
+                             I Bj[],
+                             T Bx[])
+{
+    I n = 0;
+    for(I jj = 0; jj < nnz; jj++){
+        const I j = Aj[jj];
+        const I offset = col_offsets[j];
+        const I prev_offset = (j == 0) ? 0 : col_offsets[j-1];
+        const T v = Ax[jj];
+        for(I k = prev_offset; k < offset; k++){
+            Bj[n] = col_order[k];
+            Bx[n] = v;
+            n++;
+        }
+    }
+}
+
+
 /*
  * Count the number of occupied diagonals in CSR matrix A
  *
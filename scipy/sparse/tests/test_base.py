@@ -2691,6 +2691,27 @@ class _TestFancyIndexing:
         assert_raises(IndexError, S.__getitem__, (I_bad,J))
         assert_raises(IndexError, S.__getitem__, (I,J_bad))
 
+    def test_fancy_indexing_repeated(self):
+        np.random.seed(1234)  # make runs repeatable
+
+        D = np.asmatrix(np.random.rand(7, 5))
+        D = np.multiply(D, D > 0.5)
+        S = self.spmatrix(D)
+
+        I = np.random.randint(-7, 7, size=12)
+        J = np.random.randint(-5, 5, size=9)
+
+        assert_equal(S[I].todense(), D[I])
+        assert_equal(S[I, 1:4].todense(), D[I, 1:4])
+        assert_equal(S[:, J].todense(), D[:, J])
+        assert_equal(S[2:6, J].todense(), D[2:6, J])
+        assert_equal(S[3, J].todense(), D[3, J])
+        assert_equal(S[I[:, None], J].todense(), D[np.ix_(I, J)])
+        assert_equal(S[::2, 1:4].todense(), D[::2, 1:4])
+        assert_equal(S[::-3, ::2].todense(), D[::-3, ::2])
+        assert_equal(S[[], :].shape, (0, 5))
+        assert_equal(S[:, []].shape, (7, 0))
+
     def test_fancy_indexing_boolean(self):
         np.random.seed(1234)  # make runs repeatable
 
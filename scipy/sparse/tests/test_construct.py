@@ -8,7 +8,8 @@ from numpy.testing import (TestCase, run_module_suite, assert_equal, assert_,
         assert_array_equal, assert_raises, assert_array_almost_equal_nulp)
 from scipy._lib._numpy_compat import assert_raises_regex
 
-from scipy.sparse import csr_matrix, coo_matrix
+from scipy.sparse import csr_matrix, coo_matrix, CSRBuilder
+from scipy.sparse import _builder
 
 from scipy.sparse import construct
 from scipy.sparse.construct import rand as sprand
@@ -458,5 +459,111 @@ class TestConstructUtils(TestCase):
         a = construct.random(10, 10, dtype='d')
 
 
+class TestCSRBuilder(TestCase):
+    def setUp(self):
+        self._min_block_nnz = _builder._MIN_BLOCK_NNZ
+
+    def tearDown(self):
+        _builder._MIN_BLOCK_NNZ = self._min_block_nnz
+
+    def _check(self, shape, chunks, dtype=float):
+        builder = CSRBuilder(shape, dtype=dtype)
+        for rows, cols, vals in chunks:
+            builder.add(rows, cols, vals)
+        A = builder.tocsr()
+
+        rows, cols, vals = [np.concatenate(arrays) for arrays in zip(*chunks)]
+        expected = coo_matrix((vals, (rows, cols)), shape=shape).toarray()
+        assert_(isinstance(A, csr_matrix))
+        assert_equal(A.dtype, np.dtype(dtype))
+        assert_(A.has_canonical_format)
+        assert_(A.has_sorted_indices)
+        assert_equal(A.toarray(), expected)
+        assert_equal(builder.nnz, 0)
+        return A
+
+    def _random_chunks(self, shape, nchunks, size, seed=1234):
+        rng = np.random.RandomState(seed)
+        return [(rng.randint(shape[0], size=size),
+                 rng.randint(shape[1], size=size),
+                 rng.randint(-5, 5, size=size).astype(float))
+                for k in range(nchunks)]
+
+    def test_single_block(self):
+        chunks = self._random_chunks((20, 30), 5, 40)
+        self._check((20, 30), chunks)
+
+    def test_many_blocks(self):
+        # make each chunk or two a block of its own
+        _builder._MIN_BLOCK_NNZ = 60
+        for shape in [(20, 30), (1, 5), (30, 1)]:
+            chunks = self._random_chunks(shape, 7, 40)
+            A = self._check(shape, chunks)
+            assert_equal(A.indices.dtype, np.int32)
+
+            # the summed duplicates are not counted
+            builder = CSRBuilder(shape)
+            for rows, cols, vals in chunks:
+                builder.add(rows, cols, vals)
+            assert_(builder.nnz <= 7 * 40)
+            assert_(builder.nnz >= A.nnz)
+
+    def test_blocks_merged(self):
+        # entries added many times are summed as the blocks accumulate
+        _builder._MIN_BLOCK_NNZ = 60
+        shape = (5, 6)
+        chunks = self._random_chunks(shape, 50, 40)
+        builder = CSRBuilder(shape)
+        for rows, cols, vals in chunks:
+            builder.add(rows, cols, vals)
+            # merged blocks, a block being filled and the pending entries
+            assert_(builder.nnz <= 2 * 60 + 60 + 40)
+        A = builder.tocsr()
+        assert_equal(A.toarray(), self._check(shape, chunks).toarray())
+
+    def test_scalar_and_empty(self):
+        builder = CSRBuilder((3, 4), dtype=np.int64)
+        builder.add([0, 2, 0], [1, 3, 1], 2)
+        builder.add([], [], [])
+        A = builder.tocsr()
+        assert_equal(A.toarray(), [[0, 4, 0, 0], [0, 0, 0, 0], [0, 0, 0, 2]])
+
+        A = builder.tocsr()
+        assert_equal(A.shape, (3, 4))
+        assert_equal(A.nnz, 0)
+
+    def test_input_is_copied(self):
+        builder = CSRBuilder((3, 3))
+        rows = np.array([0, 1])
+        cols = np.array([1, 2])
+        vals = np.array([1., 2.])
+        builder.add(rows, cols, vals)
+        rows[0] = cols[0] = vals[0] = 0
+        assert_equal(builder.tocsr().toarray(),
+                     [[0, 1, 0], [0, 0, 2], [0, 0, 0]])
+
+    def test_int64_indices(self):
+        builder = CSRBuilder((2, 2**33), dtype=np.int8)
+        builder.add([0, 1, 1], [2**32 + 1, 5, 5], [1, 2, 3])
+        A = builder.tocsr()
+        assert_equal(A.indices.dtype, np.int64)
+        assert_equal(A.indptr.dtype, np.int64)
+        assert_equal(A.indices, [2**32 + 1, 5])
+        assert_equal(A.data, [1, 5])
+
+    def test_errors(self):
+        assert_raises(ValueError, CSRBuilder, (3, -1))
+        assert_raises(ValueError, CSRBuilder, 3)
+        builder = CSRBuilder((3, 4))
+        assert_raises(ValueError, builder.add, [3], [0], [1])
+        assert_raises(ValueError, builder.add, [0], [4], [1])
+        assert_raises(ValueError, builder.add, [-1], [0], [1])
+        assert_raises(ValueError, builder.add, [0], [-1], [1])
+        assert_raises(ValueError, builder.add, [0, 1], [0], [1])
+        # indices are checked before they are cast to the index type
+        assert_raises(ValueError, builder.add, [2**32], [0], [1])
+        assert_raises(ValueError, builder.add, [0], [2**32 + 1], [1])
+
+
 if __name__ == "__main__":
     run_module_suite()
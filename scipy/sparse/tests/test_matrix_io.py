@@ -68,6 +68,49 @@ def test_malicious_load():
         os.remove(tmpfile)
 
 
+def _check_save_and_load_mmap(matrix, mmap_mode='r'):
+    fd, tmpfile = tempfile.mkstemp(suffix='.npz')
+    os.close(fd)
+    try:
+        save_npz(tmpfile, matrix, compressed=False)
+        loaded_matrix = load_npz(tmpfile, mmap_mode=mmap_mode)
+        assert_(type(loaded_matrix) is type(matrix))
+        assert_(loaded_matrix.data.flags.writeable == (mmap_mode == 'c'))
+        assert_equal(loaded_matrix.indices.dtype, matrix.indices.dtype)
+        assert_equal(loaded_matrix.indptr.dtype, matrix.indptr.dtype)
+        assert_equal(loaded_matrix.toarray(), matrix.toarray())
+        del loaded_matrix
+    finally:
+        os.remove(tmpfile)
+
+
+def test_save_and_load_mmap():
+    np.random.seed(0)
+    dense_matrix = np.random.random((10, 7))
+    dense_matrix[dense_matrix > 0.7] = 0
+    for matrix_class in [csc_matrix, csr_matrix]:
+        for idx_dtype in [np.int32, np.int64]:
+            matrix = matrix_class(dense_matrix)
+            matrix.indices = matrix.indices.astype(idx_dtype)
+            matrix.indptr = matrix.indptr.astype(idx_dtype)
+            _check_save_and_load_mmap(matrix)
+        _check_save_and_load_mmap(matrix_class((4, 6)))
+        _check_save_and_load_mmap(matrix_class(dense_matrix), mmap_mode='c')
+
+
+def test_load_mmap_errors():
+    fd, tmpfile = tempfile.mkstemp(suffix='.npz')
+    os.close(fd)
+    try:
+        save_npz(tmpfile, csr_matrix(np.eye(3)), compressed=True)
+        assert_raises(ValueError, load_npz, tmpfile, mmap_mode='r')
+        save_npz(tmpfile, coo_matrix(np.eye(3)), compressed=False)
+        assert_raises(ValueError, load_npz, tmpfile, mmap_mode='r')
+        assert_raises(ValueError, load_npz, tmpfile, mmap_mode='w+')
+    finally:
+        os.remove(tmpfile)
+
+
 def test_py23_compatibility():
     # Try loading files saved on Python 2 and Python 3.  They are not
     # the same, since files saved with Scipy versions < 1.0.0 may
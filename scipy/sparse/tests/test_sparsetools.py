@@ -10,8 +10,10 @@ from nose import SkipTest
 import numpy as np
 from numpy.testing import (assert_raises, assert_equal, dec, run_module_suite, assert_,
                            assert_allclose)
-from scipy.sparse import (_sparsetools, coo_matrix, csr_matrix, csc_matrix,
-                          bsr_matrix, dia_matrix)
+from scipy import sparse
+from scipy.sparse import (_sparsetools, _parallel, coo_matrix, csr_matrix,
+                          csc_matrix, bsr_matrix, dia_matrix, set_workers,
+                          get_workers)
 from scipy.sparse.sputils import supported_dtypes
 from scipy._lib._testutils import xslow
 
@@ -51,6 +53,109 @@ def test_threads():
         assert_(np.all(b.toarray() == 2))
 
 
+class TestParallelProducts(object):
+    # Products split over threads by blocks of rows agree with the serial
+    # ones. The work threshold is lowered so that small matrices are split.
+
+    def setup(self):
+        self._min_work = _parallel._MIN_WORK_PER_WORKER
+        _parallel._MIN_WORK_PER_WORKER = 10
+
+    def teardown(self):
+        _parallel._MIN_WORK_PER_WORKER = self._min_work
+
+    def _matrices(self):
+        np.random.seed(1234)
+        A = np.random.rand(60, 40) * (np.random.rand(60, 40) < 0.2)
+        A[7] = 0  # an empty row
+        return csr_matrix(A)
+
+    def test_matvec(self):
+        A = self._matrices()
+        x = np.random.rand(40)
+        X = np.random.rand(40, 3)
+        for fmt in (A, A.astype(np.complex128), A.tobsr(blocksize=(2, 2)),
+                    A.tobsr(blocksize=(3, 4))):
+            for workers in (1, 2, 5, -1):
+                assert_allclose(fmt.dot(x, workers=workers),
+                                A.toarray().dot(x))
+                assert_allclose(fmt.dot(X, workers=workers),
+                                A.toarray().dot(X))
+
+    def test_matmat(self):
+        A = self._matrices()
+        B = csr_matrix(np.random.rand(40, 30) * (np.random.rand(40, 30) < 0.3))
+        expected = A.toarray().dot(B.toarray())
+        for workers in (1, 2, 5):
+            C = A.dot(B, workers=workers)
+            assert_(isinstance(C, csr_matrix))
+            assert_allclose(C.toarray(), expected)
+            assert_equal(C.nnz, (A * B).nnz)
+
+        # the index dtype of the result depends on its nnz, not its shape
+        n = 2**16
+        A = coo_matrix((np.ones(100), (600 * np.arange(100),
+                                       np.arange(100) % 40)),
+                       shape=(n, 40)).tocsr()
+        B = coo_matrix((np.ones(80), (np.arange(80) % 40,
+                                      700 * np.arange(80))),
+                       shape=(40, n)).tocsr()
+        with set_workers(3):
+            data, indices, indptr = _parallel.csr_matmat(
+                n, n, A.indptr, A.indices, A.data, B.indptr, B.indices,
+                B.data, np.float64)
+        assert_equal(indices.dtype, np.int32)
+        assert_equal(indptr.dtype, np.int32)
+        C = csr_matrix((data, indices, indptr), shape=(n, n))
+        assert_equal((C - A * B).nnz, 0)
+
+    def test_matmat_cancellation(self):
+        # explicit zeros are dropped from the product, which compacts the
+        # blocks of the result
+        A = bsr_matrix(np.kron(np.eye(20), [[1., 1.], [1., -1.]])).tocsr()
+        B = csr_matrix(np.kron(np.eye(20), np.ones((2, 2))))
+        for workers in (1, 3):
+            C = A.dot(B, workers=workers)
+            assert_equal(C.nnz, 40)
+            assert_equal(C.indptr[-1], len(C.indices))
+            assert_allclose(C.toarray(), A.toarray().dot(B.toarray()))
+
+    def test_sort_indices(self):
+        # large enough for the threads to overlap
+        A = sparse.random(2000, 2000, density=0.05, format='csr',
+                          random_state=1234)
+        A.sort_indices()
+        perm = np.concatenate([np.random.permutation(np.arange(a, b))
+                               for a, b in zip(A.indptr[:-1], A.indptr[1:])])
+        for indices in (A.indices[perm], A.indices[perm].astype(np.int64)):
+            # the data is not contiguous, so that sparsetools would work on
+            # a copy of it
+            x = np.column_stack([A.data[perm], A.data[perm]])
+            B = csr_matrix((x[:, 0], indices, A.indptr), shape=A.shape)
+            C = csr_matrix((x[:, 0].copy(), indices.copy(), A.indptr),
+                           shape=A.shape)
+            with set_workers(4):
+                B.sort_indices()
+                C.sort_indices()
+            for M in (B, C):
+                assert_equal(M.indices, A.indices)
+                assert_equal(M.data, A.data)
+
+    def test_set_workers(self):
+        A = self._matrices()
+        x = np.random.rand(40)
+        assert_equal(get_workers(), 1)
+        with set_workers(3):
+            assert_equal(get_workers(), 3)
+            assert_allclose(A * x, A.toarray().dot(x))
+            A.dot(x, workers=2)
+            assert_equal(get_workers(), 3)
+        assert_equal(get_workers(), 1)
+        assert_raises(ValueError, set_workers, 0)
+        assert_raises(ValueError, A.dot, x, workers=-2)
+        assert_equal(get_workers(), 1)
+
+
 def test_regression_std_vector_dtypes():
     # Regression test for gh-3780, checking the std::vector typemaps
     # in sparsetools.cxx are complete.